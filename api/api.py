@@ -1,11 +1,8 @@
 '''The API calls'''
 
 from io import BytesIO
-import json
 from flask import (
     abort,
-    g,
-    jsonify,
     redirect,
     request,
     Response,
@@ -14,26 +11,29 @@ from flask import (
 )
 import re
 import sqlalchemy
-from sqlalchemy import (
-    cast,
-    desc as sql_desc,
-    distinct,
-    Float,
-    func,
-)
 import string
-from . import app, taxtree
+from . import app, metrics, protein_index, similarity, stats, taxtree
+from .cache import VersionedCache
 from .search import (
     core_search,
     format_results,
     json_stats,
     available_term_by_category,
+    suggest_corrections,
+)
+from .search.genes import (
+    GENE_FORMATTERS,
+    gene_translations,
+    protein_hits_to_json,
 )
+from .search.helpers import FormatContext
+from .search import facets
 from .search_parser import Query
 from .models import (
     db,
     BgcType,
     BiosyntheticGeneCluster as Bgc,
+    Cds,
     DnaSequence,
     Filename,
     Genome,
@@ -43,6 +43,10 @@ from .models import (
 )
 from .errors import TooManyResults
 from .legacy import dbv1_accessions
+from .resolver import resolve_identifier
+from .routing import read_only
+from .serialization import dumps, jsonify
+from .timing import label_query, phase
 
 
 MIME_TYPE_MAP = {
@@ -73,84 +77,33 @@ def get_version():
 
 def _common_stats():
     """Get the stats shared by the v1 and v2 version of the call"""
+    num_clusters, num_genomes, num_sequences, clusters, top_seq_taxon = stats.common_stats_queries()
+    return stats.common_stats(num_clusters.scalar(), num_genomes.scalar(), num_sequences.scalar(),
+                              clusters.all(), top_seq_taxon.first())
 
-    num_clusters = Bgc.query.filter(Bgc.minimal.is_(False)).count()
-
-    num_genomes = Genome.query.count()
 
-    num_sequences = DnaSequence.query.count()
-
-    clusters = []
-
-    sub = db.session.query(t_rel_clusters_types.c.bgc_type_id, func.count(1).label('count')) \
-                    .join(Bgc).filter(Bgc.minimal.is_(False)) \
-                    .group_by(t_rel_clusters_types.c.bgc_type_id).subquery()
-    ret = db.session.query(BgcType.term, BgcType.description, sub.c.count).join(sub) \
-                    .order_by(sub.c.count.desc(), BgcType.term)
-    for cluster in ret:
-        clusters.append({'name': cluster.term, 'description': cluster.description, 'count': cluster.count})
-
-    ret = db.session.query(Taxa.tax_id, Taxa.genus, Taxa.species, func.count(DnaSequence.acc).label('tax_count')) \
-                    .join(Genome).join(DnaSequence) \
-                    .group_by(Taxa.tax_id).order_by(sql_desc('tax_count')).limit(1).first()
-    top_seq_taxon = ret.tax_id
-    top_seq_species = '{r.genus} {r.species}'.format(r=ret)
-    top_seq_taxon_count = ret.tax_count
-
-    stats = {
-        'num_clusters': num_clusters,
-        'num_genomes': num_genomes,
-        'num_sequences': num_sequences,
-        'top_seq_taxon': top_seq_taxon,
-        'top_seq_taxon_count': top_seq_taxon_count,
-        'top_seq_species': top_seq_species,
-        'clusters': clusters,
-    }
-    return stats
+@app.route('/metrics')
+def get_metrics():
+    '''Export the metrics of this worker in the Prometheus text format'''
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 
 @app.route('/api/v1.0/stats')
+@read_only
 def get_stats_v1():
     '''contents for the stats page'''
-    stats = _common_stats()
-
-    ret = db.session.query(Taxa.tax_id, Taxa.genus, Taxa.species, Taxa.strain,
-                           DnaSequence.acc,
-                           func.count(distinct(Bgc.bgc_id)).label('bgc_count'),
-                           func.count(distinct(DnaSequence.acc)).label('seq_count'),
-                           (cast(func.count(distinct(Bgc.bgc_id)), Float) / func.count(distinct(DnaSequence.acc))).label('clusters_per_seq')) \
-                    .join(Genome).join(DnaSequence).join(Locus).join(Bgc) \
-                    .group_by(Taxa.tax_id, DnaSequence.acc).order_by(sql_desc('clusters_per_seq')).limit(1).first()
-    stats['top_secmet_taxon'] = ret.tax_id
-    stats['top_secmet_species'] = '{r.genus} {r.species} {r.strain}'.format(r=ret)
-    stats['top_secmet_acc'] = ret.acc
-    stats['top_secmet_taxon_count'] = ret.clusters_per_seq
-
-    return jsonify(stats)
+    return jsonify(stats.add_top_secmet_v1(_common_stats(), stats.top_secmet_query_v1().first()))
 
 
 @app.route('/api/v2.0/stats')
+@read_only
 def get_stats_v2():
     """contents for the stats page"""
-    stats = _common_stats()
-
-    ret = db.session.query(Taxa.tax_id, Taxa.genus, Taxa.species, Taxa.strain,
-                           Genome.assembly_id,
-                           func.count(distinct(Bgc.bgc_id)).label('bgc_count'),
-                           func.count(distinct(Genome.assembly_id)).label('seq_count'),
-                           (cast(func.count(distinct(Bgc.bgc_id)), Float) / func.count(distinct(Genome.assembly_id))).label('clusters_per_seq')) \
-                    .join(Genome).join(DnaSequence).join(Locus).join(Bgc) \
-                    .filter(Genome.assembly_id != None).filter(Bgc.minimal.is_(False)) \
-                    .group_by(Taxa.tax_id, Genome.assembly_id).order_by(sql_desc('clusters_per_seq')).limit(1).first()
-    stats['top_secmet_taxon'] = ret.tax_id
-    stats['top_secmet_species'] = '{r.genus} {r.species} {r.strain}'.format(r=ret)
-    stats['top_secmet_assembly_id'] = ret.assembly_id
-    stats['top_secmet_taxon_count'] = ret.bgc_count
-
-    return jsonify(stats)
+    return jsonify(stats.add_top_secmet_v2(_common_stats(), stats.top_secmet_query_v2().first()))
 
 
 @app.route('/api/v1.0/tree/secmet')
+@read_only
 def get_sec_met_tree():
     '''Get the jsTree structure for secondary metabolite clusters'''
     ret = db.session.query(Bgc.bgc_id, Bgc.cluster_number,
@@ -193,51 +146,31 @@ def get_sec_met_tree():
     return jsonify(tree)
 
 
-def _get_taxon_tree_node(tree_id):
-    HANDLERS = {
-        'superkingdom': taxtree.get_phylum,
-        'phylum': taxtree.get_class,
-        'class': taxtree.get_order,
-        'order': taxtree.get_family,
-        'family': taxtree.get_genus,
-        'genus': taxtree.get_species,
-        'species': taxtree.get_strains,
-    }
-
-    if tree_id == '1':
-        tree = taxtree.get_superkingdom()
-    else:
-        params = tree_id.split('_')
-        taxlevel = params[0]
-        params = params[1:]
-        handler = HANDLERS.get(taxlevel, lambda x: [])
-        tree = handler(params)
-
-    return tree
-
-
 @app.route('/api/v1.0/tree/taxa')
+@read_only
 def get_taxon_tree():
     '''Get the jsTree structure for all taxa'''
     tree_id = request.args.get('id', '1')
-    tree = _get_taxon_tree_node(tree_id)
+    tree = taxtree.get_tree_node(tree_id)
 
     return jsonify(tree)
 
 
 @app.route('/api/v1.0/tree/taxa/massload')
+@read_only
 def get_taxon_tree_massload():
     tree_ids = request.args.get('id', '1')
     id_list = tree_ids.split(',')
 
     multitree = {}
     for tree_id in id_list:
-        multitree[tree_id] = _get_taxon_tree_node(tree_id)
+        multitree[tree_id] = taxtree.get_tree_node(tree_id)
 
     return jsonify(multitree)
 
 
 @app.route('/api/v1.0/tree/taxa/search')
+@read_only
 def search_taxon_tree():
     search = request.args.get('str', None)
     if not search:
@@ -249,14 +182,17 @@ def search_taxon_tree():
 
 
 @app.route('/api/v1.0/search', methods=['POST'])
+@read_only
 def search():
     try:
-        if 'query' not in request.json:
-            query = Query.from_string(request.json.get('search_string', ''))
-        else:
-            query = Query.from_json(request.json['query'])
+        with phase('parse'):
+            if 'query' not in request.json:
+                query = Query.from_string(request.json.get('search_string', ''))
+            else:
+                query = Query.from_json(request.json['query'])
     except ValueError:
         abort(400)
+    label_query(query)
 
     if query.return_type != 'json':
         abort(400)
@@ -271,8 +207,24 @@ def search():
     except ValueError:
         paginate = 50
 
-    clusters = format_results(query, core_search(query))
-    stats = json_stats(clusters)
+    facet_categories = request.json.get('facets') or []
+    if isinstance(facet_categories, str):
+        facet_categories = [category.strip() for category in facet_categories.split(',') if category.strip()]
+    if not isinstance(facet_categories, list) or set(map(str, facet_categories)) - facets.CATEGORIES:
+        abort(400)
+    if facet_categories and query.search_type != 'cluster':
+        abort(400)
+    try:
+        facet_limit = min(max(int(request.json.get('facet_limit', '10')), 1), 100)
+    except (TypeError, ValueError):
+        abort(400)
+
+    with phase('search'):
+        search_results = core_search(query)
+    with phase('format'):
+        clusters = format_results(query, search_results)
+    with phase('stats'):
+        search_stats = json_stats(clusters)
 
     total = len(clusters)
 
@@ -287,22 +239,40 @@ def search():
         'clusters': clusters[offset:end],
         'offset': offset,
         'paginate': paginate,
-        'stats': stats,
+        'stats': search_stats,
     }
 
-    return jsonify(result)
+    if facet_categories:
+        try:
+            with phase('facets'):
+                result['facets'] = facets.search_facets([cluster['bgc_id'] for cluster in clusters],
+                                                        facet_categories, facet_limit)
+        except RuntimeError:
+            app.logger.exception('Failed to load the cluster attributes for the search facets')
+            abort(503)
+
+    if total == 0:
+        with phase('suggest'):
+            result['suggestions'] = suggest_corrections(query.terms)
+
+    with phase('encode'):
+        response = jsonify(result)
+    return response
 
 
 @app.route('/api/v1.0/export', methods=['POST'])
+@read_only
 def export():
     '''Export the search results as CSV file'''
     try:
-        if 'query' not in request.json:
-            query = Query.from_string(request.json.get('search_string', ''), return_type='csv')
-        else:
-            query = Query.from_json(request.json['query'])
+        with phase('parse'):
+            if 'query' not in request.json:
+                query = Query.from_string(request.json.get('search_string', ''), return_type='csv')
+            else:
+                query = Query.from_json(request.json['query'])
     except ValueError:
         abort(400)
+    label_query(query)
 
     try:
         offset = int(request.json.get('offset', '0'))
@@ -320,10 +290,8 @@ def export():
     if return_type not in ('json', 'csv', 'fasta', 'fastaa'):
         abort(400)
 
-    search_results = core_search(query)
-    g.verbose = query.verbose
-    if query.verbose:
-        g.search_str = str(query)
+    with phase('search'):
+        search_results = core_search(query)
 
     total = len(search_results)
 
@@ -340,14 +308,17 @@ def export():
         raise TooManyResults('More than {limit} search results for FASTA {search} download ({number} found), please specify a smaller query.'.format(
             limit=limit, search=search_type, number=len(search_results)))
 
-    found_bgcs = format_results(query, search_results)
+    with phase('format'):
+        found_bgcs = format_results(query, search_results)
     filename = 'asdb_search_results.{}'.format(return_type)
-    if query.return_type == 'json':
-        found_bgcs = [json.dumps(found_bgcs)]
 
-    handle = BytesIO()
-    for line in found_bgcs:
-        handle.write('{}\n'.format(line).encode('utf-8'))
+    with phase('encode'):
+        handle = BytesIO()
+        if query.return_type == 'json':
+            handle.write(dumps(found_bgcs, sort_keys=False) + b'\n')
+        else:
+            for line in found_bgcs:
+                handle.write('{}\n'.format(line).encode('utf-8'))
 
     handle.seek(0)
 
@@ -357,6 +328,7 @@ def export():
 
 
 @app.route('/api/v1.0/export/<search_type>/<return_type>')
+@read_only
 def export_get(search_type, return_type):
     '''Export the search results as a file'''
 
@@ -367,15 +339,20 @@ def export_get(search_type, return_type):
     if return_type not in ('json', 'csv', 'fasta', 'fastaa'):
         abort(400)
 
-    query = Query.from_string(search_string, search_type=search_type, return_type=return_type)
+    with phase('parse'):
+        query = Query.from_string(search_string, search_type=search_type, return_type=return_type)
+    label_query(query)
 
-    g.verbose = False
-    search_results = core_search(query)
+    with phase('search'):
+        search_results = core_search(query)
     if len(search_results) > 100 and search_type == 'cluster' and return_type == 'fasta':
         raise TooManyResults('More than 100 search results for FASTA cluster download, please specify a smaller query.')
-    found_bgcs = format_results(query, search_results)
+    # FASTA cluster records are generated while streaming, outside of this phase
+    with phase('format'):
+        found_bgcs = format_results(query, search_results)
     if query.return_type == 'json':
-        found_bgcs = [json.dumps(found_bgcs)]
+        with phase('encode'):
+            return Response(dumps(found_bgcs, sort_keys=False) + b'\n', mimetype=MIME_TYPE_MAP['json'])
 
 
     def generate():
@@ -387,6 +364,109 @@ def export_get(search_type, return_type):
     return Response(stream_with_context(generate()), mimetype=mime_type)
 
 
+@app.route('/api/v1.0/search/protein', methods=['POST'])
+@read_only
+def search_protein():
+    '''Find the genes with the proteins most similar to a query protein sequence
+
+    Needs the k-mer index of api.protein_index, configured with PROTEIN_INDEX.
+    '''
+    body = request.json or {}
+    try:
+        with phase('parse'):
+            sequence = protein_index.clean_sequence(body.get('sequence', ''))
+            limit = min(max(int(body.get('limit', '50')), 1), FASTA_LIMITS['gene'])
+            verify = str(body.get('verify', 'true')).lower() in ('true', 'yes', '1')
+    except (AttributeError, TypeError, ValueError):
+        abort(400)
+
+    return_type = body.get('return_type', 'json')
+    if return_type not in ('json', 'csv', 'fasta', 'fastaa'):
+        abort(400)
+
+    path = app.config.get('PROTEIN_INDEX')
+    if not path:
+        abort(503)
+    try:
+        index = protein_index.get_index(path)
+    except (OSError, RuntimeError, ValueError):
+        app.logger.exception('Failed to load the protein index %s', path)
+        abort(503)
+
+    with phase('search'):
+        hits = protein_index.search(index, sequence, limit=limit, verify=verify,
+                                    translations=gene_translations,
+                                    threads=app.config.get('PROTEIN_SEARCH_THREADS', 1))
+
+    with phase('format'):
+        hits = protein_hits_to_json(hits)
+        if return_type != 'json':
+            genes = [Cds(cds_id=hit['cds_id']) for hit in hits]
+            records = GENE_FORMATTERS[return_type](genes, FormatContext())
+
+    if return_type == 'json':
+        with phase('encode'):
+            return jsonify({'total': len(hits), 'hits': hits})
+    return Response(''.join('{}\n'.format(record) for record in records), mimetype=MIME_TYPE_MAP[return_type])
+
+
+@app.route('/api/v1.0/similar/<int:bgc_id>')
+@read_only
+def similar_to_cluster(bgc_id):
+    '''Find the clusters sharing the most domains, profile hits and smCOGs with a cluster
+
+    Takes the limit, metric (jaccard or cosine) and prefilter (MinHash/LSH)
+    options as query arguments.
+    '''
+    return _similar_clusters(request.args, bgc_id=bgc_id)
+
+
+@app.route('/api/v1.0/similar', methods=['POST'])
+@read_only
+def similar_to_features():
+    '''Find the clusters most similar to a bgc_id or a list of features like "pfam:PF00109"'''
+    body = request.json
+    if not isinstance(body, dict):
+        abort(400)
+    bgc_id = body.get('bgc_id')
+    if bgc_id is None and not isinstance(body.get('features'), list):
+        abort(400)
+    try:
+        bgc_id = int(bgc_id) if bgc_id is not None else None
+    except (TypeError, ValueError):
+        abort(400)
+    return _similar_clusters(body, bgc_id=bgc_id, features=body.get('features'))
+
+
+def _similar_clusters(options, bgc_id=None, features=None):
+    try:
+        limit = min(max(int(options.get('limit', '10')), 1), FASTA_LIMITS['cluster'])
+    except (TypeError, ValueError):
+        abort(400)
+    metric = options.get('metric', 'jaccard')
+    if metric not in similarity.METRICS:
+        abort(400)
+    prefilter = str(options.get('prefilter', 'false')).lower() in ('true', 'yes', '1')
+
+    try:
+        with phase('search'):
+            if bgc_id is not None:
+                hits = similarity.similar_to_cluster(bgc_id, limit=limit, metric=metric, prefilter=prefilter)
+            else:
+                hits = similarity.similar_to_features([str(feature) for feature in features], limit=limit,
+                                                      metric=metric, prefilter=prefilter)
+    except RuntimeError:
+        app.logger.exception('Failed to load the cluster feature matrix')
+        abort(503)
+    if hits is None:
+        abort(404)
+
+    with phase('format'):
+        clusters = similarity.similar_clusters_to_json(hits)
+    with phase('encode'):
+        return jsonify({'total': len(clusters), 'clusters': clusters})
+
+
 @app.route('/api/v1.0/genome/<identifier>')
 def show_genome(identifier):
     '''show information for a genome by identifier'''
@@ -406,9 +486,16 @@ def show_assembly(identifier):
 
 
 @app.route('/api/v1.0/available/<category>/<term>')
+@read_only
 def list_available(category, term):
-    '''list available terms for a given category'''
-    return jsonify(available_term_by_category(category, term))
+    '''list available terms for a given category
+
+    Pass counts=true to get the number of matching BGCs for each term,
+    and sort=count to list the most common terms first.
+    '''
+    with_counts = request.args.get('counts', 'false').lower() in ('true', 'yes', '1')
+    by_count = request.args.get('sort', '') == 'count'
+    return jsonify(available_term_by_category(category, term, with_counts=with_counts, by_count=by_count))
 
 
 def _canonical_assembly_id(identifier):
@@ -417,6 +504,12 @@ def _canonical_assembly_id(identifier):
     if safe_id in dbv1_accessions:
         return safe_id, True
 
+    if app.config.get('IDENTIFIER_RESOLVER', True):
+        assembly_id = resolve_identifier(safe_id)
+        if assembly_id is None:
+            abort(404)
+        return assembly_id, False
+
     res = db.session.query(Genome.assembly_id).filter(Genome.assembly_id.ilike("{}%".format(safe_id))).first()
     if res:
         return res.assembly_id.split('.')[0], False
@@ -434,6 +527,7 @@ def _canonical_assembly_id(identifier):
 
 @app.route('/api/v1.0/goto/<identifier>')
 @app.route('/go/<identifier>')
+@read_only
 def goto(identifier):
     safe_id, is_v1 = _canonical_assembly_id(identifier)
     if is_v1:
@@ -444,6 +538,7 @@ def goto(identifier):
 
 @app.route('/api/v1.0/goto/<identifier>/cluster/<int:number>')
 @app.route('/go/<identifier>/<int:number>')
+@read_only
 def goto_cluster(identifier, number):
     safe_id, is_v1 = _canonical_assembly_id(identifier)
     if is_v1:
@@ -452,28 +547,114 @@ def goto_cluster(identifier, number):
     return redirect("/output/{}/index.html#cluster-{}".format(safe_id, number))
 
 
-def _get_base_url(identifier):
+MAX_BULK_DOWNLOADS = 10000
+
+
+def _load_filenames():
+    """Load the base filename of every assembly"""
+    return dict(db.session.query(Filename.assembly_id, Filename.base_filename).all())
+
+
+_FILENAMES = VersionedCache(_load_filenames)
+
+
+def _lookup_base_url(identifier):
+    """Get the base download URL for an assembly, or None if there are no files"""
     safe_id = SAFE_IDENTIFIER_PATTERN.sub('', identifier).split('.')[0]
-    ret = db.session.query(Filename.assembly_id, Filename.base_filename) \
-            .filter(Filename.assembly_id == safe_id).first()
-    if not ret:
+    base_filename = _FILENAMES.get().get(safe_id)
+    if base_filename is None:
+        return None
+
+    return "/output/{}/{}".format(safe_id, base_filename)
+
+
+def _get_base_url(identifier):
+    url = _lookup_base_url(identifier)
+    if url is None:
         abort(404)
 
-    return "/output/{r.assembly_id}/{r.base_filename}".format(r=ret)
+    return url
+
+
+def _genbank_url(base_url):
+    return "{}.final.gbk".format(base_url)
+
+
+def _table_url(base_url):
+    return "{}.geneclusters.xls".format(base_url)
+
+
+def _cluster_url(base_url, number):
+    return "{}.cluster{:03d}.gbk".format(base_url, number)
+
 
 @app.route('/api/v1.0/download/genbank/<identifier>')
 def download_genbank(identifier):
     url = _get_base_url(identifier)
-    return redirect("{}.final.gbk".format(url))
+    return redirect(_genbank_url(url))
 
 
 @app.route('/api/v1.0/download/table/<identifier>')
 def download_table(identifier):
     url = _get_base_url(identifier)
-    return redirect("{}.geneclusters.xls".format(url))
+    return redirect(_table_url(url))
 
 
 @app.route('/api/v1.0/download/genbank/<identifier>/cluster/<int:number>')
 def download_cluster(identifier, number):
     url = _get_base_url(identifier)
-    return redirect("{}.cluster{:03d}.gbk".format(url, number))
+    return redirect(_cluster_url(url, number))
+
+
+def _is_cluster_number(number):
+    '''Check that a JSON value is a valid cluster number, a positive int but not a bool'''
+    return isinstance(number, int) and not isinstance(number, bool) and number >= 1
+
+
+@app.route('/api/v1.0/download/bulk', methods=['POST'])
+def download_bulk():
+    """Get the download URLs for many assemblies or clusters at once
+
+    Takes {"downloads": [...]} where every entry is either an assembly id or
+    an object with "assembly_id" and "cluster_number".
+    """
+    if not isinstance(request.json, dict) or not isinstance(request.json.get('downloads'), list):
+        abort(400)
+
+    downloads = request.json['downloads']
+    if len(downloads) > MAX_BULK_DOWNLOADS:
+        raise TooManyResults('More than {limit} downloads requested ({number}), please split up the request.'.format(
+            limit=MAX_BULK_DOWNLOADS, number=len(downloads)))
+
+    urls = []
+    not_found = []
+    for entry in downloads:
+        if isinstance(entry, dict):
+            identifier = entry.get('assembly_id')
+            number = entry.get('cluster_number')
+        else:
+            identifier = entry
+            number = None
+
+        if not isinstance(identifier, str) or (number is not None and not _is_cluster_number(number)):
+            abort(400)
+
+        base_url = _lookup_base_url(identifier)
+        if base_url is None:
+            not_found.append(entry)
+            continue
+
+        if number is None:
+            urls.append({
+                'assembly_id': identifier,
+                'genbank': _genbank_url(base_url),
+                'table': _table_url(base_url),
+            })
+        else:
+            urls.append({
+                'assembly_id': identifier,
+                'cluster_number': number,
+                'genbank': _cluster_url(base_url, number),
+            })
+
+    return jsonify({'urls': urls, 'not_found': not_found})
@@ -0,0 +1,388 @@
+'''Asyncio entry point for the read-heavy endpoints
+
+Serves search, available, the taxon tree and stats from an asyncpg connection
+pool, so one process can keep many slow queries in flight instead of blocking a
+sync worker per query. All queries are built by the same code the WSGI views in
+api.api use, only the execution differs. Every other endpoint is only served by
+api:app, so route these paths to this app in the proxy in front.
+
+Needs the packages in asgi_requirements.txt. Run with e.g.
+
+    uvicorn api.asgi:application --workers 2
+
+Gene and domain searches and "did you mean" suggestions are not ported to the
+async driver yet and run on the regular database session in a thread. So does
+building the cluster search and available queries, which can load caches like
+the type closure from the database.
+'''
+
+import asyncio
+import json
+import re
+import time
+from urllib.parse import parse_qs
+
+from . import app, stats, taxtree
+from .asyncdb import AsyncDatabase
+from .cache import data_version_query
+from .models import BiosyntheticGeneCluster as Bgc
+from .search import (
+    core_search,
+    expressions,
+    format_results,
+    json_stats,
+    json_stats_queries,
+    stats_from_rows,
+    suggest_corrections,
+)
+from .search.available import AVAILABLE
+from .search.clusters import (
+    category_guess_queries,
+    cluster_json_query,
+    clusters_from_rows,
+    cluster_query_from_term,
+)
+from .search.helpers import sanitise_string
+from .search_parser import Query
+from .serialization import dumps
+
+ERRORS = {
+    400: 'Bad request',
+    404: 'Not found',
+    405: 'Method not allowed',
+    500: 'Internal server error',
+}
+
+ROUTES = []
+
+DB = AsyncDatabase(app.config['SQLALCHEMY_DATABASE_URI'], max_size=app.config.get('ASYNC_DB_POOL_SIZE', 20))
+
+_APP_CONTEXT = app.app_context()
+_STARTUP_LOCK = asyncio.Lock()
+
+
+class HTTPError(Exception):
+    '''Abort the request with an HTTP error status'''
+    def __init__(self, status):
+        super().__init__(ERRORS[status])
+        self.status = status
+
+
+class Request(object):
+    '''The parts of an HTTP request the handlers need'''
+    def __init__(self, scope, body):
+        self.method = scope['method']
+        self.path = scope['path']
+        self.args = {key: values[0] for key, values in parse_qs(scope.get('query_string', b'').decode('utf-8')).items()}
+        self.body = body
+
+    @property
+    def json(self):
+        try:
+            data = json.loads(self.body.decode('utf-8'))
+        except ValueError:
+            raise HTTPError(400)
+        if not isinstance(data, dict):
+            raise HTTPError(400)
+        return data
+
+
+def route(path, methods=('GET',)):
+    '''Decorator to register a handler for a path, <name> parts are passed as keyword arguments'''
+    pattern = re.compile('^{}$'.format(re.sub(r'<(\w+)>', r'(?P<\1>[^/]+)', path)))
+
+    def decorator(handler):
+        ROUTES.append((pattern, methods, handler))
+        return handler
+    return decorator
+
+
+class AsyncVersionedCache(object):
+    '''Lazily build a value with a coroutine and rebuild it when the data version changes'''
+    _version = {'version': None, 'checked': 0.0}
+
+    def __init__(self, builder):
+        self.builder = builder
+        self._value = None
+        self._built_for = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def data_version(cls):
+        '''Get the data version like api.cache.current_data_version does'''
+        configured = app.config.get('DATA_VERSION')
+        if configured:
+            return configured
+
+        now = time.time()
+        if cls._version['version'] is None or now - cls._version['checked'] >= app.config.get('DATA_VERSION_TTL', 300):
+            cls._version['version'] = '{}-{}-{}'.format(*(await DB.fetchrow(data_version_query())))
+            cls._version['checked'] = now
+        return cls._version['version']
+
+    async def get(self):
+        '''Get the cached value, (re)building it if needed'''
+        version = await self.data_version()
+        if self._built_for != version:
+            async with self._lock:
+                if self._built_for != version:
+                    self._value = await self.builder()
+                    self._built_for = version
+        return self._value
+
+
+def _in_app_context(function, *args):
+    with app.app_context():
+        return function(*args)
+
+
+async def run_in_thread(function, *args):
+    '''Run blocking code using the regular database session in a worker thread'''
+    return await asyncio.get_running_loop().run_in_executor(None, _in_app_context, function, *args)
+
+
+async def guess_cluster_category(term):
+    '''Async version of api.search.clusters.guess_cluster_category'''
+    for category, query in category_guess_queries(term):
+        if await DB.fetchval(query) > 0:
+            return category
+    return term.category
+
+
+async def cluster_search(query):
+    '''Get the clusters_to_json output for the clusters matching a query'''
+    guesses = {}
+    for expression in expressions(query.terms):
+        if expression.category == 'unknown' and expression.term not in guesses:
+            guesses[expression.term] = await guess_cluster_category(expression)
+
+    # Building the query can load per data version caches, like the type closure
+    # or the architecture index, on the regular database session
+    sql_query = await run_in_thread(cluster_query_from_term, query.terms, lambda term: guesses[term.term])
+    bgc_ids = set(row[0] for row in await DB.fetch(sql_query.with_entities(Bgc.bgc_id)))
+    return clusters_from_rows(await DB.fetch(cluster_json_query(bgc_ids)))
+
+
+async def cluster_stats(clusters):
+    '''Async version of api.search.json_stats'''
+    if len(clusters) < 1:
+        return {}
+
+    bgc_ids = set(cluster['bgc_id'] for cluster in clusters)
+    type_rows, phylum_rows = await asyncio.gather(*map(DB.fetch, json_stats_queries(bgc_ids)))
+    return stats_from_rows(type_rows, phylum_rows)
+
+
+def _sync_search(query):
+    clusters = format_results(query, core_search(query))
+    return clusters, json_stats(clusters)
+
+
+@route('/api/v1.0/search', methods=('POST',))
+async def search(request):
+    '''Async version of the /api/v1.0/search view'''
+    body = request.json
+    try:
+        if 'query' not in body:
+            query = Query.from_string(body.get('search_string', ''))
+        else:
+            query = Query.from_json(body['query'])
+    except ValueError:
+        raise HTTPError(400)
+
+    if query.return_type != 'json':
+        raise HTTPError(400)
+
+    try:
+        offset = int(body.get('offset', '0'))
+    except ValueError:
+        offset = 0
+
+    try:
+        paginate = int(body.get('paginate', '50'))
+    except ValueError:
+        paginate = 50
+
+    if query.search_type == 'cluster':
+        clusters = await cluster_search(query)
+        search_stats = await cluster_stats(clusters)
+    else:
+        clusters, search_stats = await run_in_thread(_sync_search, query)
+
+    total = len(clusters)
+
+    if paginate > 0:
+        end = min(offset + paginate, total)
+    else:
+        end = total
+
+    result = {
+        'total': total,
+        'clusters': clusters[offset:end],
+        'offset': offset,
+        'paginate': paginate,
+        'stats': search_stats,
+    }
+
+    if total == 0:
+        result['suggestions'] = await run_in_thread(suggest_corrections, query.terms)
+
+    return result
+
+
+def _available_query(category, term):
+    '''Get the query for available terms, or the rows of handlers without an SQL query'''
+    query = AVAILABLE[category](term).limit(50)
+    return query if hasattr(query, 'statement') else query.all()
+
+
+@route('/api/v1.0/available/<category>/<term>')
+async def list_available(request, category, term):
+    '''List available terms for a given category
+
+    Always queries the database, the typeahead index options of the WSGI view
+    are not supported.
+    '''
+    cleaned_category = sanitise_string(category)
+    cleaned_term = sanitise_string(term)
+    if cleaned_category not in AVAILABLE:
+        return []
+
+    query = await run_in_thread(_available_query, cleaned_category, cleaned_term)
+    rows = await DB.fetch(query) if hasattr(query, 'statement') else query
+    return [{'val': row[0], 'desc': row[1]} for row in rows]
+
+
+async def tree_node(tree_id):
+    '''Async version of api.taxtree.get_tree_node'''
+    node_query = taxtree.tree_node_query(tree_id)
+    if node_query is None:
+        return []
+    query, to_nodes = node_query
+    return to_nodes(await DB.fetch(query))
+
+
+@route('/api/v1.0/tree/taxa')
+async def get_taxon_tree(request):
+    '''Get the jsTree structure for all taxa'''
+    return await tree_node(request.args.get('id', '1'))
+
+
+@route('/api/v1.0/tree/taxa/massload')
+async def get_taxon_tree_massload(request):
+    '''Get the jsTree structures for several nodes at once'''
+    id_list = request.args.get('id', '1').split(',')
+    trees = await asyncio.gather(*map(tree_node, id_list))
+    return dict(zip(id_list, trees))
+
+
+async def _build_search_index():
+    return taxtree.TaxonSearchIndex(await DB.fetch(taxtree.search_index_query()))
+
+
+_SEARCH_INDEX = AsyncVersionedCache(_build_search_index)
+
+
+@route('/api/v1.0/tree/taxa/search')
+async def search_taxon_tree(request):
+    '''Get the taxtree path of all taxa matching the search string'''
+    search_str = request.args.get('str', None)
+    if not search_str:
+        return []
+    return (await _SEARCH_INDEX.get()).search(search_str)
+
+
+async def common_stats():
+    '''Async version of the stats shared by the v1 and v2 stats'''
+    num_clusters, num_genomes, num_sequences, clusters, top_seq_taxon = stats.common_stats_queries()
+    results = await asyncio.gather(DB.fetchval(num_clusters), DB.fetchval(num_genomes), DB.fetchval(num_sequences),
+                                   DB.fetch(clusters), DB.fetchrow(top_seq_taxon))
+    return stats.common_stats(*results)
+
+
+@route('/api/v1.0/stats')
+async def get_stats_v1(request):
+    '''contents for the stats page'''
+    common, top_secmet = await asyncio.gather(common_stats(), DB.fetchrow(stats.top_secmet_query_v1()))
+    return stats.add_top_secmet_v1(common, top_secmet)
+
+
+@route('/api/v2.0/stats')
+async def get_stats_v2(request):
+    '''contents for the stats page'''
+    common, top_secmet = await asyncio.gather(common_stats(), DB.fetchrow(stats.top_secmet_query_v2()))
+    return stats.add_top_secmet_v2(common, top_secmet)
+
+
+async def dispatch(request):
+    '''Run the handler matching the request'''
+    path_matched = False
+    for pattern, methods, handler in ROUTES:
+        match = pattern.match(request.path)
+        if match is None:
+            continue
+        path_matched = True
+        if request.method in methods:
+            return await handler(request, **match.groupdict())
+
+    raise HTTPError(405 if path_matched else 404)
+
+
+async def startup():
+    '''Set up the app context used to build queries and open the database pool'''
+    async with _STARTUP_LOCK:
+        if DB.pool is None:
+            _APP_CONTEXT.push()
+            await DB.connect()
+
+
+async def shutdown():
+    '''Close the database pool'''
+    if DB.pool is not None:
+        await DB.close()
+        _APP_CONTEXT.pop()
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await startup()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await shutdown()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    '''The ASGI application'''
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+    try:
+        await startup()
+        status, payload = 200, await dispatch(Request(scope, body))
+    except HTTPError as error:
+        status, payload = error.status, {'error': ERRORS[error.status]}
+    except Exception:  # pylint: disable=broad-except
+        app.logger.exception('Error handling %s %s', scope['method'], scope['path'])
+        status, payload = 500, {'error': ERRORS[500]}
+
+    data = dumps(payload)
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(data)).encode('ascii'))],
+    })
+    await send({'type': 'http.response.body', 'body': data})
@@ -0,0 +1,106 @@
+'''Run the SQLAlchemy queries of the API on an asyncpg connection pool
+
+Queries are still built with the ORM models, but only compiled to SQL here and
+executed with asyncpg, so the asyncio mode in api.asgi shares all query
+building with the WSGI views. asyncpg is an optional dependency, see
+asgi_requirements.txt.
+'''
+
+import re
+
+from sqlalchemy.dialects.postgresql import psycopg2 as pg_dialect
+
+try:
+    import asyncpg
+except ImportError:  # pragma: no cover
+    asyncpg = None
+
+_DIALECT = pg_dialect.dialect()
+_PYFORMAT = re.compile(r'%\(([^)]+)\)s|%%')
+
+
+def compile_query(query):
+    '''Compile a Query or SQL expression to asyncpg's $n placeholder SQL and its arguments'''
+    statement = getattr(query, 'statement', query)
+    compiled = statement.compile(dialect=_DIALECT)
+    params = compiled.params
+
+    names = []
+
+    def placeholder(match):
+        name = match.group(1)
+        if name is None:
+            return '%'
+        if name not in names:
+            names.append(name)
+        return '${}'.format(names.index(name) + 1)
+
+    sql = _PYFORMAT.sub(placeholder, compiled.string)
+    return sql, [params[name] for name in names]
+
+
+# Python types of the Postgres parameter types that need converting
+_PARAMETER_TYPES = {
+    'int2': int,
+    'int4': int,
+    'int8': int,
+    'float4': float,
+    'float8': float,
+    'text': str,
+    'varchar': str,
+}
+
+
+def coerce_args(parameter_types, args):
+    '''Convert arguments to the types Postgres inferred for their parameters
+
+    Unlike psycopg2, asyncpg doesn't send untyped literals, so comparing an integer
+    column with a string search term needs the term converted.
+    '''
+    coerced = []
+    for type_name, value in zip(parameter_types, args):
+        python_type = _PARAMETER_TYPES.get(type_name)
+        if value is not None and python_type is not None and not isinstance(value, python_type):
+            value = python_type(value)
+        coerced.append(value)
+    return coerced
+
+
+class AsyncDatabase(object):
+    '''An asyncpg connection pool running compiled SQLAlchemy queries'''
+    def __init__(self, uri, min_size=5, max_size=20):
+        self.uri = uri
+        self.min_size = min_size
+        self.max_size = max_size
+        self.pool = None
+
+    async def connect(self):
+        '''Open the connection pool'''
+        if asyncpg is None:
+            raise RuntimeError('The asyncio mode needs asyncpg, see asgi_requirements.txt')
+        self.pool = await asyncpg.create_pool(self.uri, min_size=self.min_size, max_size=self.max_size)
+
+    async def close(self):
+        '''Close the connection pool'''
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    async def _run(self, method, query):
+        sql, args = compile_query(query)
+        async with self.pool.acquire() as connection:
+            statement = await connection.prepare(sql)
+            args = coerce_args([parameter.name for parameter in statement.get_parameters()], args)
+            return await getattr(statement, method)(*args)
+
+    async def fetch(self, query):
+        '''Get all result rows of a query'''
+        return await self._run('fetch', query)
+
+    async def fetchrow(self, query):
+        '''Get the first result row of a query, or None'''
+        return await self._run('fetchrow', query)
+
+    async def fetchval(self, query):
+        '''Get the first column of the first result row of a query'''
+        return await self._run('fetchval', query)
@@ -0,0 +1,86 @@
+'''In-process caches that are rebuilt whenever the database contents change'''
+
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import func
+
+from .models import (
+    db,
+    BiosyntheticGeneCluster as Bgc,
+    Cds,
+    Genome,
+)
+
+_VERSION_STATE = {
+    'version': None,
+    'checked': 0.0,
+}
+_VERSION_LOCK = threading.Lock()
+
+
+def current_data_version():
+    '''Get a fingerprint of the currently loaded data
+
+    The antiSMASH DB is only ever loaded in bulk, so the highest primary keys of
+    the main tables change whenever new data is imported. The fingerprint is only
+    re-checked every DATA_VERSION_TTL seconds. Setting DATA_VERSION explicitly
+    skips the database lookup completely.
+    '''
+    configured = current_app.config.get('DATA_VERSION')
+    if configured:
+        return configured
+
+    ttl = current_app.config.get('DATA_VERSION_TTL', 300)
+    now = time.time()
+    with _VERSION_LOCK:
+        if _VERSION_STATE['version'] is not None and now - _VERSION_STATE['checked'] < ttl:
+            return _VERSION_STATE['version']
+
+        _VERSION_STATE['version'] = '{}-{}-{}'.format(*data_version_query().one())
+        _VERSION_STATE['checked'] = now
+        return _VERSION_STATE['version']
+
+
+def data_version_query():
+    '''Get the query for the highest primary keys making up the data version'''
+    return db.session.query(
+        db.session.query(func.max(Genome.genome_id)).as_scalar(),
+        db.session.query(func.max(Bgc.bgc_id)).as_scalar(),
+        db.session.query(func.max(Cds.cds_id)).as_scalar(),
+    )
+
+
+def invalidate_data_version():
+    '''Force the data version to be looked up again on next access'''
+    with _VERSION_LOCK:
+        _VERSION_STATE['version'] = None
+        _VERSION_STATE['checked'] = 0.0
+
+
+class VersionedCache(object):
+    '''Lazily build a value and rebuild it when the data version changes'''
+    def __init__(self, builder):
+        self.builder = builder
+        self._version = None
+        self._value = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        '''Get the cached value, (re)building it if needed'''
+        version = current_data_version()
+        if self._version == version:
+            return self._value
+
+        with self._lock:
+            if self._version != version:
+                self._value = self.builder()
+                self._version = version
+        return self._value
+
+    def clear(self):
+        '''Drop the cached value'''
+        with self._lock:
+            self._value = None
+            self._version = None
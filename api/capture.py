@@ -0,0 +1,103 @@
+'''Sampled capture of real requests for replaying them later
+
+If CAPTURE_DIR is set, a CAPTURE_RATE fraction of the search, export, available
+and tree requests is written to that directory as one JSON object per line:
+the time it arrived, endpoint, method, path, query string, JSON body, the
+normalized search.Query of searches and exports, duration and status. Every
+process writes its own file, rotated when it grows beyond CAPTURE_MAX_BYTES.
+benchmarks/replay.py sends the captured requests to a server again.
+
+The duration of streamed exports only covers building the response, not
+sending it.
+'''
+
+import json
+import logging
+from logging.handlers import RotatingFileHandler
+import os
+import random
+import socket
+import threading
+import time
+
+from flask import g, request
+
+CAPTURED_ENDPOINTS = frozenset([
+    'search',
+    'export',
+    'export_get',
+    'search_protein',
+    'similar_to_cluster',
+    'similar_to_features',
+    'list_available',
+    'get_taxon_tree',
+    'get_taxon_tree_massload',
+    'search_taxon_tree',
+    'get_sec_met_tree',
+])
+
+CAPTURE_LOGGER = logging.getLogger(__name__)
+CAPTURE_LOGGER.propagate = False
+
+_CAPTURE_STATE = {'path': None}
+_CAPTURE_LOCK = threading.Lock()
+
+
+def capture_record(query=None):
+    '''Get the capture record of the current request, the query being its search.Query if any'''
+    body = request.get_json(silent=True)
+    if isinstance(body, dict) and query is not None:
+        body = dict(body)
+        body.pop('search_string', None)
+        body['query'] = query.to_json()
+
+    return {
+        'timestamp': g.capture_start,
+        'endpoint': request.endpoint,
+        'method': request.method,
+        'path': request.path,
+        'args': request.args.to_dict(),
+        'body': body,
+        'query': query.to_json() if query is not None else None,
+    }
+
+
+def _open_capture_file(directory, max_bytes):
+    '''Point the capture logger at this process' file in directory'''
+    with _CAPTURE_LOCK:
+        if _CAPTURE_STATE['path'] == directory:
+            return
+        for handler in list(CAPTURE_LOGGER.handlers):
+            CAPTURE_LOGGER.removeHandler(handler)
+            handler.close()
+        os.makedirs(directory, exist_ok=True)
+        filename = 'requests-{}-{}.ndjson'.format(socket.gethostname(), os.getpid())
+        CAPTURE_LOGGER.addHandler(RotatingFileHandler(os.path.join(directory, filename),
+                                                      maxBytes=max_bytes, backupCount=10))
+        CAPTURE_LOGGER.setLevel(logging.INFO)
+        _CAPTURE_STATE['path'] = directory
+
+
+def init_capture(app):
+    '''Capture a sample of the requests if CAPTURE_DIR is configured'''
+    @app.before_request
+    def sample_request():
+        directory = app.config.get('CAPTURE_DIR')
+        if not directory or request.endpoint not in CAPTURED_ENDPOINTS:
+            return
+        if random.random() >= app.config.get('CAPTURE_RATE', 0.01):
+            return
+        g.capture_start = time.time()
+
+    @app.after_request
+    def capture_request(response):
+        if 'capture_start' not in g:
+            return response
+
+        record = capture_record(g.get('query'))
+        record['duration'] = time.time() - g.capture_start
+        record['status'] = response.status_code
+
+        _open_capture_file(app.config['CAPTURE_DIR'], app.config.get('CAPTURE_MAX_BYTES', 100 * 1024 * 1024))
+        CAPTURE_LOGGER.info(json.dumps(record, sort_keys=True, default=str))
+        return response
@@ -29,6 +29,11 @@ def internal_server_error(error):
     return make_response(jsonify({'error': 'Internal server error'}), 500)
 
 
+@app.errorhandler(503)
+def service_unavailable(error):
+    return make_response(jsonify({'error': 'Service unavailable'}), 503)
+
+
 @app.errorhandler(TooManyResults)
 def too_many_results(error):
     return make_response(jsonify(error.to_dict()), 400)
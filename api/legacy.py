@@ -1,8882 +1,108 @@
+'''Accessions contained in version 1 of the antiSMASH database
+
+The accessions live in a sorted, fixed-width binary file next to this module.
+It is memory-mapped on the first lookup, so all worker processes share the same
+read-only pages instead of each building a large Python set at import time.
+
+To regenerate the file from a text file with one accession per line, run
+    python -m api.legacy accessions.txt
+'''
+
+import mmap
+import os
+import struct
+import sys
+import threading
+
+ACCESSION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'legacy_accessions.dat')
+
+
+class AccessionSet(object):
+    '''Read-only set of accessions backed by a sorted, fixed-width file
+
+    The file starts with a header of magic bytes, the record width and the
+    number of records, followed by the NUL-padded ASCII accessions in sorted order.
+    '''
+    MAGIC = b'ASACCv1\x00'
+    HEADER = struct.Struct('<8sII')
+
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+        self._width = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        '''Memory-map the accession file if that didn't happen yet'''
+        if self._data is not None:
+            return
+
+        with self._lock:
+            if self._data is not None:
+                return
+            with open(self.path, 'rb') as handle:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, width, count = self.HEADER.unpack_from(data, 0)
+            if magic != self.MAGIC or len(data) != self.HEADER.size + width * count:
+                raise ValueError('Invalid accession file {!r}'.format(self.path))
+            self._width = width
+            self._count = count
+            self._data = data
+
+    def _record(self, idx):
+        start = self.HEADER.size + idx * self._width
+        return self._data[start:start + self._width]
+
+    def __len__(self):
+        self._load()
+        return self._count
+
+    def __iter__(self):
+        self._load()
+        for idx in range(self._count):
+            yield self._record(idx).rstrip(b'\x00').decode('ascii')
+
+    def __contains__(self, accession):
+        self._load()
+        try:
+            key = accession.encode('ascii')
+        except (AttributeError, UnicodeEncodeError):
+            return False
+        if not key or len(key) > self._width:
+            return False
+        key = key.ljust(self._width, b'\x00')
+
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            record = self._record(mid)
+            if record < key:
+                low = mid + 1
+            elif record > key:
+                high = mid
+            else:
+                return True
+        return False
+
+
+def write_accession_file(accessions, path):
+    '''Write accessions to a sorted, fixed-width file readable by AccessionSet'''
+    records = sorted(set(acc.encode('ascii') for acc in accessions))
+    width = max(map(len, records)) if records else 0
+    with open(path, 'wb') as handle:
+        handle.write(AccessionSet.HEADER.pack(AccessionSet.MAGIC, width, len(records)))
+        for record in records:
+            handle.write(record.ljust(width, b'\x00'))
+
 
 # These accessions are contained in version1 of the DB
-dbv1_accessions = set([
-    'AE000511',
-    'AE000520',
-    'AE000512',
-    'AE001363',
-    'AE001439',
-    'AE001273',
-    'AE002098',
-    'AE004092',
-    'AE004439',
-    'AE004091',
-    'AE005176',
-    'AE004969',
-    'AE005672',
-    'CP000232',
-    'AE006470',
-    'AE006914',
-    'AE007317',
-    'AE008691',
-    'CP000237',
-    'AE009440',
-    'CP001631',
-    'AE009948',
-    'AE009949',
-    'AE009951',
-    'AE013218',
-    'AE013598',
-    'AE014074',
-    'CP000260',
-    'AE014133',
-    'AE015450',
-    'AE015451',
-    'AE015924',
-    'AE016822',
-    'AE016827',
-    'CP001657',
-    'CP001666',
-    'CP001682',
-    'AE017125',
-    'AE017143',
-    'AE017197',
-    'AE017198',
-    'CP000381',
-    'AE017226',
-    'AE017243',
-    'AE017244',
-    'AE017245',
-    'AE017262',
-    'AE017263',
-    'CP001721',
-    'AE017308',
-    'CP000394',
-    'AE017321',
-    'AE017332',
-    'AE017354',
-    'AF222894',
-    'AJ749949',
-    'AJ965256',
-    'AJ938182',
-    'CP000409',
-    'AL111168',
-    'AL157959',
-    'CP000412',
-    'CP000437',
-    'AM167904',
-    'CP001750',
-    'AM233362',
-    'AM286280',
-    'AM263198',
-    'CP007013',
-    'AM295007',
-    'AM295250',
-    'AM398681',
-    'CP006999',
-    'CP000481',
-    'AM421808',
-    'AM743169',
-    'CP007030',
-    'AM884176',
-    'AM884177',
-    'AM889136',
-    'CP000157',
-    'AM933172',
-    'CP000235',
-    'AM946015',
-    'AM946016',
-    'AM946981',
-    'AP006628',
-    'AP006840',
-    'AP007255',
-    'AP007281',
-    'AP008230',
-    'CP000253',
-    'CP000261',
-    'AP008981',
-    'CP001658',
-    'AP009180',
-    'AP009256',
-    'AP009324',
-    'AP009332',
-    'AP009333',
-    'AP009351',
-    'AP009380',
-    'CP000303',
-    'CP001668',
-    'CP000382',
-    'AP010655',
-    'AP010888',
-    'AP010889',
-    'CP000387',
-    'AP010935',
-    'CP000407',
-    'CP000410',
-    'CP000413',
-    'AP011114',
-    'AP011533',
-    'AP011540',
-    'AP011548',
-    'AP011940',
-    'AP011945',
-    'AP012027',
-    'CP000448',
-    'AP012030',
-    'AP012046',
-    'AP012047',
-    'AP012051',
-    'AP012053',
-    'AP012054',
-    'CP000479',
-    'AP012202',
-    'AP012203',
-    'CP000487',
-    'AP012209',
-    'CP001759',
-    'AP012281',
-    'AP012284',
-    'AP012303',
-    'AP012306',
-    'CP007025',
-    'CP001817',
-    'AP012323',
-    'AP012324',
-    'AP012325',
-    'AP012326',
-    'AP012327',
-    'AP012330',
-    'AP012331',
-    'AP012332',
-    'AP012333',
-    'AP012334',
-    'AP012335',
-    'AP012336',
-    'AP012337',
-    'CP000158',
-    'CP000236',
-    'AP012491',
-    'AP012492',
-    'CP000246',
-    'CP001621',
-    'CP000259',
-    'AP012600',
-    'CP000262',
-    'CP000283',
-    'CP001633',
-    'AP013070',
-    'CP000361',
-    'AP013105',
-    'AP013353',
-    'CP001662',
-    'AP014520',
-    'CP001672',
-    'AP014523',
-    'CP000408',
-    'AP014563',
-    'AP014584',
-    'AP014595',
-    'AP014652',
-    'CP000422',
-    'BX293980',
-    'BX571856',
-    'BX897699',
-    'BX897700',
-    'CP000449',
-    'CP000003',
-    'CP000012',
-    'CP000016',
-    'CP000017',
-    'CP000025',
-    'CP000027',
-    'CP000026',
-    'CP000030',
-    'CP000033',
-    'CP007022',
-    'CP000056',
-    'CP000057',
-    'CP000492',
-    'CP007003',
-    'CP000082',
-    'CP000513',
-    'CP000084',
-    'CP000087',
-    'CP000088',
-    'CP000524',
-    'CP000560',
-    'CP000096',
-    'CP000107',
-    'CP000108',
-    'CP000109',
-    'CP000112',
-    'CP000114',
-    'CP007036',
-    'CP007031',
-    'CP000123',
-    'CP001829',
-    'CP000140',
-    'CP000141',
-    'CP000142',
-    'CP000153',
-    'CP007037',
-    'CP001840',
-    'CP000569',
-    'CP000574',
-    'CP001845',
-    'CP000607',
-    'CP000608',
-    'CP001849',
-    'CP000612',
-    'CP000613',
-    'CP000655',
-    'CP000671',
-    'CP000672',
-    'CP001634',
-    'CP000680',
-    'CP001677',
-    'CP000687',
-    'CP000688',
-    'CP001685',
-    'CP000702',
-    'CP000705',
-    'CP000712',
-    'CP000716',
-    'CP000717',
-    'CP000725',
-    'CP000727',
-    'CP007024',
-    'CP000746',
-    'CP000766',
-    'CP000767',
-    'CP000768',
-    'CP000771',
-    'CP000802',
-    'CP000803',
-    'CP001827',
-    'CP000813',
-    'CP000814',
-    'CP007000',
-    'CP007001',
-    'CP000829',
-    'CP000837',
-    'CP000847',
-    'CP000848',
-    'CP000849',
-    'CP001841',
-    'CP000853',
-    'CP001848',
-    'CP000860',
-    'CP001850',
-    'CP000884',
-    'CP000885',
-    'CP000886',
-    'CP000896',
-    'CP000908',
-    'CP001854',
-    'CP007063',
-    'CP000915',
-    'CP000916',
-    'CP000918',
-    'CP000919',
-    'CP000920',
-    'CP000921',
-    'CP007062',
-    'CP000924',
-    'CP000926',
-    'CP007122',
-    'CP001872',
-    'CP001873',
-    'CP000936',
-    'CP000941',
-    'CP000942',
-    'CP000946',
-    'CP000947',
-    'CP000948',
-    'CP000949',
-    'CP001886',
-    'CP001888',
-    'CP000967',
-    'CP001010',
-    'CP001015',
-    'CP001629',
-    'CP001637',
-    'CP001033',
-    'CP001047',
-    'CP001072',
-    'CP001078',
-    'CP001079',
-    'CP001680',
-    'CP001096',
-    'CP001097',
-    'CP001099',
-    'CP001712',
-    'CP001738',
-    'CP001102',
-    'CP001110',
-    'CP001111',
-    'CP007016',
-    'CP007027',
-    'CP007029',
-    'CP001146',
-    'CP001145',
-    'CP001147',
-    'CP007032',
-    'CP007033',
-    'CP001158',
-    'CP001161',
-    'CP007002',
-    'CP001175',
-    'CP001176',
-    'CP001184',
-    'CP001185',
-    'CP001196',
-    'CP001197',
-    'CP001213',
-    'CP001220',
-    'CP001229',
-    'CP001251',
-    'CP001279',
-    'CP001843',
-    'CP001321',
-    'CP001336',
-    'CP007044',
-    'CP007045',
-    'CP006996',
-    'CP007066',
-    'CP007064',
-    'CP001358',
-    'CP001859',
-    'CP001361',
-    'CP001396',
-    'CP001409',
-    'CP001431',
-    'CP001515',
-    'CP001561',
-    'CP001584',
-    'CP001604',
-    'CP006997',
-    'CP001606',
-    'CP006998',
-    'CP001616',
-    'CP001617',
-    'CP001618',
-    'CP001641',
-    'CP001665',
-    'CP001681',
-    'CP001698',
-    'CP001743',
-    'CP001809',
-    'CP001820',
-    'CP001828',
-    'CP007034',
-    'CP007035',
-    'CP001839',
-    'CP001844',
-    'CP007041',
-    'CP001853',
-    'CP007051',
-    'CP007067',
-    'CP007131',
-    'CP001887',
-    'CP001889',
-    'CP001890',
-    'CP007052',
-    'CP007065',
-    'CP001891',
-    'CP007132',
-    'CP007139',
-    'CP007038',
-    'CP001892',
-    'CP007145',
-    'CP001900',
-    'CP001924',
-    'CP007147',
-    'CP001930',
-    'CP001936',
-    'CP007148',
-    'CP001968',
-    'CP001969',
-    'CP007123',
-    'CP007124',
-    'CP007125',
-    'CP007126',
-    'CP001976',
-    'CP007149',
-    'CP001977',
-    'CP007068',
-    'CP007069',
-    'CP007070',
-    'CP007046',
-    'CP001991',
-    'CP001992',
-    'CP007154',
-    'CP001993',
-    'CP007047',
-    'CP001995',
-    'CP001996',
-    'CP007048',
-    'CP007156',
-    'CP007158',
-    'CP007049',
-    'CP007050',
-    'CP007157',
-    'CP007144',
-    'CP007159',
-    'CP007160',
-    'CP007165',
-    'CP002001',
-    'CP007143',
-    'CP007146',
-    'CP002002',
-    'CP007166',
-    'CP002003',
-    'CP007172',
-    'CP002004',
-    'CP007173',
-    'CP002005',
-    'CP002006',
-    'CP007175',
-    'CP002007',
-    'CP007150',
-    'CP007176',
-    'CP002010',
-    'CP007179',
-    'CP007181',
-    'CP007183',
-    'CP002024',
-    'CP007201',
-    'CP007202',
-    'CP002026',
-    'CP002032',
-    'CP002033',
-    'CP002045',
-    'CP007204',
-    'CP007180',
-    'CP007205',
-    'CP002048',
-    'CP007206',
-    'CP007177',
-    'CP007182',
-    'CP007178',
-    'CP007207',
-    'CP007210',
-    'CP007185',
-    'AE000513',
-    'AE005673',
-    'AE000516',
-    'AE003852',
-    'AE007869',
-    'AE003849',
-    'CP007186',
-    'CP007187',
-    'CP007184',
-    'CP007211',
-    'CP002058',
-    'CP002073',
-    'CP007215',
-    'CP002076',
-    'CP002077',
-    'CP002081',
-    'CP007216',
-    'CP007219',
-    'CP007220',
-    'CP002082',
-    'CP007221',
-    'CP007222',
-    'CP002094',
-    'CP007235',
-    'CP007242',
-    'CP002096',
-    'CP007243',
-    'CP002097',
-    'CP002103',
-    'CP002104',
-    'CP002105',
-    'CP002106',
-    'CP002107',
-    'CP002108',
-    'CP007244',
-    'CP007245',
-    'CP002130',
-    'CP007246',
-    'CP007247',
-    'CP007248',
-    'CP007249',
-    'CP007250',
-    'CP007251',
-    'CP007252',
-    'AE000783',
-    'AE008692',
-    'AE008922',
-    'AE005674',
-    'AE008923',
-    'AE006468',
-    'AE002160',
-    'AE008917',
-    'AE001437',
-    'AE002162',
-    'AE000792',
-    'AE001575',
-    'AE001576',
-    'AE001577',
-    'AE009442',
-    'AE001578',
-    'AE001579',
-    'AE001580',
-    'AE001581',
-    'AE000791',
-    'AE000793',
-    'AE001582',
-    'AE000785',
-    'AE000794',
-    'AE000786',
-    'AE000784',
-    'AE000789',
-    'AE000788',
-    'AE000787',
-    'AE001583',
-    'AE000790',
-    'CP007253',
-    'AE001584',
-    'AE014073',
-    'AE014075',
-    'AE014291',
-    'CP007254',
-    'AE008918',
-    'CP007255',
-    'AE015925',
-    'AE015927',
-    'CP007258',
-    'AE015928',
-    'AE015929',
-    'AE016795',
-    'AE001825',
-    'CP007259',
-    'CP007260',
-    'CP007261',
-    'AE003853',
-    'AE007870',
-    'AE003850',
-    'AE003851',
-    'AE016825',
-    'AE001827',
-    'AE001826',
-    'AE015926',
-    'AE014292',
-    'AF528097',
-    'AE009443',
-    'AE016828',
-    'AE016830',
-    'CP007262',
-    'CP007263',
-    'AE016877',
-    'AE016853',
-    'AE016879',
-    'AE016958',
-    'AE001438',
-    'CP007267',
-    'AE017180',
-    'AE017194',
-    'AE017220',
-    'AE017221',
-    'AE008924',
-    'AE008925',
-    'AF386526',
-    'AE006471',
-    'AE017223',
-    'AE017225',
-    'AE016829',
-    'AE016833',
-    'AE016831',
-    'AE016832',
-    'AE017222',
-    'AE017224',
-    'AE016878',
-    'AY509004',
-    'AE016855',
-    'AE016854',
-    'AY509003',
-    'AE007872',
-    'AE007871',
-    'AE015930',
-    'AE015931',
-    'AE015932',
-    'AE015933',
-    'AE015934',
-    'AE015935',
-    'AE017282',
-    'CP007269',
-    'AE017283',
-    'AE017285',
-    'AE017333',
-    'AE017334',
-    'AE017355',
-    'AE017286',
-    'AE016796',
-    'CP007271',
-    'CP007272',
-    'AL009126',
-    'AL123456',
-    'AL591688',
-    'CP007273',
-    'CP007276',
-    'CP007280',
-    'CP007282',
-    'CP007283',
-    'CP007256',
-    'CP007257',
-    'AL954747',
-    'AY171301',
-    'AM039952',
-    'CP007285',
-    'AM040264',
-    'AM180252',
-    'AM180355',
-    'CP007286',
-    'AM236080',
-    'CP007288',
-    'AM260479',
-    'AM260522',
-    'AM286415',
-    'AM286690',
-    'AM408590',
-    'AM412059',
-    'AM412317',
-    'AM180253',
-    'AM180254',
-    'AM180255',
-    'AM420293',
-    'CP007291',
-    'AM711867',
-    'AM746676',
-    'AM260523',
-    'AM747720',
-    'AM040265',
-    'AM849034',
-    'CP007292',
-    'AE017195',
-    'CP007312',
-    'AE006469',
-    'AM889285',
-    'AM920689',
-    'CP007329',
-    'AM933173',
-    'CP007332',
-    'AM942444',
-    'AM942759',
-    'CP007333',
-    'CP007360',
-    'CP000047',
-    'AM990992',
-    'AE017336',
-    'AP006618',
-    'AP006627',
-    'AP006716',
-    'AE017335',
-    'AL591985',
-    'AM260480',
-    'CP007409',
-    'AM180356',
-    'AP006841',
-    'CP007425',
-    'CP007434',
-    'AP007209',
-    'AM039951',
-    'AM039949',
-    'AM849035',
-    'AM849036',
-    'AM747721',
-    'AM990993',
-    'AM889287',
-    'AM889286',
-    'AY305378',
-    'AM039948',
-    'AM039950',
-    'AM711865',
-    'AM711866',
-    'AM286416',
-    'AP008232',
-    'AM412318',
-    'AP008934',
-    'AM236084',
-    'AP008937',
-    'AP008955',
-    'AP008957',
-    'AP008971',
-    'AP009044',
-    'AP009049',
-    'AP009152',
-    'AM236085',
-    'CP007442',
-    'AM236086',
-    'AP009153',
-    'AM236081',
-    'AP008972',
-    'AM236082',
-    'AM236083',
-    'AP008233',
-    'AP008234',
-    'AP008235',
-    'AP008935',
-    'AP008936',
-    'AP009045',
-    'AP009050',
-    'AM990994',
-    'AM990995',
-    'AP006717',
-    'AP006718',
-    'AP006719',
-    'AP009240',
-    'CP007446',
-    'CP007448',
-    'AM942760',
-    'AP009378',
-    'AP009384',
-    'AP009385',
-    'AP009389',
-    'CP007456',
-    'AP009484',
-    'AP009493',
-    'CP007457',
-    'CP007473',
-    'AP010803',
-    'AP010890',
-    'CP007475',
-    'AP010904',
-    'AP010918',
-    'CP007476',
-    'CP007477',
-    'CP007478',
-    'CP007479',
-    'CP007458',
-    'AM747722',
-    'CP007480',
-    'CP007481',
-    'AP010946',
-    'AP006842',
-    'AP010953',
-    'AP010958',
-    'CP007482',
-    'AP010960',
-    'CP007483',
-    'AP010968',
-    'AP010969',
-    'CP007494',
-    'CP007495',
-    'AP011112',
-    'CP007502',
-    'AM747723',
-    'CP007505',
-    'AP009485',
-    'AP011115',
-    'AP009486',
-    'AP011121',
-    'CP007507',
-    'CP007511',
-    'AP009487',
-    'AP009488',
-    'AP009489',
-    'AP009490',
-    'AP011122',
-    'AP009491',
-    'AP009492',
-    'AP006619',
-    'AP011128',
-    'AP011135',
-    'AP011142',
-    'AP006620',
-    'AP011149',
-    'AP010891',
-    'AP010892',
-    'AP011156',
-    'AP007211',
-    'AP011163',
-    'AP007212',
-    'AP011129',
-    'AP011136',
-    'AP011123',
-    'AP011143',
-    'AP011130',
-    'AP011137',
-    'AP007213',
-    'AP007214',
-    'AP007210',
-    'AP011170',
-    'AP011529',
-    'AP009386',
-    'CP007520',
-    'AP011541',
-    'AP009241',
-    'AP010804',
-    'CP007522',
-    'AP009242',
-    'AP011941',
-    'AP009243',
-    'AP011943',
-    'CP007523',
-    'AP009244',
-    'AP009245',
-    'AP009246',
-    'AP011957',
-    'AP009379',
-    'CP007449',
-    'AP008932',
-    'AP012029',
-    'CP007450',
-    'AP010947',
-    'AP010805',
-    'AP010806',
-    'AP010807',
-    'AP011530',
-    'AP011150',
-    'AP011157',
-    'AP011124',
-    'AP008933',
-    'CP007528',
-    'AP008931',
-    'AP012032',
-    'AP012035',
-    'AP012044',
-    'AP011144',
-    'AP011131',
-    'AP011164',
-    'AP011125',
-    'AP011126',
-    'AP011127',
-    'AP010905',
-    'AP010906',
-    'AP009387',
-    'AP012050',
-    'AP012052',
-    'CP007530',
-    'AP012057',
-    'CP007531',
-    'CP007532',
-    'AP009388',
-    'AP011942',
-    'AP012157',
-    'AP012160',
-    'AP012167',
-    'AP012159',
-    'AP011171',
-    'AP010948',
-    'AP010949',
-    'AP010950',
-    'AP010951',
-    'AP010952',
-    'AP011944',
-    'AP012204',
-    'CP007533',
-    'AP012206',
-    'CP007534',
-    'CP007508',
-    'CP007540',
-    'AP012280',
-    'AP012282',
-    'AP010959',
-    'AP010961',
-    'AP012292',
-    'AP010954',
-    'AP010955',
-    'AP010962',
-    'AP010956',
-    'AP010957',
-    'AP010963',
-    'AP012319',
-    'AP012322',
-    'CP007547',
-    'AP010964',
-    'AP010965',
-    'AP012168',
-    'AP012169',
-    'AP012170',
-    'AP012171',
-    'AP012172',
-    'AP011542',
-    'AP012173',
-    'AP012174',
-    'AP012175',
-    'AP012176',
-    'AP012036',
-    'CP007529',
-    'CP007557',
-    'CP007559',
-    'AP012283',
-    'AP012037',
-    'AP012033',
-    'AP012038',
-    'AP012039',
-    'AP012161',
-    'AP012040',
-    'AP012041',
-    'AP012042',
-    'AP012162',
-    'AP012043',
-    'AP012544',
-    'AP012547',
-    'AP012555',
-    'AP012163',
-    'AP012164',
-    'AP012165',
-    'AP012166',
-    'AP012338',
-    'AP012340',
-    'AP012342',
-    'AP011958',
-    'AP012344',
-    'AP011959',
-    'AP012495',
-    'AP012496',
-    'CP007563',
-    'CP007564',
-    'AP012158',
-    'AP012541',
-    'CP007567',
-    'AP012601',
-    'AP012603',
-    'AP012976',
-    'AP013036',
-    'AP012045',
-    'AP013044',
-    'AP011118',
-    'AP013045',
-    'AP013063',
-    'AP011119',
-    'AP011120',
-    'AP011116',
-    'CP007581',
-    'AP013066',
-    'AP012299',
-    'CP007585',
-    'CP007598',
-    'AP013068',
-    'AP012293',
-    'AP012300',
-    'AP012294',
-    'AP011117',
-    'CP007601',
-    'AP012301',
-    'AP013072',
-    'AP012295',
-    'AP012296',
-    'AP012297',
-    'AP012345',
-    'AP012339',
-    'AP012545',
-    'AP012298',
-    'AP013357',
-    'AP014522',
-    'AP012602',
-    'AP014524',
-    'AP014547',
-    'CP007603',
-    'AP014565',
-    'CP007607',
-    'AP014573',
-    'AP014525',
-    'AP012546',
-    'AP012542',
-    'AP012543',
-    'AP014653',
-    'AP014680',
-    'CP007639',
-    'CP007641',
-    'AP014690',
-    'AP014681',
-    'AP014682',
-    'CP007558',
-    'CP007659',
-    'CP007602',
-    'AP013041',
-    'AP013040',
-    'AP013039',
-    'AP014881',
-    'AP014864',
-    'CP007666',
-    'AP013038',
-    'CP007668',
-    'BA000030',
-    'BA000043',
-    'AP013037',
-    'CP007691',
-    'BX571857',
-    'CP007692',
-    'AP013067',
-    'BX571965',
-    'BX950851',
-    'CP000001',
-    'CP000002',
-    'CP007568',
-    'CP007599',
-    'CP007582',
-    'CP000009',
-    'AP012556',
-    'CP000010',
-    'CP007699',
-    'CP000013',
-    'AP013064',
-    'AP013065',
-    'CP000020',
-    'CP000023',
-    'CP000024',
-    'CP007705',
-    'CP000029',
-    'AP014882',
-    'CP000014',
-    'CP000015',
-    'BX571858',
-    'AP014883',
-    'AP014884',
-    'AP014885',
-    'CP000031',
-    'CP000036',
-    'CP000038',
-    'CP000046',
-    'AP013069',
-    'CP007715',
-    'CP007709',
-    'CP007712',
-    'CP007719',
-    'CP000050',
-    'CP000051',
-    'CP000053',
-    'CP007720',
-    'AP006520',
-    'AP014566',
-    'CP007642',
-    'CP000058',
-    'CP000061',
-    'BX571966',
-    'CP007612',
-    'CP000075',
-    'CP007608',
-    'CP007615',
-    'CP000004',
-    'CP007706',
-    'CP000076',
-    'CP007643',
-    'CP000005',
-    'CP000006',
-    'CP000007',
-    'CP007616',
-    'CP000052',
-    'CP007644',
-    'CP007613',
-    'CP000008',
-    'CP000089',
-    'CP000090',
-    'CP000091',
-    'CP000062',
-    'CP000063',
-    'CP000064',
-    'CP000065',
-    'CP000094',
-    'CP007609',
-    'CP007610',
-    'CP007611',
-    'CP007614',
-    'CP000011',
-    'CP000103',
-    'CP007726',
-    'CP007664',
-    'CP007665',
-    'CP000104',
-    'CP000105',
-    'CP000106',
-    'CP000054',
-    'CP000021',
-    'CP000055',
-    'CP000022',
-    'CP007718',
-    'CP007727',
-    'CP007728',
-    'CP007729',
-    'CP007730',
-    'CP007710',
-    'CP007731',
-    'CP007739',
-    'CP007741',
-    'CP007740',
-    'CP007732',
-    'CP007733',
-    'CP007734',
-    'CP007645',
-    'CP000028',
-    'CP000113',
-    'CP007721',
-    'CP000115',
-    'CP000116',
-    'CP007760',
-    'CP000124',
-    'CP007761',
-    'CP000045',
-    'CP000127',
-    'CP007763',
-    'CP007765',
-    'CP000040',
-    'CP000133',
-    'CP000139',
-    'AP014865',
-    'CP000041',
-    'CP000042',
-    'CP000043',
-    'CP000044',
-    'AP014866',
-    'AP014867',
-    'AP014868',
-    'AP014869',
-    'AP014870',
-    'AP014871',
-    'AP014872',
-    'CP007762',
-    'CP007764',
-    'CP000126',
-    'CP007713',
-    'CP007714',
-    'CP007766',
-    'CP000148',
-    'CP007770',
-    'CP007771',
-    'CP007767',
-    'CP007768',
-    'CP000032',
-    'CP000154',
-    'CP000155',
-    'CP000156',
-    'CP000037',
-    'CP000227',
-    'CP000230',
-    'CP000641',
-    'CP000642',
-    'CP000643',
-    'CP000039',
-    'CP000233',
-    'CP007772',
-    'CP007773',
-    'CP007774',
-    'CP007775',
-    'AP005645',
-    'CP007776',
-    'CP000241',
-    'CP000243',
-    'CP007777',
-    'CP000245',
-    'CP007778',
-    'CP000247',
-    'CP000248',
-    'CP000250',
-    'CP000251',
-    'CP000252',
-    'CP000255',
-    'CP000234',
-    'AF488831',
-    'CP000059',
-    'CP007790',
-    'CP000060',
-    'CP007802',
-    'CP007803',
-    'CP007804',
-    'CP007805',
-    'AF488832',
-    'CP000125',
-    'CP007806',
-    'CP007735',
-    'CP007810',
-    'CP007736',
-    'CP000266',
-    'CP000267',
-    'CP000242',
-    'CP000270',
-    'CP008698',
-    'CP008700',
-    'CP000149',
-    'CP000282',
-    'CP000134',
-    'CP000284',
-    'CP000093',
-    'CP000285',
-    'CP000301',
-    'CP000092',
-    'CP000135',
-    'CP000136',
-    'CP000137',
-    'CP000304',
-    'CP008714',
-    'CP007792',
-    'CP007791',
-    'CP000231',
-    'CP008739',
-    'CP000138',
-    'CP000319',
-    'CP000323',
-    'CP000325',
-    'CP000256',
-    'CP000257',
-    'CP000258',
-    'CP000352',
-    'CP007801',
-    'CP000356',
-    'CP000359',
-    'CP000358',
-    'CP000856',
-    'U80928',
-    'CP000360',
-    'CP000676',
-    'CP000362',
-    'CP000677',
-    'CP000378',
-    'CP008740',
-    'CP000228',
-    'CP008744',
-    'CP000383',
-    'CP000229',
-    'CP000386',
-    'CP008745',
-    'CP008777',
-    'CP008784',
-    'CP008787',
-    'CP000244',
-    'CP000379',
-    'CP008778',
-    'CP000464',
-    'CP008783',
-    'CP000465',
-    'CP000466',
-    'CP000467',
-    'CP000380',
-    'CP007808',
-    'CP007807',
-    'CP000411',
-    'CP000324',
-    'CP008796',
-    'CP008701',
-    'CP000414',
-    'CP000416',
-    'CP008797',
-    'CP000419',
-    'CP008801',
-    'CP000420',
-    'CP000421',
-    'CP000415',
-    'CP000417',
-    'CP000418',
-    'CP008798',
-    'CP008799',
-    'CP008800',
-    'CP000268',
-    'CP000423',
-    'CP000424',
-    'CP000271',
-    'CP000425',
-    'CP000431',
-    'CP000436',
-    'CP000438',
-    'CP000439',
-    'CP008808',
-    'CP000019',
-    'CP008809',
-    'CP000426',
-    'CP000427',
-    'CP000428',
-    'CP000429',
-    'CP000430',
-    'CP000272',
-    'CP000357',
-    'CP000320',
-    'CP000450',
-    'CP000453',
-    'CP000458',
-    'CP000321',
-    'CP000462',
-    'CP000463',
-    'CP000322',
-    'CP000451',
-    'CP000452',
-    'CP000459',
-    'CP000353',
-    'CP000468',
-    'CP000471',
-    'CP000473',
-    'CP000474',
-    'CP008810',
-    'CP000480',
-    'CP008816',
-    'CP000482',
-    'CP000485',
-    'CP000489',
-    'CP008823',
-    'CP000511',
-    'CP000512',
-    'CP008827',
-    'CP008811',
-    'CP008812',
-    'CP008831',
-    'CP000514',
-    'CP000517',
-    'CP000521',
-    'CP008884',
-    'CP000355',
-    'CP000354',
-    'CP000526',
-    'CP000527',
-    'CP008891',
-    'CP008894',
-    'CP000529',
-    'CP000538',
-    'CP008815',
-    'CP000542',
-    'CP008814',
-    'CP008909',
-    'CP000544',
-    'CP000546',
-    'CP000548',
-    'CP008911',
-    'CP000557',
-    'CP000491',
-    'CP000568',
-    'CP000572',
-    'CP000490',
-    'CP000483',
-    'CP008824',
-    'CP000475',
-    'CP000484',
-    'CP000549',
-    'DQ381420',
-    'CP000550',
-    'CP000577',
-    'CP008825',
-    'DQ517526',
-    'CP000476',
-    'CP008892',
-    'CP000605',
-    'CP008826',
-    'CP008921',
-    'CP000611',
-    'CP000486',
-    'CP008928',
-    'CP008893',
-    'CP000614',
-    'CP000626',
-    'CP000528',
-    'CP008910',
-    'CP000628',
-    'CP000460',
-    'CP000633',
-    'CP008912',
-    'CP008934',
-    'CP000647',
-    'CP008832',
-    'CP000515',
-    'CP008833',
-    'CP008984',
-    'CP000516',
-    'CP000545',
-    'CP000525',
-    'CP008989',
-    'CP000522',
-    'CP000523',
-    'CP000656',
-    'CP000661',
-    'CP000547',
-    'CP000432',
-    'CP008992',
-    'CP000433',
-    'CP000434',
-    'CP008987',
-    'CP008988',
-    'CP000662',
-    'CP008991',
-    'CP000663',
-    'CP000664',
-    'CP000665',
-    'CP000666',
-    'CP000648',
-    'CP000649',
-    'CP000650',
-    'CP000651',
-    'CP000652',
-    'CP000657',
-    'CP000658',
-    'CP000659',
-    'CP000627',
-    'CP000461',
-    'AF538868',
-    'CP000530',
-    'AF538869',
-    'CP000558',
-    'CP000673',
-    'CP000675',
-    'CP000679',
-    'CP000531',
-    'CP000683',
-    'CP000532',
-    'CP000685',
-    'CP000533',
-    'CP000578',
-    'CP000534',
-    'CP000535',
-    'CP000536',
-    'CP000537',
-    'CP000543',
-    'CP000697',
-    'CP000698',
-    'CP000699',
-    'CP000573',
-    'CP000703',
-    'CP000708',
-    'CP000684',
-    'CP000579',
-    'CP000709',
-    'CP000674',
-    'CP000689',
-    'CP000704',
-    'CP000690',
-    'CP000691',
-    'CP000692',
-    'CP000693',
-    'CP000694',
-    'CP000695',
-    'CP000696',
-    'CP000700',
-    'CP000701',
-    'CP008935',
-    'CP000721',
-    'CP000724',
-    'CP008927',
-    'CP000726',
-    'CP000615',
-    'CP000616',
-    'CP000617',
-    'CP000618',
-    'CP000619',
-    'CP000620',
-    'CP000621',
-    'CP000634',
-    'CP000728',
-    'CP000730',
-    'CP000733',
-    'CP009019',
-    'CP009022',
-    'CP009037',
-    'CP009028',
-    'CP009034',
-    'CP009042',
-    'CP009040',
-    'CP009031',
-    'CP000639',
-    'CP000635',
-    'CP000636',
-    'CP000638',
-    'CP000637',
-    'CP000735',
-    'CP009041',
-    'CP000731',
-    'CP000729',
-    'CP009017',
-    'CP009018',
-    'CP009026',
-    'CP009020',
-    'CP009027',
-    'CP009021',
-    'CP009035',
-    'CP009029',
-    'CP009036',
-    'CP009030',
-    'CP009038',
-    'CP009032',
-    'CP009039',
-    'CP009033',
-    'CP000629',
-    'CP009045',
-    'CP000736',
-    'CP000738',
-    'CP000744',
-    'CP009049',
-    'CP000747',
-    'CP000750',
-    'CP000758',
-    'CP000764',
-    'CP009054',
-    'CP000774',
-    'CP000776',
-    'CP000781',
-    'CP000783',
-    'CP000789',
-    'CP000792',
-    'CP000632',
-    'CP000630',
-    'CP000800',
-    'CP000631',
-    'CP000804',
-    'CP009058',
-    'CP000737',
-    'CP000812',
-    'CP000817',
-    'CP000819',
-    'CP000822',
-    'CP009055',
-    'CP000826',
-    'CP000830',
-    'CP009060',
-    'CP009070',
-    'CP009069',
-    'CP009083',
-    'CP009084',
-    'CP009071',
-    'CP009085',
-    'CP009086',
-    'CP009068',
-    'CP009061',
-    'CP000775',
-    'CP009062',
-    'CP009063',
-    'CP000739',
-    'CP009087',
-    'CP009088',
-    'CP009064',
-    'CP009089',
-    'CP009065',
-    'CP009090',
-    'CP009066',
-    'CP009067',
-    'CP009059',
-    'CP009091',
-    'CP000759',
-    'CP000794',
-    'CP000793',
-    'CP000748',
-    'CP000854',
-    'CP000857',
-    'CP000859',
-    'CP000863',
-    'CP000868',
-    'CP000872',
-    'CP000875',
-    'CP000765',
-    'CP000880',
-    'CP000740',
-    'CP000751',
-    'CP000752',
-    'CP000887',
-    'CP000741',
-    'CP000873',
-    'CP000888',
-    'CP000869',
-    'CP000864',
-    'CP000865',
-    'CP000870',
-    'CP000876',
-    'CP000877',
-    'CP000871',
-    'CP000760',
-    'CP000790',
-    'CP000761',
-    'CP000762',
-    'CP000763',
-    'CP000890',
-    'CP009092',
-    'CP000784',
-    'CP000785',
-    'CP000903',
-    'CP000909',
-    'CP000910',
-    'CP000782',
-    'CP000911',
-    'CP009093',
-    'CP009102',
-    'CP000831',
-    'CP009110',
-    'CP009117',
-    'CP009124',
-    'CP009151',
-    'CP009161',
-    'CP009162',
-    'CP000796',
-    'CP000832',
-    'CP000801',
-    'CP000798',
-    'CP000797',
-    'CP000799',
-    'CP000833',
-    'CP000795',
-    'CP000834',
-    'CP000835',
-    'CP000818',
-    'CP000922',
-    'CP009118',
-    'CP009119',
-    'CP009165',
-    'CP000930',
-    'CP000889',
-    'CP000932',
-    'CP000934',
-    'CP000791',
-    'CP000824',
-    'CP000823',
-    'CP000937',
-    'CP000827',
-    'CP000939',
-    'CP009166',
-    'CP000912',
-    'CP000933',
-    'CP009150',
-    'CP009163',
-    'CP009160',
-    'CP000938',
-    'CP009103',
-    'CP009164',
-    'CP000904',
-    'CP000940',
-    'CP009167',
-    'CP000905',
-    'CP000906',
-    'CP000858',
-    'CP000958',
-    'CP000962',
-    'CP000964',
-    'CP000970',
-    'CP009208',
-    'CP000976',
-    'CP000993',
-    'CP001001',
-    'CP000977',
-    'CP000978',
-    'CP000979',
-    'CP000994',
-    'CP000995',
-    'CP000996',
-    'CP000980',
-    'CP000997',
-    'CP000981',
-    'CP000998',
-    'CP000982',
-    'CP000999',
-    'CP000983',
-    'CP001000',
-    'CP000984',
-    'CP000991',
-    'CP000992',
-    'CP000985',
-    'CP000986',
-    'CP000987',
-    'CP000988',
-    'CP000989',
-    'CP000990',
-    'CP000959',
-    'CP000963',
-    'CP000971',
-    'CP000974',
-    'CP000973',
-    'CP000972',
-    'CP000895',
-    'CP001011',
-    'CP001016',
-    'CP001019',
-    'CP009212',
-    'CP001020',
-    'CP009220',
-    'CP001029',
-    'CP001032',
-    'CP001034',
-    'CP001043',
-    'CP001050',
-    'CP001052',
-    'CP009213',
-    'CP009214',
-    'CP009226',
-    'CP001056',
-    'CP001063',
-    'CP001071',
-    'CP009230',
-    'CP001074',
-    'CP009238',
-    'CP001012',
-    'CP001021',
-    'CP009221',
-    'CP009222',
-    'CP001035',
-    'CP001036',
-    'CP001051',
-    'CP001044',
-    'CP001017',
-    'CP001018',
-    'CP009169',
-    'CP009168',
-    'CP000907',
-    'CP009240',
-    'CP001083',
-    'CP001084',
-    'CP001085',
-    'CP001087',
-    'CP009243',
-    'CP001089',
-    'CP001091',
-    'CP009253',
-    'CP009267',
-    'CP001095',
-    'CP009273',
-    'CP001086',
-    'CP009254',
-    'CP009255',
-    'CP001098',
-    'CP001100',
-    'CP009294',
-    'CP001101',
-    'CP009296',
-    'CP009291',
-    'CP009298',
-    'CP009300',
-    'CP001103',
-    'CP001104',
-    'CP001108',
-    'CP009315',
-    'CP001113',
-    'CP001114',
-    'CP001120',
-    'CP001093',
-    'CP001094',
-    'CP001092',
-    'CP001124',
-    'CP001057',
-    'CP000965',
-    'CP001127',
-    'CP001053',
-    'CP000966',
-    'CP001129',
-    'CP001132',
-    'CP000935',
-    'CP001135',
-    'CP001138',
-    'CP009318',
-    'CP000960',
-    'CP001144',
-    'CP009351',
-    'CP001002',
-    'CP009353',
-    'CP001058',
-    'CP001062',
-    'CP001105',
-    'CP001150',
-    'CP001106',
-    'CP009361',
-    'CP001059',
-    'CP001109',
-    'CP001030',
-    'CP001154',
-    'CP001060',
-    'CP001031',
-    'CP001061',
-    'CP001157',
-    'CP001081',
-    'CP009292',
-    'CP001164',
-    'CP001003',
-    'CP001090',
-    'CP001004',
-    'CP001172',
-    'CP001005',
-    'CP001045',
-    'CP009364',
-    'CP001006',
-    'CP009297',
-    'CP001007',
-    'CP001008',
-    'CP001009',
-    'CP001082',
-    'CP001173',
-    'CP001075',
-    'CP001177',
-    'CP009293',
-    'CP001182',
-    'CP009295',
-    'CP001076',
-    'CP001186',
-    'CP001189',
-    'CP001077',
-    'CP001174',
-    'CP001046',
-    'CP009362',
-    'CP001054',
-    'CP001136',
-    'CP001151',
-    'CP001125',
-    'CP009363',
-    'CP009317',
-    'CP009349',
-    'CP001137',
-    'CP001143',
-    'CP009352',
-    'CP009407',
-    'CP001191',
-    'CP001115',
-    'CP001088',
-    'CP001116',
-    'CP001205',
-    'CP001117',
-    'CP009299',
-    'CP001215',
-    'CP009408',
-    'CP001217',
-    'CP009419',
-    'CP001219',
-    'CP009314',
-    'CP001227',
-    'CP009316',
-    'CP001212',
-    'CP001206',
-    'CP009448',
-    'CP001230',
-    'CP001200',
-    'CP009474',
-    'CP001233',
-    'CP001202',
-    'CP001208',
-    'CP001211',
-    'CP001204',
-    'CP001198',
-    'CP001210',
-    'CP001209',
-    'CP001203',
-    'CP001207',
-    'CP001201',
-    'CP001199',
-    'CP001235',
-    'CP001275',
-    'CP001112',
-    'CP000604',
-    'CP001228',
-    'CP001280',
-    'CP001283',
-    'CP001298',
-    'CP001312',
-    'CP001218',
-    'CP001231',
-    'CP001276',
-    'CP009473',
-    'CP001234',
-    'CP001119',
-    'CP001118',
-    'CP009478',
-    'CP009477',
-    'CP001126',
-    'CP009480',
-    'CP009481',
-    'CP001337',
-    'CP009482',
-    'CP001339',
-    'CP001340',
-    'CP009348',
-    'CP001341',
-    'CP009347',
-    'CP009350',
-    'CP009346',
-    'CP009345',
-    'CP009344',
-    'CP001342',
-    'CP001343',
-    'CP001152',
-    'CP001153',
-    'CP001348',
-    'CP001183',
-    'CP001349',
-    'CP001357',
-    'CP001359',
-    'CP001360',
-    'CP001190',
-    'CP001363',
-    'CP009483',
-    'CP001368',
-    'CP009485',
-    'CP001383',
-    'CP001389',
-    'CP001390',
-    'CP009484',
-    'U00090',
-    'CP000874',
-    'CP001165',
-    'CP001392',
-    'CP001163',
-    'CP001192',
-    'CP001193',
-    'CP001195',
-    'CP001194',
-    'CP001236',
-    'CP001393',
-    'CP001397',
-    'CP001407',
-    'CP009493',
-    'CP001394',
-    'CP001395',
-    'CP001178',
-    'CP001179',
-    'CP009494',
-    'CP001181',
-    'CP001180',
-    'CP001429',
-    'CP001430',
-    'CP001188',
-    'CP009499',
-    'CP001187',
-    'CP001472',
-    'CP009535',
-    'CP001485',
-    'CP001487',
-    'CP001488',
-    'CP002849',
-    'CP001489',
-    'CP001313',
-    'CP001509',
-    'CP001510',
-    'CP001560',
-    'CP009538',
-    'CP001562',
-    'CP001578',
-    'CP001581',
-    'CP001563',
-    'CP001216',
-    'CP009541',
-    'CP001582',
-    'CP009551',
-    'CP001214',
-    'CP001598',
-    'CP001600',
-    'CP001583',
-    'CP001299',
-    'CP001602',
-    'CP009554',
-    'CP001607',
-    'CP001300',
-    'CP001286',
-    'CP001285',
-    'CP001612',
-    'CP001614',
-    'CP001619',
-    'CP001284',
-    'CP001620',
-    'CP001622',
-    'CP001628',
-    'CP001384',
-    'CP001579',
-    'CP001486',
-    'CP009559',
-    'CP009536',
-    'CP001385',
-    'CP001386',
-    'CP001387',
-    'CP001388',
-    'CP001630',
-    'CP001613',
-    'CP009537',
-    'CP001362',
-    'CP001632',
-    'CP009561',
-    'CP001369',
-    'CP001642',
-    'CP009565',
-    'CP009575',
-    'CP009550',
-    'CP001643',
-    'CP001644',
-    'CP001649',
-    'CP001650',
-    'CP001654',
-    'CP001655',
-    'CP001406',
-    'CP001603',
-    'CP001663',
-    'CP009577',
-    'CP001664',
-    'CP009590',
-    'CP001350',
-    'CP009540',
-    'CP001671',
-    'CP001511',
-    'CP009598',
-    'CP009607',
-    'CP001674',
-    'CP001678',
-    'CP001351',
-    'CP009613',
-    'CP001352',
-    'CP009615',
-    'CP009614',
-    'CP001353',
-    'CP001354',
-    'CP001355',
-    'CP001356',
-    'CP009622',
-    'CP001512',
-    'CP001513',
-    'CP001683',
-    'CP001514',
-    'CP001684',
-    'CP001686',
-    'CP001599',
-    'CP009625',
-    'CP009628',
-    'CP001597',
-    'CP001699',
-    'CP001700',
-    'CP001623',
-    'CP001706',
-    'CP001708',
-    'CP001624',
-    'CP001675',
-    'CP001676',
-    'CP009626',
-    'CP001625',
-    'CP001679',
-    'CP001626',
-    'CP001709',
-    'CP009591',
-    'CP001627',
-    'CP009592',
-    'CP009589',
-    'CP009597',
-    'CP001833',
-    'CP009627',
-    'CP001645',
-    'CP001713',
-    'CP001720',
-    'CP009633',
-    'CP001722',
-    'CP001726',
-    'CP001727',
-    'CP001734',
-    'CP001646',
-    'CP001737',
-    'CP001739',
-    'CP009641',
-    'CP001714',
-    'CP001744',
-    'CP001746',
-    'CP001647',
-    'CP001758',
-    'CP001769',
-    'CP001778',
-    'CP001779',
-    'CP009644',
-    'CP001781',
-    'CP001648',
-    'CP001785',
-    'CP009651',
-    'CP001790',
-    'CP001792',
-    'CP009652',
-    'CP009678',
-    'CP001798',
-    'CP009681',
-    'CP009685',
-    'CP009693',
-    'CP009694',
-    'CP001723',
-    'CP001724',
-    'CP001725',
-    'CP001801',
-    'CP001802',
-    'CP001804',
-    'CP009706',
-    'CP001810',
-    'CP001814',
-    'CP001780',
-    'CP001816',
-    'CP001818',
-    'CP009709',
-    'CP001819',
-    'CP001735',
-    'CP001753',
-    'CP001754',
-    'CP001821',
-    'CP001755',
-    'CP001756',
-    'CP001728',
-    'CP001729',
-    'CP001786',
-    'CP001730',
-    'CP001784',
-    'CP001740',
-    'CP001757',
-    'CP001823',
-    'CP001830',
-    'CP001834',
-    'CP001836',
-    'CP009751',
-    'CP001824',
-    'CP001835',
-    'CP001831',
-    'CP001832',
-    'CP001782',
-    'CP001783',
-    'CP001837',
-    'CP009753',
-    'CP009768',
-    'CP009771',
-    'CP009767',
-    'CP009772',
-    'CP009773',
-    'CP009774',
-    'CP001741',
-    'CP001846',
-    'CP009775',
-    'CP009776',
-    'CP009777',
-    'CP009778',
-    'CP001847',
-    'CP009639',
-    'CP009636',
-    'CP009640',
-    'CP009638',
-    'CP009637',
-    'CP009635',
-    'CP009634',
-    'CP001745',
-    'CP001811',
-    'CP001813',
-    'CP001812',
-    'CP001799',
-    'CP001851',
-    'CP001852',
-    'CP009650',
-    'CP009795',
-    'CP009649',
-    'CP001855',
-    'CP009648',
-    'CP009647',
-    'CP009645',
-    'CP009646',
-    'CP001867',
-    'CP009793',
-    'CP009794',
-    'CP001749',
-    'CP001747',
-    'CP001875',
-    'CP001876',
-    'CP001748',
-    'CP001878',
-    'CP001877',
-    'CP001822',
-    'CP001803',
-    'CP009863',
-    'CP009872',
-    'CP001896',
-    'CP001903',
-    'CP001907',
-    'CP001918',
-    'CP001921',
-    'CP001925',
-    'CP001928',
-    'CP001931',
-    'CP001929',
-    'CP001897',
-    'CP001898',
-    'CP001770',
-    'CP001771',
-    'CP001937',
-    'CP001772',
-    'CP001940',
-    'CP001773',
-    'CP001774',
-    'CP001775',
-    'CP001776',
-    'CP001958',
-    'CP001777',
-    'CP001959',
-    'CP001960',
-    'CP001962',
-    'CP001964',
-    'CP009876',
-    'CP001965',
-    'CP001966',
-    'CP009887',
-    'CP001970',
-    'CP001974',
-    'CP009899',
-    'CP009920',
-    'CP001978',
-    'CP009968',
-    'CP001961',
-    'CP001982',
-    'CP001983',
-    'CP001879',
-    'CP001856',
-    'CP009974',
-    'CP001963',
-    'CP001997',
-    'CP001880',
-    'CP001998',
-    'CP001999',
-    'CP002000',
-    'CP009976',
-    'CP009864',
-    'CP009865',
-    'CP001922',
-    'CP009874',
-    'CP001923',
-    'CP010019',
-    'CP010050',
-    'CP001815',
-    'CP002008',
-    'CP002011',
-    'CP002017',
-    'CP001938',
-    'CP002018',
-    'CP002025',
-    'CP010052',
-    'CP001904',
-    'CP009898',
-    'CP001919',
-    'CP009877',
-    'CP001926',
-    'CP002028',
-    'CP009878',
-    'CP009879',
-    'CP001927',
-    'CP001920',
-    'CP001908',
-    'CP002029',
-    'CP001967',
-    'CP010058',
-    'CP002031',
-    'CP001909',
-    'CP001910',
-    'CP002034',
-    'CP001911',
-    'CP001912',
-    'CP001913',
-    'CP010072',
-    'CP002038',
-    'CP001914',
-    'CP001915',
-    'CP002039',
-    'CP002040',
-    'CP001916',
-    'CP001917',
-    'CP002042',
-    'CP010089',
-    'CP002046',
-    'CP002047',
-    'CP010103',
-    'CP001980',
-    'CP002049',
-    'CP002052',
-    'CP009919',
-    'CP002054',
-    'CP009921',
-    'CP002056',
-    'CP001979',
-    'CP002071',
-    'CP010106',
-    'CP001971',
-    'CP009915',
-    'CP009918',
-    'CP009916',
-    'CP009917',
-    'CP001972',
-    'CP002053',
-    'CP010104',
-    'CP002072',
-    'CP002043',
-    'CP002044',
-    'CP010097',
-    'CP010092',
-    'CP002041',
-    'CP010091',
-    'CP010090',
-    'CP010107',
-    'CP010108',
-    'CP010109',
-    'CP010095',
-    'CP010110',
-    'CP010094',
-    'CP010111',
-    'CP010098',
-    'CP010093',
-    'CP010099',
-    'CP010096',
-    'CP010112',
-    'CP002030',
-    'CP002074',
-    'CP009967',
-    'CP001975',
-    'CP009966',
-    'CP009969',
-    'CP009970',
-    'CP009965',
-    'CP002075',
-    'CP002035',
-    'CP002036',
-    'CP010113',
-    'CP002037',
-    'CP002078',
-    'CP002080',
-    'CP002079',
-    'CP002019',
-    'CP002020',
-    'CP009975',
-    'CP010073',
-    'CP010074',
-    'CP010267',
-    'CP002083',
-    'CP002085',
-    'CP002086',
-    'CP002091',
-    'CP002095',
-    'CP001984',
-    'CP001985',
-    'CP001986',
-    'CP001987',
-    'CP010279',
-    'CP001988',
-    'CP001989',
-    'CP010280',
-    'CP010281',
-    'CP002099',
-    'CP001990',
-    'CP002102',
-    'CP010282',
-    'CP010283',
-    'CP002109',
-    'CP002111',
-    'CP002110',
-    'CP010284',
-    'CP002113',
-    'CP002114',
-    'CP002116',
-    'CP002118',
-    'CP002120',
-    'CP002121',
-    'CP002122',
-    'CP002131',
-    'CP002154',
-    'CP002156',
-    'CP002158',
-    'CP002159',
-    'CP002160',
-    'CP002161',
-    'CP002162',
-    'CP002164',
-    'CP010288',
-    'CP010289',
-    'CP002087',
-    'CP002165',
-    'CP002088',
-    'CP002167',
-    'CP002170',
-    'CP002171',
-    'CP002175',
-    'CP002176',
-    'CP002123',
-    'CP002177',
-    'CP002183',
-    'CP002184',
-    'CP002185',
-    'CP002115',
-    'CP002188',
-    'CP002189',
-    'CP010290',
-    'CP002190',
-    'CP002191',
-    'CP002205',
-    'CP010301',
-    'CP009567',
-    'CP002206',
-    'CP002207',
-    'CP010306',
-    'CP002209',
-    'CP009570',
-    'CP002166',
-    'CP002155',
-    'CP002119',
-    'CP002092',
-    'CP002093',
-    'CP002192',
-    'CP002193',
-    'CP002168',
-    'CP001893',
-    'CP009568',
-    'CP009566',
-    'CP010307',
-    'CP002211',
-    'CP010314',
-    'CP002212',
-    'CP010323',
-    'CP010331',
-    'CP002213',
-    'CP010341',
-    'CP002215',
-    'CP010344',
-    'CP002216',
-    'CP002219',
-    'CP002220',
-    'CP002221',
-    'CP002222',
-    'CP002228',
-    'CP002224',
-    'CP002243',
-    'CP002246',
-    'CP010350',
-    'CP002251',
-    'CP002271',
-    'CP002272',
-    'CP002273',
-    'CP010402',
-    'CP002274',
-    'CP010411',
-    'CP002275',
-    'CP010415',
-    'CP002276',
-    'CP002239',
-    'CP002240',
-    'CP002238',
-    'CP002235',
-    'CP002227',
-    'CP002229',
-    'CP002277',
-    'CP002242',
-    'CP002231',
-    'CP002241',
-    'CP002234',
-    'CP002232',
-    'CP002236',
-    'CP002233',
-    'CP002230',
-    'CP002279',
-    'CP002237',
-    'CP001651',
-    'CP002280',
-    'CP010434',
-    'CP002281',
-    'CP002284',
-    'CP002286',
-    'CP002287',
-    'CP002290',
-    'CP002291',
-    'CP002292',
-    'CP010435',
-    'CP002295',
-    'CP002297',
-    'CP002300',
-    'CP002301',
-    'CP002302',
-    'CP002194',
-    'CP002195',
-    'CP010403',
-    'CP010404',
-    'CP001894',
-    'CP001895',
-    'CP002225',
-    'CP002303',
-    'CP002305',
-    'CP002226',
-    'CP010352',
-    'CP010353',
-    'CP010354',
-    'CP010355',
-    'CP010356',
-    'CP010357',
-    'CP010358',
-    'CP002223',
-    'CP002312',
-    'CP002326',
-    'CP002330',
-    'CP002331',
-    'CP002186',
-    'CP010351',
-    'CP002196',
-    'CP002197',
-    'CP002187',
-    'CP002332',
-    'CP002334',
-    'CP002336',
-    'CP002340',
-    'CP002341',
-    'CP002343',
-    'CP010345',
-    'CP002282',
-    'CP002344',
-    'CP002345',
-    'CP002346',
-    'CP002316',
-    'CP002310',
-    'CP010416',
-    'CP010417',
-    'CP010418',
-    'CP002323',
-    'CP010419',
-    'CP002309',
-    'CP002321',
-    'CP010420',
-    'CP002320',
-    'CP002307',
-    'CP010421',
-    'CP002347',
-    'CP002311',
-    'CP002349',
-    'CP002322',
-    'CP002247',
-    'CP002351',
-    'CP002313',
-    'CP002308',
-    'CP002306',
-    'CP002314',
-    'CP002318',
-    'CP002352',
-    'CP002317',
-    'CP002324',
-    'CP002283',
-    'CP010446',
-    'CP002319',
-    'CP002315',
-    'CP002325',
-    'CP001652',
-    'CP002353',
-    'CP002355',
-    'CP002285',
-    'CP002214',
-    'CP002360',
-    'CP002361',
-    'CP002337',
-    'CP002335',
-    'CP002364',
-    'CP002365',
-    'CP002333',
-    'CP002371',
-    'CP002377',
-    'CP010516',
-    'CP002379',
-    'CP002385',
-    'CP010517',
-    'CP002380',
-    'CP002381',
-    'CP002386',
-    'CP002387',
-    'CP002342',
-    'CP002389',
-    'CP002388',
-    'CP002390',
-    'CP002298',
-    'CP002391',
-    'CP002327',
-    'CP002394',
-    'CP002395',
-    'CP002400',
-    'CP002401',
-    'CP002403',
-    'CP002409',
-    'CP002410',
-    'CP002402',
-    'CP002396',
-    'CP002392',
-    'CP002393',
-    'CP002411',
-    'CP002412',
-    'CP002413',
-    'CP002397',
-    'CP002414',
-    'CP002404',
-    'CP002415',
-    'CP002398',
-    'CP002405',
-    'CP002406',
-    'CP002407',
-    'CP010447',
-    'CP010526',
-    'CP002416',
-    'CP002348',
-    'CP010538',
-    'CP002417',
-    'CP002418',
-    'CP002419',
-    'CP010539',
-    'CP010540',
-    'CP002420',
-    'CP002421',
-    'CP002422',
-    'CP010541',
-    'CP010542',
-    'CP002423',
-    'CP002362',
-    'CP002424',
-    'CP010543',
-    'CP010544',
-    'CP002356',
-    'CP002427',
-    'CP002428',
-    'CP002357',
-    'CP002358',
-    'CP002359',
-    'CP002366',
-    'CP010545',
-    'CP010546',
-    'CP010547',
-    'CP002367',
-    'CP002368',
-    'CP010549',
-    'CP002369',
-    'CP002370',
-    'CP002429',
-    'CP010550',
-    'CP002431',
-    'CP010551',
-    'CP002432',
-    'CP002439',
-    'CP010577',
-    'CP010586',
-    'CP002444',
-    'CP010822',
-    'CP010855',
-    'CP010899',
-    'CP010905',
-    'CP012424',
-    'CP012423',
-    'CP002430',
-    'CP012425',
-    'CP002445',
-    'CP010823',
-    'CP010824',
-    'CP010825',
-    'CP010826',
-    'CP010856',
-    'CP010865',
-    'CP010866',
-    'CP010857',
-    'CP010858',
-    'CP010859',
-    'CP010860',
-    'CP010861',
-    'CP010862',
-    'CP010863',
-    'CP010864',
-    'CP010587',
-    'CP010578',
-    'CP010583',
-    'CP010582',
-    'CP010581',
-    'CP010580',
-    'CP010579',
-    'CP002378',
-    'CP002446',
-    'CP002350',
-    'CP010906',
-    'CP002449',
-    'CP002450',
-    'CP002451',
-    'CP002354',
-    'CP002453',
-    'CP002454',
-    'CP002455',
-    'CP002456',
-    'CP002288',
-    'CP002458',
-    'CP002289',
-    'CP002459',
-    'CP002461',
-    'CP002464',
-    'CP010953',
-    'CP002465',
-    'CP002466',
-    'CP002467',
-    'CP002469',
-    'CP002471',
-    'CP002472',
-    'CP002475',
-    'CP002478',
-    'CP010978',
-    'CP002481',
-    'CP010979',
-    'CP011013',
-    'CP002487',
-    'CP002496',
-    'CP002483',
-    'CP002508',
-    'CP002512',
-    'CP002484',
-    'CP002513',
-    'CP002485',
-    'CP002462',
-    'CP002463',
-    'CP002516',
-    'CP002521',
-    'CP002522',
-    'CP002482',
-    'CP002525',
-    'CP002530',
-    'CP002480',
-    'CP011043',
-    'CP002534',
-    'CP002536',
-    'CP002541',
-    'CP002460',
-    'CP002543',
-    'CP002544',
-    'CP002545',
-    'CP002546',
-    'CP011014',
-    'CP002547',
-    'CP011060',
-    'CP011061',
-    'CP002548',
-    'CP002549',
-    'CP002555',
-    'CP002557',
-    'CP002558',
-    'CP002562',
-    'CP011096',
-    'CP002567',
-    'CP002470',
-    'CP002550',
-    'CP011107',
-    'CP002570',
-    'CP002571',
-    'CP002572',
-    'CP011114',
-    'CP002573',
-    'CP002537',
-    'CP002582',
-    'CP002583',
-    'CP011044',
-    'CP011045',
-    'CP011046',
-    'CP002538',
-    'CP011115',
-    'CP011134',
-    'CP002539',
-    'CP011259',
-    'CP002540',
-    'CP002586',
-    'CP002589',
-    'CP002593',
-    'CP011260',
-    'CP002605',
-    'CP002606',
-    'CP002607',
-    'CP011261',
-    'CP002608',
-    'CP002609',
-    'CP002531',
-    'CP002556',
-    'CP002532',
-    'CP002533',
-    'CP002614',
-    'CP002616',
-    'CP002618',
-    'CP002523',
-    'CP002524',
-    'CP002620',
-    'CP002621',
-    'CP002622',
-    'CP002488',
-    'CP002623',
-    'CP011262',
-    'CP011263',
-    'CP002587',
-    'CP002627',
-    'CP002628',
-    'CP002489',
-    'CP011264',
-    'CP002629',
-    'CP002490',
-    'CP002630',
-    'CP002631',
-    'CP002517',
-    'CP002633',
-    'CP011288',
-    'CP002518',
-    'CP002637',
-    'CP002638',
-    'CP002640',
-    'CP002641',
-    'CP011067',
-    'CP011062',
-    'CP002643',
-    'CP011313',
-    'CP002632',
-    'CP002617',
-    'CP002619',
-    'CP002615',
-    'CP002668',
-    'CP002626',
-    'CP002625',
-    'CP002624',
-    'CP002661',
-    'CP002662',
-    'CP011332',
-    'CP002765',
-    'CP011066',
-    'CP011065',
-    'CP002509',
-    'CP002574',
-    'CP011064',
-    'CP011063',
-    'CP002510',
-    'CP002644',
-    'CP002645',
-    'CP002648',
-    'CP011330',
-    'CP002575',
-    'CP002576',
-    'CP002577',
-    'CP002651',
-    'CP002652',
-    'CP002657',
-    'CP002610',
-    'CP002611',
-    'CP002659',
-    'CP002660',
-    'CP002665',
-    'CP011331',
-    'CP002476',
-    'CP002649',
-    'CP002650',
-    'CP002666',
-    'CP002667',
-    'CP002646',
-    'CP002477',
-    'CP002653',
-    'CP002654',
-    'CP002655',
-    'CP002647',
-    'CP002669',
-    'CP002671',
-    'CP002672',
-    'CP002673',
-    'CP002674',
-    'CP011135',
-    'CP011365',
-    'CP002675',
-    'CP011394',
-    'CP011136',
-    'CP002676',
-    'CP002677',
-    'CP011137',
-    'CP011138',
-    'CP011139',
-    'CP011140',
-    'CP011141',
-    'CP011142',
-    'CP011404',
-    'CP011405',
-    'CP011143',
-    'CP011396',
-    'CP002678',
-    'CP002679',
-    'CP002680',
-    'CP002681',
-    'CP002682',
-    'CP002683',
-    'CP002689',
-    'CP002690',
-    'CP002691',
-    'CP002695',
-    'CP002696',
-    'CP002697',
-    'CP002699',
-    'CP002701',
-    'CP002703',
-    'CP002725',
-    'CP002727',
-    'CP002728',
-    'CP002729',
-    'CP002736',
-    'CP002738',
-    'CP002739',
-    'CP002740',
-    'CP002743',
-    'CP002698',
-    'CP002744',
-    'CP002700',
-    'CP002745',
-    'CP002702',
-    'CP011403',
-    'CP002747',
-    'CP011414',
-    'CP002748',
-    'CP002749',
-    'CP002704',
-    'CP002764',
-    'CP002750',
-    'CP002751',
-    'CP002752',
-    'CP002753',
-    'CP002754',
-    'CP002770',
-    'CP002771',
-    'CP002755',
-    'CP002756',
-    'CP002757',
-    'CP002758',
-    'CP002759',
-    'CP002760',
-    'CP002761',
-    'CP002776',
-    'CP002762',
-    'CP002777',
-    'CP002746',
-    'CP002780',
-    'CP002781',
-    'CP002786',
-    'CP002789',
-    'CP002790',
-    'CP002791',
-    'CP011315',
-    'CP011314',
-    'CP002794',
-    'CP011316',
-    'CP011428',
-    'CP011526',
-    'CP002797',
-    'CP011531',
-    'CP011536',
-    'CP002798',
-    'CP002804',
-    'CP002805',
-    'CP002594',
-    'CP011786',
-    'CP002598',
-    'CP002806',
-    'CP002807',
-    'CP002795',
-    'CP002796',
-    'CP011537',
-    'CP011527',
-    'CP002799',
-    'CP002787',
-    'CP002800',
-    'CP002788',
-    'CP002692',
-    'CP002693',
-    'CP002694',
-    'CP002935',
-    'CP002972',
-    'CP011333',
-    'CP011334',
-    'CP011335',
-    'CP011336',
-    'CP011337',
-    'CP011338',
-    'CP002658',
-    'CP011790',
-    'CP002808',
-    'CP002810',
-    'CP011791',
-    'CP002766',
-    'CP002815',
-    'CP002816',
-    'CP011395',
-    'CP011804',
-    'CP011827',
-    'CP011803',
-    'CP013665',
-    'CP013664',
-    'CP002778',
-    'CP002821',
-    'CP002824',
-    'CP011849',
-    'CP011850',
-    'CP011851',
-    'CP011852',
-    'CP002822',
-    'CP002823',
-    'CP002639',
-    'CP002826',
-    'CP002829',
-    'CP011856',
-    'CP002830',
-    'CP002831',
-    'CP002833',
-    'CP002835',
-    'CP002843',
-    'CP002844',
-    'CP002848',
-    'CP002845',
-    'CP002847',
-    'CP002846',
-    'CP002827',
-    'CP002834',
-    'CP002836',
-    'CP002837',
-    'CP002832',
-    'CP002741',
-    'CP002850',
-    'CP011883',
-    'CP002857',
-    'CP002858',
-    'CP011913',
-    'CP002859',
-    'CP011921',
-    'CP002865',
-    'CP002868',
-    'CP002869',
-    'CP002870',
-    'CP002871',
-    'CP002873',
-    'CP002742',
-    'CP002851',
-    'CP002852',
-    'CP002853',
-    'CP002854',
-    'CP002855',
-    'CP002856',
-    'CP002866',
-    'CP002867',
-    'CP002782',
-    'CP002874',
-    'CP002783',
-    'CP002784',
-    'CP002785',
-    'CP002875',
-    'HQ023862',
-    'CP011922',
-    'CP002731',
-    'CP002881',
-    'CP002732',
-    'CP011923',
-    'CP002882',
-    'CP002883',
-    'CP002733',
-    'CP002730',
-    'CP011435',
-    'CP011434',
-    'CP011433',
-    'CP011432',
-    'CP011430',
-    'CP002884',
-    'CP011429',
-    'CP002885',
-    'CP011431',
-    'CP002886',
-    'CP011955',
-    'CP011956',
-    'CP002896',
-    'CP011957',
-    'CP002899',
-    'CP002901',
-    'CP011958',
-    'CP011959',
-    'CP002902',
-    'CP011960',
-    'CP002903',
-    'CP002904',
-    'CP002905',
-    'CP011961',
-    'CP002910',
-    'CP011962',
-    'CP002912',
-    'CP011964',
-    'CP002914',
-    'CP002915',
-    'CP002917',
-    'CP002919',
-    'CP002900',
-    'CP002924',
-    'CP002925',
-    'CP002930',
-    'CP002931',
-    'CP002933',
-    'CP002953',
-    'CP011966',
-    'CP002955',
-    'CP002961',
-    'CP002934',
-    'CP002967',
-    'CP002970',
-    'CP002937',
-    'CP002936',
-    'CP002938',
-    'CP011972',
-    'CP002939',
-    'CP002940',
-    'CP011976',
-    'CP002941',
-    'CP002942',
-    'CP011980',
-    'CP002943',
-    'CP002976',
-    'CP002944',
-    'CP002945',
-    'CP002946',
-    'CP002947',
-    'CP002948',
-    'CP002949',
-    'CP002950',
-    'CP011985',
-    'CP002980',
-    'CP002982',
-    'CP011989',
-    'CP011996',
-    'CP002983',
-    'CP002985',
-    'CP002986',
-    'CP002954',
-    'CP002860',
-    'CP002987',
-    'CP002926',
-    'CP002991',
-    'CP012001',
-    'CP002861',
-    'CP002992',
-    'CP002994',
-    'CP002997',
-    'CP002999',
-    'CP002862',
-    'CP002932',
-    'CP003000',
-    'CP002863',
-    'CP002864',
-    'CP003001',
-    'CP003015',
-    'CP003017',
-    'CP011963',
-    'CP012009',
-    'CP003021',
-    'CP002887',
-    'CP003022',
-    'CP003095',
-    'CP003025',
-    'CP003016',
-    'CP003026',
-    'CP003032',
-    'CP003027',
-    'CP003028',
-    'CP002981',
-    'CP003033',
-    'CP003034',
-    'CP003039',
-    'CP003040',
-    'CP003035',
-    'CP003036',
-    'CP003037',
-    'CP003038',
-    'CP002984',
-    'CP003041',
-    'CP003046',
-    'CP012011',
-    'CP003047',
-    'CP003042',
-    'CP003048',
-    'CP012012',
-    'CP012010',
-    'CP012013',
-    'CP002911',
-    'CP003049',
-    'CP012014',
-    'CP002998',
-    'CP002973',
-    'CP003051',
-    'CP003053',
-    'CP003056',
-    'CP003057',
-    'CP003058',
-    'CP002975',
-    'CP002974',
-    'CP003059',
-    'CP003060',
-    'CP003052',
-    'CP003054',
-    'CP003055',
-    'CP002962',
-    'CP012015',
-    'CP002963',
-    'CP002964',
-    'CP002965',
-    'CP002966',
-    'CP012016',
-    'CP002977',
-    'CP003061',
-    'CP003062',
-    'CP003065',
-    'CP002979',
-    'CP003066',
-    'CP002978',
-    'CP003068',
-    'CP003069',
-    'CP003071',
-    'CP003075',
-    'CP003077',
-    'CP003067',
-    'CP003070',
-    'CP003076',
-    'CP003072',
-    'CP003073',
-    'CP003074',
-    'CP002968',
-    'CP003082',
-    'CP011979',
-    'CP003084',
-    'CP011977',
-    'CP011978',
-    'CP002971',
-    'CP003085',
-    'CP003086',
-    'CP011984',
-    'CP011981',
-    'CP003093',
-    'CP003094',
-    'CP012018',
-    'CP011983',
-    'CP011982',
-    'CP012019',
-    'CP012037',
-    'CP003096',
-    'CP003097',
-    'CP012017',
-    'CP011986',
-    'CP011988',
-    'CP011987',
-    'CP011973',
-    'CP012044',
-    'CP011991',
-    'CP012074',
-    'CP003099',
-    'CP011993',
-    'CP012090',
-    'CP012091',
-    'CP011990',
-    'CP003101',
-    'CP012119',
-    'CP003107',
-    'CP012120',
-    'CP003108',
-    'CP003109',
-    'CP003116',
-    'CP003119',
-    'CP003121',
-    'CP012075',
-    'CP012137',
-    'CP003122',
-    'CP003102',
-    'CP003103',
-    'CP003104',
-    'CP003105',
-    'CP012118',
-    'CP012121',
-    'CP012138',
-    'CP012139',
-    'CP003110',
-    'CP003111',
-    'CP003112',
-    'CP003113',
-    'CP003114',
-    'CP003120',
-    'CP003018',
-    'CP003019',
-    'CP003020',
-    'CP003123',
-    'CP003124',
-    'CP003125',
-    'CP012140',
-    'CP003128',
-    'CP003130',
-    'CP003131',
-    'CP003132',
-    'CP003137',
-    'CP003149',
-    'CP003150',
-    'CP012144',
-    'CP003151',
-    'CP003152',
-    'CP012145',
-    'CP003153',
-    'CP003154',
-    'CP012146',
-    'CP003155',
-    'CP003156',
-    'CP003157',
-    'CP003166',
-    'CP003169',
-    'CP003174',
-    'CP003176',
-    'CP003201',
-    'CP003178',
-    'CP003202',
-    'CP003179',
-    'CP003181',
-    'CP003182',
-    'CP003183',
-    'CP012153',
-    'CP003187',
-    'CP003190',
-    'CP003138',
-    'CP003139',
-    'CP003140',
-    'CP012195',
-    'CP003141',
-    'CP003142',
-    'CP003143',
-    'CP003144',
-    'CP003145',
-    'CP003191',
-    'CP003129',
-    'CP012257',
-    'CP012264',
-    'CP003192',
-    'CP003194',
-    'CP003195',
-    'CP003193',
-    'CP003136',
-    'CP003135',
-    'CP003134',
-    'CP003133',
-    'CP012268',
-    'CP003165',
-    'CP003164',
-    'CP003163',
-    'CP003162',
-    'CP003196',
-    'CP003161',
-    'CP003160',
-    'CP003159',
-    'CP003158',
-    'CP003197',
-    'CP003175',
-    'CP012300',
-    'CP003198',
-    'CP003177',
-    'CP003199',
-    'CP012344',
-    'CP012345',
-    'CP002995',
-    'CP003200',
-    'CP002996',
-    'CP012141',
-    'CP012346',
-    'CP003206',
-    'CP003207',
-    'CP003208',
-    'CP003209',
-    'CP012142',
-    'CP003210',
-    'CP003211',
-    'CP012347',
-    'CP012143',
-    'CP012348',
-    'CP012349',
-    'CP003212',
-    'CP003213',
-    'CP003214',
-    'CP003215',
-    'CP012372',
-    'CP003216',
-    'CP003217',
-    'CP003218',
-    'CP003219',
-    'CP003180',
-    'CP003220',
-    'CP003221',
-    'CP003222',
-    'CP003231',
-    'CP003233',
-    'CP003234',
-    'CP003235',
-    'CP003236',
-    'CP003248',
-    'CP003249',
-    'CP003252',
-    'CP003253',
-    'CP003250',
-    'CP003254',
-    'CP003251',
-    'CP003237',
-    'CP012265',
-    'CP012258',
-    'CP012382',
-    'CP012395',
-    'CP003255',
-    'CP012409',
-    'CP012513',
-    'CP003260',
-    'CP003261',
-    'CP003264',
-    'CP003273',
-    'CP003274',
-    'CP003275',
-    'CP003278',
-    'CP003280',
-    'CP003281',
-    'CP003282',
-    'CP003283',
-    'CP003289',
-    'CP003293',
-    'CP003295',
-    'CP003296',
-    'CP003294',
-    'CP003189',
-    'CP003188',
-    'CP003297',
-    'CP012681',
-    'CP003301',
-    'CP012689',
-    'CP012690',
-    'CP003304',
-    'CP012713',
-    'CP003305',
-    'CP003306',
-    'CP003307',
-    'CP012714',
-    'CP003308',
-    'CP003309',
-    'CP003311',
-    'CP003312',
-    'CP003313',
-    'CP003315',
-    'CP003322',
-    'CP003323',
-    'CP012716',
-    'CP012717',
-    'CP003324',
-    'CP012735',
-    'CP003325',
-    'CP003328',
-    'CP003329',
-    'CP003330',
-    'CP003223',
-    'CP003332',
-    'CP003224',
-    'CP003333',
-    'CP003256',
-    'CP003334',
-    'CP003338',
-    'CP003225',
-    'CP003238',
-    'CP003340',
-    'CP003341',
-    'CP012743',
-    'CP003342',
-    'CP003344',
-    'CP012744',
-    'CP003345',
-    'CP012756',
-    'CP003226',
-    'CP003346',
-    'CP003227',
-    'CP003239',
-    'CP003228',
-    'CP003347',
-    'CP003348',
-    'CP003349',
-    'CP012833',
-    'CP012868',
-    'CP003350',
-    'CP012834',
-    'CP012835',
-    'JQ657805',
-    'JQ657806',
-    'CP003339',
-    'CP003351',
-    'CP003355',
-    'CP003357',
-    'CP003262',
-    'CP003229',
-    'CP003352',
-    'CP003353',
-    'CP003354',
-    'CP003356',
-    'CP003335',
-    'CP003358',
-    'CP003336',
-    'CP003337',
-    'CP003343',
-    'CP003359',
-    'CP003314',
-    'CP003360',
-    'CP003364',
-    'CP003368',
-    'CP003369',
-    'CP003370',
-    'CP003371',
-    'CP003361',
-    'CP003365',
-    'CP003366',
-    'CP003367',
-    'CP003240',
-    'CP003375',
-    'CP012683',
-    'CP003379',
-    'CP003279',
-    'CP012684',
-    'CP012682',
-    'CP012883',
-    'CP003382',
-    'CP003291',
-    'CP003331',
-    'CP003290',
-    'CP003292',
-    'CP003383',
-    'CP012884',
-    'CP003384',
-    'CP012757',
-    'CP003385',
-    'CP012889',
-    'CP003386',
-    'CP012383',
-    'CP003298',
-    'CP012921',
-    'CP003299',
-    'CP003300',
-    'CP012922',
-    'CP012923',
-    'CP003387',
-    'CP003388',
-    'CP003389',
-    'CP003302',
-    'CP003391',
-    'CP003392',
-    'CP003303',
-    'CP003393',
-    'CP003395',
-    'CP012732',
-    'CP012733',
-    'CP012734',
-    'CP003396',
-    'CP012736',
-    'CP003397',
-    'CP003398',
-    'CP003402',
-    'CP003403',
-    'CP003407',
-    'CP003410',
-    'CP003414',
-    'CP003416',
-    'CP003418',
-    'CP012947',
-    'CP003419',
-    'CP003421',
-    'CP003422',
-    'CP003466',
-    'CP003467',
-    'CP003472',
-    'CP003473',
-    'CP012981',
-    'CP012985',
-    'CP003474',
-    'CP003475',
-    'CP003476',
-    'CP003479',
-    'CP013097',
-    'CP003481',
-    'CP003483',
-    'CP013120',
-    'CP013121',
-    'CP003486',
-    'CP003488',
-    'CP003490',
-    'CP003493',
-    'CP003420',
-    'CP003494',
-    'CP003496',
-    'CP003497',
-    'CP003498',
-    'CP003499',
-    'CP003500',
-    'CP003502',
-    'CP003477',
-    'CP003484',
-    'CP003485',
-    'CP003480',
-    'CP003487',
-    'CP003478',
-    'CP003504',
-    'CP003506',
-    'CP003507',
-    'CP003276',
-    'CP003508',
-    'CP003277',
-    'CP003509',
-    'CP003510',
-    'CP003511',
-    'CP003512',
-    'CP003513',
-    'HQ724512',
-    'CP003482',
-    'CP003532',
-    'CP003533',
-    'CP003503',
-    'CP013131',
-    'CP013183',
-    'CP013219',
-    'CP003537',
-    'CP013220',
-    'CP013122',
-    'CP013123',
-    'CP013222',
-    'CP003539',
-    'CP003540',
-    'CP003541',
-    'CP003542',
-    'CP003543',
-    'CP003544',
-    'CP003545',
-    'CP003555',
-    'CP003557',
-    'CP003583',
-    'CP003588',
-    'CP003603',
-    'CP003604',
-    'CP003605',
-    'CP003629',
-    'CP003639',
-    'CP003606',
-    'CP003584',
-    'CP003585',
-    'CP003586',
-    'CP013221',
-    'CP013223',
-    'CP003556',
-    'CP003640',
-    'CP003641',
-    'CP003589',
-    'CP012982',
-    'CP003652',
-    'CP003667',
-    'CP003668',
-    'CP003677',
-    'CP003678',
-    'CP003679',
-    'CP003683',
-    'CP013288',
-    'CP013331',
-    'CP003686',
-    'CP003666',
-    'CP012983',
-    'CP003669',
-    'CP003670',
-    'CP003671',
-    'CP003672',
-    'CP003673',
-    'CP003674',
-    'CP003675',
-    'CP003676',
-    'CP013332',
-    'CP013333',
-    'CP012984',
-    'JQ314407',
-    'CP003684',
-    'CP014577',
-    'CP013098',
-    'CP003417',
-    'CP003404',
-    'CP013334',
-    'CP003687',
-    'CP013336',
-    'CP003695',
-    'CP003696',
-    'CP003697',
-    'CP003699',
-    'CP003700',
-    'CP003703',
-    'CP003405',
-    'CP003406',
-    'CP003704',
-    'CP003708',
-    'CP003709',
-    'CP003715',
-    'CP003720',
-    'CP003723',
-    'CP003725',
-    'CP003726',
-    'CP003729',
-    'CP013342',
-    'CP003730',
-    'CP003731',
-    'CP003732',
-    'CP013337',
-    'CP013335',
-    'CP003705',
-    'CP003706',
-    'CP003707',
-    'CP003710',
-    'CP003716',
-    'CP003711',
-    'CP003717',
-    'CP003712',
-    'CP003718',
-    'CP003713',
-    'CP003719',
-    'CP003714',
-    'CP003724',
-    'CP003698',
-    'CP003727',
-    'CP003728',
-    'CP013343',
-    'CP003691',
-    'CP003692',
-    'CP003693',
-    'CP003694',
-    'CP003689',
-    'CP003688',
-    'CP003501',
-    'CP004359',
-    'CP003734',
-    'CP003736',
-    'CP003737',
-    'CP013610',
-    'CP003738',
-    'CP003740',
-    'CP013654',
-    'CP013666',
-    'CP013680',
-    'CP003742',
-    'CP003745',
-    'CP013730',
-    'CP013738',
-    'CP003746',
-    'CP003747',
-    'CP003752',
-    'CP013828',
-    'CP003761',
-    'CP003763',
-    'CP003770',
-    'CP003771',
-    'CP003772',
-    'CP003773',
-    'CP003774',
-    'CP003776',
-    'CP003777',
-    'CP003778',
-    'CP003781',
-    'CP003783',
-    'CP003743',
-    'CP003744',
-    'CP003741',
-    'CP003748',
-    'CP003749',
-    'CP003750',
-    'CP003751',
-    'CP003411',
-    'CP003784',
-    'CP003786',
-    'CP013940',
-    'CP003787',
-    'CP003788',
-    'CP003789',
-    'CP003790',
-    'CP013984',
-    'CP003812',
-    'CP013941',
-    'CP013942',
-    'CP003690',
-    'CP003791',
-    'CP003792',
-    'CP003815',
-    'CP003721',
-    'CP003793',
-    'CP003794',
-    'CP003819',
-    'CP003817',
-    'CP003797',
-    'CP003798',
-    'CP003796',
-    'CP003800',
-    'CP003802',
-    'CP003799',
-    'CP003795',
-    'CP003813',
-    'CP003818',
-    'CP003816',
-    'CP003808',
-    'CP003810',
-    'CP003835',
-    'CP003811',
-    'CP003814',
-    'CP003838',
-    'CP003836',
-    'CP003839',
-    'CP003840',
-    'CP003841',
-    'CP003844',
-    'CP003846',
-    'CP003845',
-    'CP003847',
-    'CP013993',
-    'CP003851',
-    'CP003849',
-    'CP003857',
-    'CP003858',
-    'CP003860',
-    'CP003859',
-    'CP003852',
-    'CP003853',
-    'CP003854',
-    'CP003855',
-    'CP003856',
-    'CP003861',
-    'CP003862',
-    'CP003866',
-    'CP014004',
-    'CP003867',
-    'CP014008',
-    'CP003863',
-    'CP003868',
-    'CP003871',
-    'CP003873',
-    'CP003877',
-    'CP003876',
-    'CP003881',
-    'CP003882',
-    'CP003884',
-    'CP003885',
-    'CP003883',
-    'CP003889',
-    'CP003899',
-    'CP003874',
-    'CP003903',
-    'CP003901',
-    'CP003900',
-    'CP003904',
-    'CP004058',
-    'CP004059',
-    'CP003864',
-    'CP003887',
-    'CP003907',
-    'CP003936',
-    'CP003989',
-    'CP003992',
-    'CP014166',
-    'CP003850',
-    'CP003888',
-    'CP003973',
-    'CP003908',
-    'CP004060',
-    'CP003905',
-    'CP003906',
-    'CP003910',
-    'CP003909',
-    'CP003913',
-    'CP003911',
-    'CP003914',
-    'CP003915',
-    'CP003917',
-    'CP003919',
-    'CP003922',
-    'CP003923',
-    'CP003924',
-    'CP003926',
-    'CP003932',
-    'CP003933',
-    'CP003918',
-    'CP003941',
-    'CP003942',
-    'CP014005',
-    'CP003886',
-    'CP014006',
-    'CP003949',
-    'CP003775',
-    'CP014009',
-    'CP003959',
-    'CP013731',
-    'CP003865',
-    'CP003925',
-    'CP003848',
-    'CP003963',
-    'CP003965',
-    'CP003964',
-    'CP003967',
-    'CP003972',
-    'CP003976',
-    'CP003969',
-    'CP003927',
-    'CP003916',
-    'CP003979',
-    'CP003984',
-    'CP003985',
-    'CP003934',
-    'CP003935',
-    'CP014223',
-    'CP014225',
-    'CP003993',
-    'CP003937',
-    'CP014230',
-    'CP003999',
-    'CP004001',
-    'CP003996',
-    'CP003994',
-    'CP003995',
-    'CP003997',
-    'CP003998',
-    'CP004000',
-    'CP004002',
-    'CP013732',
-    'CP004003',
-    'CP004005',
-    'CP004006',
-    'CP004007',
-    'CP004004',
-    'CP003980',
-    'CP003981',
-    'CP014255',
-    'CP003739',
-    'CP004009',
-    'CP004014',
-    'CP004015',
-    'CP004016',
-    'CP004017',
-    'CP004018',
-    'CP003986',
-    'CP004020',
-    'CP004021',
-    'CP004023',
-    'CP004027',
-    'CP004022',
-    'CP004025',
-    'CP003782',
-    'CP004026',
-    'CP004028',
-    'CP004029',
-    'CP014269',
-    'CP004030',
-    'CP004031',
-    'CP004032',
-    'CP004033',
-    'CP004034',
-    'CP004035',
-    'CP004044',
-    'CP004042',
-    'CP003753',
-    'CP003754',
-    'CP004045',
-    'CP003755',
-    'CP003756',
-    'CP003757',
-    'CP003758',
-    'CP003759',
-    'CP003760',
-    'CP004048',
-    'CP004047',
-    'CP004024',
-    'CP004043',
-    'CP003960',
-    'CP004053',
-    'CP003968',
-    'CP004055',
-    'CP004054',
-    'CP004056',
-    'CP004057',
-    'CP014281',
-    'CP003912',
-    'CP014316',
-    'CP003764',
-    'CP003765',
-    'CP003766',
-    'CP004061',
-    'CP014346',
-    'CP003767',
-    'CP003768',
-    'CP003769',
-    'CP014348',
-    'CP004063',
-    'CP014356',
-    'CP014358',
-    'CP003892',
-    'CP003897',
-    'CP003890',
-    'CP004064',
-    'CP003896',
-    'CP003895',
-    'CP003891',
-    'CP003894',
-    'CP003893',
-    'CP003898',
-    'CP004065',
-    'CP004066',
-    'CP004069',
-    'CP004077',
-    'CP004067',
-    'CP004068',
-    'CP004079',
-    'CP004078',
-    'CP004080',
-    'CP004081',
-    'CP004085',
-    'CP004086',
-    'CP004082',
-    'CP004091',
-    'CP014359',
-    'CP014357',
-    'CP006247',
-    'CP006248',
-    'CP006249',
-    'CP004120',
-    'CP004121',
-    'CP004123',
-    'CP004140',
-    'CP004141',
-    'CP014536',
-    'CP014566',
-    'CP014537',
-    'CP004092',
-    'CP004093',
-    'CP004094',
-    'CP004087',
-    'CP004088',
-    'CP004857',
-    'CP014317',
-    'CP014318',
-    'CP014319',
-    'CP014321',
-    'CP014320',
-    'CP004142',
-    'CP003977',
-    'CP004143',
-    'CP014620',
-    'CP014621',
-    'CP004345',
-    'CP014657',
-    'CP004346',
-    'CP013739',
-    'CP014659',
-    'CP014661',
-    'CP004351',
-    'CP004350',
-    'CP004353',
-    'CP004354',
-    'CP014622',
-    'CP014658',
-    'CP014662',
-    'CP014660',
-    'CP013740',
-    'CP004355',
-    'CP004356',
-    'CP004352',
-    'CP004138',
-    'CP014663',
-    'CP014664',
-    'CP004139',
-    'CP004357',
-    'CP004358',
-    'CP004360',
-    'CP014665',
-    'CP014666',
-    'CP004361',
-    'CP004362',
-    'CP004363',
-    'CP004364',
-    'CP004368',
-    'CP004365',
-    'CP004370',
-    'CP014840',
-    'CP004372',
-    'CP014858',
-    'CP004373',
-    'CP014965',
-    'CP014969',
-    'CP014967',
-    'CP014975',
-    'CP014971',
-    'CP004374',
-    'CP004379',
-    'CP014968',
-    'CP014966',
-    'CP014970',
-    'CP014976',
-    'CP014972',
-    'CP014979',
-    'CP014973',
-    'CP014974',
-    'CP014981',
-    'CP014982',
-    'CP014983',
-    'CP014977',
-    'CP014994',
-    'CP004383',
-    'CP004387',
-    'CP014980',
-    'CP014995',
-    'CP014978',
-    'CP004369',
-    'CP004380',
-    'CP004384',
-    'CP004072',
-    'CP004073',
-    'CP004076',
-    'CP004070',
-    'CP004071',
-    'CP004074',
-    'CP004075',
-    'CP004388',
-    'CP014996',
-    'CP015024',
-    'CP015081',
-    'CP015082',
-    'CP015084',
-    'CP015083',
-    'CP014997',
-    'CP004389',
-    'CP004134',
-    'CP004391',
-    'CP004127',
-    'CP004128',
-    'CP004129',
-    'CP004135',
-    'CP015176',
-    'CP004392',
-    'CP004399',
-    'CP015235',
-    'CP015418',
-    'CP004406',
-    'CP004407',
-    'CP004408',
-    'CP004409',
-    'CR522870',
-    'CR555306',
-    'CP004753',
-    'CP004752',
-    'CP004846',
-    'CR555307',
-    'CR555308',
-    'CR626927',
-    'CR522871',
-    'CR522872',
-    'CP004847',
-    'CR628336',
-    'CP004848',
-    'CP015419',
-    'CP004851',
-    'CP004852',
-    'CR628337',
-    'CR626928',
-    'CP004853',
-    'CR767821',
-    'CP004402',
-    'CP004401',
-    'CP004855',
-    'CR848038',
-    'CP004400',
-    'CR925677',
-    'CP004856',
-    'CR925678',
-    'CR936503',
-    'CR954253',
-    'CP004858',
-    'CP004870',
-    'CP004884',
-    'CP015420',
-    'CT573213',
-    'CU179680',
-    'CP004885',
-    'CU207366',
-    'CR628338',
-    'CP004886',
-    'CU458896',
-    'CU459141',
-    'EU271968',
-    'CU468135',
-    'CP004887',
-    'CR628339',
-    'CP004136',
-    'CP004137',
-    'CU468128',
-    'CU468130',
-    'CU468132',
-    'CU468133',
-    'CP004122',
-    'CP004888',
-    'CU651637',
-    'CP004889',
-    'CP005074',
-    'CP005076',
-    'CU928145',
-    'CP005075',
-    'CP005077',
-    'CP005078',
-    'CP005079',
-    'CP005081',
-    'CP005080',
-    'CP005082',
-    'CU468131',
-    'CP005094',
-    'CP005095',
-    'CU459137',
-    'CU459138',
-    'CU459140',
-    'CU459139',
-    'CU928160',
-    'CU928161',
-    'CP015177',
-    'CP015178',
-    'CP015179',
-    'CP015180',
-    'CP015182',
-    'CP015181',
-    'CP004130',
-    'CP004124',
-    'CP004131',
-    'CP004132',
-    'CP004125',
-    'CP004133',
-    'CP004126',
-    'CP005286',
-    'CU928164',
-    'DQ489736',
-    'DQ489740',
-    'DQ489737',
-    'DQ489738',
-    'DQ489739',
-    'FM177140',
-    'FM179322',
-    'FM179323',
-    'FM180568',
-    'FM179324',
-    'FM200053',
-    'FM204883',
-    'CP005287',
-    'CP005288',
-    'CP005383',
-    'CP005384',
-    'CP005386',
-    'FM180570',
-    'FM180569',
-    'CP005289',
-    'CP004863',
-    'CP004859',
-    'CP004861',
-    'CP005387',
-    'CP004860',
-    'FM204884',
-    'FM211187',
-    'FM209186',
-    'FM211192',
-    'CP005388',
-    'CP004883',
-    'CP004878',
-    'CP004876',
-    'CP004877',
-    'CP003762',
-    'CP005390',
-    'FM242711',
-    'FM211688',
-    'FM252031',
-    'CP005484',
-    'FM872306',
-    'FM252032',
-    'FM872307',
-    'FM872308',
-    'FM991728',
-    'FM999788',
-    'FM252033',
-    'FN424405',
-    'FN433596',
-    'FN434113',
-    'CP005485',
-    'FN538970',
-    'CP005486',
-    'CP005490',
-    'CP005487',
-    'CP005491',
-    'CP005492',
-    'CP005493',
-    'CP005587',
-    'CP005389',
-    'CP005391',
-    'CP005925',
-    'CP005926',
-    'FN554766',
-    'FN433597',
-    'FN433598',
-    'CP005928',
-    'CP005930',
-    'FN554767',
-    'FN555004',
-    'FN554889',
-    'FN557490',
-    'FN563149',
-    'FN568063',
-    'CP005933',
-    'FN597254',
-    'CP005935',
-    'FN597644',
-    'FN598874',
-    'FN665651',
-    'FN645454',
-    'CP005941',
-    'CP005942',
-    'CP005943',
-    'CP005944',
-    'CP005945',
-    'CP005946',
-    'CP005947',
-    'CP005948',
-    'CP010527',
-    'FN650140',
-    'CP005950',
-    'CP005958',
-    'CP015236',
-    'FN434114',
-    'FN652779',
-    'CP005951',
-    'CP005952',
-    'CP005954',
-    'CP004862',
-    'CP004869',
-    'CP004867',
-    'CP004866',
-    'CP004865',
-    'CP004864',
-    'CP004868',
-    'CP005955',
-    'CP005963',
-    'CP005959',
-    'CP005960',
-    'CP005956',
-    'CP005931',
-    'CP005932',
-    'CP005964',
-    'CP005965',
-    'CP004871',
-    'CP004872',
-    'CP004873',
-    'CP004874',
-    'CP004879',
-    'CP004881',
-    'CP004875',
-    'CP004882',
-    'CP005966',
-    'CP005953',
-    'CP005969',
-    'CP005967',
-    'CP005970',
-    'CP005972',
-    'CP005973',
-    'FN806773',
-    'CP015237',
-    'FN822744',
-    'FN869568',
-    'FN995097',
-    'CP005976',
-    'CP004375',
-    'CP004376',
-    'CP005986',
-    'FN650141',
-    'CP005995',
-    'FO082843',
-    'CP005996',
-    'FO117623',
-    'CP005998',
-    'FO203363',
-    'CP006004',
-    'CP006003',
-    'CP005987',
-    'CP005988',
-    'CP005989',
-    'FO203503',
-    'FO203512',
-    'CP006008',
-    'CP006006',
-    'CP002486',
-    'CP005936',
-    'CP005937',
-    'CP006009',
-    'CP005938',
-    'CP005939',
-    'CP005940',
-    'CP005994',
-    'CP006018',
-    'CP006010',
-    'CP006011',
-    'FO681347',
-    'CP006012',
-    'CP006013',
-    'CP006014',
-    'CP006015',
-    'CP006016',
-    'CP006017',
-    'CP006601',
-    'CP006027',
-    'CP006032',
-    'FO681494',
-    'CP006030',
-    'CP006031',
-    'FO681495',
-    'FO681496',
-    'FO681497',
-    'CP006028',
-    'CP006029',
-    'CP005999',
-    'CP006033',
-    'CP006000',
-    'CP006001',
-    'CP006002',
-    'CP006034',
-    'CP006035',
-    'CP006036',
-    'CP006037',
-    'CP006038',
-    'CP006039',
-    'CP006040',
-    'CP006041',
-    'CP006042',
-    'CP006043',
-    'CP006005',
-    'FO704551',
-    'CP006044',
-    'CP006045',
-    'CP006007',
-    'FP103042',
-    'CP006048',
-    'CP006046',
-    'CP006053',
-    'CP006055',
-    'CP006058',
-    'CP006245',
-    'CP006246',
-    'FP236530',
-    'FP236842',
-    'CP006252',
-    'CP006256',
-    'CP006054',
-    'CP006050',
-    'CP006259',
-    'CP006056',
-    'CP006057',
-    'FP236843',
-    'CP006262',
-    'FP103043',
-    'FP103044',
-    'FP236827',
-    'FP236828',
-    'FP928999',
-    'FP236829',
-    'FP236826',
-    'FP236830',
-    'CP006051',
-    'CP005974',
-    'CP006253',
-    'CP006263',
-    'CP006264',
-    'CP006636',
-    'FQ670179',
-    'FQ859183',
-    'CP006643',
-    'CP005961',
-    'CP006272',
-    'CP006365',
-    'CP006366',
-    'CP006469',
-    'FP885906',
-    'CU458745',
-    'FQ311868',
-    'FQ311875',
-    'CP006571',
-    'FQ311869',
-    'CP006572',
-    'FQ311870',
-    'FQ311871',
-    'FQ311872',
-    'FQ311873',
-    'FQ311874',
-    'FP885891',
-    'FQ311475',
-    'FQ311476',
-    'CP006052',
-    'CP006573',
-    'FQ312003',
-    'CP006574',
-    'CP006576',
-    'CP006578',
-    'CP006579',
-    'CP006584',
-    'CP006580',
-    'FQ312006',
-    'CP006602',
-    'CP006603',
-    'CP006575',
-    'FQ312027',
-    'CP006604',
-    'CP006605',
-    'CP006610',
-    'CP006608',
-    'FQ312029',
-    'CP006616',
-    'CP006615',
-    'CP006617',
-    'CP006619',
-    'FQ312030',
-    'CP006630',
-    'CP006620',
-    'FQ312041',
-    'FQ312043',
-    'CP006621',
-    'CP006622',
-    'CP006623',
-    'CP006624',
-    'CP006625',
-    'CP006626',
-    'CP006631',
-    'CP006632',
-    'FQ312044',
-    'FQ312045',
-    'FQ790233',
-    'CP006644',
-    'FQ958210',
-    'FQ859185',
-    'FQ958212',
-    'CP011450',
-    'FQ859182',
-    'FQ958211',
-    'CP006609',
-    'CP006645',
-    'CP006647',
-    'CP010328',
-    'CP006648',
-    'CP006649',
-    'CP006606',
-    'CP006650',
-    'CP006656',
-    'CP006664',
-    'CP006674',
-    'CP006667',
-    'CP006607',
-    'FR687253',
-    'CP006681',
-    'CP006682',
-    'CP006657',
-    'CP006658',
-    'CP006668',
-    'CP006665',
-    'CP006666',
-    'CP006669',
-    'CP006651',
-    'CP006652',
-    'CP006653',
-    'CP006654',
-    'CP006655',
-    'CP006637',
-    'CP006638',
-    'CP006639',
-    'CP006640',
-    'CP006685',
-    'CP006641',
-    'CP006642',
-    'CP006686',
-    'FR687359',
-    'CP006687',
-    'CP006688',
-    'CP006689',
-    'FR714927',
-    'CP006690',
-    'FR720602',
-    'FR714928',
-    'FR714929',
-    'CP006633',
-    'CP006634',
-    'CP006635',
-    'CP006691',
-    'CP006692',
-    'CP006693',
-    'FR729477',
-    'CP006696',
-    'CP006698',
-    'CP006699',
-    'CP006702',
-    'CP006706',
-    'CP006704',
-    'CP006707',
-    'CP006703',
-    'CP006708',
-    'CP006697',
-    'FR745874',
-    'CP006711',
-    'CP006709',
-    'CP006712',
-    'FR733642',
-    'CP006713',
-    'CP006710',
-    'CP006716',
-    'CP006715',
-    'FR733643',
-    'CP006714',
-    'CP006717',
-    'CP006718',
-    'FR733644',
-    'CP006720',
-    'CP006722',
-    'CP006721',
-    'FR733645',
-    'CP006729',
-    'CP006730',
-    'CP006731',
-    'FR733647',
-    'CP006734',
-    'CP006736',
-    'FR733648',
-    'CP006738',
-    'FR733649',
-    'FR733650',
-    'CP006740',
-    'FR667691',
-    'CP006741',
-    'FR733651',
-    'FR774048',
-    'FR773153',
-    'CP006742',
-    'FR821779',
-    'CP006745',
-    'FR821780',
-    'CP006743',
-    'CP006744',
-    'CP006739',
-    'FR870271',
-    'FR872582',
-    'CP006763',
-    'CP006764',
-    'CP006766',
-    'FR872581',
-    'CP006767',
-    'CP007043',
-    'CP006765',
-    'CP006700',
-    'CP006770',
-    'CP006771',
-    'CP006701',
-    'CP006732',
-    'CP006733',
-    'CP006773',
-    'CP006777',
-    'FR873481',
-    'CP004119',
-    'CP006778',
-    'FR875178',
-    'CP006784',
-    'FR873482',
-    'CP006798',
-    'CP006774',
-    'CP006775',
-    'CP006788',
-    'CP006789',
-    'CP006799',
-    'CP006800',
-    'CP006801',
-    'CP006802',
-    'CP006737',
-    'CP006811',
-    'CP006809',
-    'FR878060',
-    'CP006810',
-    'CP006719',
-    'CP006812',
-    'FR877557',
-    'CP006818',
-    'CP006819',
-    'CP006820',
-    'CP006821',
-    'CP006813',
-    'CP006814',
-    'CP006815',
-    'CP006816',
-    'CP006817',
-    'CP006822',
-    'CP006823',
-    'HE572590',
-    'CP006824',
-    'CP006825',
-    'CP006891',
-    'CP006892',
-    'CP006827',
-    'CP006893',
-    'CP006894',
-    'CP006895',
-    'CP006826',
-    'CP006828',
-    'CP006829',
-    'CP006833',
-    'CP006835',
-    'CP006838',
-    'HE577054',
-    'CP006841',
-    'CP006845',
-    'CP006842',
-    'HE579059',
-    'CP006849',
-    'CP006850',
-    'CP006851',
-    'CP006853',
-    'CP006854',
-    'CP006857',
-    'CP006863',
-    'CP006869',
-    'CP003950',
-    'CP003951',
-    'CP003952',
-    'CP003953',
-    'CP003954',
-    'CP003955',
-    'CP006870',
-    'CP003956',
-    'CP003957',
-    'CP003958',
-    'CP006871',
-    'CP006839',
-    'HE579060',
-    'HE579063',
-    'HE579061',
-    'CP006872',
-    'CP006875',
-    'CP006876',
-    'CP006877',
-    'HE579065',
-    'CP006843',
-    'HE579067',
-    'CP006889',
-    'CP006883',
-    'CP006888',
-    'CP006890',
-    'CP006896',
-    'CP006898',
-    'HE579064',
-    'HE579069',
-    'HE579071',
-    'CP006900',
-    'CP006897',
-    'CP006899',
-    'CP006903',
-    'CP006905',
-    'CP006855',
-    'CP006907',
-    'HE579066',
-    'CP006904',
-    'CP006906',
-    'HE579073',
-    'CP006908',
-    'CP006909',
-    'HE579074',
-    'HE579068',
-    'CP006910',
-    'HE601795',
-    'CP006912',
-    'HE603222',
-    'HE601796',
-    'HE603209',
-    'HE601797',
-    'HE579070',
-    'CP006916',
-    'HE601801',
-    'HE601804',
-    'CP006917',
-    'HE601808',
-    'HE601805',
-    'CP006918',
-    'HE603236',
-    'CP006919',
-    'CP006922',
-    'CP006921',
-    'CP006878',
-    'HE601809',
-    'HE601870',
-    'CP006879',
-    'CP006923',
-    'HE603212',
-    'CP006880',
-    'CP006864',
-    'HE601949',
-    'CP006865',
-    'HE601950',
-    'HE601952',
-    'HE601953',
-    'CP006931',
-    'HE603218',
-    'HE603220',
-    'HE601955',
-    'HE601954',
-    'HE603228',
-    'HE601956',
-    'HE603227',
-    'HE579072',
-    'HE613569',
-    'CP006932',
-    'HE617159',
-    'HE614873',
-    'CP006934',
-    'CP006935',
-    'HE613570',
-    'CP006936',
-    'HE617160',
-    'CP006937',
-    'CP006941',
-    'CP006943',
-    'CP006942',
-    'CP006944',
-    'CP006945',
-    'CP006947',
-    'HE663067',
-    'CP006946',
-    'CP006949',
-    'CP006950',
-    'CP006951',
-    'CP006953',
-    'CP006954',
-    'HE617161',
-    'CP006952',
-    'CP006955',
-    'CP006956',
-    'CP006957',
-    'HE681097',
-    'CP006958',
-    'CP006959',
-    'CP006960',
-    'CP006961',
-    'CP006927',
-    'CP006926',
-    'CP006925',
-    'CP006928',
-    'CP006924',
-    'CP006966',
-    'CP006974',
-    'CP006975',
-    'CP006978',
-    'CP006979',
-    'CP006986',
-    'CP006948',
-    'CP006962',
-    'HE717023',
-    'CP006967',
-    'HE774679',
-    'CP006968',
-    'CP006969',
-    'CP006970',
-    'HE717024',
-    'HE717025',
-    'HE774682',
-    'CP006987',
-    'CP006971',
-    'CP006972',
-    'CP006988',
-    'CP006989',
-    'CP006990',
-    'HE798556',
-    'CP006973',
-    'CP006991',
-    'CP005971',
-    'FR687360',
-    'HE802067',
-    'HE804045',
-    'HE858529',
-    'HE965803',
-    'HE965804',
-    'HE965805',
-    'CP006470',
-    'HE965806',
-    'HE965807',
-    'HE970764',
-    'HE970765',
-    'HE978252',
-    'HE983995',
-    'HE983996',
-    'HE983624',
-    'HE995405',
-    'HE999757',
-    'HE999705',
-    'HF558398',
-    'HF558530',
-    'HF559394',
-    'FQ859184',
-    'HF563609',
-    'HF563562',
-    'HE995406',
-    'HF571988',
-    'HE995407',
-    'HE995408',
-    'HF677570',
-    'HF677571',
-    'HF677572',
-    'HF677573',
-    'HF677574',
-    'HF677575',
-    'HF677576',
-    'HF677577',
-    'HF680312',
-    'HF937208',
-    'HF952104',
-    'HF952105',
-    'HF937209',
-    'HF952106',
-    'HG004426',
-    'HG004427',
-    'HG322949',
-    'HG322950',
-    'CP006257',
-    'HG328253',
-    'HE577055',
-    'HG328254',
-    'FR687361',
-    'HG421741',
-    'HG428754',
-    'HG514499',
-    'HG530135',
-    'HG530136',
-    'HG738867',
-    'HG794546',
-    'CP006836',
-    'HG813240',
-    'CP006260',
-    'CP006261',
-    'HG813242',
-    'HG813243',
-    'HG813244',
-    'HG813245',
-    'HG813246',
-    'HG813249',
-    'HG813247',
-    'HG813250',
-    'HG813248',
-    'HG916826',
-    'HG916765',
-    'HG917972',
-    'HG938353',
-    'HG938354',
-    'HG938355',
-    'HG938370',
-    'HG938356',
-    'HG938357',
-    'HG939456',
-    'HG941718',
-    'HG938371',
-    'L42023',
-    'HG941719',
-    'HG941720',
-    'L43967',
-    'HG938372',
-    'LM995445',
-    'LN515398',
-    'LN515399',
-    'LN614827',
-    'LN649235',
-    'LN681227',
-    'LN774769',
-    'LN774770',
-    'LN774771',
-    'LN831027',
-    'LN831028',
-    'LN831776',
-    'LN614828',
-    'LN614829',
-    'LN868943',
-    'LN890331',
-    'LN890332',
-    'LN890333',
-    'LN890334',
-    'LN890518',
-    'LN868944',
-    'LN868945',
-    'LN868946',
-    'LN890519',
-    'LN908249',
-    'LN997841',
-    'U00089',
-    'HG514500',
-    'HG917973',
-    'LN681228',
-    'AE010300',
-    'AE014184',
-    'AE014299',
-    'AE016823',
-    'AE017196',
-    'AE017042',
-    'AE017126',
-    'AE010301',
-    'AE016824',
-    'AL646052',
-    'AM181176',
-    'AM406670',
-    'AM422018',
-    'AM902716',
-    'AP006725',
-    'AP008231',
-    'AP009178',
-    'AP009247',
-    'AP009179',
-    'AP009510',
-    'AP010656',
-    'AP009552',
-    'AP009511',
-    'AP009512',
-    'AP009513',
-    'AP010657',
-    'AP010658',
-    'AP010659',
-    'AP010660',
-    'AP011177',
-    'AP012048',
-    'AP012210',
-    'AP012205',
-    'AP012211',
-    'AP012212',
-    'AP012222',
-    'AP012276',
-    'AP012273',
-    'AP012224',
-    'AP012277',
-    'AP012278',
-    'AP012049',
-    'AE014300',
-    'AP012304',
-    'AP012279',
-    'AP012320',
-    'AP012305',
-    'AP012223',
-    'AP012549',
-    'AP012274',
-    'AP012275',
-    'AP012551',
-    'AP012554',
-    'AP012978',
-    'AP013035',
-    'AP013042',
-    'AP013028',
-    'AP013058',
-    'AP013293',
-    'AP013294',
-    'AP014521',
-    'AP014568',
-    'AP014572',
-    'AP014569',
-    'AP014576',
-    'AP014582',
-    'AP013059',
-    'AP014583',
-    'AP014613',
-    'AP014622',
-    'AP014624',
-    'AP014631',
-    'AP014633',
-    'AP014627',
-    'AP014637',
-    'AP014648',
-    'AP014649',
-    'AP014577',
-    'AP014570',
-    'AP014657',
-    'AP014658',
-    'AP014683',
-    'AP013060',
-    'AP012552',
-    'AP012553',
-    'AP014696',
-    'AP014685',
-    'AP014722',
-    'AP014719',
-    'AP014704',
-    'AP014800',
-    'AP014808',
-    'AP013061',
-    'AP014720',
-    'AP014721',
-    'AP014578',
-    'AP014659',
-    'AP014705',
-    'AP014686',
-    'AP014687',
-    'AP014688',
-    'AP014706',
-    'AP014707',
-    'AP014708',
-    'AP014709',
-    'AP014650',
-    'AP013062',
-    'AP014801',
-    'AP014802',
-    'AP014803',
-    'AP014579',
-    'AP014580',
-    'AP014581',
-    'AL646053',
-    'AP014821',
-    'AP014815',
-    'AP014854',
-    'AP014857',
-    'AP014816',
-    'AP014817',
-    'AP014818',
-    'AP014819',
-    'AP014820',
-    'AP014822',
-    'AP014823',
-    'AP014824',
-    'AP014825',
-    'AP014826',
-    'AP014827',
-    'AP014828',
-    'AP014829',
-    'AP014830',
-    'AP014831',
-    'AP014832',
-    'AP006726',
-    'AP014924',
-    'AP014926',
-    'AP014928',
-    'AP014925',
-    'AP014938',
-    'AP014942',
-    'AP014944',
-    'AP014945',
-    'AP014943',
-    'AE017043',
-    'AE017044',
-    'AE017045',
-    'AE017046',
-    'AP014950',
-    'AP014951',
-    'AP017295',
-    'AP017305',
-    'AP017308',
-    'AP017367',
-    'BX248583',
-    'BX548174',
-    'BX548175',
-    'BX936398',
-    'AP014952',
-    'AP014953',
-    'AP014954',
-    'AP014955',
-    'CP000083',
-    'CP000086',
-    'AP017309',
-    'AP017310',
-    'CP000095',
-    'CP000097',
-    'CP000100',
-    'CP000110',
-    'CP000111',
-    'CP000101',
-    'CP000117',
-    'CP000151',
-    'CP000159',
-    'CP000238',
-    'CP000239',
-    'CP000240',
-    'CP000249',
-    'CP000160',
-    'CP000264',
-    'CP000269',
-    'CP000302',
-    'CP000305',
-    'CP000312',
-    'CP000308',
-    'CP000316',
-    'CP000313',
-    'CP000314',
-    'CP000315',
-    'CP000348',
-    'CP000350',
-    'CP000351',
-    'CP000349',
-    'CP000317',
-    'CP000377',
-    'CP000318',
-    'CP000384',
-    'CP000390',
-    'CP000388',
-    'CP000393',
-    'CP000265',
-    'BX936399',
-    'BX936400',
-    'CP000435',
-    'CP000440',
-    'CP000444',
-    'CP000446',
-    'AP017311',
-    'CP000447',
-    'CP000376',
-    'CP000375',
-    'CP000152',
-    'CP000454',
-    'CP000150',
-    'CP000455',
-    'CP000456',
-    'CP000457',
-    'AP017296',
-    'CP000472',
-    'CP000469',
-    'CP000478',
-    'CP000470',
-    'AP017297',
-    'CP000306',
-    'CP000307',
-    'CP000488',
-    'CP000494',
-    'CP000507',
-    'CP000503',
-    'CP000389',
-    'CP000391',
-    'CP000509',
-    'CP000392',
-    'CP000510',
-    'CP000508',
-    'CP000445',
-    'CP000518',
-    'CP000551',
-    'CP000539',
-    'CP000554',
-    'CP000553',
-    'CP000552',
-    'CP000555',
-    'CP000563',
-    'CP000576',
-    'CP000570',
-    'CP000580',
-    'CP000606',
-    'CP000540',
-    'CP000541',
-    'CP000556',
-    'CP000564',
-    'CP000565',
-    'CP000566',
-    'CP000567',
-    'CP000571',
-    'CP000441',
-    'CP000442',
-    'AP017306',
-    'AP017307',
-    'CP000311',
-    'CP000309',
-    'CP000310',
-    'CP000653',
-    'CP000668',
-    'CP000681',
-    'CP000686',
-    'CP000713',
-    'CP000714',
-    'CP000715',
-    'CP000654',
-    'CP000669',
-    'CP000670',
-    'CP000085',
-    'CP000720',
-    'CP000749',
-    'CP000753',
-    'CP000770',
-    'CP000769',
-    'CP000777',
-    'CP000786',
-    'CP000806',
-    'CP000778',
-    'CP000821',
-    'CP000820',
-    'CP000825',
-    'CP000787',
-    'CP000828',
-    'CP000779',
-    'CP000788',
-    'CP000851',
-    'CP000879',
-    'CP000891',
-    'CP000901',
-    'CP000754',
-    'CP000923',
-    'CP000927',
-    'CP000931',
-    'CP000838',
-    'CP000943',
-    'CP000950',
-    'CP000951',
-    'CP000961',
-    'CP000928',
-    'CP000719',
-    'CP000718',
-    'CP000929',
-    'CP000969',
-    'CP000975',
-    'CP001013',
-    'CP001022',
-    'CP001025',
-    'CP001037',
-    'CP001048',
-    'CP001023',
-    'CP001024',
-    'CP000892',
-    'CP000893',
-    'CP001055',
-    'CP000894',
-    'CP001068',
-    'CP001080',
-    'CP001107',
-    'CP001069',
-    'CP001070',
-    'CP000952',
-    'CP000953',
-    'CP000954',
-    'CP000955',
-    'CP000956',
-    'CP000957',
-    'CP001130',
-    'CP001131',
-    'CP000902',
-    'CP000900',
-    'CP001226',
-    'CP001221',
-    'CP001252',
-    'CP001222',
-    'CP001253',
-    'CP001254',
-    'CP001255',
-    'CP001026',
-    'CP001281',
-    'CP001291',
-    'CP001322',
-    'CP001287',
-    'CP001344',
-    'CP001282',
-    'CP001364',
-    'CP001027',
-    'CP000119',
-    'CP000120',
-    'CP000121',
-    'CP000385',
-    'CP001391',
-    'CP001585',
-    'CP001589',
-    'CP001593',
-    'CP001605',
-    'CP001608',
-    'CP001615',
-    'CP001635',
-    'CP001638',
-    'CP001639',
-    'CP001640',
-    'CP000839',
-    'CP000840',
-    'CP000841',
-    'CP000842',
-    'CP000843',
-    'CP000844',
-    'CP000845',
-    'CP000846',
-    'CP001656',
-    'CP001661',
-    'CP001345',
-    'CP001049',
-    'CP001346',
-    'CP001347',
-    'CP001673',
-    'CP001292',
-    'CP000944',
-    'CP000945',
-    'CP001701',
-    'CP001707',
-    'CP001715',
-    'CP001733',
-    'CP000118',
-    'CP001736',
-    'CP001028',
-    'CP001751',
-    'CP001609',
-    'CP001610',
-    'CP001611',
-    'CP001791',
-    'CP001793',
-    'CP001794',
-    'CP001796',
-    'CP000519',
-    'CP001805',
-    'CP001797',
-    'CP001807',
-    'CP000807',
-    'CP000808',
-    'CP000809',
-    'CP000810',
-    'CP000811',
-    'GQ866234',
-    'GQ866235',
-    'CP001594',
-    'CP001595',
-    'CP001596',
-    'CP000520',
-    'GQ866233',
-    'CP001825',
-    'CP001808',
-    'CP001842',
-    'CP001795',
-    'CP001826',
-    'CP001590',
-    'CP001874',
-    'CP001591',
-    'CP001592',
-    'CP001905',
-    'CP001806',
-    'CP001716',
-    'CP001717',
-    'CP001718',
-    'CP001981',
-    'CP000495',
-    'CP002013',
-    'CP002021',
-    'CP002050',
-    'CP001906',
-    'CP002059',
-    'CP001586',
-    'CP001587',
-    'CP001588',
-    'CP002084',
-    'CP002124',
-    'CP002157',
-    'CP002163',
-    'CP002210',
-    'CP002198',
-    'CP002125',
-    'CP002126',
-    'CP002127',
-    'CP002128',
-    'CP002129',
-    'CP002199',
-    'CP002200',
-    'CP002201',
-    'CP002202',
-    'CP002203',
-    'CP002204',
-    'CP002014',
-    'CP002217',
-    'CP002244',
-    'CP002252',
-    'CP002249',
-    'CP002293',
-    'CP002015',
-    'CP002304',
-    'CP002016',
-    'CP002299',
-    'CP001636',
-    'CP002329',
-    'CP002339',
-    'CP002382',
-    'CP002383',
-    'CP002399',
-    'CP002248',
-    'CP002294',
-    'CP002250',
-    'CP002384',
-    'CP002218',
-    'CP001293',
-    'CP001294',
-    'CP001295',
-    'CP001296',
-    'CP001297',
-    'CP002022',
-    'CP002023',
-    'CP002433',
-    'CP002442',
-    'CP002447',
-    'CP002452',
-    'CP002457',
-    'CP002468',
-    'CP002479',
-    'CP002491',
-    'CP002511',
-    'CP002505',
-    'CP002492',
-    'CP002493',
-    'CP002514',
-    'CP002494',
-    'CP002495',
-    'CP002519',
-    'CP002443',
-    'CP002515',
-    'CP002506',
-    'CP002507',
-    'CP002448',
-    'CP002434',
-    'CP002435',
-    'CP002436',
-    'CP002437',
-    'CP002438',
-    'CP002520',
-    'CP012899',
-    'CP002060',
-    'CP002061',
-    'CP002528',
-    'CP002526',
-    'CP001288',
-    'CP001289',
-    'CP001290',
-    'CP002542',
-    'CP002552',
-    'CP002559',
-    'CP000443',
-    'CP002563',
-    'CP002527',
-    'CP002568',
-    'CP002580',
-    'CP002584',
-    'CP002560',
-    'CP002561',
-    'CP002585',
-    'CP002599',
-    'CP002564',
-    'CP002553',
-    'CP002554',
-    'CP002634',
-    'CP002663',
-    'CP002726',
-    'CP002734',
-    'CP002735',
-    'CP002569',
-    'CP002767',
-    'CP002773',
-    'CP002775',
-    'CP002774',
-    'CP002801',
-    'CP002809',
-    'CP002811',
-    'CP002819',
-    'CP002825',
-    'CP002820',
-    'CP002768',
-    'CP002769',
-    'CP002812',
-    'CP002813',
-    'CP002814',
-    'CP002664',
-    'CP002581',
-    'CP002802',
-    'CP002803',
-    'CP002600',
-    'CP002635',
-    'CP002601',
-    'CP002602',
-    'CP002603',
-    'CP002604',
-    'CP001702',
-    'CP001703',
-    'CP001704',
-    'CP001705',
-    'CP002872',
-    'CP002876',
-    'CP002877',
-    'CP002878',
-    'CP002898',
-    'CP002888',
-    'CP002889',
-    'CP002906',
-    'CP002907',
-    'CP002918',
-    'CP002927',
-    'CP002956',
-    'CP002959',
-    'CP002993',
-    'CP002960',
-    'CP003029',
-    'CP003030',
-    'CP003031',
-    'CP002879',
-    'CP003063',
-    'CP003078',
-    'CP003087',
-    'CP002880',
-    'CP003088',
-    'CP003126',
-    'CP003127',
-    'CP003171',
-    'CP003170',
-    'CP003184',
-    'CP003185',
-    'CP003186',
-    'CP003205',
-    'CP003203',
-    'CP002957',
-    'CP002958',
-    'CP003230',
-    'CP003172',
-    'CP003173',
-    'CP003089',
-    'CP003241',
-    'CP003259',
-    'CP003257',
-    'CP003258',
-    'CP003263',
-    'CP003265',
-    'CP003284',
-    'CP003204',
-    'CP003242',
-    'CP003270',
-    'CP003271',
-    'CP003272',
-    'CP003267',
-    'CP003268',
-    'CP003266',
-    'CP003269',
-    'CP003326',
-    'CP003327',
-    'CP003380',
-    'CP003390',
-    'CP003408',
-    'CP003409',
-    'CP003415',
-    'CP003424',
-    'CP003468',
-    'CP003470',
-    'CP003491',
-    'CP003492',
-    'CP003495',
-    'CP003514',
-    'CP003535',
-    'CP003536',
-    'CP003538',
-    'CP003547',
-    'CP003548',
-    'CP003546',
-    'CP003549',
-    'CP003552',
-    'CP003558',
-    'CP003587',
-    'CP003590',
-    'CP003559',
-    'CP003381',
-    'CP003515',
-    'CP003090',
-    'CP003591',
-    'CP003594',
-    'CP003592',
-    'CP003597',
-    'CP003593',
-    'CP003607',
-    'CP003610',
-    'CP003614',
-    'CP003620',
-    'CP003595',
-    'CP003596',
-    'CP003091',
-    'CP003092',
-    'CP003615',
-    'CP003616',
-    'CP003617',
-    'CP003618',
-    'CP003619',
-    'CP003608',
-    'CP003609',
-    'CP003611',
-    'CP003612',
-    'CP003613',
-    'CP003621',
-    'CP003622',
-    'CP003623',
-    'CP003624',
-    'CP003625',
-    'CP003626',
-    'CP003627',
-    'CP003628',
-    'CP003598',
-    'CP003599',
-    'CP003516',
-    'CP003630',
-    'CP003646',
-    'CP003653',
-    'CP003517',
-    'CP003631',
-    'CP003632',
-    'CP003633',
-    'CP003634',
-    'CP003635',
-    'CP003636',
-    'CP003637',
-    'CP003638',
-    'CP003654',
-    'CP003655',
-    'CP003656',
-    'CP003657',
-    'CP003658',
-    'CP003647',
-    'CP003648',
-    'CP003649',
-    'CP003650',
-    'CP003469',
-    'CP003659',
-    'CP003660',
-    'CP003661',
-    'CP003662',
-    'CP003663',
-    'CP003664',
-    'CP003665',
-    'CP003553',
-    'CP003554',
-    'CP003550',
-    'CP003551',
-    'CP003425',
-    'CP003733',
-    'CP003079',
-    'CP003080',
-    'CP003081',
-    'CP003735',
-    'CP003785',
-    'CP003801',
-    'CP003803',
-    'CP003804',
-    'CP003806',
-    'CP003805',
-    'CP003807',
-    'CP001038',
-    'CP003809',
-    'CP001039',
-    'CP003837',
-    'CP001040',
-    'CP003869',
-    'CP003872',
-    'CP003870',
-    'CP003879',
-    'CP003880',
-    'CP003938',
-    'CP003940',
-    'CP003943',
-    'CP003944',
-    'CP003945',
-    'CP003946',
-    'CP003947',
-    'CP003961',
-    'CP001041',
-    'CP001042',
-    'CP003948',
-    'CP003962',
-    'CP002908',
-    'CP002112',
-    'CP003978',
-    'CP002909',
-    'CP003982',
-    'CP003987',
-    'CP003990',
-    'CP004008',
-    'CP004019',
-    'CP004036',
-    'CP004089',
-    'CP004095',
-    'CP004097',
-    'CP004117',
-    'CP004037',
-    'CP004038',
-    'CP004039',
-    'CP004040',
-    'CP004041',
-    'CP004347',
-    'CP004098',
-    'CP004096',
-    'CP004090',
-    'CP004118',
-    'CP003991',
-    'CP003988',
-    'CP003285',
-    'CP004349',
-    'CP004348',
-    'CP003286',
-    'CP003287',
-    'CP003288',
-    'CP004371',
-    'CP004377',
-    'CP004381',
-    'CP004385',
-    'CP004390',
-    'CP004393',
-    'CP004403',
-    'CP004404',
-    'CP004405',
-    'CP005083',
-    'CP005188',
-    'CP005488',
-    'CP005489',
-    'CP004394',
-    'CP004395',
-    'CP005586',
-    'CP004396',
-    'CP004397',
-    'CP004398',
-    'CP005927',
-    'CP005084',
-    'CP005929',
-    'CP005957',
-    'CP005189',
-    'CP005085',
-    'CP005975',
-    'CP005991',
-    'CP005086',
-    'CP005990',
-    'CP005087',
-    'CP005190',
-    'CP005088',
-    'CP005090',
-    'CP005091',
-    'CP005092',
-    'CP005093',
-    'CP005089',
-    'CP005191',
-    'CP005192',
-    'CP005193',
-    'CP006047',
-    'CP006059',
-    'CP006060',
-    'CP006250',
-    'CP006254',
-    'CP006265',
-    'CP006270',
-    'CP006269',
-    'CP006271',
-    'CP006266',
-    'CP004378',
-    'CP006255',
-    'CP005992',
-    'CP006751',
-    'CP006754',
-    'CP006762',
-    'CP006758',
-    'CP006724',
-    'CP004386',
-    'CP006725',
-    'CP006726',
-    'CP006727',
-    'CP006268',
-    'CP006267',
-    'CP006367',
-    'CP006471',
-    'CP006566',
-    'CP006568',
-    'CP006569',
-    'CP006472',
-    'CP006473',
-    'CP006587',
-    'CP006591',
-    'CP006368',
-    'CP006570',
-    'CP006600',
-    'CP006369',
-    'CP006370',
-    'CP006588',
-    'CP006589',
-    'CP006590',
-    'CP006371',
-    'CP006372',
-    'CP006373',
-    'CP006374',
-    'CP006375',
-    'CP006614',
-    'CP006659',
-    'CP006673',
-    'CP006694',
-    'CP006723',
-    'CP006695',
-    'CP006748',
-    'CP004382',
-    'CP006772',
-    'CP006776',
-    'CP006783',
-    'CP006792',
-    'CP006805',
-    'CP006780',
-    'CP006779',
-    'CP006791',
-    'CP006790',
-    'CP006793',
-    'CP006663',
-    'CP006662',
-    'CP006660',
-    'CP006661',
-    'CP006837',
-    'CP006852',
-    'CP006866',
-    'CP006873',
-    'CP006881',
-    'CP006882',
-    'CP006753',
-    'CP006752',
-    'CP006911',
-    'CP006757',
-    'CP006756',
-    'CP006747',
-    'CP006746',
-    'CP006915',
-    'CP006913',
-    'CP006750',
-    'CP006749',
-    'CP006914',
-    'CP006929',
-    'CP006939',
-    'CP006761',
-    'CP006760',
-    'CP006992',
-    'CP006993',
-    'CP006994',
-    'CP006995',
-    'CP006251',
-    'CP007127',
-    'CP007028',
-    'CP007004',
-    'CP007014',
-    'CP007039',
-    'CP007012',
-    'CP007128',
-    'CP007053',
-    'CP007133',
-    'CP007151',
-    'CP007136',
-    'CP007152',
-    'CP007142',
-    'CP007155',
-    'CP007161',
-    'CP007208',
-    'CP007212',
-    'CP007233',
-    'CP007234',
-    'CP007241',
-    'CP007240',
-    'CP007229',
-    'CP007230',
-    'CP007265',
-    'CP007162',
-    'CP007163',
-    'CP007164',
-    'CP007129',
-    'CP007130',
-    'CP007287',
-    'CP007005',
-    'CP007054',
-    'CP007399',
-    'CP007006',
-    'CP007436',
-    'CP007410',
-    'CP007440',
-    'CP007441',
-    'CP007443',
-    'CP007444',
-    'CP007447',
-    'CP007445',
-    'CP007451',
-    'CP007209',
-    'CP007452',
-    'CP007454',
-    'CP007470',
-    'CP007453',
-    'CP007474',
-    'CP007490',
-    'CP007496',
-    'CP007497',
-    'CP007499',
-    'CP007501',
-    'CP007503',
-    'CP007506',
-    'CP007137',
-    'CP007514',
-    'CP007518',
-    'CP007512',
-    'CP007521',
-    'CP007524',
-    'CP007519',
-    'CP007535',
-    'CP007537',
-    'CP007539',
-    'CP007541',
-    'CP007542',
-    'CP007546',
-    'CP007231',
-    'CP007560',
-    'CP007561',
-    'CP007562',
-    'CP007566',
-    'CP007565',
-    'CP007135',
-    'CP007134',
-    'CP007543',
-    'CP007544',
-    'CP007545',
-    'CP007573',
-    'CP007577',
-    'CP007587',
-    'CP007576',
-    'CP007574',
-    'CP007588',
-    'CP007589',
-    'CP007591',
-    'CP007593',
-    'CP007594',
-    'CP007595',
-    'CP007600',
-    'CP007455',
-    'CP007604',
-    'CP007606',
-    'CP007618',
-    'CP007619',
-    'CP007620',
-    'CP007500',
-    'CP007626',
-    'CP007628',
-    'CP007627',
-    'CP007629',
-    'CP007631',
-    'CP007632',
-    'CP007633',
-    'CP007634',
-    'CP007630',
-    'CP007515',
-    'CP007646',
-    'CP007656',
-    'CP007657',
-    'CP007650',
-    'CP007649',
-    'CP007647',
-    'CP007648',
-    'CP007663',
-    'CP007667',
-    'CP007669',
-    'CP007670',
-    'CP007672',
-    'CP007674',
-    'CP007516',
-    'CP007676',
-    'CP007684',
-    'CP007517',
-    'CP007685',
-    'CP007686',
-    'CP007662',
-    'CP007687',
-    'CP007688',
-    'CP007689',
-    'CP007690',
-    'CP007635',
-    'CP007693',
-    'CP007695',
-    'CP007697',
-    'CP007636',
-    'CP007698',
-    'CP007694',
-    'CP007696',
-    'CP007658',
-    'CP007717',
-    'CP007711',
-    'CP007724',
-    'CP007716',
-    'CP007725',
-    'CP007675',
-    'CP007671',
-    'CP007738',
-    'CP007737',
-    'CP007673',
-    'CP007677',
-    'CP007678',
-    'CP007679',
-    'CP007743',
-    'CP007753',
-    'CP007744',
-    'CP007754',
-    'CP007755',
-    'CP007742',
-    'CP007617',
-    'CP007758',
-    'CP007757',
-    'CP007759',
-    'CP007578',
-    'CP007579',
-    'CP007580',
-    'CP007769',
-    'CP007783',
-    'CP007787',
-    'CP007793',
-    'CP007799',
-    'CP007800',
-    'CP007213',
-    'CP007809',
-    'CP008695',
-    'CP008697',
-    'CP008696',
-    'CP008699',
-    'CP008704',
-    'CP008706',
-    'CP008713',
-    'CP008712',
-    'CP007015',
-    'CP008724',
-    'CP008726',
-    'CP008730',
-    'CP008741',
-    'CP008747',
-    'CP007794',
-    'CP007795',
-    'CP008715',
-    'CP008716',
-    'CP008717',
-    'CP008718',
-    'CP008719',
-    'CP007784',
-    'CP007786',
-    'CP008707',
-    'CP008708',
-    'CP007782',
-    'CP007796',
-    'CP007621',
-    'CP007622',
-    'CP007623',
-    'CP007624',
-    'CP007625',
-    'CP008757',
-    'CP008750',
-    'CP008751',
-    'CP008756',
-    'CP007513',
-    'CP008758',
-    'CP008760',
-    'CP008774',
-    'CP008776',
-    'CP008775',
-    'CP008788',
-    'CP008762',
-    'CP008761',
-    'CP008789',
-    'CP008790',
-    'CP008791',
-    'CP008759',
-    'CP008720',
-    'CP008721',
-    'CP008802',
-    'CP008804',
-    'CP008805',
-    'CP008806',
-    'CP008807',
-    'CP008709',
-    'CP008820',
-    'CP008841',
-    'CP008846',
-    'CP008849',
-    'CP008852',
-    'CP008853',
-    'CP008819',
-    'CP008854',
-    'CP008855',
-    'CP008817',
-    'CP008818',
-    'CP008856',
-    'CP008847',
-    'CP008848',
-    'CP008842',
-    'CP008843',
-    'CP008844',
-    'CP008845',
-    'CP008705',
-    'CP008729',
-    'CP008857',
-    'CP008858',
-    'CP008859',
-    'CP008728',
-    'CP008860',
-    'CP008861',
-    'CP007785',
-    'CP008862',
-    'CP008863',
-    'CP008864',
-    'CP008865',
-    'CP008866',
-    'CP008867',
-    'CP008868',
-    'CP008727',
-    'CP008869',
-    'CP008870',
-    'CP008871',
-    'CP007797',
-    'CP007798',
-    'CP008872',
-    'CP007214',
-    'CP008873',
-    'CP008881',
-    'CP008883',
-    'CP008878',
-    'CP008876',
-    'CP008885',
-    'CP008889',
-    'CP008877',
-    'CP008896',
-    'CP008897',
-    'CP008902',
-    'CP008890',
-    'CP008903',
-    'CP008904',
-    'CP008905',
-    'CP008913',
-    'CP008914',
-    'CP008918',
-    'CP008920',
-    'CP008923',
-    'CP008919',
-    'CP008926',
-    'CP008929',
-    'CP008936',
-    'CP008941',
-    'CP008943',
-    'CP008944',
-    'CP008953',
-    'CP008898',
-    'CP008899',
-    'CP008900',
-    'CP008901',
-    'CP008957',
-    'CP008985',
-    'CP008986',
-    'CP008945',
-    'CP008995',
-    'CP008998',
-    'CP009001',
-    'CP009004',
-    'CP009010',
-    'CP009013',
-    'CP009007',
-    'CP009016',
-    'CP008906',
-    'CP008907',
-    'CP008942',
-    'CP009043',
-    'CP009046',
-    'CP009048',
-    'CP009056',
-    'CP009057',
-    'CP008937',
-    'CP008938',
-    'CP008939',
-    'CP008940',
-    'CP009072',
-    'CP009044',
-    'CP009047',
-    'CP009094',
-    'CP009096',
-    'CP009100',
-    'CP008958',
-    'CP009101',
-    'CP009104',
-    'CP009106',
-    'CP009108',
-    'CP008930',
-    'CP008931',
-    'CP008932',
-    'CP008933',
-    'CP009114',
-    'CP008993',
-    'CP008994',
-    'CP008996',
-    'CP008997',
-    'CP009122',
-    'CP008915',
-    'CP009002',
-    'CP009003',
-    'CP009006',
-    'CP009125',
-    'CP009126',
-    'CP008999',
-    'CP009000',
-    'CP009095',
-    'CP009129',
-    'CP009144',
-    'CP009130',
-    'CP009145',
-    'CP009146',
-    'CP009008',
-    'CP009009',
-    'CP009148',
-    'CP009147',
-    'CP009097',
-    'CP009011',
-    'CP009012',
-    'CP009015',
-    'CP009158',
-    'CP009159',
-    'CP009170',
-    'CP009105',
-    'CP009107',
-    'CP009211',
-    'CP009215',
-    'CP009216',
-    'CP009116',
-    'CP009115',
-    'CP009217',
-    'CP009223',
-    'CP009218',
-    'CP009219',
-    'CP009224',
-    'CP009225',
-    'CP009227',
-    'CP009228',
-    'CP009229',
-    'CP009235',
-    'CP009236',
-    'CP009237',
-    'CP009239',
-    'CP009234',
-    'CP009123',
-    'CP009241',
-    'CP009242',
-    'CP009256',
-    'CP009257',
-    'CP009258',
-    'CP009261',
-    'CP009264',
-    'CP009268',
-    'CP009274',
-    'CP009278',
-    'CP009279',
-    'CP009280',
-    'CP009262',
-    'CP009281',
-    'CP009282',
-    'CP009283',
-    'CP009265',
-    'CP009275',
-    'CP009276',
-    'CP009284',
-    'CP009285',
-    'CP009263',
-    'CP009286',
-    'CP009287',
-    'CP009288',
-    'CP009290',
-    'CP009266',
-    'CP009289',
-    'CP009109',
-    'CP009301',
-    'CP009302',
-    'CP009312',
-    'CP009073',
-    'CP009074',
-    'CP009325',
-    'CP009328',
-    'CP009323',
-    'CP009331',
-    'CP009335',
-    'CP009337',
-    'CP009341',
-    'CP009343',
-    'CP009354',
-    'CP009355',
-    'CP009365',
-    'CP009327',
-    'CP009326',
-    'CP009418',
-    'CP009415',
-    'CP009369',
-    'CP009416',
-    'CP009367',
-    'CP009420',
-    'CP009421',
-    'CP009422',
-    'CP009324',
-    'CP009426',
-    'CP009417',
-    'CP009427',
-    'CP009330',
-    'CP009329',
-    'CP009428',
-    'CP009429',
-    'CP009435',
-    'CP009438',
-    'CP009340',
-    'CP009339',
-    'CP009447',
-    'CP009336',
-    'CP009342',
-    'CP009449',
-    'CP009450',
-    'CP009451',
-    'CP009455',
-    'CP009454',
-    'CP009452',
-    'CP009368',
-    'CP009338',
-    'CP009458',
-    'CP009366',
-    'CP009459',
-    'CP009460',
-    'CP009461',
-    'CP009430',
-    'CP009431',
-    'CP009464',
-    'CP009470',
-    'CP009472',
-    'CP009453',
-    'CP009476',
-    'CP009357',
-    'CP009356',
-    'CP009359',
-    'CP009358',
-    'CP009488',
-    'CP009492',
-    'CP009496',
-    'CP009498',
-    'CP009531',
-    'CP009500',
-    'CP009532',
-    'CP009533',
-    'CP009534',
-    'CP009463',
-    'CP009462',
-    'CP009475',
-    'CP009539',
-    'CP009434',
-    'CP009544',
-    'CP009545',
-    'CP009549',
-    'CP009553',
-    'CP009555',
-    'CP009557',
-    'CP009558',
-    'CP009574',
-    'CP009571',
-    'CP009576',
-    'CP009583',
-    'CP009585',
-    'CP009587',
-    'CP009596',
-    'CP009572',
-    'CP009573',
-    'CP009543',
-    'CP009542',
-    'CP009584',
-    'CP009548',
-    'CP009593',
-    'CP009594',
-    'CP009595',
-    'CP009588',
-    'CP009546',
-    'CP009586',
-    'CP009556',
-    'CP009433',
-    'CP009432',
-    'CP009547',
-    'CP009486',
-    'CP009601',
-    'CP009487',
-    'CP009602',
-    'CP007575',
-    'CP009605',
-    'CP009608',
-    'CP009610',
-    'CP009611',
-    'CP009612',
-    'CP009604',
-    'CP009606',
-    'CP009603',
-    'CP009491',
-    'CP009490',
-    'CP009489',
-    'CP009616',
-    'CP009617',
-    'CP009618',
-    'CP009620',
-    'CP009619',
-    'CP009321',
-    'CP009322',
-    'CP009621',
-    'CP009623',
-    'CP009624',
-    'CP009631',
-    'CP009642',
-    'CP009676',
-    'CP009630',
-    'CP009632',
-    'CP009643',
-    'CP009629',
-    'CP009334',
-    'CP009332',
-    'CP009333',
-    'CP009679',
-    'CP009686',
-    'CP009687',
-    'CP009692',
-    'CP009688',
-    'CP009697',
-    'CP009700',
-    'CP009704',
-    'CP009707',
-    'CP009691',
-    'CP009696',
-    'CP009695',
-    'CP009699',
-    'CP009698',
-    'CP009702',
-    'CP009703',
-    'CP009701',
-    'CP009690',
-    'CP009689',
-    'CP009708',
-    'CP009439',
-    'CP009712',
-    'CP009715',
-    'CP009716',
-    'CP009720',
-    'CP009723',
-    'CP009743',
-    'CP009746',
-    'CP009747',
-    'CP009713',
-    'CP009714',
-    'CP009744',
-    'CP009719',
-    'CP009718',
-    'CP009717',
-    'CP009754',
-    'CP009755',
-    'CP009756',
-    'CP009757',
-    'CP009759',
-    'CP009745',
-    'CP009760',
-    'CP009761',
-    'CP009762',
-    'CP009711',
-    'CP009710',
-    'CP009765',
-    'CP009780',
-    'CP009781',
-    'CP009786',
-    'CP009785',
-    'CP009766',
-    'CP009721',
-    'CP009722',
-    'CP009724',
-    'CP009787',
-    'CP009788',
-    'CP009792',
-    'CP009798',
-    'CP009758',
-    'CP009799',
-    'CP009779',
-    'CP009783',
-    'CP009784',
-    'CP009782',
-    'CP009800',
-    'CP008954',
-    'CP009828',
-    'CP009801',
-    'CP009832',
-    'CP009838',
-    'CP009840',
-    'CP009844',
-    'CP009837',
-    'CP009847',
-    'CP009850',
-    'CP009851',
-    'CP009852',
-    'CP009853',
-    'CP009854',
-    'CP009859',
-    'CP009866',
-    'CP009831',
-    'CP009848',
-    'CP009849',
-    'CP009880',
-    'CP009888',
-    'CP009896',
-    'CP009889',
-    'CP009881',
-    'CP010325',
-    'CP009882',
-    'CP010326',
-    'CP009867',
-    'CP009868',
-    'CP009869',
-    'CP009870',
-    'CP009871',
-    'CP009883',
-    'CP009897',
-    'CP009884',
-    'CP009841',
-    'CP009839',
-    'CP009902',
-    'CP009906',
-    'CP009907',
-    'CP009910',
-    'CP009908',
-    'CP009911',
-    'CP009912',
-    'CP009913',
-    'CP009914',
-    'CP009830',
-    'CP009923',
-    'CP009855',
-    'CP009922',
-    'CP009856',
-    'CP009857',
-    'CP009925',
-    'CP009927',
-    'CP009928',
-    'CP009935',
-    'CP009933',
-    'CP009938',
-    'CP009941',
-    'CP009962',
-    'CP009973',
-    'CP009860',
-    'CP009861',
-    'CP009862',
-    'CP009982',
-    'CP009981',
-    'CP009984',
-    'CP009991',
-    'CP009842',
-    'CP009843',
-    'CP009997',
-    'CP010013',
-    'CP010017',
-    'CP010014',
-    'CP009985',
-    'CP009983',
-    'CP010023',
-    'CP010026',
-    'CP009939',
-    'CP009940',
-    'CP009901',
-    'CP009900',
-    'CP010028',
-    'CP010048',
-    'CP010049',
-    'CP009937',
-    'CP009934',
-    'CP009936',
-    'CP009980',
-    'CP009979',
-    'CP010054',
-    'CP010065',
-    'CP010067',
-    'CP009972',
-    'CP009971',
-    'CP010071',
-    'CP010075',
-    'CP010086',
-    'CP009989',
-    'CP009990',
-    'CP009988',
-    'CP009905',
-    'CP009904',
-    'CP009903',
-    'CP010088',
-    'CP010055',
-    'CP010056',
-    'CP010057',
-    'CP010087',
-    'CP010069',
-    'CP010068',
-    'CP010066',
-    'CP010027',
-    'CP010105',
-    'CP010114',
-    'CP010115',
-    'CP010247',
-    'CP010250',
-    'CP010018',
-    'CP010256',
-    'CP010255',
-    'CP010254',
-    'CP010253',
-    'CP010257',
-    'CP010258',
-    'CP010025',
-    'CP010024',
-    'CP010246',
-    'CP010248',
-    'CP010016',
-    'CP010022',
-    'CP010021',
-    'CP010020',
-    'CP010259',
-    'CP010260',
-    'CP010261',
-    'CP010262',
-    'CP010263',
-    'CP010264',
-    'CP010265',
-    'CP010266',
-    'CP010268',
-    'CP010295',
-    'CP010296',
-    'CP010297',
-    'CP010298',
-    'CP010299',
-    'CP010300',
-    'CP010304',
-    'CP010308',
-    'CP010309',
-    'CP010310',
-    'CP010311',
-    'CP010315',
-    'CP010319',
-    'CP010313',
-    'CP010322',
-    'CP010312',
-    'CP010329',
-    'CP010327',
-    'CP010330',
-    'CP010332',
-    'CP010333',
-    'CP010334',
-    'CP010335',
-    'CP010305',
-    'CP010336',
-    'CP010337',
-    'CP010338',
-    'CP010339',
-    'CP010317',
-    'CP010318',
-    'CP010316',
-    'CP010321',
-    'CP010320',
-    'CP010340',
-    'CP010346',
-    'CP009963',
-    'CP010361',
-    'CP010368',
-    'CP010359',
-    'CP010371',
-    'CP009320',
-    'CP009319',
-    'CP010376',
-    'CP010574',
-    'CP010575',
-    'CP010576',
-    'CP010377',
-    'CP009797',
-    'CP010384',
-    'CP010372',
-    'CP010373',
-    'CP010392',
-    'CP010394',
-    'CP010393',
-    'CP010395',
-    'CP010396',
-    'CP012170',
-    'CP010374',
-    'CP010375',
-    'CP010397',
-    'CP010401',
-    'CP010398',
-    'CP010399',
-    'CP010400',
-    'CP010903',
-    'CP010369',
-    'CP010370',
-    'CP010385',
-    'CP010386',
-    'CP010387',
-    'CP010406',
-    'CP010380',
-    'CP010379',
-    'CP010378',
-    'CP010409',
-    'CP010407',
-    'CP010412',
-    'CP010413',
-    'CP010414',
-    'CP010423',
-    'CP010427',
-    'CP010410',
-    'CP010429',
-    'CP010428',
-    'CP010432',
-    'CP010433',
-    'CP010431',
-    'CP010436',
-    'CP010437',
-    'CP010449',
-    'CP010450',
-    'CP010453',
-    'CP010451',
-    'CP010454',
-    'CP010457',
-    'CP010462',
-    'CP010460',
-    'CP010461',
-    'CP010463',
-    'CP010464',
-    'CP010465',
-    'CP010466',
-    'CP010468',
-    'CP010467',
-    'CP010469',
-    'CP010470',
-    'CP010471',
-    'CP010472',
-    'CP010473',
-    'CP010474',
-    'CP010476',
-    'CP010475',
-    'CP010477',
-    'CP010480',
-    'CP010478',
-    'CP010479',
-    'CP010481',
-    'CP010483',
-    'CP010482',
-    'CP010484',
-    'CP010485',
-    'CP010486',
-    'CP010487',
-    'CP010488',
-    'CP010489',
-    'CP010452',
-    'CP010490',
-    'CP010491',
-    'CP010492',
-    'CP010493',
-    'CP010494',
-    'CP010495',
-    'CP010497',
-    'CP010496',
-    'CP010499',
-    'CP010498',
-    'CP010500',
-    'CP010501',
-    'CP010502',
-    'CP010503',
-    'CP010504',
-    'CP010506',
-    'CP010509',
-    'CP010507',
-    'CP010505',
-    'CP010508',
-    'CP010015',
-    'CP010510',
-    'CP010511',
-    'CP010512',
-    'CP010520',
-    'CP010521',
-    'CP010523',
-    'CP010524',
-    'CP010519',
-    'CP010522',
-    'CP010525',
-    'CP010518',
-    'CP010528',
-    'CP010535',
-    'CP010536',
-    'CP010548',
-    'CP010552',
-    'CP010554',
-    'CP010555',
-    'CP010567',
-    'CP010556',
-    'CP010557',
-    'CP010568',
-    'CP010569',
-    'CP010570',
-    'CP010571',
-    'CP010572',
-    'CP010585',
-    'CP010537',
-    'CP010513',
-    'CP010777',
-    'CP010776',
-    'CP010778',
-    'CP010779',
-    'CP010783',
-    'CP010781',
-    'CP010792',
-    'CP010795',
-    'CP010796',
-    'CP010797',
-    'CP010799',
-    'CP010819',
-    'CP010802',
-    'CP010803',
-    'CP010804',
-    'CP010800',
-    'CP010811',
-    'CP010812',
-    'CP010816',
-    'CP010794',
-    'CP010817',
-    'CP010818',
-    'CP010801',
-    'CP010820',
-    'CP010827',
-    'CP010782',
-    'CP010828',
-    'CP010829',
-    'CP010836',
-    'CP010838',
-    'CP010839',
-    'CP010840',
-    'CP010841',
-    'CP010843',
-    'CP010842',
-    'CP010837',
-    'CP010844',
-    'CP010780',
-    'CP010845',
-    'CP010846',
-    'CP010847',
-    'CP010848',
-    'CP010850',
-    'CP010852',
-    'CP010867',
-    'CP010869',
-    'CP010851',
-    'CP010870',
-    'CP010871',
-    'CP010872',
-    'CP010853',
-    'CP010854',
-    'CP010830',
-    'CP010831',
-    'CP010832',
-    'CP010873',
-    'CP010874',
-    'CP010875',
-    'CP010876',
-    'CP010888',
-    'CP010889',
-    'CP010890',
-    'CP010896',
-    'CP010892',
-    'CP010897',
-    'CP010904',
-    'CP010907',
-    'CP010912',
-    'CP010908',
-    'CP010909',
-    'CP010910',
-    'CP010911',
-    'CP010945',
-    'CP010947',
-    'CP010951',
-    'CP010954',
-    'CP010961',
-    'CP010962',
-    'CP010963',
-    'CP010964',
-    'CP010965',
-    'CP010966',
-    'CP010967',
-    'CP010973',
-    'CP010975',
-    'CP010891',
-    'CP010976',
-    'CP010989',
-    'CP010993',
-    'CP010994',
-    'CP010995',
-    'CP013041',
-    'CP013042',
-    'CP013043',
-    'CP013044',
-    'CP013045',
-    'CP013615',
-    'CP013040',
-    'CP013039',
-    'CP010998',
-    'CP013038',
-    'CP010997',
-    'CP010999',
-    'CP011004',
-    'CP011005',
-    'CP011007',
-    'CP010955',
-    'CP010956',
-    'CP010957',
-    'CP011008',
-    'CP011010',
-    'CP010958',
-    'CP010959',
-    'CP010960',
-    'CP011015',
-    'CP011018',
-    'CP011020',
-    'CP011016',
-    'CP011017',
-    'CP011022',
-    'CP011021',
-    'CP011024',
-    'CP011034',
-    'CP011035',
-    'CP011019',
-    'CP010408',
-    'CP010898',
-    'CP010270',
-    'CP010990',
-    'CP010269',
-    'CP010974',
-    'CP010893',
-    'CP010894',
-    'CP010948',
-    'CP010949',
-    'CP010950',
-    'CP011047',
-    'CP011048',
-    'CP011049',
-    'CP011050',
-    'CP010877',
-    'CP010878',
-    'CP010879',
-    'CP010880',
-    'CP010881',
-    'CP010882',
-    'CP011051',
-    'CP011052',
-    'CP011058',
-    'CP011059',
-    'CP011068',
-    'CP011071',
-    'CP011072',
-    'CP011073',
-    'CP011077',
-    'CP011095',
-    'CP011078',
-    'CP011098',
-    'CP011100',
-    'CP011053',
-    'CP011054',
-    'CP011006',
-    'CP011101',
-    'CP011105',
-    'CP011104',
-    'CP011108',
-    'CP011110',
-    'CP011112',
-    'CP011113',
-    'CP011116',
-    'CP011117',
-    'CP011106',
-    'CP011120',
-    'CP011118',
-    'CP011125',
-    'CP011126',
-    'CP011127',
-    'CP011128',
-    'CP011129',
-    'CP011130',
-    'CP011131',
-    'CP011119',
-    'CP011132',
-    'CP011121',
-    'CP011122',
-    'CP011123',
-    'CP011144',
-    'CP011145',
-    'CP011147',
-    'CP011150',
-    'CP011151',
-    'CP011153',
-    'CP011155',
-    'CP011133',
-    'CP011146',
-    'CP011111',
-    'CP011152',
-    'CP011156',
-    'CP011157',
-    'CP011154',
-    'CP011009',
-    'CP011158',
-    'CP011159',
-    'CP011209',
-    'CP010991',
-    'CP011210',
-    'CP011211',
-    'CP011212',
-    'CP011213',
-    'CP011214',
-    'CP011215',
-    'CP011216',
-    'CP011217',
-    'CP011232',
-    'CP011246',
-    'CP011254',
-    'CP011253',
-    'CP011255',
-    'CP011247',
-    'CP011256',
-    'CP011257',
-    'CP011268',
-    'CP011265',
-    'CP011248',
-    'CP011249',
-    'CP011269',
-    'CP011270',
-    'CP011258',
-    'CP011518',
-    'CP011519',
-    'CP011520',
-    'CP011521',
-    'CP011023',
-    'CP011271',
-    'CP011272',
-    'CP011273',
-    'CP011279',
-    'CP011280',
-    'CP011286',
-    'CP011281',
-    'CP011282',
-    'CP011283',
-    'CP015123',
-    'CP011284',
-    'CP011285',
-    'CP011289',
-    'CP011287',
-    'CP011295',
-    'CP011293',
-    'CP011294',
-    'CP011300',
-    'CP011301',
-    'CP011303',
-    'CP011304',
-    'CP011306',
-    'CP011305',
-    'CP011307',
-    'CP011308',
-    'CP011309',
-    'CP011310',
-    'CP011311',
-    'CP011312',
-    'CP015441',
-    'CP011317',
-    'CP011320',
-    'CP011274',
-    'CP011275',
-    'CP011276',
-    'CP011277',
-    'CP011321',
-    'CP011322',
-    'CP011323',
-    'CP011324',
-    'CP011328',
-    'CP011325',
-    'CP011329',
-    'CP011302',
-    'CP011339',
-    'CP011340',
-    'CP011341',
-    'CP011291',
-    'CP011344',
-    'CP011346',
-    'CP011348',
-    'CP011347',
-    'CP011349',
-    'CP011359',
-    'CP011364',
-    'CP011366',
-    'CP011372',
-    'CP011367',
-    'CP011368',
-    'CP011371',
-    'CP011373',
-    'CP011386',
-    'CP011382',
-    'CP011389',
-    'CP011391',
-    'CP011392',
-    'CP011397',
-    'CP011398',
-    'CP011399',
-    'CP011400',
-    'CP011401',
-    'CP011406',
-    'CP011410',
-    'CP011409',
-    'CP011411',
-    'CP011415',
-    'CP011412',
-    'CP011416',
-    'CP011419',
-    'CP011413',
-    'CP011427',
-    'CP011440',
-    'CP011407',
-    'CP011408',
-    'CP011417',
-    'CP011418',
-    'CP011383',
-    'CP011384',
-    'CP011385',
-    'CP010977',
-    'CP011441',
-    'CP011442',
-    'CP011443',
-    'CP011444',
-    'CP011445',
-    'CP011446',
-    'CP011447',
-    'CP011448',
-    'CP011451',
-    'CP011452',
-    'CP011454',
-    'CP011456',
-    'CP011474',
-    'CP011477',
-    'CP011489',
-    'CP011479',
-    'CP011453',
-    'CP011494',
-    'CP011495',
-    'CP011501',
-    'CP011502',
-    'CP011478',
-    'CP011503',
-    'CP011507',
-    'CP011480',
-    'CP011481',
-    'CP011509',
-    'CP011496',
-    'CP011511',
-    'CP011512',
-    'CP011516',
-    'CP011522',
-    'CP011504',
-    'CP011505',
-    'CP011457',
-    'CP011506',
-    'CP011350',
-    'CP011528',
-    'CP011530',
-    'CP011534',
-    'CP011535',
-    'CP011538',
-    'CP011539',
-    'CP011542',
-    'CP011541',
-    'CP011545',
-    'CP011529',
-    'CP011546',
-    'CP011568',
-    'CP011572',
-    'CP011578',
-    'CP011543',
-    'CP011544',
-    'CP011581',
-    'CP011584',
-    'CP011591',
-    'CP011597',
-    'CP011602',
-    'CP011577',
-    'CP011576',
-    'CP011575',
-    'CP011612',
-    'CP011569',
-    'CP011570',
-    'CP011571',
-    'CP011618',
-    'CP011624',
-    'CP011600',
-    'CP011601',
-    'CP011599',
-    'CP011598',
-    'CP011580',
-    'CP011636',
-    'CP011647',
-    'CP011355',
-    'CP011356',
-    'CP011357',
-    'CP011642',
-    'CP011358',
-    'CP011351',
-    'CP011352',
-    'CP011353',
-    'CP011354',
-    'CP011650',
-    'CP011610',
-    'CP011583',
-    'CP011582',
-    'CP011586',
-    'CP011623',
-    'CP011627',
-    'CP011633',
-    'CP011628',
-    'CP011914',
-    'CP011594',
-    'CP011596',
-    'CP011592',
-    'CP011593',
-    'CP011595',
-    'CP011917',
-    'CP011808',
-    'CP011809',
-    'CP011927',
-    'CP011929',
-    'CP011930',
-    'CP011603',
-    'CP011604',
-    'CP011605',
-    'CP011606',
-    'CP011607',
-    'CP011609',
-    'CP011611',
-    'CP011608',
-    'CP011657',
-    'CP011663',
-    'CP011685',
-    'CP011664',
-    'CP011654',
-    'CP011655',
-    'CP011653',
-    'CP011585',
-    'CP011587',
-    'CP011588',
-    'CP011590',
-    'CP011589',
-    'CP011686',
-    'CP011769',
-    'CP011770',
-    'CP011773',
-    'CP011771',
-    'CP011772',
-    'CP011619',
-    'CP011620',
-    'CP011621',
-    'CP011622',
-    'CP011651',
-    'CP011652',
-    'CP011656',
-    'CP011777',
-    'CP011774',
-    'CP011625',
-    'CP011634',
-    'CP011630',
-    'CP011631',
-    'CP011626',
-    'CP011632',
-    'CP011635',
-    'CP011787',
-    'CP011788',
-    'CP011789',
-    'CP011798',
-    'CP011801',
-    'CP011805',
-    'CP011807',
-    'CP011828',
-    'CP011649',
-    'CP011832',
-    'CP011834',
-    'CP011829',
-    'CP011854',
-    'CP011830',
-    'CP011831',
-    'CP011853',
-    'CP011855',
-    'CP011833',
-    'CP011863',
-    'CP011862',
-    'CP011868',
-    'CP011882',
-    'CP011643',
-    'CP011644',
-    'CP011645',
-    'CP011646',
-    'CP011864',
-    'CP011865',
-    'CP011866',
-    'CP011867',
-    'CP011617',
-    'CP011616',
-    'CP011613',
-    'CP011614',
-    'CP011931',
-    'CP011938',
-    'CP011939',
-    'CP011932',
-    'CP011933',
-    'CP011540',
-    'CP011965',
-    'CP011971',
-    'CP011968',
-    'CP011974',
-    'CP011975',
-    'CP011995',
-    'CP011969',
-    'CP011994',
-    'CP011970',
-    'CP011997',
-    'CP012006',
-    'CP012004',
-    'CP012022',
-    'CP012020',
-    'CP012021',
-    'CP012024',
-    'CP012023',
-    'CP012026',
-    'CP011641',
-    'CP011637',
-    'CP011638',
-    'CP011640',
-    'CP011639',
-    'CP012025',
-    'CP012007',
-    'CP012008',
-    'CP015323',
-    'CP015324',
-    'CP015325',
-    'CP015326',
-    'CP015327',
-    'CP015328',
-    'CP015329',
-    'CP015330',
-    'CP011998',
-    'CP012005',
-    'CP011918',
-    'CP012029',
-    'CP012033',
-    'CP012034',
-    'CP012040',
-    'CP012041',
-    'CP012045',
-    'CP012030',
-    'CP012031',
-    'CP012032',
-    'CP012046',
-    'CP012066',
-    'CP011919',
-    'CP011920',
-    'CP012042',
-    'CP011928',
-    'CP012067',
-    'CP012068',
-    'CP012069',
-    'CP012070',
-    'CP012071',
-    'CP012072',
-    'CP012073',
-    'CP012076',
-    'CP011296',
-    'CP011297',
-    'CP011298',
-    'CP012095',
-    'CP012099',
-    'CP012109',
-    'CP012111',
-    'CP012122',
-    'CP012125',
-    'CP012126',
-    'CP012123',
-    'CP012124',
-    'CP012127',
-    'CP012136',
-    'CP012149',
-    'CP012148',
-    'CP012147',
-    'CP012150',
-    'CP012151',
-    'CP012152',
-    'CP012154',
-    'CP012155',
-    'CP012156',
-    'CP012157',
-    'CP012159',
-    'CP012160',
-    'CP012162',
-    'CP012165',
-    'CP012167',
-    'CP012171',
-    'CP012161',
-    'CP012181',
-    'CP012184',
-    'CP012187',
-    'CP012188',
-    'CP012189',
-    'CP012190',
-    'CP012191',
-    'CP012194',
-    'CP012192',
-    'CP012196',
-    'CP012199',
-    'CP012201',
-    'CP012202',
-    'CP012412',
-    'CP012252',
-    'CP012203',
-    'CP012253',
-    'CP012163',
-    'CP010360',
-    'CP012164',
-    'CP010383',
-    'CP012169',
-    'CP012168',
-    'CP010381',
-    'CP010382',
-    'CP012266',
-    'CP010366',
-    'CP010363',
-    'CP012166',
-    'CP010364',
-    'CP010367',
-    'CP010365',
-    'CP012269',
-    'CP012270',
-    'CP012271',
-    'CP012272',
-    'CP012273',
-    'CP012274',
-    'CP012288',
-    'CP012294',
-    'CP012299',
-    'CP012289',
-    'CP012295',
-    'CP012296',
-    'CP012290',
-    'CP012291',
-    'CP012292',
-    'CP012293',
-    'CP012328',
-    'CP012329',
-    'CP012332',
-    'CP012333',
-    'CP012343',
-    'CP012254',
-    'CP012255',
-    'CP012256',
-    'CP012100',
-    'CP012352',
-    'CP012357',
-    'CP012358',
-    'CP012359',
-    'CP012360',
-    'CP012361',
-    'CP012362',
-    'CP012101',
-    'CP012363',
-    'CP012102',
-    'CP012364',
-    'CP012366',
-    'CP012103',
-    'CP012104',
-    'CP012105',
-    'CP012106',
-    'CP012107',
-    'CP012108',
-    'CP012370',
-    'CP012367',
-    'CP012368',
-    'CP012267',
-    'CP012381',
-    'CP012373',
-    'CP012384',
-    'CP012390',
-    'CP012385',
-    'CP012386',
-    'CP012374',
-    'CP012193',
-    'CP012398',
-    'CP012410',
-    'CP012400',
-    'CP012401',
-    'CP012413',
-    'CP012411',
-    'CP012419',
-    'CP012402',
-    'CP012420',
-    'CP012421',
-    'CP012422',
-    'CP012475',
-    'CP012414',
-    'CP012415',
-    'CP012416',
-    'CP012417',
-    'CP012479',
-    'CP012480',
-    'CP012482',
-    'CP012483',
-    'CP012476',
-    'CP012742',
-    'CP012506',
-    'CP012487',
-    'CP012507',
-    'CP012504',
-    'CP012403',
-    'CP012508',
-    'CP012478',
-    'CP012477',
-    'CP012509',
-    'CP012510',
-    'CP012511',
-    'CP012512',
-    'CP012514',
-    'CP012515',
-    'CP012517',
-    'CP012522',
-    'CP012399',
-    'CP012529',
-    'CP012533',
-    'CP012530',
-    'CP012531',
-    'CP012532',
-    'CP012541',
-    'CP012534',
-    'CP012535',
-    'CP012536',
-    'CP012537',
-    'CP012538',
-    'CP012539',
-    'CP012540',
-    'CP012554',
-    'CP012404',
-    'CP012405',
-    'CP012406',
-    'CP012407',
-    'CP012408',
-    'CP012488',
-    'CP012186',
-    'CP012185',
-    'CP012182',
-    'CP012559',
-    'CP011513',
-    'CP012573',
-    'CP012574',
-    'CP012575',
-    'CP012183',
-    'CP011869',
-    'CP012576',
-    'CP012588',
-    'CP012586',
-    'CP012589',
-    'CP012590',
-    'CP012591',
-    'CP012593',
-    'CP012603',
-    'CP012604',
-    'CP012594',
-    'CP012595',
-    'CP012596',
-    'CP012592',
-    'CP012577',
-    'CP012489',
-    'CP012490',
-    'CP012608',
-    'CP012622',
-    'CP012625',
-    'CP012623',
-    'CP012631',
-    'CP012633',
-    'CP012635',
-    'CP012639',
-    'CP012640',
-    'CP012641',
-    'CP012642',
-    'CP012643',
-    'CP012646',
-    'CP012647',
-    'CP012648',
-    'CP012649',
-    'CP012644',
-    'CP012645',
-    'CP012650',
-    'CP012665',
-    'CP012661',
-    'CP012669',
-    'CP012657',
-    'CP012655',
-    'CP012651',
-    'CP012652',
-    'CP012659',
-    'CP012660',
-    'CP012653',
-    'CP012656',
-    'CP012658',
-    'CP012662',
-    'CP012663',
-    'CP012664',
-    'CP012485',
-    'CP012484',
-    'CP012486',
-    'CP012654',
-    'CP012674',
-    'CP012675',
-    'CP012676',
-    'CP012677',
-    'CP012678',
-    'CP012679',
-    'CP012680',
-    'CP012707',
-    'CP012708',
-    'CP012709',
-    'CP012710',
-    'CP012711',
-    'CP012685',
-    'CP012687',
-    'CP012695',
-    'CP012696',
-    'CP012688',
-    'CP012686',
-    'CP012626',
-    'CP012697',
-    'CP012627',
-    'CP012700',
-    'CP012628',
-    'CP012629',
-    'CP012630',
-    'CP012712',
-    'CP012698',
-    'CP012699',
-    'CP012701',
-    'CP012702',
-    'CP012703',
-    'CP012704',
-    'CP012705',
-    'CP012636',
-    'CP012637',
-    'CP012638',
-    'CP012715',
-    'CP012718',
-    'CP012518',
-    'CP012731',
-    'CP012516',
-    'CP012746',
-    'CP012750',
-    'CP012752',
-    'CP012753',
-    'CP012801',
-    'CP012802',
-    'CP012805',
-    'CP012808',
-    'CP012830',
-    'CP012831',
-    'CP012751',
-    'CP012832',
-    'CP012836',
-    'CP012837',
-    'CP012869',
-    'CP012870',
-    'CP012747',
-    'CP012871',
-    'CP012873',
-    'CP012874',
-    'CP012875',
-    'CP012876',
-    'CP012877',
-    'CP012878',
-    'CP012879',
-    'CP012880',
-    'CP012890',
-    'CP012891',
-    'CP012892',
-    'CP012893',
-    'CP012894',
-    'CP012632',
-    'CP012634',
-    'CP012803',
-    'CP012754',
-    'CP012748',
-    'CP013254',
-    'CP012895',
-    'CP012896',
-    'CP012897',
-    'CP012898',
-    'CP012900',
-    'CP012905',
-    'CP012907',
-    'CP012906',
-    'CP012911',
-    'CP012908',
-    'CP012914',
-    'CP012920',
-    'CP012924',
-    'CP012912',
-    'CP012913',
-    'CP012930',
-    'CP012909',
-    'CP012910',
-    'CP012925',
-    'CP012927',
-    'CP012926',
-    'CP012928',
-    'CP012929',
-    'CP012915',
-    'CP012916',
-    'CP012917',
-    'CP012918',
-    'CP012919',
-    'CP013125',
-    'CP013139',
-    'CP013105',
-    'CP013056',
-    'CP012804',
-    'CP012939',
-    'CP012937',
-    'CP012938',
-    'CP012943',
-    'CP012946',
-    'CP012949',
-    'CP012952',
-    'CP012958',
-    'CP012941',
-    'CP012942',
-    'CP012940',
-    'CP012944',
-    'CP012960',
-    'CP012970',
-    'CP012961',
-    'CP012962',
-    'CP012963',
-    'CP012964',
-    'CP012965',
-    'CP012966',
-    'CP012967',
-    'CP012971',
-    'CP012953',
-    'CP012955',
-    'CP012956',
-    'CP012954',
-    'CP012932',
-    'CP012931',
-    'CP012933',
-    'CP012935',
-    'CP012936',
-    'CP012972',
-    'CP012974',
-    'CP012978',
-    'CP012976',
-    'CP012979',
-    'CP011665',
-    'CP011523',
-    'CP012987',
-    'CP012996',
-    'CP012999',
-    'CP012975',
-    'CP013000',
-    'CP012973',
-    'CP013002',
-    'CP013009',
-    'CP013025',
-    'CP012980',
-    'CP013029',
-    'CP013010',
-    'CP013034',
-    'CP011666',
-    'CP013035',
-    'CP011667',
-    'CP013046',
-    'CP013049',
-    'CP013055',
-    'CP013003',
-    'CP012989',
-    'CP012990',
-    'CP013028',
-    'CP013030',
-    'CP013001',
-    'CP013024',
-    'CP013026',
-    'CP013027',
-    'CP013224',
-    'CP013489',
-    'CP012991',
-    'CP012988',
-    'CP013062',
-    'CP013064',
-    'CP013065',
-    'CP013066',
-    'CP013067',
-    'CP013068',
-    'CP013099',
-    'CP013069',
-    'CP013102',
-    'CP013106',
-    'CP013112',
-    'CP013114',
-    'CP013100',
-    'CP013118',
-    'CP013119',
-    'CP013126',
-    'CP013124',
-    'CP013128',
-    'CP013129',
-    'CP013130',
-    'CP013137',
-    'CP013133',
-    'CP013141',
-    'CP013138',
-    'CP013134',
-    'CP013135',
-    'CP013144',
-    'CP013142',
-    'CP013145',
-    'CP013146',
-    'CP013178',
-    'CP013103',
-    'CP013143',
-    'CP013187',
-    'CP013189',
-    'CP013195',
-    'CP013196',
-    'CP013200',
-    'CP013202',
-    'CP013203',
-    'CP013211',
-    'CP013212',
-    'CP013216',
-    'CP013213',
-    'CP013201',
-    'CP013217',
-    'CP013214',
-    'CP013231',
-    'CP013226',
-    'CP013232',
-    'CP013233',
-    'CP013234',
-    'CP013235',
-    'CP013237',
-    'CP013188',
-    'CP013179',
-    'CP013180',
-    'CP013181',
-    'CP013245',
-    'CP013227',
-    'CP013228',
-    'CP013229',
-    'CP013230',
-    'CP013104',
-    'CP013252',
-    'CP013253',
-    'CP013225',
-    'CP013260',
-    'CP013261',
-    'CP013262',
-    'CP013057',
-    'CP013058',
-    'CP013059',
-    'CP013060',
-    'CP013061',
-    'CP013263',
-    'CP013264',
-    'CP013265',
-    'CP013274',
-    'CP013266',
-    'CP013267',
-    'CP013268',
-    'CP013269',
-    'CP013270',
-    'CP013271',
-    'CP013272',
-    'CP013285',
-    'CP013286',
-    'CP013287',
-    'CP013289',
-    'CP013292',
-    'CP013293',
-    'CP013327',
-    'CP013297',
-    'CP013322',
-    'CP013338',
-    'CP013341',
-    'CP013298',
-    'CP013299',
-    'CP013294',
-    'CP013324',
-    'CP013323',
-    'CP013325',
-    'CP013339',
-    'CP013340',
-    'CP013273',
-    'CP013255',
-    'CP013256',
-    'CP013257',
-    'CP013258',
-    'CP013344',
-    'CP013347',
-    'CP013350',
-    'CP013352',
-    'CP013351',
-    'CP013353',
-    'CP013354',
-    'CP013348',
-    'CP013345',
-    'CP013349',
-    'CP013047',
-    'CP013355',
-    'CP013380',
-    'CP013476',
-    'CP013480',
-    'CP013484',
-    'CP013481',
-    'CP013611',
-    'CP013614',
-    'CP013616',
-    'CP013619',
-    'CP013621',
-    'CP013485',
-    'CP013620',
-    'CP013486',
-    'CP013487',
-    'CP013488',
-    'CP013650',
-    'CP013482',
-    'CP013651',
-    'CP013652',
-    'CP013653',
-    'CP013658',
-    'CP013659',
-    'CP013661',
-    'CP013667',
-    'CP013671',
-    'CP013617',
-    'CP013618',
-    'CP013672',
-    'CP013660',
-    'CP013689',
-    'CP013688',
-    'CP013690',
-    'CP013697',
-    'CP013692',
-    'CP013696',
-    'CP013698',
-    'CP013699',
-    'CP013711',
-    'CP013723',
-    'CP013722',
-    'CP013724',
-    'CP013725',
-    'CP013727',
-    'CP013729',
-    'CP013382',
-    'CP013733',
-    'CP013736',
-    'CP013735',
-    'CP013734',
-    'CP013691',
-    'CP013737',
-    'CP013668',
-    'CP013741',
-    'CP013745',
-    'CP013747',
-    'CP013829',
-    'CP013831',
-    'CP013838',
-    'CP013835',
-    'CP013837',
-    'CP013836',
-    'CP013748',
-    'CP013746',
-    'CP013833',
-    'CP013834',
-    'CP013832',
-    'CP013204',
-    'CP013205',
-    'CP013206',
-    'CP013207',
-    'CP013208',
-    'CP013209',
-    'CP013712',
-    'CP013713',
-    'CP013839',
-    'CP013840',
-    'CP013859',
-    'CP013860',
-    'CP013862',
-    'CP013861',
-    'CP013909',
-    'CP013910',
-    'CP013911',
-    'CP013912',
-    'CP013657',
-    'CP013913',
-    'CP013919',
-    'CP013920',
-    'CP013921',
-    'CP013923',
-    'CP013924',
-    'CP013926',
-    'CP013928',
-    'CP013932',
-    'CP013929',
-    'CP013933',
-    'CP013939',
-    'CP013944',
-    'CP013949',
-    'CP013950',
-    'CP013945',
-    'CP013953',
-    'CP013946',
-    'CP013947',
-    'CP013948',
-    'CP013955',
-    'CP013957',
-    'CP013959',
-    'CP013927',
-    'CP013965',
-    'CP013975',
-    'CP013976',
-    'CP013977',
-    'CP013978',
-    'CP013987',
-    'CP013954',
-    'CP013956',
-    'CP013988',
-    'CP013989',
-    'CP013990',
-    'CP013991',
-    'CP013992',
-    'CP013958',
-    'CP013994',
-    'CP013960',
-    'CP013995',
-    'CP013996',
-    'CP013997',
-    'CP013998',
-    'CP014010',
-    'CP014012',
-    'CP013925',
-    'CP014013',
-    'CP014015',
-    'CP014016',
-    'CP014329',
-    'CP014017',
-    'CP013966',
-    'CP013967',
-    'CP013968',
-    'CP013969',
-    'CP014022',
-    'CP014024',
-    'CP014026',
-    'CP014027',
-    'CP014028',
-    'CP014029',
-    'CP014030',
-    'CP013999',
-    'CP014000',
-    'CP014001',
-    'CP014002',
-    'CP014003',
-    'CP014031',
-    'CP014034',
-    'CP013914',
-    'CP013915',
-    'CP014042',
-    'CP014038',
-    'CP014035',
-    'CP014048',
-    'CP014046',
-    'CP014051',
-    'CP014056',
-    'CP014057',
-    'CP014055',
-    'CP014047',
-    'CP014060',
-    'CP014064',
-    'CP014065',
-    'CP014067',
-    'CP014070',
-    'CP014099',
-    'CP014068',
-    'CP014096',
-    'CP014097',
-    'CP014098',
-    'CP014100',
-    'CP014101',
-    'CP014063',
-    'CP014069',
-    'CP014066',
-    'CP014059',
-    'CP014049',
-    'CP014058',
-    'CP014138',
-    'CP014129',
-    'CP014126',
-    'CP014127',
-    'CP014128',
-    'CP014039',
-    'CP014050',
-    'CP014139',
-    'CP013612',
-    'CP014144',
-    'CP014141',
-    'CP014140',
-    'CP014145',
-    'CP014153',
-    'CP014159',
-    'CP014158',
-    'CP014142',
-    'CP014160',
-    'CP014161',
-    'CP014162',
-    'CP014163',
-    'CP014164',
-    'CP014179',
-    'CP014196',
-    'CP014177',
-    'CP014178',
-    'CP013613',
-    'CP014043',
-    'CP014197',
-    'CP014205',
-    'CP014206',
-    'CP014207',
-    'CP014209',
-    'CP014215',
-    'CP014222',
-    'CP014208',
-    'CP014226',
-    'CP014227',
-    'CP014228',
-    'CP014229',
-    'CP014198',
-    'CP014199',
-    'CP014200',
-    'CP014232',
-    'CP014231',
-    'CP014233',
-    'CP014234',
-    'CP014241',
-    'CP014239',
-    'CP014250',
-    'CP014252',
-    'CP014238',
-    'CP014256',
-    'CP014240',
-    'CP014257',
-    'CP014237',
-    'CP014251',
-    'CP014236',
-    'CP014235',
-    'CP014259',
-    'CP014253',
-    'CP014254',
-    'CP014261',
-    'CP014267',
-    'CP014264',
-    'CP014268',
-    'CP014274',
-    'CP014279',
-    'CP014275',
-    'CP014282',
-    'CP014304',
-    'CP014301',
-    'CP014306',
-    'CP014313',
-    'CP014276',
-    'CP014277',
-    'CP014322',
-    'CP014323',
-    'CP014326',
-    'CP014302',
-    'CP014327',
-    'CP014334',
-    'CP014335',
-    'CP014342',
-    'CP014011',
-    'CP014344',
-    'CP014343',
-    'CP014260',
-    'CP014345',
-    'CP014352',
-    'CP014336',
-    'CP014449',
-    'CP014471',
-    'CP014307',
-    'CP014328',
-    'CP014474',
-    'CP014476',
-    'CP014475',
-    'CP014450',
-    'CP014477',
-    'CP014451',
-    'CP014452',
-    'CP014485',
-    'CP014308',
-    'CP014303',
-    'CP014309',
-    'CP014310',
-    'CP014311',
-    'CP014353',
-    'CP014488',
-    'CP014492',
-    'CP014495',
-    'CP014497',
-    'CP014504',
-    'CP014505',
-    'CP014513',
-    'CP014517',
-    'CP014506',
-    'CP014493',
-    'CP014494',
-    'CP014507',
-    'CP014508',
-    'CP014509',
-    'CP014510',
-    'CP014511',
-    'CP014512',
-    'CP014514',
-    'CP014515',
-    'CP014516',
-    'CP014496',
-    'CP014498',
-    'CP014489',
-    'CP014490',
-    'CP014491',
-    'CP014312',
-    'CP014518',
-    'CP014522',
-    'CP014519',
-    'CP014523',
-    'CP014524',
-    'CP014216',
-    'CP014217',
-    'CP014525',
-    'CP014526',
-    'CP014527',
-    'CP014528',
-    'CP014539',
-    'CP014538',
-    'CP014540',
-    'CP014541',
-    'CP014544',
-    'CP014545',
-    'CP014546',
-    'CP013381',
-    'CP014578',
-    'CP014608',
-    'CP014579',
-    'CP014580',
-    'CP014581',
-    'CP014582',
-    'CP014478',
-    'CP014479',
-    'CP014609',
-    'CP014616',
-    'CP014634',
-    'CP014643',
-    'CP014646',
-    'CP014651',
-    'CP014696',
-    'CP014702',
-    'CP014742',
-    'CP014744',
-    'CP014743',
-    'CP014745',
-    'CP014746',
-    'CP014748',
-    'CP014749',
-    'CP014768',
-    'CP014771',
-    'CP014773',
-    'CP014774',
-    'CP014780',
-    'CP014703',
-    'CP014781',
-    'CP014783',
-    'CP014697',
-    'CP014698',
-    'CP014786',
-    'CP014784',
-    'CP014787',
-    'CP014790',
-    'CP014788',
-    'CP014789',
-    'CP014791',
-    'CP014805',
-    'CP014775',
-    'CP014806',
-    'CP014841',
-    'CP014847',
-    'CP014652',
-    'CP014653',
-    'CP014654',
-    'CP014655',
-    'CP014656',
-    'CP014807',
-    'CP014769',
-    'CP014770',
-    'CP014772',
-    'CP014644',
-    'CP014747',
-    'CP014848',
-    'CP014849',
-    'CP014850',
-    'CP014851',
-    'CP014852',
-    'CP014853',
-    'CP014472',
-    'CP014473',
-    'CP014861',
-    'CP014864',
-    'CP014865',
-    'CP014867',
-    'CP014869',
-    'CP014945',
-    'CP014947',
-    'CP014948',
-    'CP014949',
-    'CP014950',
-    'CP014951',
-    'CP014952',
-    'CP014953',
-    'CP014946',
-    'CP014954',
-    'CP014956',
-    'CP014955',
-    'CP014957',
-    'CP014958',
-    'CP014959',
-    'CP014960',
-    'CP014961',
-    'CP014963',
-    'CP014964',
-    'CP014290',
-    'CP014288',
-    'CP014287',
-    'CP014289',
-    'CP014993',
-    'CP015004',
-    'CP015005',
-    'CP015020',
-    'CP015023',
-    'CP015033',
-    'CP015006',
-    'CP015007',
-    'CP015008',
-    'CP015009',
-    'CP015036',
-    'CP015062',
-    'CP015064',
-    'CP015066',
-    'CP015067',
-    'CP015021',
-    'CP015068',
-    'CP015069',
-    'CP015074',
-    'CP014286',
-    'CP014285',
-    'CP014284',
-    'CP015076',
-    'CP015063',
-    'CP014283',
-    'CP015022',
-    'CP015080',
-    'CP015098',
-    'CP015099',
-    'CP015065',
-    'CP015107',
-    'CP015110',
-    'CP015114',
-    'CP015034',
-    'CP015117',
-    'CP015126',
-    'CP015127',
-    'CP015128',
-    'CP015129',
-    'CP015136',
-    'CP015111',
-    'CP015112',
-    'CP015145',
-    'CP015138',
-    'CP015150',
-    'CP015173',
-    'CP015075',
-    'CP015070',
-    'CP015072',
-    'CP015073',
-    'CP015071',
-    'CP015219',
-    'CP015077',
-    'CP015078',
-    'CP015220',
-    'CP015224',
-    'CP015037',
-    'CP015227',
-    'CP015174',
-    'CP015175',
-    'CP015035',
-    'CP015032',
-    'CP015038',
-    'CP015238',
-    'CP015249',
-    'CP015140',
-    'CP015141',
-    'CP015142',
-    'CP015143',
-    'CP015144',
-    'CP015139',
-    'CP015285',
-    'CP015345',
-    'CP015346',
-    'CP015347',
-    'CP015147',
-    'CP015148',
-    'CP015146',
-    'CP015364',
-    'CP015371',
-    'CP015377',
-    'CP015378',
-    'CP015372',
-    'CP015373',
-    'CP015374',
-    'CP015379',
-    'CP015380',
-    'CP015417',
-    'CP015421',
-    'CP015435',
-    'CP015436',
-    'CP015438',
-    'CP015365',
-    'CP015366',
-    'CP015439',
-    'CP015440',
-    'CP015437',
-    'CP015422',
-    'CP015151',
-    'CP015152',
-    'CP015153',
-    'CP015154',
-    'CP015155',
-    'CP015156',
-    'CP015448',
-    'CP015511',
-    'CP015515',
-    'CP015516',
-    'CP015521',
-    'CP015517',
-    'CP015528',
-    'CP015557',
-    'CR543861',
-    'CP015522',
-    'CP015523',
-    'CR954246',
-    'CT573326',
-    'CT971583',
-    'CT978603',
-    'CR954247',
-    'CU207211',
-    'CU234118',
-    'CU466930',
-    'CU469464',
-    'CP013728',
-    'CU928158',
-    'CU928163',
-    'FM162591',
-    'FM178379',
-    'FM954972',
-    'FN543093',
-    'FN543502',
-    'FM178380',
-    'FM178382',
-    'FM178384',
-    'FM178383',
-    'FM178381',
-    'FN667741',
-    'FO082060',
-    'CU928144',
-    'FO082820',
-    'FO203431',
-    'FO203526',
-    'FO393392',
-    'FO538765',
-    'FO681348',
-    'FM954973',
-    'FO704550',
-    'FO818637',
-    'FO834906',
-    'FN543094',
-    'FN543095',
-    'FN543096',
-    'FP476056',
-    'FP565575',
-    'FP565809',
-    'FN543503',
-    'FN543504',
-    'FO538766',
-    'FO082821',
-    'FO082822',
-    'FO082061',
-    'FN543505',
-    'FP565814',
-    'FP671138',
-    'FP929003',
-    'FP929140',
-    'FP565810',
-    'FP565811',
-    'FP565812',
-    'FQ312004',
-    'FP565813',
-    'FQ859181',
-    'FR733646',
-    'FR872580',
-    'FR856862',
-    'FR821777',
-    'FR667692',
-    'FR856860',
-    'FR856861',
-    'HE660029',
-    'FR856859',
-    'HE956757',
-    'HE999704',
-    'HF545616',
-    'HF572917',
-    'HF545617',
-    'HG316453',
-    'HG326223',
-    'FR821778',
-    'HG518322',
-    'HG793133',
-    'HG917868',
-    'HG518323',
-    'HG934468',
-    'HG965802',
-    'HG969192',
-    'LK021130',
-    'LK028559',
-    'LK055284',
-    'LK391695',
-    'LK936442',
-    'LM651928',
-    'LM655252',
-    'LM993812',
-    'LM995446',
-    'LM995447',
-    'LM997412',
-    'LN515532',
-    'LN554882',
-    'LN554846',
-    'LN554852',
-    'LN554884',
-    'LN606600',
-    'HG917869',
-    'LN614756',
-    'LN614830',
-    'HG969193',
-    'LK021129',
-    'LK021128',
-    'HG518324',
-    'LN606601',
-    'LN554847',
-    'LN554849',
-    'HE610900',
-    'HE610901',
-    'CP015221',
-    'FO203527',
-    'LN649255',
-    'LN680001',
-    'LN649259',
-    'LN681225',
-    'LN734649',
-    'LN794158',
-    'LN794217',
-    'LN824133',
-    'LN827929',
-    'LN824141',
-    'LN831024',
-    'LN824139',
-    'LN824134',
-    'LN824135',
-    'LN824136',
-    'LN824137',
-    'LN824138',
-    'LN681226',
-    'LN554851',
-    'LN554850',
-    'LN554848',
-    'LN831025',
-    'LN831026',
-    'HE610902',
-    'LN831029',
-    'LN831030',
-    'LN831035',
-    'LN831036',
-    'LN831039',
-    'LN831031',
-    'LN831048',
-    'LN831040',
-    'LN831049',
-    'LN831041',
-    'LN831032',
-    'LN831033',
-    'LN831042',
-    'LN831051',
-    'LN831046',
-    'LN831047',
-    'LN846980',
-    'LN846995',
-    'LN846996',
-    'LN847000',
-    'LN847221',
-    'LN847257',
-    'LN847264',
-    'LN847353',
-    'LN849008',
-    'LN865143',
-    'LN854573',
-    'LN868200',
-    'LN831050',
-    'LN831037',
-    'LN831038',
-    'LN865144',
-    'FO834904',
-    'FO834905',
-    'LN868938',
-    'LN869922',
-    'LN868939',
-    'LN868940',
-    'LN868941',
-    'LN868942',
-    'LN554854',
-    'LN554853',
-    'LN871187',
-    'LN877293',
-    'LN879502',
-    'LN881739',
-    'LN885086',
-    'LN879503',
-    'LN890520',
-    'LN890522',
-    'LN890524',
-    'LN907827',
-    'LN907858',
-    'LN907867',
-    'LN890521',
-    'LN997842',
-    'LN890523',
-    'LN890525',
-    'LN890526',
-    'LN997846',
-    'LN997848',
-    'LN907828',
-    'LN907829',
-    'LN997863',
-    'LN997864',
-    'LN997849',
-    'LN997843',
-    'LN997844',
-    'LN997845',
-    'LK936443',
-    'LN998829',
-    'LN998830',
-    'LN999011',
-    'LN999056',
-    'LN999057',
-    'LN999829',
-    'LN999831',
-    'LN999832',
-    'LN999833',
-    'LN999834',
-    'LN999835',
-    'LN999836',
-    'LN999837',
-    'LN999844',
-    'LT546645',
-    'LT546646',
-    'LN999830',
-    'FM162592',
-    'FO704549',
-    'FO818639',
-    'FO818638',
-    'CP007232',
-    'CP007390',
-    'CP007391',
-    'CP007392',
-    'CP007393',
-    'CP007394',
-    'CP007471',
-    'CP007472',
-    'CP007491',
-    'CP007504',
-    'CP007509',
-    'CP007510',
-    'CP007570',
-    'CP007571',
-    'CP007572',
-    'CP007586',
-    'CP007590',
-    'CP007605',
-    'CP007653',
-    'CP007654',
-    'CP007655',
-    'CP007681',
-    'CP007680',
-    'CP007682',
-    'CP007683',
-    'CP007700',
-    'CP007701',
-    'CP007722',
-    'CP007723',
-    'CP007781',
-    'CP007780',
-    'CP007779',
-    'CP008711',
-    'CP008710',
-    'CP008723',
-    'CP008722',
-    'CP008732',
-    'CP008731',
-    'CP008780',
-    'CP008779',
-    'CP008781',
-    'CP008782',
-    'CP008834',
-    'CP008835',
-    'CP008922',
-    'CP008924',
-    'CP009128',
-    'CP009127',
-    'CP009157',
-    'CP009156',
-    'CP009155',
-    'CP009154',
-    'CP009209',
-    'CP009210',
-    'CP009436',
-    'CP009437',
-    'CP009440',
-    'CP012280',
-    'CP012281',
-    'CP012282',
-    'CP012283',
-    'CP012284',
-    'CP012285',
-    'CP012286',
-    'CP012287',
-    'CP009441',
-    'CP009442',
-    'CP009443',
-    'CP009444',
-    'CP009446',
-    'CP009445',
-    'CP009456',
-    'CP009495',
-    'CP009600',
-    'CP009599',
-    'CP009609',
-    'CP009748',
-    'CP009749',
-    'CP009796',
-    'CP010053',
-    'CP010249',
-    'CP010251',
-    'CP010252',
-    'CP010458',
-    'CP010459',
-    'CP010849',
-    'CP011099',
-    'CP011278',
-    'CP011492',
-    'CP011574',
-    'CP011573',
-    'CP011934',
-    'CP011935',
-    'CP012027',
-    'CP012028',
-    'CP012077',
-    'CP012275',
-    'CP012276',
-    'CP012277',
-    'CP012278',
-    'CP012279',
-    'CP012351',
-    'CP012354',
-    'CP012355',
-    'CP012356',
-    'CP012369',
-    'CP012959',
-    'CP013063',
-    'CP013236',
-    'CP013743',
-    'CP013744',
-    'CP013930',
-    'CP013931',
-    'CP014023',
-    'CP014113',
-    'CP014114',
-    'CP014115',
-    'CP014635',
-    'CP014856',
-    'CP014857',
-    'HG969191',
-    'LN649236',
-    'LN865164',
-    'AP014585',
-    'AP014646',
-    'AP014651',
-    'AP014839',
-    'AP017302',
-    'AP017320',
-    'AP017321',
-    'CP000049',
-    'CP000667',
-    'CP000850',
-    'CP006592',
-    'CP006593',
-    'CP006594',
-    'CP006595',
-    'CP006596',
-    'CP006597',
-    'CP006611',
-    'CP006598',
-    'CP006612',
-    'CP006599',
-    'CP006613',
-    'CP006671',
-    'CP006676',
-    'CP006680',
-])
+dbv1_accessions = AccessionSet(ACCESSION_FILE)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print('Usage: {} <accession list>'.format(sys.argv[0]), file=sys.stderr)
+        sys.exit(2)
+    with open(sys.argv[1], 'r') as fh:
+        write_accession_file([line.strip() for line in fh if line.strip()], ACCESSION_FILE)
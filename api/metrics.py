@@ -0,0 +1,150 @@
+'''Minimal in-process metrics in the Prometheus text exposition format
+
+Metrics are kept per process, so with several gunicorn workers every worker
+reports its own values.
+'''
+
+from bisect import bisect_left
+import threading
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REGISTRY = []
+
+
+def _format_labels(labelnames, labelvalues, extra=()):
+    '''Render a label set like {name="value",...}'''
+    pairs = list(zip(labelnames, labelvalues)) + list(extra)
+    if not pairs:
+        return ''
+    escaped = ('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+               for name, value in pairs)
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class _Metric(object):
+    '''Base class of all metrics, registers itself on creation'''
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError('Expected labels {} for {}'.format(self.labelnames, self.name))
+        return tuple(labels[name] for name in self.labelnames)
+
+    def samples(self):
+        '''Get (suffix, label values, extra labels, value) tuples for rendering'''
+        with self._lock:
+            return [('', key, (), value) for key, value in sorted(self._values.items())]
+
+    def render(self):
+        lines = [
+            '# HELP {} {}'.format(self.name, self.documentation),
+            '# TYPE {} {}'.format(self.name, self.kind),
+        ]
+        for suffix, key, extra, value in self.samples():
+            lines.append('{}{}{} {}'.format(self.name, suffix, _format_labels(self.labelnames, key, extra),
+                                            _format_value(value)))
+        return lines
+
+
+class Counter(_Metric):
+    '''A value that only goes up'''
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    '''A value that can go up and down'''
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def get(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    '''Observations counted into cumulative buckets'''
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0, 0.0]
+            entry[0][bisect_left(self.buckets, value)] += 1
+            entry[1] += 1
+            entry[2] += value
+
+    def get(self, **labels):
+        '''Get the (count, sum) of observations'''
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            if entry is None:
+                return 0, 0.0
+            return entry[1], entry[2]
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, (counts, count, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    samples.append(('_bucket', key, (('le', _format_value(bound)),), cumulative))
+                samples.append(('_count', key, (), count))
+                samples.append(('_sum', key, (), total))
+        return samples
+
+
+def render():
+    '''Render all registered metrics in the Prometheus text format
+
+    >>> counter = Counter('asdb_doctest_total', 'Doctest counter', ['kind'])
+    >>> counter.inc(kind='a')
+    >>> [line for line in render().splitlines() if 'asdb_doctest' in line]
+    ['# HELP asdb_doctest_total Doctest counter', '# TYPE asdb_doctest_total counter', 'asdb_doctest_total{kind="a"} 1.0']
+    '''
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
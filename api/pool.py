@@ -0,0 +1,82 @@
+'''Database connection pool configuration and instrumentation'''
+
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import NullPool, QueuePool
+
+from .metrics import Counter, Gauge, Histogram
+
+POOL_CHECKOUT_WAIT = Histogram('asdb_db_pool_checkout_wait_seconds',
+                               'Time spent waiting for a database connection from the pool')
+POOL_IN_USE = Gauge('asdb_db_pool_connections_in_use', 'Database connections currently checked out')
+POOL_OVERFLOWS = Counter('asdb_db_pool_overflow_total', 'Connections opened beyond the configured pool size')
+POOL_TIMEOUTS = Counter('asdb_db_pool_timeout_total', 'Checkouts that timed out waiting for a connection')
+
+
+class InstrumentedQueuePool(QueuePool):
+    '''QueuePool recording checkout wait time, connections in use and overflow events'''
+    def _do_get(self):
+        start = time.perf_counter()
+        overflow_before = self.overflow()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+        if self.overflow() > max(overflow_before, 0):
+            POOL_OVERFLOWS.inc()
+        POOL_IN_USE.inc()
+        return conn
+
+    def _do_return_conn(self, conn):
+        POOL_IN_USE.dec()
+        super()._do_return_conn(conn)
+
+
+def _env_bool(environ, name, default):
+    return environ.get(name, default).lower() in ('true', 'yes', '1')
+
+
+def engine_options(environ):
+    '''Build SQLAlchemy engine options from AS_DB_* environment variables
+
+    >>> engine_options({})['pool_size']
+    5
+    >>> options = engine_options({'AS_DB_POOL_SIZE': '20', 'AS_DB_POOL_PRE_PING': 'false'})
+    >>> options['pool_size'], options['pool_pre_ping']
+    (20, False)
+    >>> engine_options({'AS_DB_PGBOUNCER': 'true'})['poolclass'].__name__
+    'NullPool'
+    '''
+    if _env_bool(environ, 'AS_DB_PGBOUNCER', 'false'):
+        # PgBouncer in transaction pooling mode does the pooling, so keep no
+        # connections (and no session state) around in the workers
+        return {
+            'poolclass': NullPool,
+        }
+
+    return {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': int(environ.get('AS_DB_POOL_SIZE', '5')),
+        'max_overflow': int(environ.get('AS_DB_MAX_OVERFLOW', '10')),
+        'pool_recycle': int(environ.get('AS_DB_POOL_RECYCLE', '1800')),
+        'pool_pre_ping': _env_bool(environ, 'AS_DB_POOL_PRE_PING', 'true'),
+        'pool_timeout': float(environ.get('AS_DB_POOL_TIMEOUT', '30')),
+    }
+
+
+def prewarm(engine, count):
+    '''Open count connections at once and return them to the pool'''
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+    return len(connections)
@@ -0,0 +1,394 @@
+'''Protein similarity search over the CDS translations of the database
+
+Proteins are indexed by the 5-mers of their sequence in a reduced, 10 letter
+amino acid alphabet (Murphy et al. 2000), which finds distant homologues that
+share few exact k-mers. The index is built offline from Cds.translation and
+stored as one file of a CSR postings matrix: for every possible k-mer, the rows
+of the proteins containing it. The file is memory-mapped, so all worker
+processes share the same read-only pages.
+
+A search counts the k-mers every protein shares with the query with a single
+bincount over the postings of the query k-mers. The best candidates can then be
+verified with a Smith-Waterman alignment (BLOSUM62, gap open 11, extend 1) that
+is vectorized over the candidates and split over a thread pool by length. Only
+the top MAX_VERIFIED candidates are aligned, with at most MAX_ALIGNED_LENGTH
+residues of the query, to bound the cost of a search.
+
+To build the index from the database in $AS_DB_URI, run
+    python -m api.protein_index proteins.idx [--processes N]
+and point AS_PROTEIN_INDEX to the file. This needs numpy, see index_requirements.txt.
+'''
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Murphy et al. 2000, 10 letter reduced alphabet
+REDUCED_ALPHABET = ('LVIM', 'C', 'A', 'G', 'ST', 'P', 'FYW', 'EDNQ', 'KR', 'H')
+KMER_SIZE = 5
+
+AMINO_ACIDS = 'ARNDCQEGHILKMFPSTWYV'
+BLOSUM62 = '''
+ 4 -1 -2 -2  0 -1 -1  0 -2 -1 -1 -1 -1 -2 -1  1  0 -3 -2  0
+-1  5  0 -2 -3  1  0 -2  0 -3 -2  2 -1 -3 -2 -1 -1 -3 -2 -3
+-2  0  6  1 -3  0  0  0  1 -3 -3  0 -2 -3 -2  1  0 -4 -2 -3
+-2 -2  1  6 -3  0  2 -1 -1 -3 -4 -1 -3 -3 -1  0 -1 -4 -3 -3
+ 0 -3 -3 -3  9 -3 -4 -3 -3 -1 -1 -3 -1 -2 -3 -1 -1 -2 -2 -1
+-1  1  0  0 -3  5  2 -2  0 -3 -2  1  0 -3 -1  0 -1 -2 -1 -2
+-1  0  0  2 -4  2  5 -2  0 -3 -3  1 -2 -3 -1  0 -1 -3 -2 -2
+ 0 -2  0 -1 -3 -2 -2  6 -2 -4 -4 -2 -3 -3 -2  0 -2 -2 -3 -3
+-2  0  1 -1 -3  0  0 -2  8 -3 -3 -1 -2 -1 -2 -1 -2 -2  2 -3
+-1 -3 -3 -3 -1 -3 -3 -4 -3  4  2 -3  1  0 -3 -2 -1 -3 -1  3
+-1 -2 -3 -4 -1 -2 -3 -4 -3  2  4 -2  2  0 -3 -2 -1 -2 -1  1
+-1  2  0 -1 -3  1  1 -2 -1 -3 -2  5 -1 -3 -1  0 -1 -3 -2 -2
+-1 -1 -2 -3 -1  0 -2 -3 -2  1  2 -1  5  0 -2 -1 -1 -1 -1  1
+-2 -3 -3 -3 -2 -3 -3 -3 -1  0  0 -3  0  6 -4 -2 -2  1  3 -1
+-1 -2 -2 -1 -3 -1 -1 -2 -2 -3 -3 -1 -2 -4  7 -1 -1 -4 -3 -2
+ 1 -1  1  0 -1  0  0  0 -1 -2 -2  0 -1 -2 -1  4  1 -3 -2 -2
+ 0 -1  0 -1 -1 -1 -1 -2 -2 -1 -1 -1 -1 -2 -1  1  5 -2 -2  0
+-3 -3 -4 -4 -2 -2 -3 -2 -2 -3 -2 -3 -1  1 -4 -3 -2 11  2 -3
+-2 -2 -2 -3 -2 -1 -2 -3  2 -1 -1 -2 -1  3 -3 -2 -2  2  7 -1
+ 0 -3 -3 -3 -1 -2 -2 -3 -3  3  1 -2  1 -1 -2 -2  0 -3 -1  4
+'''
+# Score of anything aligned to a character not in AMINO_ACIDS, like X
+UNKNOWN_SCORE = -1
+# Score of padding at the end of shorter targets, low enough to end any local alignment
+PADDING_SCORE = -1000
+GAP_OPEN = 11
+GAP_EXTEND = 1
+
+INVALID = 255
+MAX_QUERY_LENGTH = 10000
+# Alignment costs query length x target length per candidate, so verification
+# is limited to the best candidates and to the start of long queries
+MAX_VERIFIED = 50
+MAX_ALIGNED_LENGTH = 2000
+
+
+def clean_sequence(text):
+    '''Get the protein sequence of a plain or FASTA formatted query, upper case without whitespace
+
+    Raises a ValueError if there is no sequence, it is too long or contains invalid characters.
+
+    >>> clean_sequence('>query\\nmktAYIA KQRQ\\nISFVK*')
+    'MKTAYIAKQRQISFVK*'
+    '''
+    lines = [line for line in text.splitlines() if not line.startswith('>')]
+    sequence = ''.join(''.join(lines).split()).upper()
+    if not sequence:
+        raise ValueError('Empty protein sequence')
+    if len(sequence) > MAX_QUERY_LENGTH:
+        raise ValueError('Protein sequences are limited to {} residues'.format(MAX_QUERY_LENGTH))
+    if not sequence.replace('*', '').isalpha() or not sequence.isascii():
+        raise ValueError('Invalid characters in protein sequence')
+    return sequence
+
+
+def _reduced_table():
+    table = np.full(256, INVALID, dtype=np.uint8)
+    for code, group in enumerate(REDUCED_ALPHABET):
+        for letter in group:
+            table[ord(letter)] = code
+            table[ord(letter.lower())] = code
+    return table
+
+
+def _residue_table():
+    table = np.full(256, len(AMINO_ACIDS), dtype=np.uint8)
+    for code, letter in enumerate(AMINO_ACIDS):
+        table[ord(letter)] = code
+        table[ord(letter.lower())] = code
+    return table
+
+
+def _score_matrix():
+    '''Get BLOSUM62 extended by a row/column for unknown residues and one for padding'''
+    size = len(AMINO_ACIDS)
+    matrix = np.full((size + 2, size + 2), UNKNOWN_SCORE, dtype=np.int32)
+    matrix[:size, :size] = np.array(BLOSUM62.split(), dtype=np.int32).reshape(size, size)
+    matrix[:, size + 1] = PADDING_SCORE
+    matrix[size + 1, :] = PADDING_SCORE
+    return matrix
+
+
+if np is not None:
+    REDUCED_TABLE = _reduced_table()
+    RESIDUE_TABLE = _residue_table()
+    SCORE_MATRIX = _score_matrix()
+
+
+def kmer_codes(sequence, k=KMER_SIZE):
+    '''Get the sorted, distinct reduced alphabet k-mers of a protein sequence as integers
+
+    K-mers containing characters outside of the alphabet, like X or *, are skipped.
+    '''
+    values = REDUCED_TABLE[np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)]
+    if len(values) < k:
+        return np.empty(0, dtype=np.uint32)
+    windows = np.lib.stride_tricks.sliding_window_view(values, k)
+    valid = (windows != INVALID).all(axis=1)
+    powers = len(REDUCED_ALPHABET) ** np.arange(k - 1, -1, -1, dtype=np.uint32)
+    return np.unique(windows[valid].astype(np.uint32) @ powers)
+
+
+def _encode_chunk(chunk):
+    '''Get the concatenated k-mers and k-mer counts of a chunk of sequences'''
+    codes = [kmer_codes(sequence or '') for sequence in chunk]
+    counts = np.array([len(protein) for protein in codes], dtype=np.uint32)
+    if not codes:
+        return np.empty(0, dtype=np.uint32), counts
+    return np.concatenate(codes), counts
+
+
+class KmerIndex(object):
+    '''Memory-mapped CSR postings of the reduced alphabet k-mers of proteins
+
+    The file starts with a header of magic bytes, the k-mer size, the alphabet
+    size, the number of proteins and the number of postings, followed by the
+    arrays offsets (uint64, one per possible k-mer plus one), postings
+    (uint32 protein rows), cds_ids (int64) and kmer_counts (uint32).
+    '''
+    MAGIC = b'ASKMERv1'
+    HEADER = struct.Struct('<8sIIQQ')
+
+    def __init__(self, offsets, postings, cds_ids, kmer_counts, k=KMER_SIZE):
+        self.offsets = offsets
+        self.postings = postings
+        self.cds_ids = cds_ids
+        self.kmer_counts = kmer_counts
+        self.k = k
+
+    def __len__(self):
+        return len(self.cds_ids)
+
+    @classmethod
+    def build(cls, cds_ids, sequences, processes=None, chunk_size=10000):
+        '''Build an index of sequences, encoding chunks of them in parallel'''
+        cds_ids = np.asarray(cds_ids, dtype=np.int64)
+        chunks = [sequences[start:start + chunk_size] for start in range(0, len(sequences), chunk_size)]
+        if processes == 1 or len(chunks) < 2:
+            encoded = list(map(_encode_chunk, chunks))
+        else:
+            with multiprocessing.Pool(processes) as pool:
+                encoded = pool.map(_encode_chunk, chunks)
+
+        kmers = np.concatenate([codes for codes, _ in encoded] or [np.empty(0, dtype=np.uint32)])
+        kmer_counts = np.concatenate([counts for _, counts in encoded] or [np.empty(0, dtype=np.uint32)])
+        rows = np.repeat(np.arange(len(cds_ids), dtype=np.uint32), kmer_counts)
+
+        order = np.argsort(kmers, kind='stable')
+        offsets = np.zeros(len(REDUCED_ALPHABET) ** KMER_SIZE + 1, dtype=np.uint64)
+        offsets[1:] = np.cumsum(np.bincount(kmers, minlength=len(offsets) - 1))
+        return cls(offsets, rows[order], cds_ids, kmer_counts)
+
+    def save(self, path):
+        '''Write the index to a file, replacing it atomically'''
+        temp_path = '{}.tmp'.format(path)
+        with open(temp_path, 'wb') as handle:
+            handle.write(self.HEADER.pack(self.MAGIC, self.k, len(REDUCED_ALPHABET), len(self), len(self.postings)))
+            for array, dtype in ((self.offsets, np.uint64), (self.postings, np.uint32),
+                                 (self.cds_ids, np.int64), (self.kmer_counts, np.uint32)):
+                handle.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        '''Memory-map an index file'''
+        with open(path, 'rb') as handle:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, k, alphabet, count, total = cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC or k != KMER_SIZE or alphabet != len(REDUCED_ALPHABET):
+            raise ValueError('Invalid protein index file {!r}'.format(path))
+
+        arrays = []
+        position = cls.HEADER.size
+        for dtype, length in ((np.uint64, alphabet ** k + 1), (np.uint32, total), (np.int64, count), (np.uint32, count)):
+            arrays.append(np.frombuffer(data, dtype=dtype, count=length, offset=position))
+            position += np.dtype(dtype).itemsize * length
+        if position != len(data):
+            raise ValueError('Invalid protein index file {!r}'.format(path))
+        return cls(*arrays, k=k)
+
+    def shared_kmers(self, sequence):
+        '''Get the number of distinct k-mers every indexed protein shares with a sequence'''
+        codes = kmer_codes(sequence, self.k)
+        if not len(codes):
+            return np.zeros(len(self), dtype=np.int64)
+        starts = self.offsets[codes].astype(np.int64)
+        ends = self.offsets[codes + 1].astype(np.int64)
+        rows = np.concatenate([self.postings[start:end] for start, end in zip(starts, ends)])
+        return np.bincount(rows, minlength=len(self))
+
+    def candidates(self, sequence, limit, min_shared=1):
+        '''Get the (cds_id, shared k-mers) pairs of the limit proteins sharing the most k-mers with a sequence'''
+        shared = self.shared_kmers(sequence)
+        limit = min(limit, len(shared))
+        if limit < 1:
+            return []
+        top = np.argpartition(-shared, limit - 1)[:limit]
+        top = top[np.lexsort((self.cds_ids[top], -shared[top]))]
+        return [(int(self.cds_ids[row]), int(shared[row])) for row in top if shared[row] >= min_shared]
+
+
+def _encode_residues(sequence):
+    return RESIDUE_TABLE[np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)]
+
+
+def _align_batch(query, targets):
+    '''Get the local alignment scores of an encoded query against a list of encoded targets'''
+    padding = len(AMINO_ACIDS) + 1
+    length = max(len(target) for target in targets)
+    matrix = np.full((len(targets), length), padding, dtype=np.uint8)
+    for row, target in enumerate(targets):
+        matrix[row, :len(target)] = target
+
+    profile = SCORE_MATRIX[query]
+    size = len(query)
+    gap_first = GAP_OPEN + GAP_EXTEND
+    steps = GAP_EXTEND * np.arange(1, size + 1, dtype=np.int32)
+
+    previous = np.zeros((len(targets), size + 1), dtype=np.int32)
+    horizontal = np.full((len(targets), size), -gap_first, dtype=np.int32)
+    best = np.zeros(len(targets), dtype=np.int32)
+    vertical = np.empty((len(targets), size), dtype=np.int32)
+    for column in range(length):
+        np.maximum(previous[:, 1:] - gap_first, horizontal - GAP_EXTEND, out=horizontal)
+        scores = previous[:, :-1] + profile[:, matrix[:, column]].T
+        np.maximum(scores, horizontal, out=scores)
+        np.maximum(scores, 0, out=scores)
+
+        # A vertical gap ending in row i opens after the best earlier row k, costing GAP_EXTEND per row
+        running = np.maximum.accumulate(scores + steps, axis=1)
+        vertical[:, 0] = -gap_first
+        vertical[:, 1:] = running[:, :-1] - steps[:-1] - gap_first
+        np.maximum(scores, vertical, out=scores)
+
+        previous[:, 1:] = scores
+        np.maximum(best, scores.max(axis=1), out=best)
+    return best
+
+
+def align_scores(query, targets, threads=1, batch_size=64):
+    '''Get the Smith-Waterman scores of a query protein against target proteins
+
+    Targets are grouped by length into batches aligned together, and the batches
+    are spread over a thread pool. numpy releases the GIL for the array operations.
+    '''
+    if not targets or not query:
+        return [0] * len(targets)
+    encoded_query = _encode_residues(query)
+    encoded = [_encode_residues(target or '') for target in targets]
+    order = sorted((index for index in range(len(targets)) if len(encoded[index])), key=lambda index: len(encoded[index]))
+    batches = [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+
+    def run(batch):
+        return batch, _align_batch(encoded_query, [encoded[index] for index in batch])
+
+    scores = [0] * len(targets)
+    if threads > 1 and len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(run, batches))
+    else:
+        results = map(run, batches)
+    for batch, batch_scores in results:
+        for index, score in zip(batch, batch_scores):
+            scores[index] = int(score)
+    return scores
+
+
+class IndexFile(object):
+    '''Lazily loaded KmerIndex of a file, reloaded when the file is replaced'''
+    def __init__(self):
+        self._index = None
+        self._key = None
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        '''Get the index of a file'''
+        if np is None:
+            raise RuntimeError('The protein search needs numpy, see index_requirements.txt')
+        stat = os.stat(path)
+        key = (path, stat.st_ino, stat.st_mtime)
+        if self._key != key:
+            with self._lock:
+                if self._key != key:
+                    self._index = KmerIndex.load(path)
+                    self._key = key
+        return self._index
+
+
+_INDEX_FILE = IndexFile()
+
+
+def get_index(path):
+    '''Get the memory-mapped KmerIndex of a file'''
+    return _INDEX_FILE.get(path)
+
+
+def search(index, sequence, limit=50, verify=True, translations=None, threads=1):
+    '''Get the ranked hits of a protein sequence as dicts with cds_id, shared_kmers and, if verified, score
+
+    Without verification, hits are ranked by shared k-mers. With it, the first
+    MAX_VERIFIED candidates are aligned with the first MAX_ALIGNED_LENGTH
+    residues of the query and re-ranked by alignment score, ahead of the
+    remaining candidates. This needs a translations function mapping a list of
+    cds_ids to their protein sequences.
+    '''
+    hits = [{'cds_id': cds_id, 'shared_kmers': shared} for cds_id, shared in index.candidates(sequence, limit)]
+    if not verify or not hits:
+        return hits
+
+    verified = hits[:MAX_VERIFIED]
+    sequences = translations([hit['cds_id'] for hit in verified])
+    scores = align_scores(sequence[:MAX_ALIGNED_LENGTH], [sequences.get(hit['cds_id']) for hit in verified],
+                          threads=threads)
+    for hit, score in zip(verified, scores):
+        hit['score'] = score
+    verified.sort(key=lambda hit: (-hit['score'], -hit['shared_kmers'], hit['cds_id']))
+    return verified + hits[MAX_VERIFIED:]
+
+
+def _load_translations(batch_size=50000):
+    '''Get the cds_ids and protein sequences of all CDSs with a translation'''
+    from . import app
+    from .models import db, Cds
+
+    cds_ids = []
+    sequences = []
+    with app.app_context():
+        query = db.session.query(Cds.cds_id, Cds.translation).filter(Cds.translation.isnot(None)) \
+                          .order_by(Cds.cds_id).yield_per(batch_size)
+        for cds_id, translation in query:
+            cds_ids.append(cds_id)
+            sequences.append(translation)
+    return cds_ids, sequences
+
+
+def main():
+    '''Build the protein index file from the database'''
+    parser = argparse.ArgumentParser(description='Build the k-mer index of the protein search')
+    parser.add_argument('output', help='Index file to write')
+    parser.add_argument('--processes', type=int, default=None, help='Processes to encode with, defaults to all cores')
+    args = parser.parse_args()
+
+    if np is None:
+        sys.exit('Building the protein index needs numpy, see index_requirements.txt')
+
+    cds_ids, sequences = _load_translations()
+    index = KmerIndex.build(cds_ids, sequences, processes=args.processes)
+    index.save(args.output)
+    print('Indexed {} proteins with {} k-mer postings'.format(len(index), len(index.postings)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+'''In-memory resolution of accessions and assembly ids to canonical assembly ids'''
+
+from bisect import bisect_left
+
+from .cache import VersionedCache
+from .models import (
+    db,
+    DnaSequence,
+    Genome,
+)
+
+
+class IdentifierResolver(object):
+    '''Map assembly ids and sequence accessions to their unversioned assembly id
+
+    Identifiers are matched case-insensitively by prefix, assembly ids are tried
+    before sequence accessions.
+
+    >>> resolver = IdentifierResolver(['GCF_000203835.1'], [('NC_003888', 3, 'GCF_000203835.1')])
+    >>> resolver.resolve('gcf_000203835')
+    'GCF_000203835'
+    >>> resolver.resolve('NC_003888')
+    'GCF_000203835'
+    >>> resolver.resolve('NC_003888.3')
+    'GCF_000203835'
+    >>> resolver.resolve('NC_0039') is None
+    True
+    '''
+    def __init__(self, assemblies, sequences):
+        '''Build from assembly ids and (accession, version, assembly id) tuples'''
+        self._assemblies = self._sorted_keys((assembly_id, assembly_id) for assembly_id in assemblies)
+
+        keys = []
+        for acc, version, assembly_id in sequences:
+            keys.append((acc, assembly_id))
+            if version is not None:
+                keys.append(('{}.{}'.format(acc, version), assembly_id))
+        self._sequences = self._sorted_keys(keys)
+
+    @staticmethod
+    def _sorted_keys(pairs):
+        '''Turn (identifier, assembly id) pairs into sorted lists of keys and canonical ids'''
+        pairs = sorted(set((identifier.casefold(), assembly_id.split('.')[0])
+                           for identifier, assembly_id in pairs if identifier and assembly_id))
+        return [key for key, _ in pairs], [canonical for _, canonical in pairs]
+
+    def resolve(self, identifier):
+        '''Get the canonical assembly id for an identifier, or None if unknown'''
+        folded = identifier.casefold()
+        for keys, canonical_ids in (self._assemblies, self._sequences):
+            pos = bisect_left(keys, folded)
+            if pos < len(keys) and keys[pos].startswith(folded):
+                return canonical_ids[pos]
+
+        return None
+
+
+def _build_resolver():
+    '''Load all assembly ids and sequence accessions into an IdentifierResolver'''
+    assemblies = db.session.query(Genome.assembly_id).filter(Genome.assembly_id.isnot(None))
+    sequences = db.session.query(DnaSequence.acc, DnaSequence.version, Genome.assembly_id) \
+                          .join(Genome).filter(Genome.assembly_id.isnot(None))
+    return IdentifierResolver([row.assembly_id for row in assemblies], sequences.all())
+
+
+_RESOLVER = VersionedCache(_build_resolver)
+
+
+def resolve_identifier(identifier):
+    '''Get the canonical assembly id for an accession or assembly id, or None if unknown'''
+    return _RESOLVER.get().resolve(identifier)
@@ -0,0 +1,148 @@
+'''Routing of read-only requests to streaming replicas
+
+Replicas are configured with AS_DB_REPLICA_URIS. Views marked with read_only
+send their queries to the replica with the fewest requests in flight,
+skipping replicas that lag behind the primary by more than
+AS_DB_REPLICA_MAX_LAG seconds. Everything else keeps using AS_DB_URI.
+
+To try this locally, start a primary and one or more streaming replicas on
+different ports and point AS_DB_URI and AS_DB_REPLICA_URIS at them.
+'''
+
+import os
+import threading
+import time
+
+from flask import _app_ctx_stack, g, has_request_context, request
+from flask_sqlalchemy import SignallingSession
+from sqlalchemy import create_engine, orm, text
+
+LAG_QUERY = text('SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+                 'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END')
+
+
+def read_only(view):
+    '''Mark a view as only reading from the database, so it can be served from a replica'''
+    view.read_only = True
+    return view
+
+
+def replication_lag(engine):
+    '''Get the replication lag of a replica in seconds, or None if it can't be reached'''
+    try:
+        with engine.connect() as connection:
+            return float(connection.execute(LAG_QUERY).scalar())
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+class Replica(object):
+    '''A replica engine and its bookkeeping'''
+    def __init__(self, engine):
+        self.engine = engine
+        self.active = 0
+        self.lag = None
+        self.checked = None
+
+
+class ReplicaSet(object):
+    '''Pick the least busy replica that is not lagging too far behind
+
+    The replication lag of every replica is checked by a background thread
+    every check_interval seconds, started on first use in each process, so a
+    slow or unreachable replica never holds up a request. Until the first
+    check has finished, requests use the primary.
+    '''
+    def __init__(self, engines, max_lag=30.0, check_interval=5.0, lag_check=replication_lag, background=True):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.lag_check = lag_check
+        self.background = background
+        self._lock = threading.Lock()
+        self._checker = None
+        self._checker_pid = None
+        self._stopped = threading.Event()
+
+    def refresh(self):
+        '''Check the lag of all replicas, without holding the lock while the checks run'''
+        lags = [(replica, self.lag_check(replica.engine)) for replica in self.replicas]
+        now = time.time()
+        with self._lock:
+            for replica, lag in lags:
+                replica.lag = lag
+                replica.checked = now
+
+    def _check_lags(self):
+        while not self._stopped.is_set():
+            self.refresh()
+            self._stopped.wait(self.check_interval)
+
+    def _ensure_checker(self):
+        '''Start the lag checking thread, again after a fork as threads don't survive it'''
+        if self._stopped.is_set():
+            return
+        with self._lock:
+            if self._checker is not None and self._checker_pid == os.getpid() and self._checker.is_alive():
+                return
+            self._checker = threading.Thread(target=self._check_lags, name='replica-lag', daemon=True)
+            self._checker_pid = os.getpid()
+            self._checker.start()
+
+    def close(self):
+        '''Stop checking the replication lag'''
+        self._stopped.set()
+
+    def acquire(self):
+        '''Get the replica to use for a request, or None to use the primary'''
+        if self.background:
+            self._ensure_checker()
+        with self._lock:
+            healthy = [replica for replica in self.replicas
+                       if replica.lag is not None and replica.lag <= self.max_lag]
+            if not healthy:
+                return None
+            replica = min(healthy, key=lambda replica: replica.active)
+            replica.active += 1
+            return replica
+
+    def release(self, replica):
+        '''Mark a request on a replica as finished'''
+        with self._lock:
+            replica.active -= 1
+
+
+class RoutingSession(SignallingSession):
+    '''Session sending the queries of read-only requests to a replica'''
+    def get_bind(self, mapper=None, clause=None):
+        if not self._flushing and has_request_context() and getattr(g, 'db_replica', None) is not None:
+            return g.db_replica.engine
+        return super().get_bind(mapper, clause)
+
+
+def init_replicas(app, db):
+    '''Set up replica routing if replicas are configured'''
+    uris = app.config.get('DB_REPLICA_URIS')
+    if not uris:
+        return None
+
+    options = app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+    replicas = ReplicaSet([create_engine(uri, **options) for uri in uris],
+                          max_lag=app.config.get('DB_REPLICA_MAX_LAG', 30.0),
+                          check_interval=app.config.get('DB_REPLICA_CHECK_INTERVAL', 5.0))
+
+    db.session = orm.scoped_session(orm.sessionmaker(class_=RoutingSession, db=db),
+                                    scopefunc=_app_ctx_stack.__ident_func__)
+
+    @app.before_request
+    def pick_replica():
+        view = app.view_functions.get(request.endpoint)
+        g.db_replica = replicas.acquire() if getattr(view, 'read_only', False) else None
+
+    @app.teardown_request
+    def release_replica(_):
+        replica = g.pop('db_replica', None)
+        if replica is not None:
+            replicas.release(replica)
+
+    return replicas
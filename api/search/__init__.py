@@ -1,4 +1,5 @@
 '''Search-related functions'''
+from flask import current_app
 from sqlalchemy import (
     func,
 )
@@ -14,8 +15,13 @@ from api.models import (
     Taxa,
     t_rel_clusters_types,
 )
+from api.search_parser import QueryTerm
+from api.statements import cached_query
+from .helpers import FormatContext
+from .idsets import restrict_to_ids
 from .clusters import (
     cluster_query_from_term,
+    guess_cluster_category,
     CLUSTER_FORMATTERS,
 )
 from .genes import (
@@ -26,6 +32,11 @@ from .domains import (
     domain_query_from_term,
     DOMAIN_FORMATTERS,
 )
+from .available import (
+    fuzzy_term_by_category,
+    get_typeahead_index,
+)
+from .typeahead import FUZZY_CATEGORIES
 
 #######
 # The following imports are just so the code depending on search doesn't need changes
@@ -38,6 +49,9 @@ FORMATTERS = {
     'domain': DOMAIN_FORMATTERS,
 }
 
+# Categories to look for corrections of terms without a category
+GUESSED_CATEGORIES = ('type', 'genus', 'species')
+
 
 class NoneQuery(object):
     '''A 'no result' return object'''
@@ -46,55 +60,141 @@ class NoneQuery(object):
         return []
 
 
+# Models, ordering columns and query builders of the search types
+SEARCH_TYPES = {
+    'cluster': (Bgc, Bgc.bgc_id, cluster_query_from_term),
+    'gene': (Cds, Cds.cds_id, gene_query_from_term),
+    'domain': (AsDomain, AsDomain.as_domain_id, domain_query_from_term),
+}
+
+
 def core_search(query):
-    '''Actually run the search logic'''
-    sql_query = NoneQuery()
+    '''Actually run the search logic
+
+    Queries with the same structure of operations and categories reuse the
+    compiled SQL of the first one, see api.statements.
+    '''
+    if query.search_type not in SEARCH_TYPES:
+        return NoneQuery().all()
 
+    model, order, from_term = SEARCH_TYPES[query.search_type]
     if query.search_type == 'cluster':
-        sql_query = cluster_query_from_term(query.terms).order_by(Bgc.bgc_id)
-    elif query.search_type == 'gene':
-        sql_query = gene_query_from_term(query.terms).order_by(Cds.cds_id)
-    elif query.search_type == 'domain':
-        sql_query = domain_query_from_term(query.terms).order_by(AsDomain.as_domain_id)
+        for expression in expressions(query.terms):
+            if expression.category == 'unknown':
+                expression.category = guess_cluster_category(expression)
+
+    shape = term_shape(query.terms)
+
+    def build(*values):
+        return from_term(term_from_shape(shape, iter(values))).order_by(order)
+
+    values = [expression.term for expression in expressions(query.terms)]
+    return cached_query((query.search_type, shape), build, values, model).all()
+
+
+def term_shape(term):
+    '''Get the structure of a QueryTerm tree without the values of its expressions
+
+    >>> term_shape(QueryTerm.from_string('[genus]streptomyces OR [type]nrps'))
+    ('or', ('genus',), ('type',))
+    '''
+    if term.kind == 'operation':
+        return (term.operation, term_shape(term.left), term_shape(term.right))
+    return (term.category,)
+
 
-    results = sql_query.all()
+def term_from_shape(shape, values):
+    '''Build a QueryTerm tree of a term_shape, taking the expression values from an iterator'''
+    if len(shape) == 3:
+        return QueryTerm('operation', operation=shape[0], left=term_from_shape(shape[1], values),
+                         right=term_from_shape(shape[2], values))
+    return QueryTerm('expression', category=shape[0], term=next(values))
 
-    return results
 
+def format_results(query, results, context=None):
+    '''Get the appropriate formatter for the query
 
-def format_results(query, results):
-    '''Get the appropriate formatter for the query'''
+    The formatting context defaults to the one of the query.
+    '''
+    if context is None:
+        context = FormatContext.from_query(query)
     try:
         fmt_func = FORMATTERS[query.search_type][query.return_type]
-        return fmt_func(results)
+        return fmt_func(results, context)
     except KeyError:
         return []
 
 
 def json_stats(json_clusters):
     '''Calculate some stats on the search results'''
-    stats = {}
     if len(json_clusters) < 1:
-        return stats
+        return {}
 
     bgc_ids = set()
     for cluster in json_clusters:
         bgc_ids.add(cluster['bgc_id'])
 
-    clusters_by_type_list = db.session.query(BgcType.term, func.count(BgcType.term)) \
-                                      .join(t_rel_clusters_types).join(Bgc) \
-                                      .filter(Bgc.bgc_id.in_(bgc_ids)).group_by(BgcType.term).order_by(BgcType.term).all()
+    by_type, by_phylum = json_stats_queries(bgc_ids)
+    return stats_from_rows(by_type.all(), by_phylum.all())
+
+
+def json_stats_queries(bgc_ids):
+    '''Get the queries counting the clusters with the given ids by type and by phylum'''
+    clusters_by_type = db.session.query(BgcType.term, func.count(BgcType.term)) \
+                                 .join(t_rel_clusters_types).join(Bgc) \
+                                 .group_by(BgcType.term).order_by(BgcType.term)
+    clusters_by_phylum = db.session.query(Taxa.phylum, func.count(Taxa.phylum)) \
+                                   .join(Genome).join(DnaSequence).join(Locus).join(Bgc) \
+                                   .group_by(Taxa.phylum)
+    return restrict_to_ids(clusters_by_type, Bgc.bgc_id, bgc_ids), restrict_to_ids(clusters_by_phylum, Bgc.bgc_id, bgc_ids)
+
+
+def stats_from_rows(clusters_by_type_list, clusters_by_phylum_list):
+    '''Build the json_stats output from the rows of the json_stats_queries'''
+    stats = {}
+
     clusters_by_type = {}
     if clusters_by_type_list is not None:
         clusters_by_type['labels'], clusters_by_type['data'] = zip(*clusters_by_type_list)
     stats['clusters_by_type'] = clusters_by_type
 
-    clusters_by_phylum_list = db.session.query(Taxa.phylum, func.count(Taxa.phylum)) \
-                                        .join(Genome).join(DnaSequence).join(Locus).join(Bgc) \
-                                        .filter(Bgc.bgc_id.in_(bgc_ids)).group_by(Taxa.phylum).all()
     clusters_by_phylum = {}
     if clusters_by_phylum_list is not None:
         clusters_by_phylum['labels'], clusters_by_phylum['data'] = zip(*clusters_by_phylum_list)
     stats['clusters_by_phylum'] = clusters_by_phylum
 
     return stats
+
+
+def suggest_corrections(terms):
+    '''Get "did you mean" candidates for the expressions of a query that match no known term
+
+    Candidates come from the typeahead indices, so there are none if those are disabled.
+    '''
+    if not current_app.config.get('TYPEAHEAD_INDEX', True):
+        return []
+
+    suggestions = []
+    for expression in expressions(terms):
+        if not isinstance(expression.term, str):
+            continue
+        categories = GUESSED_CATEGORIES if expression.category == 'unknown' else (expression.category,)
+        for category in categories:
+            if category not in FUZZY_CATEGORIES:
+                continue
+            if get_typeahead_index(category).lookup(expression.term, limit=1):
+                continue
+            candidates = fuzzy_term_by_category(category, expression.term)
+            if candidates:
+                suggestions.append({'category': category, 'term': expression.term, 'candidates': candidates})
+
+    return suggestions
+
+
+def expressions(term):
+    '''Get all expression leaves of a QueryTerm tree'''
+    if term.kind == 'expression':
+        return [term]
+    if term.kind == 'operation':
+        return expressions(term.left) + expressions(term.right)
+    return []
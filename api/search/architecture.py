@@ -0,0 +1,159 @@
+'''Search genes and clusters by the order of the antiSMASH domains of a gene
+
+An architecture pattern is a comma or space separated list of domain tokens,
+e.g. [architecture]Condensation,AMP-binding,PCP or [architecture]KS,AT,*,ACP.
+Search strings are split on spaces, so they need the commas, structured JSON
+queries can use either.
+
+A token matches the AsDomainProfile names equal to it or with it as one of
+their '_' separated parts, so KS matches PKS_KS and Condensation matches
+Condensation_LCL. Domain names match case-insensitively. Some tokens have a
+special meaning:
+
+    *       any number of domains, including none
+    ?       exactly one domain
+    A|B     a domain matching A or B
+    ^ $     the start or the end of the gene
+
+A pattern matches genes containing the domains in that order, without other
+domains in between unless a wildcard allows for them.
+
+The ordered domains of every CDS are kept as a token string per data version,
+one character per domain profile, N- to C-terminal, so on the reverse strand
+in descending locus order. All strings are joined by newlines into one text,
+and a pattern is compiled into a regular expression automaton over the
+domain characters that scans that text once.
+'''
+
+import bisect
+import re
+
+from api.cache import VersionedCache
+from api.models import (
+    db,
+    AsDomain,
+    AsDomainProfile,
+    Locus,
+)
+
+# Token characters start above the ASCII range, so no domain is a newline or regex syntax
+_FIRST_TOKEN = 0x100
+_SEPARATOR = '\n'
+_NONE = '(?!)'
+_TOKEN_SEPARATORS = re.compile(r'[\s,]+')
+
+
+class ArchitectureIndex(object):
+    '''The domain token strings of all CDSs in one text, with the cds_id of every line'''
+    def __init__(self, profiles, architectures):
+        '''Build the index from profile names and (cds_id, [profile name, ...]) pairs
+
+        >>> index = ArchitectureIndex(['PKS_KS', 'PKS_AT', 'ACP'], [(1, ['PKS_KS', 'PKS_AT', 'ACP'])])
+        >>> index.match('KS AT ACP')
+        [1]
+        '''
+        self.tokens = {name: chr(_FIRST_TOKEN + number) for number, name in enumerate(sorted(set(profiles)))}
+        self.cds_ids = []
+        self.offsets = []
+        lines = []
+        offset = 0
+        for cds_id, names in architectures:
+            line = ''.join(self.tokens[name] for name in names if name in self.tokens)
+            self.cds_ids.append(cds_id)
+            self.offsets.append(offset)
+            lines.append(line)
+            offset += len(line) + len(_SEPARATOR)
+        self.text = _SEPARATOR.join(lines)
+
+    def __len__(self):
+        return len(self.cds_ids)
+
+    def token_class(self, token):
+        '''Get the regex for one domain token of a pattern'''
+        if token == '?':
+            return '[^{}]'.format(_SEPARATOR)
+        chars = set()
+        for alternative in token.casefold().split('|'):
+            for name, char in self.tokens.items():
+                folded = name.casefold()
+                if folded == alternative or alternative in folded.split('_'):
+                    chars.add(char)
+        if not chars:
+            return _NONE
+        return '[{}]'.format(''.join(sorted(chars)))
+
+    def compile(self, pattern):
+        '''Compile an architecture pattern into a regex over the token text
+
+        Raises a ValueError for empty patterns.
+        '''
+        tokens = [token for token in _TOKEN_SEPARATORS.split(pattern) if token]
+        start = tokens[:1] == ['^']
+        end = tokens[-1:] == ['$']
+        tokens = tokens[1 if start else 0:len(tokens) - 1 if end else len(tokens)]
+        if not tokens or all(token == '*' for token in tokens):
+            raise ValueError('Architecture pattern {!r} has no domains'.format(pattern))
+
+        parts = ['[^{}]*'.format(_SEPARATOR) if token == '*' else self.token_class(token) for token in tokens]
+        return re.compile('{}{}{}'.format('^' if start else '', ''.join(parts), '$' if end else ''), re.MULTILINE)
+
+    def match(self, pattern):
+        '''Get the sorted cds_ids of the genes matching an architecture pattern'''
+        automaton = self.compile(pattern)
+        found = set()
+        position = 0
+        while True:
+            match = automaton.search(self.text, position)
+            if match is None:
+                break
+            line = bisect.bisect_right(self.offsets, match.start()) - 1
+            found.add(self.cds_ids[line])
+            # one hit per gene is enough, continue on the next line
+            next_line = self.text.find(_SEPARATOR, match.start())
+            if next_line == -1:
+                break
+            position = next_line + 1
+        return sorted(found)
+
+
+def architecture_rows():
+    '''Get the query for the (cds_id, strand, profile name) rows of all domains, in locus order per CDS'''
+    return db.session.query(AsDomain.cds_id, Locus.strand, AsDomainProfile.name) \
+                     .join(AsDomainProfile).join(Locus, AsDomain.locus_id == Locus.locus_id) \
+                     .filter(AsDomain.cds_id.isnot(None)) \
+                     .order_by(AsDomain.cds_id, Locus.start_pos, AsDomain.as_domain_id)
+
+
+def group_architectures(rows):
+    '''Group (cds_id, strand, name) rows ordered by cds_id into (cds_id, names) in N- to C-terminal order
+
+    >>> list(group_architectures([(1, '+', 'KS'), (1, '+', 'AT'), (2, '-', 'A'), (2, '-', 'C')]))
+    [(1, ['KS', 'AT']), (2, ['C', 'A'])]
+    '''
+    cds_id = None
+    names = []
+    strand = None
+    for row_cds_id, row_strand, name in rows:
+        if row_cds_id != cds_id:
+            if cds_id is not None:
+                yield cds_id, names[::-1] if strand == '-' else names
+            cds_id, names, strand = row_cds_id, [], row_strand
+        names.append(name)
+    if cds_id is not None:
+        yield cds_id, names[::-1] if strand == '-' else names
+
+
+def _build_index():
+    profiles = [name for name, in db.session.query(AsDomainProfile.name)]
+    return ArchitectureIndex(profiles, group_architectures(architecture_rows().yield_per(100000)))
+
+
+_INDEX = VersionedCache(_build_index)
+
+
+def cds_ids_by_architecture(pattern):
+    '''Get the cds_ids of the genes matching an architecture pattern, none for invalid patterns'''
+    try:
+        return _INDEX.get().match(pattern)
+    except ValueError:
+        return []
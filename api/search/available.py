@@ -5,8 +5,10 @@ This is used for the web UI for typeahead opetions
 
 import sqlalchemy
 
+from flask import current_app
 from sqlalchemy import (
     distinct,
+    func,
     null,
     or_,
 )
@@ -17,39 +19,145 @@ from .helpers import (
     register_handler,
     sanitise_string,
 )
+from .typeahead import (
+    DESCRIPTION_MATCHES,
+    FUZZY_CATEGORIES,
+    TypeaheadIndex,
+)
+from .typeclosure import type_closure
+
+from api.cache import VersionedCache
+from api.statements import cached_rows
+from api.text_index import FuzzyIndex
 
 from api.models import (
     db,
+    AsDomain,
     AsDomainProfile,
     BgcType,
+    BiosyntheticGeneCluster as Bgc,
     ClusterblastAlgorithm,
     ClusterblastHit,
+    Cds,
     Compound,
     DnaSequence,
     Genome,
+    Locus,
     Monomer,
     Profile,
+    ProfileHit,
+    RelCompoundsMonomer,
     Taxa,
     Terpene,
     TerpeneCyclisation,
     Smcog,
+    SmcogHit,
+    t_cds_cluster_map,
+    t_rel_clusters_compounds,
+    t_rel_clusters_types,
 )
 
 AVAILABLE = {}
+# Functions returning the (term, number of BGCs) rows of a category, as a query or a list
+AVAILABLE_COUNTS = {}
+TYPEAHEAD_INDICES = {}
+TYPEAHEAD_COUNTS = {}
+FUZZY_INDICES = {}
+
+# Categories with a fixed set of answers that don't need an index
+STATIC_CATEGORIES = set(['contigedge', 'minimal'])
 
 
-def available_term_by_category(category, term):
-    '''List all available terms by category'''
+def available_term_by_category(category, term, with_counts=False, by_count=False):
+    '''List all available terms by category
+
+    With with_counts, every term is annotated with the number of BGCs it matches.
+    With by_count, the terms matching the most BGCs are listed first.
+    Both need the typeahead index.
+    If nothing matches, "did you mean" candidates are returned instead, marked with 'fuzzy': True.
+    '''
     cleaned_category = sanitise_string(category)
     cleaned_term = sanitise_string(term)
 
-    if cleaned_category in AVAILABLE:
+    if cleaned_category in AVAILABLE and cleaned_category not in STATIC_CATEGORIES \
+       and current_app.config.get('TYPEAHEAD_INDEX', True):
+        index = get_typeahead_index(cleaned_category)
+        counts = None
+        if (with_counts or by_count) and cleaned_category in AVAILABLE_COUNTS:
+            counts = get_typeahead_counts(cleaned_category)
+
+        results = index.lookup(cleaned_term, limit=50, counts=counts if by_count else None)
+        if not results:
+            return [{'val': match['val'], 'desc': match['desc'], 'fuzzy': True}
+                    for match in fuzzy_term_by_category(cleaned_category, cleaned_term)]
+        if counts is None:
+            return list(map(lambda x: {'val': x[0], 'desc': x[1]}, results))
+        return list(map(lambda x: {'val': x[0], 'desc': x[1], 'count': counts.get(x[0], 0)}, results))
+
+    if cleaned_category in STATIC_CATEGORIES:
         query = AVAILABLE[cleaned_category](cleaned_term).limit(50)
         return list(map(lambda x: {'val': x[0], 'desc': x[1]}, query.all()))
 
+    if cleaned_category in AVAILABLE:
+        rows = cached_rows(('available', cleaned_category),
+                           lambda term: AVAILABLE[cleaned_category](term).limit(50), [cleaned_term])
+        return list(map(lambda x: {'val': x[0], 'desc': x[1]}, rows))
+
     return []
 
 
+def get_typeahead_index(category):
+    '''Get the TypeaheadIndex for a category, building it for the current data version if needed'''
+    if category not in TYPEAHEAD_INDICES:
+        TYPEAHEAD_INDICES.setdefault(category, VersionedCache(lambda: _build_typeahead_index(category)))
+    return TYPEAHEAD_INDICES[category].get()
+
+
+def get_typeahead_counts(category):
+    '''Get a dict of the number of BGCs matched by every term of a category'''
+    if category not in TYPEAHEAD_COUNTS:
+        TYPEAHEAD_COUNTS.setdefault(category, VersionedCache(lambda: dict(AVAILABLE_COUNTS[category]())))
+    return TYPEAHEAD_COUNTS[category].get()
+
+
+def fuzzy_term_by_category(category, term, max_distance=2, limit=10):
+    '''List terms of a category within max_distance edits of term, closest first'''
+    cleaned_category = sanitise_string(category)
+    cleaned_term = sanitise_string(term)
+    if cleaned_category not in FUZZY_CATEGORIES:
+        return []
+
+    entries, index = get_fuzzy_index(cleaned_category)
+    matches = index.search(cleaned_term, max_distance=max_distance, limit=limit)
+    return list(map(lambda x: {'val': entries[x[0]][0], 'desc': entries[x[0]][1], 'distance': x[1]}, matches))
+
+
+def get_fuzzy_index(category):
+    '''Get the distinct (value, description) entries of a category and a FuzzyIndex over their values'''
+    if category not in FUZZY_INDICES:
+        FUZZY_INDICES.setdefault(category, VersionedCache(lambda: _build_fuzzy_index(category)))
+    return FUZZY_INDICES[category].get()
+
+
+def _build_fuzzy_index(category):
+    '''Index the values of a category's typeahead entries for fuzzy lookups'''
+    entries = []
+    seen = set()
+    for value, description in get_typeahead_index(category).entries:
+        if value in seen:
+            continue
+        seen.add(value)
+        entries.append((value, description))
+    return entries, FuzzyIndex([value for value, _ in entries])
+
+
+def _build_typeahead_index(category):
+    '''Load all available terms of a category into a TypeaheadIndex'''
+    # An empty search term matches everything
+    entries = AVAILABLE[category]('').all()
+    return TypeaheadIndex(entries, DESCRIPTION_MATCHES.get(category))
+
+
 class FakeBooleanQuery:
     """Fake Query class to return boolean value typeaheads."""
     def __init__(self, term, true_help, false_help):
@@ -264,3 +372,179 @@ def available_terpenetocarbon(term):
     return db.session.query(distinct(TerpeneCyclisation.to_carbon), TerpeneCyclisation.to_carbon) \
              .filter(cast(TerpeneCyclisation.to_carbon, sqlalchemy.String).ilike('{}%'.format(term))) \
              .order_by(TerpeneCyclisation.to_carbon)
+
+
+######################################
+# BGC counts per available term      #
+######################################
+
+def _count_bgcs(column):
+    '''Generate query counting distinct BGCs per value of column, needs joins from Bgc'''
+    return db.session.query(column, func.count(distinct(Bgc.bgc_id))).select_from(Bgc)
+
+
+def _count_bgcs_by_taxon(column):
+    '''Generate query counting BGCs per taxon'''
+    return _count_bgcs(column).join(Locus).join(DnaSequence).join(Genome).join(Taxa) \
+                              .group_by(column)
+
+
+def _count_bgcs_by_cds(column):
+    '''Generate query counting BGCs via their CDSs, needs joins from Cds'''
+    return _count_bgcs(column).join(t_cds_cluster_map, t_cds_cluster_map.c.bgc_id == Bgc.bgc_id) \
+                              .join(Cds, t_cds_cluster_map.c.cds_id == Cds.cds_id)
+
+
+def _count_bgcs_by_x_clusterblast(algorithm):
+    '''Generate query counting BGCs per XClusterBlast hit'''
+    return _count_bgcs(ClusterblastHit.acc).join(ClusterblastHit).join(ClusterblastAlgorithm) \
+                                           .filter(ClusterblastAlgorithm.name == algorithm) \
+                                           .group_by(ClusterblastHit.acc)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_superkingdom():
+    '''Count BGCs per superkingdom'''
+    return _count_bgcs_by_taxon(Taxa.superkingdom)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_phylum():
+    '''Count BGCs per phylum'''
+    return _count_bgcs_by_taxon(Taxa.phylum)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_class():
+    '''Count BGCs per class'''
+    return _count_bgcs_by_taxon(Taxa._class)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_order():
+    '''Count BGCs per order'''
+    return _count_bgcs_by_taxon(Taxa.taxonomic_order)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_family():
+    '''Count BGCs per family'''
+    return _count_bgcs_by_taxon(Taxa.family)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_genus():
+    '''Count BGCs per genus'''
+    return _count_bgcs_by_taxon(Taxa.genus)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_species():
+    '''Count BGCs per species'''
+    return _count_bgcs_by_taxon(Taxa.species)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_strain():
+    '''Count BGCs per strain'''
+    return _count_bgcs_by_taxon(Taxa.strain)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_acc():
+    '''Count BGCs per accession'''
+    return _count_bgcs(DnaSequence.acc).join(Locus).join(DnaSequence).group_by(DnaSequence.acc)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_assembly():
+    """Count BGCs per assembly"""
+    return _count_bgcs(Genome.assembly_id).join(Locus).join(DnaSequence).join(Genome) \
+                                          .group_by(Genome.assembly_id)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_compoundseq():
+    '''Count BGCs per compound peptide sequence'''
+    return _count_bgcs(Compound.peptide_sequence).join(t_rel_clusters_compounds).join(Compound) \
+                                                 .group_by(Compound.peptide_sequence)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_compoundclass():
+    '''Count BGCs per compound class'''
+    return _count_bgcs(Compound._class).join(t_rel_clusters_compounds).join(Compound) \
+                                       .group_by(Compound._class)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_monomer():
+    '''Count BGCs per monomer'''
+    return _count_bgcs(Monomer.name).join(t_rel_clusters_compounds) \
+                                    .join(RelCompoundsMonomer, t_rel_clusters_compounds.c.compound_id == RelCompoundsMonomer.compound_id) \
+                                    .join(Monomer).group_by(Monomer.name)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_type():
+    '''Count BGCs per type, including the BGCs of all subtypes like the type search does'''
+    closure = type_closure()
+    counts = closure.rollup(db.session.query(t_rel_clusters_types.c.bgc_id, t_rel_clusters_types.c.bgc_type_id))
+    return [(closure.types[bgc_type_id][0], count) for bgc_type_id, count in counts.items()]
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_profile():
+    '''Count BGCs per profile'''
+    return _count_bgcs_by_cds(Profile.name).join(ProfileHit).join(Profile).group_by(Profile.name)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_asdomain():
+    '''Count BGCs per asDomain profile'''
+    return _count_bgcs_by_cds(AsDomainProfile.name).join(AsDomain).join(AsDomainProfile) \
+                                                   .group_by(AsDomainProfile.name)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_smcog():
+    """Count BGCs per smCoG."""
+    return _count_bgcs_by_cds(Smcog.name).join(SmcogHit).join(Smcog).group_by(Smcog.name)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_terpene():
+    """Count BGCs per terpene synthase type."""
+    return _count_bgcs_by_cds(Terpene.name).join(TerpeneCyclisation).join(Terpene).group_by(Terpene.name)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_terpenefromcarbon():
+    """Count BGCs per terpene cyclisation start carbon."""
+    return _count_bgcs_by_cds(TerpeneCyclisation.from_carbon).join(TerpeneCyclisation) \
+                                                             .group_by(TerpeneCyclisation.from_carbon)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_terpenetocarbon():
+    """Count BGCs per terpene cyclisation end carbon."""
+    return _count_bgcs_by_cds(TerpeneCyclisation.to_carbon).join(TerpeneCyclisation) \
+                                                           .group_by(TerpeneCyclisation.to_carbon)
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_clusterblast():
+    '''Count BGCs per ClusterBlast hit'''
+    return _count_bgcs_by_x_clusterblast('clusterblast')
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_knowncluster():
+    '''Count BGCs per KnownClusterBlast hit'''
+    return _count_bgcs_by_x_clusterblast('knownclusterblast')
+
+
+@register_handler(AVAILABLE_COUNTS)
+def count_subcluster():
+    '''Count BGCs per SubClusterBlast hit'''
+    return _count_bgcs_by_x_clusterblast('subclusterblast')
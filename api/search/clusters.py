@@ -1,17 +1,19 @@
 '''Cluster-related search options'''
 
-from flask import g
-
 from sqlalchemy import (
     func,
     or_,
     sql,
 )
-from sqlalchemy.orm import joinedload
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from .architecture import cds_ids_by_architecture
 from .helpers import (
     break_lines,
     register_handler,
 )
+from .idsets import id_filter, restrict_to_ids
+from .regions import parse_region, region_filter
+from .typeclosure import type_closure
 from api.models import (
     db,
     AsDomain,
@@ -44,35 +46,78 @@ CLUSTER_FORMATTERS = {}
 
 
 @register_handler(CLUSTER_FORMATTERS)
-def clusters_to_json(clusters):
+def clusters_to_json(clusters, context):
     '''Convert model.BiosyntheticGeneClusters into JSON'''
-    query = db.session.query(Bgc, Genome.assembly_id, Locus.start_pos, Locus.end_pos, DnaSequence.acc, DnaSequence.version, Taxa.tax_id, Taxa.genus, Taxa.species, Taxa.strain)
-    query = query.options(joinedload('bgc_types')).options(joinedload('clusterblast_hits'))
-    query = query.join(Locus).join(DnaSequence).join(Genome).join(Taxa).filter(Bgc.bgc_id.in_(map(lambda x: x.bgc_id, clusters))).order_by(Bgc.bgc_id)
+    return clusters_from_rows(cluster_json_query([cluster.bgc_id for cluster in clusters]))
+
+
+def _types_subquery():
+    '''Get the LATERAL subquery aggregating the type terms and descriptions of a cluster into arrays'''
+    return db.session.query(func.array_agg(aggregate_order_by(BgcType.term, BgcType.bgc_type_id)).label('terms'),
+                            func.array_agg(aggregate_order_by(BgcType.description, BgcType.bgc_type_id)).label('descriptions')) \
+                     .select_from(t_rel_clusters_types).join(BgcType) \
+                     .filter(t_rel_clusters_types.c.bgc_id == Bgc.bgc_id) \
+                     .correlate(Bgc) \
+                     .subquery() \
+                     .lateral()
+
+
+def cluster_json_query(bgc_ids):
+    '''Get the column-only query for the rows of clusters_from_rows
+
+    Returns one row per cluster, with its types aggregated and its rank 1
+    KnownClusterBlast hit picked by LATERAL subqueries, so none of the other
+    ClusterBlast hits are loaded.
+    '''
+    types = _types_subquery()
+    hit = db.session.query(ClusterblastHit.similarity, ClusterblastHit.description, ClusterblastHit.acc,
+                           ClusterblastHit.rank) \
+                    .join(ClusterblastAlgorithm) \
+                    .filter(ClusterblastHit.bgc_id == Bgc.bgc_id) \
+                    .filter(ClusterblastAlgorithm.name == 'knownclusterblast') \
+                    .filter(ClusterblastHit.rank == 1) \
+                    .order_by(ClusterblastHit.clusterblast_hit_id) \
+                    .limit(1) \
+                    .correlate(Bgc) \
+                    .subquery() \
+                    .lateral()
+    query = db.session.query(Bgc.bgc_id, Bgc.cluster_number, Locus.start_pos, Locus.end_pos,
+                             DnaSequence.acc, Genome.assembly_id, DnaSequence.version,
+                             Taxa.genus, Taxa.species, Taxa.strain, Bgc.contig_edge, Bgc.minimal,
+                             types.c.terms, types.c.descriptions,
+                             hit.c.similarity, hit.c.description, hit.c.acc, hit.c.rank) \
+                      .select_from(Bgc).join(Locus).join(DnaSequence).join(Genome).join(Taxa) \
+                      .outerjoin(types, sql.true()) \
+                      .outerjoin(hit, sql.true())
+    return restrict_to_ids(query, Bgc.bgc_id, bgc_ids).order_by(Bgc.bgc_id)
+
+
+def clusters_from_rows(rows):
+    '''Build the clusters_to_json output from the rows of a cluster_json_query'''
     json_clusters = []
-    for cluster in query.all():
-        json_cluster = {}
-        json_cluster['bgc_id'] = cluster.BiosyntheticGeneCluster.bgc_id
-        json_cluster['cluster_number'] = cluster.BiosyntheticGeneCluster.cluster_number
-
-        json_cluster['start_pos'] = cluster.start_pos
-        json_cluster['end_pos'] = cluster.end_pos
-
-        json_cluster['acc'] = cluster.acc
-        json_cluster['assembly_id'] = cluster.assembly_id.split('.')[0] if cluster.assembly_id else ''
-        json_cluster['version'] = cluster.version
-
-        json_cluster['genus'] = cluster.genus
-        json_cluster['species'] = cluster.species
-        json_cluster['strain'] = cluster.strain
-
-        term = '-'.join(sorted([t.term for t in cluster.BiosyntheticGeneCluster.bgc_types]))
-        if len(cluster.BiosyntheticGeneCluster.bgc_types) == 1:
-            json_cluster['description'] = cluster.BiosyntheticGeneCluster.bgc_types[0].description
+    for (bgc_id, cluster_number, start_pos, end_pos, acc, assembly_id, version, genus, species, strain,
+         contig_edge, minimal, terms, descriptions, similarity, cbh_description, cbh_acc, cbh_rank) in rows:
+        json_cluster = {
+            'bgc_id': bgc_id,
+            'cluster_number': cluster_number,
+            'start_pos': start_pos,
+            'end_pos': end_pos,
+            'acc': acc,
+            'assembly_id': assembly_id.split('.')[0] if assembly_id else '',
+            'version': version,
+            'genus': genus,
+            'species': species,
+            'strain': strain,
+        }
+
+        terms = terms or []
+        descriptions = descriptions or []
+        term = '-'.join(sorted(terms))
+        if len(terms) == 1:
+            json_cluster['description'] = descriptions[0]
             json_cluster['term'] = term
         else:
-            descs = ' & '.join(sorted([t.description for t in cluster.BiosyntheticGeneCluster.bgc_types],
-                                      key=str.casefold))
+            descs = ' & '.join(sorted(descriptions, key=str.casefold))
             json_cluster['description'] = 'Hybrid cluster: {}'.format(descs)
             json_cluster['term'] = '{} hybrid'.format(term)
 
@@ -80,24 +125,24 @@ def clusters_to_json(clusters):
         json_cluster['cbh_description'] = None
         json_cluster['cbh_acc'] = None
 
-        knownclusterblasts = [hit for hit in cluster.BiosyntheticGeneCluster.clusterblast_hits if hit.algorithm.name == 'knownclusterblast' and hit.rank == 1]
-        if len(knownclusterblasts) > 0:
-            json_cluster['similarity'] = knownclusterblasts[0].similarity
-            json_cluster['cbh_description'] = knownclusterblasts[0].description
-            json_cluster['cbh_acc'] = knownclusterblasts[0].acc
-            json_cluster['cbh_rank'] = knownclusterblasts[0].rank
+        # The hit is filtered on rank 1, so no rank means there is no hit
+        if cbh_rank is not None:
+            json_cluster['similarity'] = similarity
+            json_cluster['cbh_description'] = cbh_description
+            json_cluster['cbh_acc'] = cbh_acc
+            json_cluster['cbh_rank'] = cbh_rank
 
-        json_cluster['contig_edge'] = cluster.BiosyntheticGeneCluster.contig_edge
-        json_cluster['minimal'] = cluster.BiosyntheticGeneCluster.minimal
+        json_cluster['contig_edge'] = contig_edge
+        json_cluster['minimal'] = minimal
 
         json_clusters.append(json_cluster)
     return json_clusters
 
 
 @register_handler(CLUSTER_FORMATTERS)
-def clusters_to_csv(clusters):
+def clusters_to_csv(clusters, context):
     '''Convert model.BiosyntheticGeneClusters into CSV'''
-    json_clusters = clusters_to_json(clusters)
+    json_clusters = clusters_to_json(clusters, context)
     csv_lines = ['#Genus\tSpecies\tStrain\tNCBI accession\tCluster number\tBGC type\tFrom\tTo\tOn contig edge\tFast mode only\tMost similar known cluster\tSimilarity in %\tMIBiG BGC-ID\tResults URL\tDownload URL']
     for cluster in json_clusters:
         csv_lines.append('{genus}\t{species}\t{strain}\t{acc}.{version}\t{cluster_number}\t{term}\t{start_pos}\t{end_pos}\t'
@@ -109,41 +154,42 @@ def clusters_to_csv(clusters):
 
 
 @register_handler(CLUSTER_FORMATTERS)
-def clusters_to_fasta(clusters):
+def clusters_to_fasta(clusters, context):
     '''Convert model.BiosyntheticGeneCluster into FASTA'''
-    query = db.session.query(Bgc, Locus.start_pos, Locus.end_pos, DnaSequence.acc, DnaSequence.version,
+    types = _types_subquery()
+    query = db.session.query(Bgc.cluster_number, Locus.start_pos, Locus.end_pos, DnaSequence.acc, DnaSequence.version,
                              func.substr(DnaSequence.dna, Locus.start_pos + 1, Locus.end_pos - Locus.start_pos).label('sequence'),
-                             Taxa.tax_id, Taxa.genus, Taxa.species, Taxa.strain)
-    query = query.options(joinedload('bgc_types'))
-    query = query.join(Locus).join(DnaSequence).join(Genome).join(Taxa)
-    query = query.filter(Bgc.bgc_id.in_(map(lambda x: x.bgc_id, clusters))).order_by(Bgc.bgc_id)
-    search = ''
-    if g.verbose:
-        search = "|{}".format(g.search_str)
+                             Taxa.genus, Taxa.species, Taxa.strain, types.c.terms)
+    query = query.select_from(Bgc).join(Locus).join(DnaSequence).join(Genome).join(Taxa)
+    query = query.outerjoin(types, sql.true())
+    query = restrict_to_ids(query, Bgc.bgc_id, [cluster.bgc_id for cluster in clusters]).order_by(Bgc.bgc_id)
+    search = context.fasta_suffix
     for cluster in query:
         seq = break_lines(cluster.sequence)
-        compiled_type = '-'.join(sorted([t.term for t in cluster.BiosyntheticGeneCluster.bgc_types], key=str.casefold))
-        fasta = '>{c.acc}.{c.version}|Cluster {cluster_number}|' \
+        compiled_type = '-'.join(sorted(cluster.terms or [], key=str.casefold))
+        fasta = '>{c.acc}.{c.version}|Cluster {c.cluster_number}|' \
                 '{compiled_type}|{c.start_pos}-{c.end_pos}|' \
                 '{c.genus} {c.species} {c.strain}{search}\n{seq}' \
-                .format(c=cluster, cluster_number=cluster.BiosyntheticGeneCluster.cluster_number,
-                        compiled_type=compiled_type, search=search, seq=seq)
+                .format(c=cluster, compiled_type=compiled_type, search=search, seq=seq)
         yield fasta
 
 
 
-def cluster_query_from_term(term):
-    '''Recursively generate an SQL query from the search terms'''
+def cluster_query_from_term(term, guess=None):
+    '''Recursively generate an SQL query from the search terms
+
+    Terms without a category get one from guess, which defaults to guess_cluster_category.
+    '''
     if term.kind == 'expression':
         if term.category == 'unknown':
-            term.category = guess_cluster_category(term)
+            term.category = (guess or guess_cluster_category)(term)
         if term.category in CLUSTERS:
             return CLUSTERS[term.category](term.term)
         else:
             return Bgc.query.filter(sql.false())
     elif term.kind == 'operation':
-        left_query = cluster_query_from_term(term.left)
-        right_query = cluster_query_from_term(term.right)
+        left_query = cluster_query_from_term(term.left, guess)
+        right_query = cluster_query_from_term(term.right, guess)
         if term.operation == 'except':
             return left_query.except_(right_query)
         elif term.operation == 'or':
@@ -154,26 +200,36 @@ def cluster_query_from_term(term):
     return Bgc.query.filter(sql.false())
 
 
+# Columns looked up to guess the category of a term without one, in order of preference
+CATEGORY_GUESSES = (
+    ('type', BgcType.term),
+    ('acc', DnaSequence.acc),
+    ('genus', Taxa.genus),
+    ('species', Taxa.species),
+)
+
+
+def category_guess_queries(term):
+    '''Get (category, query) pairs counting the matches of term in each guessable category'''
+    return [(category, db.session.query(func.count()).filter(column.ilike(term.term)))
+            for category, column in CATEGORY_GUESSES]
+
+
 def guess_cluster_category(term):
     '''Guess cluster search category from term'''
-    if BgcType.query.filter(BgcType.term.ilike(term.term)).count() > 0:
-        return 'type'
-    if DnaSequence.query.filter(DnaSequence.acc.ilike(term.term)).count() > 0:
-        return 'acc'
-    if Taxa.query.filter(Taxa.genus.ilike(term.term)).count() > 0:
-        return 'genus'
-    if Taxa.query.filter(Taxa.species.ilike(term.term)).count() > 0:
-        return 'species'
+    for category, query in category_guess_queries(term):
+        if query.scalar() > 0:
+            return category
 
     return term.category
 
 
 @register_handler(CLUSTERS)
 def clusters_by_type(term):
-    '''Return a query for a bgc by type or type description search'''
-    all_subtypes = db.session.query(BgcType).filter(or_(BgcType.term == term, BgcType.description.ilike('%{}%'.format(term)))).cte(recursive=True)
-    all_subtypes = all_subtypes.union(db.session.query(BgcType).filter(BgcType.parent_id == all_subtypes.c.bgc_type_id))
-    return db.session.query(Bgc).join(t_rel_clusters_types).join(all_subtypes)
+    '''Return a query for a bgc by type or type description search, including all subtypes'''
+    closure = type_closure()
+    type_ids = closure.with_subtypes(closure.matching(term))
+    return Bgc.query.join(t_rel_clusters_types).filter(id_filter(t_rel_clusters_types.c.bgc_type_id, type_ids))
 
 
 @register_handler(CLUSTERS)
@@ -242,6 +298,15 @@ def clusters_by_acc(term):
     '''Return a query for a bgc by accession number search'''
     return Bgc.query.join(Locus).join(DnaSequence).filter(DnaSequence.acc.ilike('%{}%'.format(term)))
 
+@register_handler(CLUSTERS)
+def clusters_by_region(term):
+    '''Return a query for a bgc by overlap with a region, acc:start-end'''
+    try:
+        region = parse_region(term)
+    except ValueError:
+        return Bgc.query.filter(sql.false())
+    return Bgc.query.join(Locus).join(DnaSequence).filter(region_filter(region))
+
 
 @register_handler(CLUSTERS)
 def clusters_by_assembly(term):
@@ -288,6 +353,13 @@ def clusters_by_asdomain(term):
                     .filter(AsDomainProfile.name.ilike(term))
 
 
+@register_handler(CLUSTERS)
+def clusters_by_architecture(term):
+    '''Return a query for a bgc by the domain order of one of its genes, see api.search.architecture'''
+    query = Bgc.query.join(t_cds_cluster_map, t_cds_cluster_map.c.bgc_id == Bgc.bgc_id)
+    return restrict_to_ids(query, t_cds_cluster_map.c.cds_id, cds_ids_by_architecture(term))
+
+
 @register_handler(CLUSTERS)
 def clusters_by_terpene(term):
     '''Return a query for a bgc by terpene synthase type'''
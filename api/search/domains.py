@@ -1,7 +1,5 @@
 '''Search functions related to asDomain searches'''
 
-from flask import g
-
 from sqlalchemy import (
     func,
     sql,
@@ -11,6 +9,8 @@ from .helpers import (
     calculate_sequence,
     register_handler,
 )
+from .idsets import restrict_to_ids
+from .regions import parse_region, region_filter
 
 from api.models import (
     db,
@@ -123,6 +123,15 @@ def query_acc(term):
     '''Generate asDomain query by NCBI accession'''
     return AsDomain.query.join(Locus).join(DnaSequence).filter(DnaSequence.acc.ilike(term))
 
+@register_handler(DOMAIN_QUERIES)
+def query_region(term):
+    '''Generate asDomain query by overlap with a region, acc:start-end'''
+    try:
+        region = parse_region(term)
+    except ValueError:
+        return AsDomain.query.filter(sql.false())
+    return AsDomain.query.join(Locus).join(DnaSequence).filter(region_filter(region))
+
 
 @register_handler(DOMAIN_QUERIES)
 def query_type(term):
@@ -205,16 +214,14 @@ def query_subcluster(term):
 ##############
 
 @register_handler(DOMAIN_FORMATTERS)
-def format_fastaa(domains):
+def format_fastaa(domains, context):
     '''Generate protein FASTA records for a list of domains'''
     query = db.session.query(AsDomain.as_domain_id, AsDomain.translation, AsDomainProfile.name,
                              Cds.locus_tag, Locus.start_pos, Locus.end_pos, Locus.strand,
                              DnaSequence.acc, DnaSequence.version)
     query = query.join(AsDomainProfile).join(Locus).join(DnaSequence).join(Cds, AsDomain.cds_id == Cds.cds_id)
-    query = query.filter(AsDomain.as_domain_id.in_(map(lambda x: x.as_domain_id, domains))).order_by(AsDomain.as_domain_id)
-    search = ''
-    if g.verbose:
-        search = "|{}".format(g.search_str)
+    query = restrict_to_ids(query, AsDomain.as_domain_id, [domain.as_domain_id for domain in domains]).order_by(AsDomain.as_domain_id)
+    search = context.fasta_suffix
     fasta_records = []
     for domain in query:
         sequence = break_lines(domain.translation)
@@ -227,17 +234,15 @@ def format_fastaa(domains):
 
 
 @register_handler(DOMAIN_FORMATTERS)
-def format_fasta(domains):
+def format_fasta(domains, context):
     '''Generate DNA FASTA records for a list of domains'''
     query = db.session.query(AsDomain.as_domain_id, AsDomainProfile.name,
                              Cds.locus_tag, Locus.start_pos, Locus.end_pos, Locus.strand,
                              func.substr(DnaSequence.dna, Locus.start_pos + 1, Locus.end_pos - Locus.start_pos).label('sequence'),
                              DnaSequence.acc, DnaSequence.version)
     query = query.join(AsDomainProfile).join(Locus, AsDomain.locus_id == Locus.locus_id).join(DnaSequence).join(Cds, AsDomain.cds_id == Cds.cds_id)
-    query = query.filter(AsDomain.as_domain_id.in_(map(lambda x: x.as_domain_id, domains))).order_by(AsDomain.as_domain_id)
-    search = ''
-    if g.verbose:
-        search = "|{}".format(g.search_str)
+    query = restrict_to_ids(query, AsDomain.as_domain_id, [domain.as_domain_id for domain in domains]).order_by(AsDomain.as_domain_id)
+    search = context.fasta_suffix
     fasta_records = []
     for domain in query:
         sequence = break_lines(calculate_sequence(domain.strand, domain.sequence))
@@ -250,13 +255,13 @@ def format_fasta(domains):
 
 
 @register_handler(DOMAIN_FORMATTERS)
-def format_csv(domains):
+def format_csv(domains, context):
     '''Generate CSV records for a list of domains'''
     query = db.session.query(AsDomain.as_domain_id, AsDomain.translation, AsDomainProfile.name,
                              Cds.locus_tag, Locus.start_pos, Locus.end_pos, Locus.strand,
                              DnaSequence.acc, DnaSequence.version)
     query = query.join(AsDomainProfile).join(Locus).join(DnaSequence).join(Cds, AsDomain.cds_id == Cds.cds_id)
-    query = query.filter(AsDomain.as_domain_id.in_(map(lambda x: x.as_domain_id, domains))).order_by(AsDomain.as_domain_id)
+    query = restrict_to_ids(query, AsDomain.as_domain_id, [domain.as_domain_id for domain in domains]).order_by(AsDomain.as_domain_id)
     csv_lines = ['#Locus tag\tDomain type\tAccession\tStart\tEnd\tStrand\tSequence']
     for domain in query:
         csv_lines.append('{d.locus_tag}\t{d.name}\t'
@@ -0,0 +1,191 @@
+'''Count the values of cluster attributes over a set of search results
+
+The facets of a search are the top values of some categories, like genus or
+type, with the number of result clusters having them. Instead of one GROUP BY
+query per facet, the attributes of all clusters are kept in memory as columns
+of numpy arrays per data version, with the clusters in bgc_id order and every
+value dictionary-encoded as an integer code:
+
+* single-valued categories, like the taxonomy, have one code per cluster,
+  -1 where the value is missing
+* multi-valued categories, like the types, have their codes in CSR form,
+  codes[indptr[row]:indptr[row + 1]] being the codes of a cluster's row
+
+The rows of the result clusters are looked up once and every facet is then a
+bincount of the codes of these rows.
+
+This needs numpy, see index_requirements.txt.
+'''
+
+from .helpers import register_handler
+from api.cache import VersionedCache
+from api.models import (
+    db,
+    BgcType,
+    BiosyntheticGeneCluster as Bgc,
+    ClusterblastAlgorithm,
+    ClusterblastHit,
+    DnaSequence,
+    Genome,
+    Locus,
+    Monomer,
+    RelCompoundsMonomer,
+    Taxa,
+    t_rel_clusters_compounds,
+    t_rel_clusters_types,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Single-valued categories and the columns they come from
+SINGLE_FACETS = {
+    'superkingdom': Taxa.superkingdom,
+    'phylum': Taxa.phylum,
+    'class': Taxa._class,
+    'order': Taxa.taxonomic_order,
+    'family': Taxa.family,
+    'genus': Taxa.genus,
+    'species': Taxa.species,
+    'contigedge': Bgc.contig_edge,
+    'minimal': Bgc.minimal,
+}
+
+# Multi-valued categories and the functions getting their (bgc_id, value) queries
+MULTI_FACETS = {}
+
+
+@register_handler(MULTI_FACETS)
+def facet_type():
+    return db.session.query(t_rel_clusters_types.c.bgc_id, BgcType.term).join(BgcType)
+
+
+@register_handler(MULTI_FACETS)
+def facet_monomer():
+    return db.session.query(t_rel_clusters_compounds.c.bgc_id, Monomer.name) \
+                     .join(RelCompoundsMonomer, t_rel_clusters_compounds.c.compound_id == RelCompoundsMonomer.compound_id) \
+                     .join(Monomer)
+
+
+@register_handler(MULTI_FACETS)
+def facet_knowncluster():
+    return db.session.query(ClusterblastHit.bgc_id, ClusterblastHit.acc).join(ClusterblastAlgorithm) \
+                     .filter(ClusterblastAlgorithm.name == 'knownclusterblast')
+
+
+CATEGORIES = frozenset(SINGLE_FACETS) | frozenset(MULTI_FACETS)
+
+
+def _encode(values):
+    '''Dictionary-encode values into (codes, distinct values), None becoming -1'''
+    lookup = {}
+    codes = [lookup.setdefault(value, len(lookup)) if value is not None else -1 for value in values]
+    return np.array(codes, dtype=np.int32), sorted(lookup, key=lookup.get)
+
+
+class ClusterAttributes(object):
+    '''Columnar, dictionary-encoded cluster attributes by bgc_id'''
+    def __init__(self, bgc_ids, single, multi):
+        '''Build the columns
+
+        bgc_ids are all cluster ids, single maps categories to a value per
+        cluster in the same order, multi maps categories to (bgc_id, value)
+        pairs.
+        '''
+        self.bgc_ids = np.asarray(bgc_ids, dtype=np.int64)
+        order = np.argsort(self.bgc_ids, kind='stable')
+        self.bgc_ids = self.bgc_ids[order]
+
+        self.single = {}
+        for category, values in single.items():
+            codes, distinct = _encode(values)
+            self.single[category] = (codes[order], distinct)
+
+        self.multi = {}
+        for category, pairs in multi.items():
+            pairs = list(pairs)
+            codes, distinct = _encode([value for _, value in pairs])
+            rows = self.rows([bgc_id for bgc_id, _ in pairs])
+            keep = (rows >= 0) & (codes >= 0)
+            # one entry per distinct (row, code), sorted by row
+            width = max(len(distinct), 1)
+            entries = np.unique(rows[keep].astype(np.int64) * width + codes[keep])
+            rows, codes = np.divmod(entries, width)
+            indptr = np.zeros(len(self.bgc_ids) + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum(np.bincount(rows, minlength=len(self.bgc_ids)))
+            self.multi[category] = (indptr, codes.astype(np.int32), distinct)
+
+    def __len__(self):
+        return len(self.bgc_ids)
+
+    def rows(self, bgc_ids):
+        '''Get the rows of bgc_ids, -1 for unknown ones'''
+        bgc_ids = np.asarray(list(bgc_ids), dtype=np.int64)
+        rows = np.searchsorted(self.bgc_ids, bgc_ids)
+        rows[rows >= len(self.bgc_ids)] = 0
+        if len(self.bgc_ids):
+            rows[self.bgc_ids[rows] != bgc_ids] = -1
+        else:
+            rows[:] = -1
+        return rows
+
+    def _codes(self, category, rows):
+        '''Get the codes and the distinct values of category for the clusters in rows'''
+        if category in self.single:
+            codes, distinct = self.single[category]
+            codes = codes[rows]
+            return codes[codes >= 0], distinct
+
+        indptr, codes, distinct = self.multi[category]
+        lengths = indptr[rows + 1] - indptr[rows]
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        positions = np.repeat(indptr[rows] - offsets, lengths) + np.arange(lengths.sum())
+        return codes[positions], distinct
+
+    def facets(self, bgc_ids, categories, limit=10):
+        '''Get the top limit (value, count) pairs of every category for the clusters of bgc_ids
+
+        Values are ordered by descending count, then by value.
+        '''
+        rows = self.rows(set(bgc_ids))
+        rows = rows[rows >= 0]
+        facets = {}
+        for category in categories:
+            codes, distinct = self._codes(category, rows)
+            counts = np.bincount(codes, minlength=len(distinct))
+            found = np.nonzero(counts)[0]
+            ranked = sorted(found.tolist(), key=lambda code: (-counts[code], str(distinct[code])))[:limit]
+            facets[category] = [(distinct[code], int(counts[code])) for code in ranked]
+        return facets
+
+
+def _build_attributes():
+    columns = list(SINGLE_FACETS)
+    rows = db.session.query(Bgc.bgc_id, *[SINGLE_FACETS[column] for column in columns]) \
+                     .join(Locus).join(DnaSequence).join(Genome).join(Taxa) \
+                     .all()
+    bgc_ids = [row[0] for row in rows]
+    single = {column: [row[index + 1] for row in rows] for index, column in enumerate(columns)}
+    multi = {category: query().distinct().yield_per(100000) for category, query in MULTI_FACETS.items()}
+    return ClusterAttributes(bgc_ids, single, multi)
+
+
+_ATTRIBUTES = VersionedCache(_build_attributes)
+
+
+def search_facets(bgc_ids, categories, limit=10):
+    '''Get the facets of the clusters of bgc_ids as {category: [{'value': ..., 'count': ...}, ...]}
+
+    Raises a ValueError for unknown categories and a RuntimeError without numpy.
+    '''
+    unknown = set(categories) - CATEGORIES
+    if unknown:
+        raise ValueError('Unknown facet categories: {}'.format(', '.join(sorted(unknown))))
+    if np is None:
+        raise RuntimeError('Search facets need numpy, see index_requirements.txt')
+
+    facets = _ATTRIBUTES.get().facets(bgc_ids, categories, limit)
+    return {category: [{'value': value, 'count': count} for value, count in values]
+            for category, values in facets.items()}
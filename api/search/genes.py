@@ -1,23 +1,23 @@
 '''Gene-related search functions'''
 
-from flask import g
-
 from sqlalchemy import (
     func,
-    or_,
     sql,
 )
+from .architecture import cds_ids_by_architecture
 from .helpers import (
     break_lines,
     calculate_sequence,
     register_handler,
 )
+from .idsets import id_filter, restrict_to_ids
+from .regions import parse_region, region_filter
+from .typeclosure import type_closure
 
 from api.models import (
     db,
     AsDomain,
     AsDomainProfile,
-    BgcType,
     BiosyntheticGeneCluster as Bgc,
     ClusterblastAlgorithm,
     ClusterblastHit,
@@ -125,14 +125,24 @@ def query_acc(term):
     '''Generate Gene query by NCBI accession number'''
     return Cds.query.join(Locus).join(DnaSequence).filter(DnaSequence.acc.ilike(term))
 
+@register_handler(GENE_QUERIES)
+def query_region(term):
+    '''Generate Gene query by overlap with a region, acc:start-end'''
+    try:
+        region = parse_region(term)
+    except ValueError:
+        return Cds.query.filter(sql.false())
+    return Cds.query.join(Locus).join(DnaSequence).filter(region_filter(region))
+
 
 @register_handler(GENE_QUERIES)
 def query_type(term):
-    '''Generate Gene query by cluster type'''
+    '''Generate Gene query by cluster type, including all subtypes'''
+    closure = type_closure()
+    type_ids = closure.with_subtypes(closure.matching(term, substring_terms=True))
     return Cds.query.join(t_cds_cluster_map, Cds.cds_id == t_cds_cluster_map.c.cds_id) \
-                     .join(Bgc, t_cds_cluster_map.c.bgc_id == Bgc.bgc_id) \
-                     .join(t_rel_clusters_types).join(BgcType) \
-                     .filter(or_(BgcType.term.ilike('%{}%'.format(term)), BgcType.description.ilike('%{}%'.format(term))))
+                     .join(t_rel_clusters_types, t_cds_cluster_map.c.bgc_id == t_rel_clusters_types.c.bgc_id) \
+                     .filter(id_filter(t_rel_clusters_types.c.bgc_type_id, type_ids))
 
 
 @register_handler(GENE_QUERIES)
@@ -178,6 +188,12 @@ def query_asdomain(term):
               .filter(AsDomainProfile.name.ilike(term))
 
 
+@register_handler(GENE_QUERIES)
+def query_architecture(term):
+    '''Generate Gene query by the order of its AsDomains, see api.search.architecture'''
+    return restrict_to_ids(Cds.query, Cds.cds_id, cds_ids_by_architecture(term))
+
+
 def gene_by_x_clusterblast(term, algorithm):
     '''Generic search for gene by XClusterBlast match'''
     return Cds.query.join(t_cds_cluster_map, Cds.cds_id == t_cds_cluster_map.c.cds_id) \
@@ -209,19 +225,23 @@ def query_subcluster(term):
 # Formatters #
 #############
 
+def in_order_of(rows, genes):
+    '''Sort formatter rows into the order of the genes they were queried for'''
+    position = {gene.cds_id: index for index, gene in enumerate(genes)}
+    return sorted(rows, key=lambda row: position[row.cds_id])
+
+
 @register_handler(GENE_FORMATTERS)
-def format_fasta(genes):
+def format_fasta(genes, context):
     '''Generate DNA FASTA records for a list of genes'''
     query = db.session.query(Cds.cds_id, Cds.locus_tag, Locus.start_pos, Locus.end_pos, Locus.strand,
                              DnaSequence.acc, DnaSequence.version,
                              func.substr(DnaSequence.dna, Locus.start_pos + 1, Locus.end_pos - Locus.start_pos).label('sequence'))
     query = query.join(Locus).join(DnaSequence)
-    query = query.filter(Cds.cds_id.in_(map(lambda x: x.cds_id, genes))).order_by(Cds.cds_id)
-    search = ''
-    if g.verbose:
-        search = "|{}".format(g.search_str)
+    query = restrict_to_ids(query, Cds.cds_id, [gene.cds_id for gene in genes]).order_by(Cds.cds_id)
+    search = context.fasta_suffix
     fasta_records = []
-    for gene in query:
+    for gene in in_order_of(query, genes):
         sequence = break_lines(calculate_sequence(gene.strand, gene.sequence))
         record = '>{g.locus_tag}|{g.acc}.{g.version}|' \
                  '{g.start_pos}-{g.end_pos}({g.strand}){search}\n' \
@@ -232,17 +252,15 @@ def format_fasta(genes):
 
 
 @register_handler(GENE_FORMATTERS)
-def format_fastaa(genes):
+def format_fastaa(genes, context):
     '''Generate protein FASTA records for a list of genes'''
     query = db.session.query(Cds.cds_id, Cds.locus_tag, Locus.start_pos, Locus.end_pos, Locus.strand,
                              DnaSequence.acc, DnaSequence.version, Cds.translation)
     query = query.join(Locus).join(DnaSequence)
-    query = query.filter(Cds.cds_id.in_(map(lambda x: x.cds_id, genes))).order_by(Cds.cds_id)
-    search = ''
-    if g.verbose:
-        search = "|{}".format(g.search_str)
+    query = restrict_to_ids(query, Cds.cds_id, [gene.cds_id for gene in genes]).order_by(Cds.cds_id)
+    search = context.fasta_suffix
     fasta_records = []
-    for gene in query:
+    for gene in in_order_of(query, genes):
         sequence = break_lines(gene.translation)
         record = '>{g.locus_tag}|{g.acc}.{g.version}|' \
                  '{g.start_pos}-{g.end_pos}({g.strand}){search}\n' \
@@ -253,13 +271,41 @@ def format_fastaa(genes):
 
 
 @register_handler(GENE_FORMATTERS)
-def format_csv(genes):
+def format_csv(genes, context):
     '''Generate CSV records for a list of genes'''
-    query = db.session.query(Cds.locus_tag, Locus.start_pos, Locus.end_pos, Locus.strand, DnaSequence.acc, DnaSequence.version)
+    query = db.session.query(Cds.cds_id, Cds.locus_tag, Locus.start_pos, Locus.end_pos, Locus.strand,
+                             DnaSequence.acc, DnaSequence.version)
     query = query.join(Locus).join(DnaSequence)
-    query = query.filter(Cds.cds_id.in_(map(lambda x: x.cds_id, genes))).order_by(Cds.cds_id)
+    query = restrict_to_ids(query, Cds.cds_id, [gene.cds_id for gene in genes]).order_by(Cds.cds_id)
     csv_lines = ['#Locus tag\tAccession\tStart\tEnd\tStrand']
-    for gene in query:
+    for gene in in_order_of(query, genes):
         csv_lines.append('{g.locus_tag}\t{g.acc}.{g.version}\t'
                          '{g.start_pos}\t{g.end_pos}\t{g.strand}'.format(g=gene))
     return csv_lines
+
+
+def gene_translations(cds_ids):
+    '''Get a dict of the protein sequences of CDSs by cds_id'''
+    query = restrict_to_ids(db.session.query(Cds.cds_id, Cds.translation), Cds.cds_id, cds_ids)
+    return dict(query.all())
+
+
+def protein_hits_to_json(hits):
+    '''Add the locus tags and locations of the genes to protein search hits
+
+    Hits of CDSs that are no longer in the database are dropped.
+    '''
+    query = db.session.query(Cds.cds_id, Cds.locus_tag, Locus.start_pos, Locus.end_pos, Locus.strand,
+                             DnaSequence.acc, DnaSequence.version)
+    query = query.join(Locus).join(DnaSequence)
+    genes = {gene.cds_id: gene for gene in restrict_to_ids(query, Cds.cds_id, [hit['cds_id'] for hit in hits])}
+    results = []
+    for hit in hits:
+        gene = genes.get(hit['cds_id'])
+        if gene is None:
+            continue
+        result = dict(hit)
+        result.update(locus_tag=gene.locus_tag, acc=gene.acc, version=gene.version,
+                      start=gene.start_pos, end=gene.end_pos, strand=gene.strand)
+        results.append(result)
+    return results
@@ -13,6 +13,31 @@ def register_handler(handler):
     return real_decorator
 
 
+class FormatContext(object):
+    '''Per-request settings of the result formatters'''
+    def __init__(self, verbose=False, search_str=''):
+        self.verbose = verbose
+        self.search_str = search_str
+
+    @classmethod
+    def from_query(cls, query):
+        '''Get the formatting context for a search.Query'''
+        return cls(verbose=query.verbose, search_str=str(query) if query.verbose else '')
+
+    @property
+    def fasta_suffix(self):
+        '''The text appended to FASTA headers, the search string in verbose mode
+
+        >>> FormatContext().fasta_suffix
+        ''
+        >>> FormatContext(verbose=True, search_str='[type]nrps').fasta_suffix
+        '|[type]nrps'
+        '''
+        if self.verbose:
+            return '|{}'.format(self.search_str)
+        return ''
+
+
 def break_lines(string, width=80):
     '''Break up a long string to lines of width (default: 80)'''
     parts = []
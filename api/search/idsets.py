@@ -0,0 +1,64 @@
+'''Restrict queries to a set of ids
+
+The formatters re-query the search results by id. An IN list renders one bind
+parameter per id, so instead the ids are sent as a single array parameter
+(column = ANY(:ids)). Sets of ID_TEMP_TABLE_THRESHOLD ids or more are copied
+into a temporary table that the query joins against, which gives the planner
+row estimates to work with. See benchmarks/id_sets.py for the crossover.
+
+Temporary tables need a writable connection of the current request, so
+queries built without a request context, like the ones of api.asgi, or for
+requests routed to a read-only replica always use the array parameter.
+'''
+
+import io
+import itertools
+
+from flask import current_app, g, has_request_context
+from sqlalchemy import Column, Integer, MetaData, Table, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+
+_TABLE_NUMBERS = itertools.count(1)
+
+
+def id_filter(column, ids):
+    '''Get the clause matching column against ids, sent as one array parameter'''
+    return column == any_(bindparam(None, sorted(set(ids)), type_=ARRAY(Integer)))
+
+
+def load_id_table(session, ids):
+    '''Copy ids into a temporary table of the session's transaction and return the table'''
+    name = 'search_ids_{}'.format(next(_TABLE_NUMBERS))
+    connection = session.connection()
+    connection.execute('CREATE TEMPORARY TABLE {} (id integer PRIMARY KEY) ON COMMIT DROP'.format(name))
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert('COPY {} (id) FROM STDIN'.format(name),
+                           io.StringIO(''.join('{}\n'.format(value) for value in sorted(set(ids)))))
+    finally:
+        cursor.close()
+    connection.execute('ANALYZE {}'.format(name))
+
+    return Table(name, MetaData(), Column('id', Integer, primary_key=True))
+
+
+def join_id_table(query, column, ids):
+    '''Restrict a query to the rows with column in ids by joining a temporary table of the ids'''
+    table = load_id_table(query.session, ids)
+    return query.join(table, table.c.id == column)
+
+
+def _temp_tables_allowed(session):
+    if not has_request_context() or g.get('db_replica') is not None:
+        return False
+    return session.get_bind().dialect.name == 'postgresql'
+
+
+def restrict_to_ids(query, column, ids):
+    '''Restrict a query to the rows with column in ids, using a temporary table for large sets'''
+    ids = set(ids)
+    threshold = current_app.config.get('ID_TEMP_TABLE_THRESHOLD')
+    if threshold and len(ids) >= threshold and _temp_tables_allowed(query.session):
+        return join_id_table(query, column, ids)
+    return query.filter(id_filter(column, ids))
@@ -0,0 +1,64 @@
+'''Search for the features overlapping a region of a DNA sequence
+
+Regions are written as acc[.version]:start-end with 1-based, inclusive
+coordinates like in genome browsers, e.g. [region]NZ_CP012345.1:100000-250000.
+
+Overlaps are tested on int4range(start_pos, end_pos) of the loci, which the
+GiST index declared here answers per sequence. It needs the btree_gist
+extension for the sequence_id column:
+
+    CREATE EXTENSION IF NOT EXISTS btree_gist;
+    CREATE INDEX loci_sequence_range_idx ON antismash.loci
+        USING gist (sequence_id, int4range(start_pos, end_pos));
+
+The plain start and end comparisons are kept next to the range overlap, so
+databases without that index can still use loci_start_end_strand_idx.
+'''
+
+import re
+
+from sqlalchemy import and_, func
+
+from api.models import db, DnaSequence, Locus
+
+REGION_INDEX = db.Index('loci_sequence_range_idx', Locus.sequence_id,
+                        func.int4range(Locus.start_pos, Locus.end_pos), postgresql_using='gist')
+
+REGION_PATTERN = re.compile(r'^(?P<acc>[A-Za-z0-9_]+)(?:\.(?P<version>\d+))?:(?P<start>[\d,]+)-(?P<end>[\d,]+)$')
+
+
+def parse_region(term):
+    '''Parse a region term into (acc, version, start, end) with 0-based, half-open coordinates
+
+    Raises a ValueError for malformed regions.
+
+    >>> parse_region('NZ_CP012345.1:100,000-250,000')
+    ('NZ_CP012345', 1, 99999, 250000)
+    >>> parse_region('nc_003888:1-20')
+    ('NC_003888', None, 0, 20)
+    '''
+    match = REGION_PATTERN.match(term.strip())
+    if match is None:
+        raise ValueError('Invalid region {!r}, expected acc:start-end'.format(term))
+
+    start = int(match.group('start').replace(',', ''))
+    end = int(match.group('end').replace(',', ''))
+    if start < 1 or end < start:
+        raise ValueError('Invalid coordinates in region {!r}'.format(term))
+
+    version = match.group('version')
+    return match.group('acc').upper(), int(version) if version else None, start - 1, end
+
+
+def region_filter(region):
+    '''Get the filter for the loci overlapping a parsed region, the query needs to join Locus and DnaSequence'''
+    acc, version, start, end = region
+    clauses = [
+        DnaSequence.acc == acc,
+        func.int4range(Locus.start_pos, Locus.end_pos).op('&&')(func.int4range(start, end)),
+        Locus.start_pos < end,
+        Locus.end_pos > start,
+    ]
+    if version is not None:
+        clauses.append(DnaSequence.version == version)
+    return and_(*clauses)
@@ -0,0 +1,134 @@
+'''In-memory typeahead index for the available terms by category
+
+The index keeps a sorted, case-folded array of all (value, description) pairs
+of a category. Value prefixes are looked up with a binary search, descriptions
+are matched by prefix or by substring via an n-gram index.
+'''
+
+from array import array
+from bisect import bisect_left
+import heapq
+
+from api.text_index import SubstringIndex
+
+# Largest code point, used as upper bound for prefix ranges
+MAX_CHAR = '\U0010ffff'
+
+# How the descriptions of a category are matched, categories not listed here
+# only match on the value
+DESCRIPTION_MATCHES = {
+    'monomer': 'prefix',
+    'type': 'prefix',
+    'profile': 'substring',
+    'asdomain': 'substring',
+    'clusterblast': 'substring',
+    'knowncluster': 'substring',
+    'subcluster': 'substring',
+    'smcog': 'substring',
+    'terpene': 'substring',
+}
+
+# Categories with human-readable names that get "did you mean" suggestions,
+# not strains, there are about as many of them as genomes
+FUZZY_CATEGORIES = set([
+    'superkingdom', 'phylum', 'class', 'order', 'family', 'genus', 'species',
+    'compoundclass', 'monomer', 'type', 'profile', 'asdomain', 'smcog', 'terpene',
+])
+
+
+def _sort_key(entry):
+    '''Order entries by value, ignoring case for text values'''
+    value, description = entry
+    if isinstance(value, str):
+        return (value.casefold(), value, description or '')
+    return (value, '', '')
+
+
+class TypeaheadIndex(object):
+    '''Prefix and description lookups over the (value, description) pairs of a category
+
+    >>> index = TypeaheadIndex([('ala', 'Alanine'), ('gly', 'Glycine'), ('ala-thz', 'Alanine-thiazole')], 'prefix')
+    >>> index.lookup('AL')
+    [('ala', 'Alanine'), ('ala-thz', 'Alanine-thiazole')]
+    >>> index.lookup('glyc')
+    [('gly', 'Glycine')]
+    >>> index.lookup('a', limit=1)
+    [('ala', 'Alanine')]
+    '''
+    def __init__(self, entries, description_match=None):
+        self.entries = sorted(set(entries), key=_sort_key)
+        self.description_match = description_match
+
+        keys = sorted((str(value).casefold(), idx) for idx, (value, _) in enumerate(self.entries))
+        self._keys = [key for key, _ in keys]
+        self._key_entries = array('I', [idx for _, idx in keys])
+        # For text values the key order and entry order are identical, so a prefix
+        # range is already sorted and can be cut off at the limit
+        self._ordered = all(idx == pos for pos, idx in enumerate(self._key_entries))
+
+        self._desc_keys = []
+        self._desc_entries = array('I')
+        self._desc_index = None
+        if description_match == 'prefix':
+            desc_keys = sorted((desc.casefold(), idx) for idx, (_, desc) in enumerate(self.entries) if desc)
+            self._desc_keys = [key for key, _ in desc_keys]
+            self._desc_entries = array('I', [idx for _, idx in desc_keys])
+        elif description_match == 'substring':
+            self._desc_index = SubstringIndex([desc for _, desc in self.entries])
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def _prefix_range(keys, prefix):
+        '''Get the start and end position of all keys starting with prefix'''
+        return bisect_left(keys, prefix), bisect_left(keys, prefix + MAX_CHAR)
+
+    def _value_matches(self, term, limit):
+        start, end = self._prefix_range(self._keys, term)
+        if self._ordered:
+            return range(start, min(end, start + limit))
+        return sorted(self._key_entries[start:end])[:limit]
+
+    def _description_matches(self, term, limit):
+        if self.description_match == 'prefix':
+            start, end = self._prefix_range(self._desc_keys, term)
+            return sorted(self._desc_entries[start:end])[:limit]
+        if self.description_match == 'substring':
+            return self._desc_index.search(term, limit=limit)
+        return []
+
+    def lookup(self, term, limit=50, counts=None):
+        '''Get up to limit (value, description) pairs matching term
+
+        Results are ordered by value, unless a counts dict mapping values to the
+        number of matching BGCs is given, in which case the most common values
+        are returned first.
+
+        >>> index = TypeaheadIndex([('Salinispora', None), ('Streptomyces', None), ('Sorangium', None)])
+        >>> index.lookup('s', limit=2, counts={'Streptomyces': 120, 'Sorangium': 3})
+        [('Streptomyces', None), ('Sorangium', None)]
+        '''
+        folded = term.casefold()
+        if counts is not None:
+            return self._ranked_lookup(folded, limit, counts)
+
+        matches = heapq.merge(self._value_matches(folded, limit), self._description_matches(folded, limit))
+        results = []
+        last = None
+        for idx in matches:
+            if idx == last:
+                continue
+            last = idx
+            results.append(self.entries[idx])
+            if len(results) >= limit:
+                break
+
+        return results
+
+    def _ranked_lookup(self, folded, limit, counts):
+        everything = len(self.entries)
+        matches = set(self._value_matches(folded, everything))
+        matches.update(self._description_matches(folded, everything))
+        ranked = heapq.nlargest(limit, matches, key=lambda idx: (counts.get(self.entries[idx][0], 0), -idx))
+        return [self.entries[idx] for idx in ranked]
@@ -0,0 +1,100 @@
+'''The transitive closure of the BGC type hierarchy
+
+BgcType.parent_id makes the types a small tree, e.g. NRPS-like types below
+NRPS. Instead of walking it with a recursive CTE for every type search, the
+(ancestor, descendant) closure of all types is kept in memory per data
+version. Type searches then look up the matching type ids with all their
+subtypes and filter rel_clusters_types on that id set, and the type counts of
+the typeahead roll cluster counts up to the parent types without recursion.
+'''
+
+from api.cache import VersionedCache
+from api.models import db, BgcType
+
+
+class TypeClosure(object):
+    '''The descendants and ancestors of all BGC types, each including the type itself
+
+    >>> closure = TypeClosure([(1, 'nrps', 'NRPS', None), (2, 'nrps-like', 'NRPS-like', 1), (3, 't1pks', 'T1PKS', None)])
+    >>> sorted(closure.descendants[1]), sorted(closure.ancestors[2])
+    ([1, 2], [1, 2])
+    '''
+    def __init__(self, types):
+        '''Build the closure from (bgc_type_id, term, description, parent_id) rows'''
+        self.types = {}
+        parents = {}
+        for bgc_type_id, term, description, parent_id in types:
+            self.types[bgc_type_id] = (term or '', description or '')
+            parents[bgc_type_id] = parent_id
+
+        self.ancestors = {}
+        for bgc_type_id in self.types:
+            ancestors = []
+            current = bgc_type_id
+            # stop at unknown parents and at cycles in broken data
+            while current in self.types and current not in ancestors:
+                ancestors.append(current)
+                current = parents[current]
+            self.ancestors[bgc_type_id] = frozenset(ancestors)
+
+        descendants = {bgc_type_id: set() for bgc_type_id in self.types}
+        for bgc_type_id, ancestors in self.ancestors.items():
+            for ancestor in ancestors:
+                descendants[ancestor].add(bgc_type_id)
+        self.descendants = {bgc_type_id: frozenset(ids) for bgc_type_id, ids in descendants.items()}
+
+    def matching(self, term, substring_terms=False):
+        '''Get the ids of the types with a term equal to term or a description containing it, ignoring case
+
+        With substring_terms, the type terms may contain term as well.
+        '''
+        folded = term.casefold()
+        found = set()
+        for bgc_type_id, (type_term, description) in self.types.items():
+            type_term = type_term.casefold()
+            if type_term == folded or folded in description.casefold() or (substring_terms and folded in type_term):
+                found.add(bgc_type_id)
+        return found
+
+    def with_subtypes(self, type_ids):
+        '''Get the ids of types and all their subtypes'''
+        found = set()
+        for bgc_type_id in type_ids:
+            found |= self.descendants.get(bgc_type_id, frozenset((bgc_type_id,)))
+        return found
+
+    def with_parents(self, type_ids):
+        '''Get the ids of types and all their parent types'''
+        found = set()
+        for bgc_type_id in type_ids:
+            found |= self.ancestors.get(bgc_type_id, frozenset((bgc_type_id,)))
+        return found
+
+    def rollup(self, cluster_types):
+        '''Count the distinct clusters of every type including its subtypes from (bgc_id, bgc_type_id) rows
+
+        >>> closure = TypeClosure([(1, 'nrps', 'NRPS', None), (2, 'nrps-like', 'NRPS-like', 1), (3, 't1pks', 'T1PKS', None)])
+        >>> sorted(closure.rollup([(10, 1), (10, 2), (11, 2), (12, 3)]).items())
+        [(1, 2), (2, 2), (3, 1)]
+        '''
+        clusters = {}
+        for bgc_id, bgc_type_id in cluster_types:
+            clusters.setdefault(bgc_id, set()).add(bgc_type_id)
+
+        counts = {}
+        for type_ids in clusters.values():
+            for bgc_type_id in self.with_parents(type_ids):
+                counts[bgc_type_id] = counts.get(bgc_type_id, 0) + 1
+        return counts
+
+
+def _build_closure():
+    return TypeClosure(db.session.query(BgcType.bgc_type_id, BgcType.term, BgcType.description, BgcType.parent_id))
+
+
+_CLOSURE = VersionedCache(_build_closure)
+
+
+def type_closure():
+    '''Get the TypeClosure of the current data version'''
+    return _CLOSURE.get()
@@ -32,6 +32,15 @@ class Query(object):
         return "Query(search: {search}, terms: {terms})".format(
             search=self.search_type, terms=str(self.terms))
 
+    def to_json(self):
+        '''Get the json structure of the query, the inverse of from_json'''
+        return {
+            'search': self.search_type,
+            'return_type': self.return_type,
+            'verbose': self.verbose,
+            'terms': self.terms.to_json(),
+        }
+
     @classmethod
     def from_json(cls, json_query):
         '''Generate query from a json structure'''
@@ -100,6 +109,12 @@ class QueryTerm(object):
         if self.kind == 'operation':
             return '( {l} {o} {r} )'.format(l=self.left, o=self.operation.upper(), r=self.right)
 
+    def to_json(self):
+        '''Recursively get the json data structure of the term, the inverse of from_json'''
+        if self.kind == 'expression':
+            return {'term_type': 'expr', 'category': self.category, 'term': self.term}
+        return {'term_type': 'op', 'operation': self.operation, 'left': self.left.to_json(), 'right': self.right.to_json()}
+
     @classmethod
     def from_json(cls, term):
         '''Recursively generate terms from a json data structure'''
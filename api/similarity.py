@@ -0,0 +1,277 @@
+'''Find clusters with similar domain content
+
+Every BGC is described by the set of its features: the antiSMASH domains, Pfam
+domains, profile hits and smCOGs of its CDSs, named like 'pfam:PF00109'. The
+sets are kept in a sparse, binary cluster x feature matrix in CSR form plus its
+transpose, the postings of every feature. It is built once per data version.
+
+The shared features of a query with all clusters are counted with a single
+bincount over the postings of the query features, turned into Jaccard or
+cosine similarities with vectorized operations. For very large databases, an
+optional MinHash/LSH prefilter only scores the clusters that share a bucket
+with the query in at least one of 16 bands of 3 MinHash values. That finds
+nearly all clusters with a Jaccard similarity above 0.5, and few below 0.2.
+
+This needs numpy, see index_requirements.txt.
+'''
+
+from .cache import VersionedCache
+from .search.clusters import cluster_json_query, clusters_from_rows
+from .models import (
+    db,
+    AsDomain,
+    AsDomainProfile,
+    BiosyntheticGeneCluster as Bgc,
+    PfamDomain,
+    ProfileHit,
+    Smcog,
+    SmcogHit,
+    t_cds_cluster_map,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+METRICS = ('jaccard', 'cosine')
+
+# MinHash signatures have BANDS * BAND_ROWS values
+BANDS = 16
+BAND_ROWS = 3
+_PRIME = (1 << 31) - 1
+_EMPTY = np.iinfo(np.uint64).max if np is not None else None
+
+
+class FeatureMatrix(object):
+    '''Binary cluster x feature matrix with feature postings and MinHash LSH tables'''
+    def __init__(self, bgc_ids, features, indptr, indices, seed=0):
+        self.bgc_ids = np.asarray(bgc_ids, dtype=np.int64)
+        self.features = list(features)
+        self.feature_ids = {name: index for index, name in enumerate(self.features)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.sizes = np.diff(self.indptr)
+
+        rows = np.repeat(np.arange(len(self.bgc_ids), dtype=np.int32), self.sizes)
+        order = np.argsort(self.indices, kind='stable')
+        self.postings = rows[order]
+        self.feature_indptr = np.zeros(len(self.features) + 1, dtype=np.int64)
+        self.feature_indptr[1:] = np.cumsum(np.bincount(self.indices, minlength=len(self.features)))
+
+        rng = np.random.RandomState(seed)
+        self._hash_a = rng.randint(1, _PRIME, size=BANDS * BAND_ROWS).astype(np.uint64)
+        self._hash_b = rng.randint(0, _PRIME, size=BANDS * BAND_ROWS).astype(np.uint64)
+        self._build_lsh()
+
+    @classmethod
+    def from_pairs(cls, bgc_ids, pairs, seed=0):
+        '''Build the matrix of all bgc_ids from (bgc_id, feature name) pairs'''
+        bgc_ids = np.unique(np.asarray(list(bgc_ids), dtype=np.int64))
+        feature_ids = {}
+        pair_rows = []
+        pair_features = []
+        for bgc_id, feature in pairs:
+            pair_rows.append(bgc_id)
+            pair_features.append(feature_ids.setdefault(feature, len(feature_ids)))
+
+        pair_rows = np.asarray(pair_rows, dtype=np.int64)
+        rows = np.searchsorted(bgc_ids, pair_rows)
+        known = rows < len(bgc_ids)
+        known[known] = bgc_ids[rows[known]] == pair_rows[known]
+
+        # one entry per distinct (row, feature), sorted by row and then feature
+        width = max(len(feature_ids), 1)
+        entries = np.unique(rows[known] * width + np.asarray(pair_features, dtype=np.int64)[known])
+        rows, features = np.divmod(entries, width)
+
+        indptr = np.zeros(len(bgc_ids) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(rows, minlength=len(bgc_ids)))
+        names = sorted(feature_ids, key=feature_ids.get)
+        return cls(bgc_ids, names, indptr, features, seed=seed)
+
+    def __len__(self):
+        return len(self.bgc_ids)
+
+    def row_of(self, bgc_id):
+        '''Get the matrix row of a bgc_id, or None if it is unknown'''
+        row = int(np.searchsorted(self.bgc_ids, bgc_id))
+        if row < len(self.bgc_ids) and self.bgc_ids[row] == bgc_id:
+            return row
+        return None
+
+    def cluster_features(self, row):
+        '''Get the feature indices of a matrix row'''
+        return self.indices[self.indptr[row]:self.indptr[row + 1]]
+
+    def feature_indices(self, names):
+        '''Get the sorted indices of the known features among names'''
+        return np.array(sorted(set(self.feature_ids[name] for name in names if name in self.feature_ids)), dtype=np.int32)
+
+    def _hashes(self, features):
+        '''Get the (permutations x features) MinHash values of feature indices'''
+        features = features.astype(np.uint64)
+        return (self._hash_a[:, None] * features[None, :] + self._hash_b[:, None]) % np.uint64(_PRIME)
+
+    def _band_keys(self, signatures):
+        '''Combine the signature values of every band into one uint64 key per band and cluster'''
+        keys = np.zeros((BANDS, signatures.shape[1]), dtype=np.uint64)
+        for band in range(BANDS):
+            for row in range(BAND_ROWS):
+                keys[band] = keys[band] * np.uint64(1000003) + signatures[band * BAND_ROWS + row]
+        return keys
+
+    def _build_lsh(self):
+        feature_hashes = self._hashes(np.arange(len(self.features)))
+        signatures = np.full((BANDS * BAND_ROWS, len(self)), _EMPTY, dtype=np.uint64)
+        filled = self.sizes > 0
+        if filled.any():
+            starts = self.indptr[:-1][filled]
+            for permutation in range(BANDS * BAND_ROWS):
+                signatures[permutation, filled] = np.minimum.reduceat(feature_hashes[permutation][self.indices], starts)
+
+        keys = self._band_keys(signatures)
+        keys[:, ~filled] = _EMPTY
+        self._band_order = np.argsort(keys, axis=1, kind='stable')
+        self._band_keys_sorted = np.take_along_axis(keys, self._band_order, axis=1)
+
+    def lsh_candidates(self, features):
+        '''Get the rows sharing an LSH bucket with a set of feature indices in any band'''
+        if not len(features):
+            return np.empty(0, dtype=np.int64)
+        signature = self._hashes(features).min(axis=1)[:, None]
+        keys = self._band_keys(signature)[:, 0]
+        found = []
+        for band, key in enumerate(keys):
+            start = np.searchsorted(self._band_keys_sorted[band], key, side='left')
+            end = np.searchsorted(self._band_keys_sorted[band], key, side='right')
+            found.append(self._band_order[band, start:end])
+        return np.unique(np.concatenate(found))
+
+    def shared_features(self, features, rows=None):
+        '''Count the features every cluster, or every cluster of rows, shares with a set of feature indices'''
+        if rows is None:
+            if not len(features):
+                return np.zeros(len(self), dtype=np.int64)
+            postings = [self.postings[self.feature_indptr[feature]:self.feature_indptr[feature + 1]] for feature in features]
+            return np.bincount(np.concatenate(postings), minlength=len(self))
+
+        rows = np.asarray(rows, dtype=np.int64)
+        counts = np.zeros(len(rows), dtype=np.int64)
+        filled = self.sizes[rows] > 0
+        if not filled.any():
+            return counts
+        # gather the CSR entries of the rows into one array and sum the hits per row
+        lengths = self.sizes[rows[filled]]
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        positions = np.repeat(self.indptr[rows[filled]] - offsets, lengths) + np.arange(lengths.sum())
+        hits = np.isin(self.indices[positions], features).astype(np.int64)
+        counts[filled] = np.add.reduceat(hits, offsets)
+        return counts
+
+    def similar(self, features, limit=10, metric='jaccard', prefilter=False, exclude_row=None):
+        '''Get the (bgc_id, score, shared features) of the limit clusters most similar to a set of feature indices'''
+        if metric not in METRICS:
+            raise ValueError('Unknown similarity metric {!r}'.format(metric))
+        if not len(features):
+            return []
+
+        if prefilter:
+            rows = self.lsh_candidates(features)
+            shared = self.shared_features(features, rows)
+        else:
+            shared = self.shared_features(features)
+            rows = np.nonzero(shared)[0]
+            shared = shared[rows]
+        keep = shared > 0
+        if exclude_row is not None:
+            keep &= rows != exclude_row
+        rows, shared = rows[keep], shared[keep]
+
+        sizes = self.sizes[rows]
+        if metric == 'jaccard':
+            scores = shared / (len(features) + sizes - shared)
+        else:
+            scores = shared / np.sqrt(len(features) * sizes)
+
+        top = np.lexsort((self.bgc_ids[rows], -scores))[:limit]
+        return [(int(self.bgc_ids[rows[index]]), round(float(scores[index]), 4), int(shared[index])) for index in top]
+
+
+def feature_queries():
+    '''Get (prefix, query) pairs for the distinct (bgc_id, feature name) rows of every feature kind'''
+    def by_cds(*columns):
+        return db.session.query(t_cds_cluster_map.c.bgc_id, *columns).select_from(t_cds_cluster_map).distinct()
+
+    return [
+        ('asdomain', by_cds(AsDomainProfile.name).join(AsDomain, AsDomain.cds_id == t_cds_cluster_map.c.cds_id)
+                                                 .join(AsDomainProfile)),
+        ('pfam', by_cds(PfamDomain.pfam_id).join(PfamDomain, PfamDomain.cds_id == t_cds_cluster_map.c.cds_id)),
+        ('profile', by_cds(ProfileHit.name).join(ProfileHit, ProfileHit.cds_id == t_cds_cluster_map.c.cds_id)),
+        ('smcog', by_cds(Smcog.name).join(SmcogHit, SmcogHit.cds_id == t_cds_cluster_map.c.cds_id).join(Smcog)),
+    ]
+
+
+def _feature_pairs():
+    for prefix, query in feature_queries():
+        for bgc_id, name in query.yield_per(100000):
+            if name is not None:
+                yield bgc_id, '{}:{}'.format(prefix, name)
+
+
+def _build_matrix():
+    '''Load the features of all clusters into a FeatureMatrix'''
+    bgc_ids = [bgc_id for bgc_id, in db.session.query(Bgc.bgc_id)]
+    return FeatureMatrix.from_pairs(bgc_ids, _feature_pairs())
+
+
+_MATRIX = VersionedCache(_build_matrix)
+
+
+def get_matrix():
+    '''Get the FeatureMatrix of the current data version'''
+    if np is None:
+        raise RuntimeError('The cluster similarity search needs numpy, see index_requirements.txt')
+    return _MATRIX.get()
+
+
+def similar_to_cluster(bgc_id, limit=10, metric='jaccard', prefilter=False):
+    '''Get the (bgc_id, score, shared features) of the clusters most similar to a cluster
+
+    Returns None for unknown clusters.
+    '''
+    matrix = get_matrix()
+    row = matrix.row_of(bgc_id)
+    if row is None:
+        return None
+    return matrix.similar(matrix.cluster_features(row), limit=limit, metric=metric,
+                          prefilter=prefilter, exclude_row=row)
+
+
+def similar_to_features(names, limit=10, metric='jaccard', prefilter=False):
+    '''Get the (bgc_id, score, shared features) of the clusters most similar to a list of feature names'''
+    matrix = get_matrix()
+    return matrix.similar(matrix.feature_indices(names), limit=limit, metric=metric, prefilter=prefilter)
+
+
+def cluster_feature_names(bgc_id):
+    '''Get the sorted feature names of a cluster'''
+    matrix = get_matrix()
+    row = matrix.row_of(bgc_id)
+    if row is None:
+        return []
+    return sorted(matrix.features[feature] for feature in matrix.cluster_features(row))
+
+
+def similar_clusters_to_json(hits):
+    '''Get the cluster JSON of (bgc_id, score, shared features) hits in their order, with score and shared_features'''
+    clusters = {cluster['bgc_id']: cluster for cluster in clusters_from_rows(cluster_json_query([hit[0] for hit in hits]))}
+    json_clusters = []
+    for bgc_id, score, shared in hits:
+        if bgc_id not in clusters:
+            continue
+        cluster = clusters[bgc_id]
+        cluster['score'] = score
+        cluster['shared_features'] = shared
+        json_clusters.append(cluster)
+    return json_clusters
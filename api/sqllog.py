@@ -0,0 +1,115 @@
+'''SQL statement accounting and slow query logging
+
+Engine event hooks count the statements and rows of every request, which end
+up in the request log line. Statements slower than SLOW_QUERY_SECONDS are
+logged with their parameters. If EXPLAIN_LOG is set, their EXPLAIN (FORMAT JSON)
+plan is captured by a background thread and written to that file, which is
+rotated when it grows beyond EXPLAIN_LOG_MAX_BYTES.
+'''
+
+import json
+import logging
+from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+
+from flask import current_app, g, has_app_context, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .metrics import Counter
+
+SQL_STATEMENTS = Counter('asdb_sql_statements_total', 'SQL statements executed')
+SLOW_STATEMENTS = Counter('asdb_sql_slow_statements_total', 'SQL statements slower than the slow query threshold')
+
+LOGGER = logging.getLogger(__name__)
+EXPLAIN_LOGGER = logging.getLogger('{}.explain'.format(__name__))
+EXPLAIN_LOGGER.propagate = False
+
+# Slow statements waiting for their plan to be captured, extra ones are dropped
+_EXPLAIN_QUEUE = queue.Queue(maxsize=100)
+_EXPLAIN_STATE = {'worker': None, 'path': None}
+_EXPLAIN_LOCK = threading.Lock()
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info['query_start'].pop()
+    SQL_STATEMENTS.inc()
+
+    if has_request_context():
+        g.sql_statements = g.get('sql_statements', 0) + 1
+        g.sql_rows = g.get('sql_rows', 0) + max(cursor.rowcount, 0)
+
+    if not has_app_context():
+        return
+    threshold = current_app.config.get('SLOW_QUERY_SECONDS')
+    if threshold is None or duration < threshold:
+        return
+
+    SLOW_STATEMENTS.inc()
+    LOGGER.warning('slow query duration=%.3f statement=%r parameters=%r', duration, statement, parameters)
+
+    path = current_app.config.get('EXPLAIN_LOG')
+    if path and not executemany and statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+        _queue_explain(conn.engine, statement, parameters, duration, path,
+                       current_app.config.get('EXPLAIN_LOG_MAX_BYTES', 10 * 1024 * 1024))
+
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(context):
+    if context.connection is not None and context.connection.info.get('query_start'):
+        context.connection.info['query_start'].pop()
+
+
+def _queue_explain(engine, statement, parameters, duration, path, max_bytes):
+    '''Hand a slow statement to the background thread capturing plans'''
+    with _EXPLAIN_LOCK:
+        if _EXPLAIN_STATE['path'] != path:
+            for handler in list(EXPLAIN_LOGGER.handlers):
+                EXPLAIN_LOGGER.removeHandler(handler)
+                handler.close()
+            EXPLAIN_LOGGER.addHandler(RotatingFileHandler(path, maxBytes=max_bytes, backupCount=5))
+            EXPLAIN_LOGGER.setLevel(logging.INFO)
+            _EXPLAIN_STATE['path'] = path
+        if _EXPLAIN_STATE['worker'] is None:
+            _EXPLAIN_STATE['worker'] = threading.Thread(target=_explain_worker, name='explain', daemon=True)
+            _EXPLAIN_STATE['worker'].start()
+
+    try:
+        _EXPLAIN_QUEUE.put_nowait((engine, statement, parameters, duration, time.time()))
+    except queue.Full:
+        LOGGER.info('Dropping EXPLAIN capture, too many slow queries waiting')
+
+
+def _explain_worker():
+    while True:
+        job = _EXPLAIN_QUEUE.get()
+        try:
+            capture_explain(*job)
+        finally:
+            _EXPLAIN_QUEUE.task_done()
+
+
+def capture_explain(engine, statement, parameters, duration, timestamp):
+    '''Write the EXPLAIN (FORMAT JSON) plan of a statement to the explain log'''
+    record = {
+        'timestamp': timestamp,
+        'duration': duration,
+        'statement': statement,
+        'parameters': parameters,
+    }
+    try:
+        with engine.connect() as connection:
+            plan = connection.execute('EXPLAIN (FORMAT JSON) {}'.format(statement), parameters).scalar()
+        record['plan'] = json.loads(plan) if isinstance(plan, str) else plan
+    except Exception as err:  # pylint: disable=broad-except
+        record['error'] = str(err)
+
+    EXPLAIN_LOGGER.info(json.dumps(record, default=str))
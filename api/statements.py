@@ -0,0 +1,212 @@
+'''Reuse the compiled SQL of queries that only differ in their search terms
+
+Most requests run the same few query shapes, like a genus search or one level
+of the taxon tree, with different values. Building the ORM query and compiling
+it to SQL costs more Python time than the database needs for such small
+queries, so the SQL of every shape is compiled once per process and cached.
+
+A shape is compiled by building its query with sentinel strings in place of the
+search terms. Every bound parameter that contains a sentinel becomes a template
+filled in with the real term, e.g. '%{}%' for a substring search, all others
+are constants. Cached statements are run as text(...).columns(...) with the
+original bind types, hydrated into model instances with from_statement().
+
+Shapes that can't be cached fall back to building the query every time. That
+is the case if a sentinel doesn't end up in exactly one spot of a parameter,
+e.g. because the handler transforms the term, or if the SQL depends on the
+value of the terms. Only string terms are replaced by sentinels, other values
+like the booleans of [contigedge] are part of the shape key.
+'''
+
+import collections
+import threading
+
+from flask import current_app, has_app_context
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import ArgumentError
+
+from .models import db
+
+_SENTINEL_SETS = ('QsHaPe{}tErM', 'zShApE{}TeRm')
+# Stands in for the string terms in shape keys
+_TERM = '?'
+
+
+class ShapeStatement(object):
+    '''The compiled SQL of a query shape and how to fill in its parameters'''
+    def __init__(self, statement, parameters):
+        self.statement = statement
+        self.parameters = parameters
+
+    def params(self, terms):
+        '''Get the parameters of the statement for a list of search terms'''
+        values = {}
+        for name, (index, prefix, suffix) in self.parameters.items():
+            if index is None:
+                values[name] = prefix
+            else:
+                values[name] = '{}{}{}'.format(prefix, terms[index], suffix)
+        return values
+
+
+class UncacheableShape(Exception):
+    '''Raised if the SQL of a query shape depends on more than the position of its terms'''
+    pass
+
+
+def _compile(query, dialect):
+    statement = getattr(query, 'statement', query)
+    return statement, statement.compile(dialect=dialect)
+
+
+def _parameter(value, sentinels):
+    '''Get the (term index, prefix, suffix) template of a compiled parameter value
+
+    >>> _parameter('%QsHaPe1tErM%', ['QsHaPe0tErM', 'QsHaPe1tErM'])
+    (1, '%', '%')
+    >>> _parameter(50, ['QsHaPe0tErM'])
+    (None, 50, None)
+    '''
+    if not isinstance(value, str):
+        return None, value, None
+    found = [index for index, sentinel in enumerate(sentinels) if sentinel in value]
+    if not found:
+        return None, value, None
+    if len(found) > 1 or value.count(sentinels[found[0]]) > 1:
+        raise UncacheableShape('Parameter {!r} contains more than one term'.format(value))
+    prefix, suffix = value.split(sentinels[found[0]])
+    return found[0], prefix, suffix
+
+
+def compile_shape(build, arity, dialect):
+    '''Compile the query of build(*terms) for arity string terms into a ShapeStatement
+
+    Raises UncacheableShape if the query can't be reused for other terms.
+    '''
+    compiled_sets = []
+    for pattern in _SENTINEL_SETS:
+        sentinels = [pattern.format(index) for index in range(arity)]
+        statement, compiled = _compile(build(*sentinels), dialect)
+        parameters = {name: _parameter(value, sentinels) for name, value in compiled.params.items()}
+        compiled_sets.append((compiled.string, parameters))
+
+    sql, parameters = compiled_sets[0]
+    if compiled_sets[1] != compiled_sets[0]:
+        raise UncacheableShape('The SQL of the query depends on the terms')
+    if set(index for index, _, _ in parameters.values()) - {None} != set(range(arity)):
+        raise UncacheableShape('Not all terms end up in a parameter')
+
+    binds = [bindparam(name, type_=compiled.binds[name].type) for name in parameters]
+    columns = list(getattr(statement, 'inner_columns', []))
+    clause = text(sql).bindparams(*binds)
+    if columns:
+        clause = clause.columns(*columns)
+    return ShapeStatement(clause, parameters)
+
+
+class StatementCache(object):
+    '''A size limited, thread-safe cache of ShapeStatements by shape key
+
+    Uncacheable shapes are remembered as None, so they aren't compiled again.
+    '''
+    def __init__(self, size=512):
+        self.size = size
+        self._statements = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build, arity, dialect):
+        '''Get the ShapeStatement of a shape, compiling it on first use, or None if it can't be cached'''
+        with self._lock:
+            if key in self._statements:
+                self._statements.move_to_end(key)
+                self.hits += 1
+                return self._statements[key]
+            self.misses += 1
+
+        try:
+            shape = compile_shape(build, arity, dialect)
+        except (UncacheableShape, ArgumentError, ValueError, TypeError):
+            shape = None
+
+        with self._lock:
+            self._statements[key] = shape
+            while len(self._statements) > self.size:
+                self._statements.popitem(last=False)
+        return shape
+
+    def clear(self):
+        '''Drop all cached statements'''
+        with self._lock:
+            self._statements.clear()
+
+    def __len__(self):
+        return len(self._statements)
+
+
+STATEMENTS = StatementCache()
+_DIALECTS = {}
+
+
+def statement_dialect(session=None):
+    '''Get the dialect of a session's database, using named parameters to fit text()'''
+    dialect = (session or db.session).get_bind().dialect
+    if type(dialect) not in _DIALECTS:
+        _DIALECTS.setdefault(type(dialect), type(dialect)(paramstyle='named'))
+    return _DIALECTS[type(dialect)]
+
+
+def _cache_enabled():
+    return not has_app_context() or current_app.config.get('STATEMENT_CACHE', True)
+
+
+def split_terms(values):
+    '''Split values into the string terms to be parameters and the others that are part of the shape
+
+    >>> split_terms(['streptomyces', True, 'nrps'])
+    (('streptomyces', 'nrps'), ('?', True, '?'))
+    '''
+    terms = tuple(value for value in values if isinstance(value, str))
+    fixed = tuple(_TERM if isinstance(value, str) else value for value in values)
+    return terms, fixed
+
+
+def shape_statement(key, build, values):
+    '''Get the cached statement of the shape of build(*values) and its parameters
+
+    Returns (None, None) if the shape can't be cached or caching is disabled.
+    '''
+    if not _cache_enabled():
+        return None, None
+    terms, fixed = split_terms(values)
+
+    def build_from_terms(*sentinels):
+        sentinels = iter(sentinels)
+        return build(*[next(sentinels) if value == _TERM else value for value in fixed])
+
+    shape = STATEMENTS.get((key, fixed), build_from_terms, len(terms), statement_dialect())
+    if shape is None:
+        return None, None
+    return shape.statement, shape.params(terms)
+
+
+def cached_query(key, build, values, *entities):
+    '''Get a query for entities running the cached SQL of build(*values)
+
+    key identifies the shape together with the non-string values, build must
+    return a query for entities. If the shape can't be cached, build(*values)
+    is returned as is.
+    '''
+    statement, params = shape_statement(key, build, values)
+    if statement is None:
+        return build(*values)
+    return db.session.query(*entities).from_statement(statement).params(**params)
+
+
+def cached_rows(key, build, values):
+    '''Get the result rows of build(*values), using the cached SQL of its shape'''
+    statement, params = shape_statement(key, build, values)
+    if statement is None:
+        return build(*values).all()
+    return db.session.execute(statement, params).fetchall()
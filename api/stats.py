@@ -0,0 +1,106 @@
+'''Queries and result assembly for the stats endpoints
+
+The queries are only built here, so the WSGI views and the asyncio mode in
+api.asgi can run them with their own database driver.
+'''
+
+from sqlalchemy import (
+    desc as sql_desc,
+    distinct,
+    Float,
+    func,
+)
+from sqlalchemy.sql.expression import cast
+
+from .models import (
+    db,
+    BgcType,
+    BiosyntheticGeneCluster as Bgc,
+    DnaSequence,
+    Genome,
+    Locus,
+    Taxa,
+    t_rel_clusters_types,
+)
+
+
+def common_stats_queries():
+    '''Get the queries for the stats shared by the v1 and v2 version of the call
+
+    The first three queries return a single count, the fourth the clusters per
+    type and the last one the taxon with the most sequences.
+    '''
+    num_clusters = db.session.query(func.count(Bgc.bgc_id)).filter(Bgc.minimal.is_(False))
+    num_genomes = db.session.query(func.count(Genome.genome_id))
+    num_sequences = db.session.query(func.count(DnaSequence.sequence_id))
+
+    sub = db.session.query(t_rel_clusters_types.c.bgc_type_id, func.count().label('count')) \
+                    .join(Bgc).filter(Bgc.minimal.is_(False)) \
+                    .group_by(t_rel_clusters_types.c.bgc_type_id).subquery()
+    clusters = db.session.query(BgcType.term, BgcType.description, sub.c.count).join(sub) \
+                         .order_by(sub.c.count.desc(), BgcType.term)
+
+    top_seq_taxon = db.session.query(Taxa.tax_id, Taxa.genus, Taxa.species,
+                                     func.count(DnaSequence.acc).label('tax_count')) \
+                              .select_from(Taxa).join(Genome).join(DnaSequence) \
+                              .group_by(Taxa.tax_id).order_by(sql_desc('tax_count')).limit(1)
+
+    return num_clusters, num_genomes, num_sequences, clusters, top_seq_taxon
+
+
+def common_stats(num_clusters, num_genomes, num_sequences, cluster_rows, top_seq_taxon):
+    '''Build the shared stats from the results of the common_stats_queries'''
+    tax_id, genus, species, tax_count = top_seq_taxon
+    return {
+        'num_clusters': num_clusters,
+        'num_genomes': num_genomes,
+        'num_sequences': num_sequences,
+        'top_seq_taxon': tax_id,
+        'top_seq_taxon_count': tax_count,
+        'top_seq_species': '{} {}'.format(genus, species),
+        'clusters': [{'name': term, 'description': description, 'count': count}
+                     for term, description, count in cluster_rows],
+    }
+
+
+def top_secmet_query_v1():
+    '''Get the query for the sequence with the most clusters per sequence'''
+    return db.session.query(Taxa.tax_id, Taxa.genus, Taxa.species, Taxa.strain,
+                            DnaSequence.acc,
+                            func.count(distinct(Bgc.bgc_id)).label('bgc_count'),
+                            func.count(distinct(DnaSequence.acc)).label('seq_count'),
+                            (cast(func.count(distinct(Bgc.bgc_id)), Float) / func.count(distinct(DnaSequence.acc))).label('clusters_per_seq')) \
+                     .select_from(Taxa).join(Genome).join(DnaSequence).join(Locus).join(Bgc) \
+                     .group_by(Taxa.tax_id, DnaSequence.acc).order_by(sql_desc('clusters_per_seq')).limit(1)
+
+
+def add_top_secmet_v1(stats, row):
+    '''Add the result of the top_secmet_query_v1 to the stats'''
+    tax_id, genus, species, strain, acc, _, _, clusters_per_seq = row
+    stats['top_secmet_taxon'] = tax_id
+    stats['top_secmet_species'] = '{} {} {}'.format(genus, species, strain)
+    stats['top_secmet_acc'] = acc
+    stats['top_secmet_taxon_count'] = clusters_per_seq
+    return stats
+
+
+def top_secmet_query_v2():
+    '''Get the query for the assembly with the most non-minimal clusters'''
+    return db.session.query(Taxa.tax_id, Taxa.genus, Taxa.species, Taxa.strain,
+                            Genome.assembly_id,
+                            func.count(distinct(Bgc.bgc_id)).label('bgc_count'),
+                            func.count(distinct(Genome.assembly_id)).label('seq_count'),
+                            (cast(func.count(distinct(Bgc.bgc_id)), Float) / func.count(distinct(Genome.assembly_id))).label('clusters_per_seq')) \
+                     .select_from(Taxa).join(Genome).join(DnaSequence).join(Locus).join(Bgc) \
+                     .filter(Genome.assembly_id != None).filter(Bgc.minimal.is_(False)) \
+                     .group_by(Taxa.tax_id, Genome.assembly_id).order_by(sql_desc('clusters_per_seq')).limit(1)
+
+
+def add_top_secmet_v2(stats, row):
+    '''Add the result of the top_secmet_query_v2 to the stats'''
+    tax_id, genus, species, strain, assembly_id, bgc_count, _, _ = row
+    stats['top_secmet_taxon'] = tax_id
+    stats['top_secmet_species'] = '{} {} {}'.format(genus, species, strain)
+    stats['top_secmet_assembly_id'] = assembly_id
+    stats['top_secmet_taxon_count'] = bgc_count
+    return stats
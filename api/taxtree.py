@@ -1,194 +1,209 @@
 '''Functions related to building the taxonomic tree data'''
-from sqlalchemy import func, or_
+from sqlalchemy import func
 
+from .cache import VersionedCache
 from .models import (
     db,
-    DnaSequence,
     Genome,
     Taxa,
 )
+from .statements import cached_rows
+from .text_index import SubstringIndex
+
+
+TREE_LEVELS = ('superkingdom', 'phylum', 'class', 'order', 'family', 'genus', 'species')
+
+
+class TaxonSearchIndex(object):
+    """Substring index over genus, species and strain names with precomputed tree paths."""
+    def __init__(self, rows):
+        """Build the index from (superkingdom, phylum, class, order, family, genus, species, strain) rows."""
+        rows = list(rows)
+        self._paths = [_tree_path(row[:len(TREE_LEVELS)]) for row in rows]
+        self._indices = [SubstringIndex([row[column] for row in rows]) for column in (5, 6, 7)]
+
+    def search(self, search_term):
+        """Get the taxtree path ids of all taxa where genus, species or strain contain the search term."""
+        matches = set()
+        for index in self._indices:
+            matches.update(index.search(search_term))
+
+        levels = [set() for _ in TREE_LEVELS]
+        for idx in matches:
+            for level, node_id in zip(levels, self._paths[idx]):
+                level.add(node_id)
+
+        tax_path = []
+        for level in levels:
+            tax_path.extend(sorted(level))
+
+        return tax_path
+
+
+def _tree_path(hit):
+    """Get the tree node ids from the superkingdom down to the species of a taxon."""
+    path = []
+    for depth, level in enumerate(TREE_LEVELS, 1):
+        path.append('{}_{}'.format(level, '_'.join(hit[0:depth])).lower())
+    return tuple(path)
+
+
+def search_index_query():
+    """Get the query for the rows of a TaxonSearchIndex."""
+    return db.session.query(Taxa.superkingdom, Taxa.phylum, Taxa._class, Taxa.taxonomic_order,
+                            Taxa.family, Taxa.genus, Taxa.species, Taxa.strain)
+
+
+def _build_search_index():
+    """Load all taxa into a TaxonSearchIndex."""
+    return TaxonSearchIndex(search_index_query().all())
+
+
+_SEARCH_INDEX = VersionedCache(_build_search_index)
 
 
 def search(search_term):
     """Get a taxtree path where genus, species or strain matches the search term."""
-    kingdoms = set()
-    phyla = set()
-    classes = set()
-    orders = set()
-    families = set()
-    genera = set()
-    species = set()
-
-    filters = [
-       Taxa.genus.ilike('%{}%'.format(search_term)),
-       Taxa.species.ilike('%{}%'.format(search_term)),
-       Taxa.strain.ilike('%{}%'.format(search_term)),
-    ]
-
-    hits = db.session.query(Taxa.superkingdom, Taxa.phylum, Taxa._class, Taxa.taxonomic_order,
-                            Taxa.family, Taxa.genus, Taxa.species) \
-                     .filter(or_(*filters))
-    for hit in hits.all():
-        kingdoms.add('superkingdom_{}'.format(hit[0]).lower())
-        phyla.add('phylum_{}'.format('_'.join(hit[0:2])).lower())
-        classes.add('class_{}'.format('_'.join(hit[0:3])).lower())
-        orders.add('order_{}'.format('_'.join(hit[0:4])).lower())
-        families.add('family_{}'.format('_'.join(hit[0:5])).lower())
-        genera.add('genus_{}'.format('_'.join(hit[0:6])).lower())
-        species.add('species_{}'.format('_'.join(hit[0:7])).lower())
-
-    tax_path = sorted(list(kingdoms))
-    tax_path.extend(sorted(list(phyla)))
-    tax_path.extend(sorted(list(classes)))
-    tax_path.extend(sorted(list(orders)))
-    tax_path.extend(sorted(list(families)))
-    tax_path.extend(sorted(list(genera)))
-    tax_path.extend(sorted(list(species)))
-
-    return tax_path
+    return _SEARCH_INDEX.get().search(search_term)
 
 
-def get_superkingdom():
-    '''Get list of superkingdoms'''
+# Columns of the tree levels, in the same order as TREE_LEVELS
+TREE_COLUMNS = (Taxa.superkingdom, Taxa.phylum, Taxa._class, Taxa.taxonomic_order,
+                Taxa.family, Taxa.genus, Taxa.species)
+
+
+def level_query(level, params):
+    '''Get the query for the (name, genome count) rows of a tree level below the params path'''
+    column = TREE_COLUMNS[TREE_LEVELS.index(level)]
+    query = db.session.query(column, func.count(Genome.assembly_id)).join(Genome)
+    for parent_column, param in zip(TREE_COLUMNS, params):
+        query = query.filter(parent_column.ilike(param))
+    return query.group_by(column).order_by(column)
+
+
+def level_nodes(level, params, rows):
+    '''Turn the rows of a level_query into jsTree nodes'''
+    depth = TREE_LEVELS.index(level)
+    parent = '{}_{}'.format(TREE_LEVELS[depth - 1], '_'.join(params)) if depth else '#'
     tree = []
-    kingdoms = db.session.query(Taxa.superkingdom, func.count(Genome.assembly_id)) \
-                         .join(Genome) \
-                         .group_by(Taxa.superkingdom).order_by(Taxa.superkingdom)
-    for kingdom in kingdoms:
-        tree.append(_create_tree_node('superkingdom_{}'.format(kingdom[0].lower()),
-                                      '#', '{} ({})'.format(kingdom[0], kingdom[1])))
+    for name, count in rows:
+        id_list = params + [name.lower()]
+        tree.append(_create_tree_node('{}_{}'.format(level, '_'.join(id_list)),
+                                      parent, '{} ({})'.format(name, count)))
+    return tree
+
+
+def strains_query(params):
+    '''Get the query for the strains of a species'''
+    query = db.session.query(Taxa.tax_id, Taxa.genus, Taxa.species, Taxa.strain,
+                             Genome.assembly_id).join(Genome)
+    for column, param in zip(TREE_COLUMNS, params):
+        query = query.filter(column.ilike(param))
+    return query.order_by(Taxa.strain)
 
+
+def strain_nodes(params, rows):
+    '''Turn the rows of a strains_query into jsTree leaf nodes'''
+    tree = []
+    for _, genus, species, strain, assembly_id in rows:
+        tree.append(_create_tree_node('{}'.format(assembly_id.lower()),
+                                      'species_{}'.format('_'.join(params)),
+                                      '{} {} {} {}'.format(genus, species, strain, assembly_id),
+                                      assembly_id=assembly_id,
+                                      disabled=False, leaf=True))
     return tree
 
 
+def level_rows(level, params):
+    '''Get the rows of a level_query, reusing the compiled SQL of the level'''
+    return cached_rows(('tree_level', level), lambda *terms: level_query(level, list(terms)), params)
+
+
+def strain_rows(params):
+    '''Get the rows of a strains_query, reusing the compiled SQL'''
+    return cached_rows(('tree_strains',), lambda *terms: strains_query(list(terms)), params)
+
+
+def _tree_node(tree_id):
+    '''Get the level and path params of the children of a tree node
+
+    The level is 'strain' below species and None for unknown nodes.
+    '''
+    if tree_id == '1':
+        return 'superkingdom', []
+
+    params = tree_id.split('_')
+    taxlevel = params[0]
+    params = params[1:]
+    if taxlevel == 'species':
+        return 'strain', params
+    if taxlevel in TREE_LEVELS[:-1]:
+        return TREE_LEVELS[TREE_LEVELS.index(taxlevel) + 1], params
+
+    return None, params
+
+
+def tree_node_query(tree_id):
+    '''Get the query for the children of a tree node and a function turning its rows into nodes
+
+    Returns None for unknown nodes.
+    '''
+    level, params = _tree_node(tree_id)
+    if level is None:
+        return None
+    if level == 'strain':
+        return strains_query(params), lambda rows: strain_nodes(params, rows)
+    return level_query(level, params), lambda rows: level_nodes(level, params, rows)
+
+
+def get_tree_node(tree_id):
+    '''Get the children of a tree node'''
+    level, params = _tree_node(tree_id)
+    if level is None:
+        return []
+    if level == 'strain':
+        return get_strains(params)
+    return level_nodes(level, params, level_rows(level, params))
+
+
+def get_superkingdom():
+    '''Get list of superkingdoms'''
+    return level_nodes('superkingdom', [], level_rows('superkingdom', []))
+
+
 def get_phylum(params):
     '''Get list of phyla per kingdom'''
-    tree = []
-    phyla = db.session.query(Taxa.phylum, func.count(Genome.assembly_id)) \
-                      .join(Genome) \
-                      .filter(Taxa.superkingdom.ilike(params[0])) \
-                      .group_by(Taxa.phylum).order_by(Taxa.phylum)
-    for phylum in phyla:
-        id_list = params + [phylum[0].lower()]
-        tree.append(_create_tree_node('phylum_{}'.format('_'.join(id_list)),
-                                      'superkingdom_{}'.format('_'.join(params)),
-                                      '{} ({})'.format(phylum[0], phylum[1])))
-
-    return tree
+    return level_nodes('phylum', params, level_rows('phylum', params))
 
 
 def get_class(params):
     '''Get list of classes per kingdom/phylum'''
-    tree = []
-    classes = db.session.query(Taxa._class, func.count(Genome.assembly_id)) \
-                        .join(Genome) \
-                        .filter(Taxa.superkingdom.ilike(params[0])) \
-                        .filter(Taxa.phylum.ilike(params[1])) \
-                        .group_by(Taxa._class).order_by(Taxa._class)
-    for cls in classes:
-        id_list = params + [cls[0].lower()]
-        tree.append(_create_tree_node('class_{}'.format('_'.join(id_list)),
-                                      'phylum_{}'.format('_'.join(params)),
-                                      '{} ({})'.format(cls[0], cls[1])))
-    return tree
+    return level_nodes('class', params, level_rows('class', params))
 
 
 def get_order(params):
     '''Get list of oders per kingdom/phylum/class'''
-    tree = []
-    orders = db.session.query(Taxa.taxonomic_order, func.count(Genome.assembly_id)) \
-                       .join(Genome) \
-                       .filter(Taxa.superkingdom.ilike(params[0])) \
-                       .filter(Taxa.phylum.ilike(params[1])) \
-                       .filter(Taxa._class.ilike(params[2])) \
-                       .group_by(Taxa.taxonomic_order).order_by(Taxa.taxonomic_order)
-    for order in orders:
-        id_list = params + [order[0].lower()]
-        tree.append(_create_tree_node('order_{}'.format('_'.join(id_list)),
-                                      'class_{}'.format('_'.join(params)),
-                                      '{} ({})'.format(order[0], order[1])))
-    return tree
+    return level_nodes('order', params, level_rows('order', params))
 
 
 def get_family(params):
     '''Get list of families per kingdom/phylum/class/order'''
-    tree = []
-    families = db.session.query(Taxa.family, func.count(Genome.assembly_id)) \
-                         .join(Genome) \
-                         .filter(Taxa.superkingdom.ilike(params[0])) \
-                         .filter(Taxa.phylum.ilike(params[1])) \
-                         .filter(Taxa._class.ilike(params[2])) \
-                         .filter(Taxa.taxonomic_order.ilike(params[3])) \
-                         .group_by(Taxa.family).order_by(Taxa.family)
-    for family in families:
-        id_list = params + [family[0].lower()]
-        tree.append(_create_tree_node('family_{}'.format('_'.join(id_list)),
-                                      'order_{}'.format('_'.join(params)),
-                                      '{} ({})'.format(family[0], family[1])))
-    return tree
+    return level_nodes('family', params, level_rows('family', params))
 
 
 def get_genus(params):
     '''Get list of genera per kingdom/phylum/class/order/family'''
-    tree = []
-    genera = db.session.query(Taxa.genus, func.count(Genome.assembly_id)) \
-                       .join(Genome) \
-                       .filter(Taxa.superkingdom.ilike(params[0])) \
-                       .filter(Taxa.phylum.ilike(params[1])) \
-                       .filter(Taxa._class.ilike(params[2])) \
-                       .filter(Taxa.taxonomic_order.ilike(params[3])) \
-                       .filter(Taxa.family.ilike(params[4])) \
-                       .group_by(Taxa.genus).order_by(Taxa.genus)
-    for genus in genera:
-        id_list = params + [genus[0].lower()]
-        tree.append(_create_tree_node('genus_{}'.format('_'.join(id_list)),
-                                      'family_{}'.format('_'.join(params)),
-                                      '{} ({})'.format(genus[0], genus[1])))
-    return tree
+    return level_nodes('genus', params, level_rows('genus', params))
 
 
 def get_species(params):
     '''Get list of species per kingdom/phylum/class/order/family/genus'''
-    tree = []
-    species = db.session.query(Taxa.species, func.count(Genome.assembly_id)) \
-                        .join(Genome) \
-                        .filter(Taxa.superkingdom.ilike(params[0])) \
-                        .filter(Taxa.phylum.ilike(params[1])) \
-                        .filter(Taxa._class.ilike(params[2])) \
-                        .filter(Taxa.taxonomic_order.ilike(params[3])) \
-                        .filter(Taxa.family.ilike(params[4])) \
-                        .filter(Taxa.genus.ilike(params[5])) \
-                        .group_by(Taxa.species).order_by(Taxa.species)
-    for sp in species:
-        id_list = params + [sp[0].lower()]
-        tree.append(_create_tree_node('species_{}'.format('_'.join(id_list)),
-                                      'genus_{}'.format('_'.join(params)),
-                                      '{} ({})'.format(sp[0], sp[1])))
-
-    return tree
+    return level_nodes('species', params, level_rows('species', params))
 
 
 def get_strains(params):
     '''Get list of strains per kingdom/phylum/class/order/family/genus/species'''
-    tree = []
-    strains = db.session.query(Taxa.tax_id, Taxa.genus, Taxa.species, Taxa.strain,
-                               Genome.assembly_id) \
-                        .join(Genome) \
-                        .filter(Taxa.superkingdom.ilike(params[0])) \
-                        .filter(Taxa.phylum.ilike(params[1])) \
-                        .filter(Taxa._class.ilike(params[2])) \
-                        .filter(Taxa.taxonomic_order.ilike(params[3])) \
-                        .filter(Taxa.family.ilike(params[4])) \
-                        .filter(Taxa.genus.ilike(params[5])) \
-                        .filter(Taxa.species.ilike(params[6])) \
-                        .order_by(Taxa.strain)
-    for strain in strains:
-        tree.append(_create_tree_node('{}'.format(strain.assembly_id.lower()),
-                                      'species_{}'.format('_'.join(params)),
-                                      '{s.genus} {s.species} {s.strain} {s.assembly_id}'.format(s=strain),
-                                      assembly_id=strain.assembly_id,
-                                      disabled=False, leaf=True))
-    return tree
+    return strain_nodes(params, strain_rows(params))
 
 
 def _create_tree_node(node_id, parent, text, assembly_id=None, disabled=True, leaf=False):
@@ -0,0 +1,174 @@
+'''In-memory text indices used to avoid ILIKE scans on the database'''
+
+from array import array
+
+
+class SubstringIndex(object):
+    '''N-gram postings over case-folded strings, answering substring queries
+
+    Every string is indexed by all of its 1- to NGRAM-grams. A query term of at
+    most NGRAM characters is answered straight from its postings list, longer
+    terms walk the shortest postings list of their n-grams and verify each
+    candidate. Results are always in index order.
+
+    >>> index = SubstringIndex(['Streptomyces', 'Salinispora', None])
+    >>> index.search('MYCES')
+    [0]
+    >>> index.search('s')
+    [0, 1]
+    >>> index.search('s', limit=1)
+    [0]
+    >>> index.search('spor')
+    [1]
+    >>> index.search('')
+    [0, 1]
+    '''
+    NGRAM = 3
+
+    def __init__(self, strings):
+        self._strings = []
+        self._postings = {}
+        for idx, string in enumerate(strings):
+            folded = string.casefold() if string else ''
+            self._strings.append(folded)
+            for gram in self._grams(folded):
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = array('I')
+                postings.append(idx)
+
+    def __len__(self):
+        return len(self._strings)
+
+    @classmethod
+    def _grams(cls, string):
+        '''All distinct 1- to NGRAM-grams of a string'''
+        grams = set()
+        for size in range(1, cls.NGRAM + 1):
+            for start in range(len(string) - size + 1):
+                grams.add(string[start:start + size])
+        return grams
+
+    def search(self, term, limit=None):
+        '''Get the sorted indices of strings containing term, ignoring case'''
+        folded = term.casefold()
+        if not folded:
+            matches = [idx for idx, string in enumerate(self._strings) if string]
+            return matches[:limit]
+
+        if len(folded) <= self.NGRAM:
+            return list(self._postings.get(folded, array('I'))[:limit])
+
+        shortest = None
+        for start in range(len(folded) - self.NGRAM + 1):
+            postings = self._postings.get(folded[start:start + self.NGRAM])
+            if postings is None:
+                return []
+            if shortest is None or len(postings) < len(shortest):
+                shortest = postings
+
+        matches = []
+        for idx in shortest:
+            if folded in self._strings[idx]:
+                matches.append(idx)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+
+def edit_distance(first, second):
+    '''Get the optimal string alignment distance between two strings
+
+    Like the Levenshtein distance, but swapping two neighbouring characters
+    also only counts as a single edit.
+
+    >>> edit_distance('streptomyces', 'streptomyces')
+    0
+    >>> edit_distance('streptomyces', 'strpetomyces')
+    1
+    >>> edit_distance('streptomyces', 'steptomyce')
+    2
+    '''
+    previous = None
+    current = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(second)
+        for j in range(1, len(second) + 1):
+            cost = 0 if first[i - 1] == second[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+    return current[-1]
+
+
+class FuzzyIndex(object):
+    '''Symmetric delete index finding case-folded strings within a small edit distance
+
+    Every string is stored under all variants with up to max_distance characters
+    deleted. Looking up the deletion variants of a query term gives all strings
+    that might be close enough, which are then checked with edit_distance.
+
+    >>> index = FuzzyIndex(['Streptomyces', 'Salinispora', 'Streptococcus'])
+    >>> index.search('strpetomyces')
+    [(0, 1)]
+    >>> index.search('Salinspra')
+    [(1, 2)]
+    >>> index.search('Salinspra', max_distance=1)
+    []
+    '''
+    # Longer strings are not indexed, their number of deletion variants grows
+    # quadratically and every worker keeps its own index
+    MAX_LENGTH = 24
+
+    def __init__(self, strings, max_distance=2):
+        self.max_distance = max_distance
+        self._strings = []
+        self._variants = {}
+        for idx, string in enumerate(strings):
+            folded = string.casefold() if string else ''
+            self._strings.append(folded)
+            if not folded or len(folded) > self.MAX_LENGTH:
+                continue
+            for variant in self._deletions(folded, max_distance):
+                postings = self._variants.get(variant)
+                if postings is None:
+                    postings = self._variants[variant] = array('I')
+                postings.append(idx)
+
+    def __len__(self):
+        return len(self._strings)
+
+    @staticmethod
+    def _deletions(string, distance):
+        '''All variants of string with up to distance characters deleted'''
+        variants = set([string])
+        latest = variants
+        for _ in range(distance):
+            deleted = set()
+            for variant in latest:
+                for pos in range(len(variant)):
+                    deleted.add(variant[:pos] + variant[pos + 1:])
+            deleted.difference_update(variants)
+            variants.update(deleted)
+            latest = deleted
+        return variants
+
+    def search(self, term, max_distance=None, limit=None):
+        '''Get (index, distance) pairs of strings close to term, closest first'''
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        folded = term.casefold()
+        if not folded or len(folded) > self.MAX_LENGTH + max_distance:
+            return []
+
+        candidates = set()
+        for variant in self._deletions(folded, max_distance):
+            candidates.update(self._variants.get(variant, ()))
+
+        matches = []
+        for idx in candidates:
+            distance = edit_distance(folded, self._strings[idx])
+            if distance <= max_distance:
+                matches.append((idx, distance))
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches[:limit]
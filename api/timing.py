@@ -0,0 +1,68 @@
+'''Per-phase request timing
+
+Views wrap the expensive parts of a request in phase() blocks. The recorded
+durations are sent back in a Server-Timing header and observed in a histogram
+labelled with the endpoint, phase and, for searches, the search and return type.
+'''
+
+from contextlib import contextmanager
+import time
+
+from flask import g, has_request_context, request
+
+from .metrics import Histogram
+
+PHASE_SECONDS = Histogram('asdb_request_phase_seconds', 'Time spent in each phase of a request',
+                          ['endpoint', 'phase', 'search_type', 'return_type'])
+
+
+@contextmanager
+def phase(name):
+    '''Time the enclosed block as a phase of the current request'''
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if has_request_context():
+            g.setdefault('phases', []).append((name, time.perf_counter() - start))
+
+
+def label_query(query):
+    '''Label the current request with its search.Query, for the phase metrics and request capture'''
+    g.query = query
+    g.search_type = query.search_type
+    g.return_type = query.return_type
+
+
+def server_timing(phases):
+    '''Format (name, seconds) pairs as a Server-Timing header value
+
+    >>> server_timing([('parse', 0.0012), ('search', 0.25)])
+    'parse;dur=1.2, search;dur=250.0'
+    '''
+    return ', '.join('{};dur={}'.format(name, round(seconds * 1000, 1)) for name, seconds in phases)
+
+
+def init_timing(app):
+    '''Report the phases of every request'''
+    @app.before_request
+    def start_phases():
+        g.phase_start = time.perf_counter()
+
+    @app.after_request
+    def report_phases(response):
+        phases = list(g.get('phases', []))
+        if 'phase_start' in g:
+            phases.append(('total', time.perf_counter() - g.phase_start))
+
+        labels = {
+            'endpoint': request.endpoint or '',
+            'search_type': g.get('search_type', ''),
+            'return_type': g.get('return_type', ''),
+        }
+        for name, seconds in phases:
+            PHASE_SECONDS.observe(seconds, phase=name, **labels)
+
+        if phases:
+            response.headers['Server-Timing'] = server_timing(phases)
+        return response
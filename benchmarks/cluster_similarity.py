@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+'''Measure the cluster similarity search on a synthetic feature matrix
+
+Builds an api.similarity.FeatureMatrix for a number of random clusters, with
+feature frequencies following a power law like real domain counts do, and
+times the exact top-k search against the MinHash/LSH prefilter. The recall of
+the prefilter is the share of exact top hits with a Jaccard similarity of at
+least --threshold that it finds as well. No database needed.
+
+Usage: python benchmarks/cluster_similarity.py [--clusters N] [--queries N]
+'''
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def synthetic_pairs(np, clusters, features, per_cluster, seed):
+    '''Get (bgc_id, feature) pairs, with clusters of near duplicates like in real data'''
+    rng = np.random.RandomState(seed)
+    weights = 1.0 / np.arange(1, features + 1)
+    weights /= weights.sum()
+    families = max(clusters // 20, 1)
+    templates = [rng.choice(features, size=per_cluster, replace=False, p=weights) for _ in range(families)]
+    for bgc_id in range(1, clusters + 1):
+        template = templates[rng.randint(families)]
+        keep = template[rng.rand(len(template)) > 0.15]
+        extra = rng.choice(features, size=per_cluster // 5, p=weights)
+        for feature in np.concatenate((keep, extra)):
+            yield bgc_id, 'pfam:PF{:05}'.format(feature)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clusters', type=int, default=200000, help='Number of clusters')
+    parser.add_argument('--features', type=int, default=20000, help='Number of distinct features')
+    parser.add_argument('--per-cluster', type=int, default=40, help='Features of a cluster family')
+    parser.add_argument('--queries', type=int, default=50, help='Number of queries')
+    parser.add_argument('--limit', type=int, default=10, help='Hits per query')
+    parser.add_argument('--threshold', type=float, default=0.5, help='Jaccard threshold for the recall')
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    import numpy as np
+    from api.similarity import FeatureMatrix
+
+    pairs = list(synthetic_pairs(np, args.clusters, args.features, args.per_cluster, 0))
+    start = time.perf_counter()
+    matrix = FeatureMatrix.from_pairs(range(1, args.clusters + 1), pairs)
+    build_s = time.perf_counter() - start
+
+    rows = np.random.RandomState(1).randint(len(matrix), size=args.queries)
+    timings = {'exact': [], 'prefilter': []}
+    expected = found = 0
+    for row in rows:
+        query = matrix.cluster_features(row)
+        results = {}
+        for strategy in timings:
+            start = time.perf_counter()
+            results[strategy] = matrix.similar(query, limit=args.limit, prefilter=strategy == 'prefilter',
+                                               exclude_row=row)
+            timings[strategy].append((time.perf_counter() - start) * 1000)
+        relevant = set(bgc_id for bgc_id, score, _ in results['exact'] if score >= args.threshold)
+        expected += len(relevant)
+        found += len(relevant & set(bgc_id for bgc_id, _, _ in results['prefilter']))
+
+    report = {
+        'clusters': len(matrix),
+        'entries': int(matrix.sizes.sum()),
+        'build_s': round(build_s, 2),
+        'recall': round(found / expected, 3) if expected else None,
+    }
+    for strategy, values in timings.items():
+        report['{}_median_ms'.format(strategy)] = round(float(np.median(values)), 2)
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,596 @@
+#!/usr/bin/env python
+'''Fill an empty database with a synthetic antiSMASH data set
+
+Creates the antismash schema from api/models.py and loads a configurable number
+of BGCs with the shape of the real data: a taxonomy where a few genera like
+Streptomyces hold most genomes and BGCs, a skewed mix of BGC types with hybrids,
+ClusterBLAST/KnownClusterBLAST/SubClusterBLAST hits, and CDS, domain, profile,
+smCOG, compound and terpene annotations per BGC. Output is deterministic for a
+given --seed, so runs of run_benchmarks.py on databases of the same scale are
+comparable.
+
+Rows are loaded with COPY in batches, so memory use stays flat up to 1M BGCs.
+The DNA of 1M BGCs is tens of GB on disk though, pass --no-dna to skip it if
+FASTA exports are not benchmarked.
+
+The cds_cluster_map, sequence_lengths and sequence_gc_content views of the real
+schema are created as plain tables and filled here.
+
+Usage: python benchmarks/generate_db.py --db-uri postgres://... [--bgcs N] [--seed N] [--drop] [--no-dna]
+'''
+
+import argparse
+import io
+import itertools
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (superkingdom, phylum, class, order, family, genus, mean BGCs per genome, GC content)
+# in order of decreasing number of genomes
+KNOWN_GENERA = [
+    ('Bacteria', 'Actinobacteria', 'Actinomycetia', 'Streptomycetales', 'Streptomycetaceae', 'Streptomyces', 30, 0.72),
+    ('Bacteria', 'Proteobacteria', 'Gammaproteobacteria', 'Pseudomonadales', 'Pseudomonadaceae', 'Pseudomonas', 12, 0.62),
+    ('Bacteria', 'Firmicutes', 'Bacilli', 'Bacillales', 'Bacillaceae', 'Bacillus', 9, 0.43),
+    ('Bacteria', 'Proteobacteria', 'Gammaproteobacteria', 'Enterobacterales', 'Enterobacteriaceae', 'Escherichia', 4, 0.51),
+    ('Bacteria', 'Actinobacteria', 'Actinomycetia', 'Mycobacteriales', 'Mycobacteriaceae', 'Mycobacterium', 14, 0.66),
+    ('Bacteria', 'Proteobacteria', 'Betaproteobacteria', 'Burkholderiales', 'Burkholderiaceae', 'Burkholderia', 16, 0.67),
+    ('Bacteria', 'Firmicutes', 'Clostridia', 'Eubacteriales', 'Clostridiaceae', 'Clostridium', 6, 0.29),
+    ('Bacteria', 'Actinobacteria', 'Actinomycetia', 'Micromonosporales', 'Micromonosporaceae', 'Micromonospora', 22, 0.72),
+    ('Bacteria', 'Cyanobacteria', 'Cyanophyceae', 'Nostocales', 'Nostocaceae', 'Nostoc', 15, 0.41),
+    ('Bacteria', 'Bacteroidetes', 'Flavobacteriia', 'Flavobacteriales', 'Flavobacteriaceae', 'Flavobacterium', 5, 0.34),
+    ('Bacteria', 'Proteobacteria', 'Deltaproteobacteria', 'Myxococcales', 'Myxococcaceae', 'Myxococcus', 24, 0.69),
+    ('Bacteria', 'Actinobacteria', 'Actinomycetia', 'Pseudonocardiales', 'Pseudonocardiaceae', 'Amycolatopsis', 26, 0.71),
+    ('Bacteria', 'Proteobacteria', 'Alphaproteobacteria', 'Hyphomicrobiales', 'Rhizobiaceae', 'Rhizobium', 7, 0.61),
+    ('Bacteria', 'Firmicutes', 'Bacilli', 'Lactobacillales', 'Streptococcaceae', 'Streptococcus', 3, 0.39),
+    ('Archaea', 'Euryarchaeota', 'Methanomicrobia', 'Methanosarcinales', 'Methanosarcinaceae', 'Methanosarcina', 3, 0.42),
+]
+
+# Synthetic genera of the long tail are placed in the families of the known ones
+LONG_TAIL_BGCS_PER_GENOME = 6
+
+EPITHETS = ['coelicolor', 'griseus', 'albus', 'fluorescens', 'subtilis', 'coli', 'tuberculosis', 'cepacia',
+            'aurantiaca', 'punctiforme', 'xanthus', 'orientalis', 'leguminosarum', 'pyogenes', 'mazei',
+            'venezuelae', 'avermitilis', 'clavuligerus', 'putida', 'amyloliquefaciens', 'cereus', 'botulinum']
+
+# (term, description, parent term, relative frequency, (min, max) length in kb)
+BGC_TYPES = [
+    ('pks', 'Polyketide', None, 0, None),
+    ('ripp', 'Ribosomally synthesised and post-translationally modified peptide', None, 0, None),
+    ('nrps', 'Non-ribosomal peptide synthetase', None, 14, (40, 110)),
+    ('nrps-like', 'NRPS-like fragment', None, 10, (15, 45)),
+    ('t1pks', 'Type I polyketide synthase', 'pks', 9, (40, 120)),
+    ('t2pks', 'Type II polyketide synthase', 'pks', 2, (30, 60)),
+    ('t3pks', 'Type III polyketide synthase', 'pks', 5, (20, 45)),
+    ('transatpks', 'Trans-AT polyketide synthase', 'pks', 1, (60, 130)),
+    ('terpene', 'Terpene', None, 15, (15, 30)),
+    ('bacteriocin', 'Bacteriocin or other unspecified ribosomally synthesised and post-translationally modified peptide product', 'ripp', 11, (8, 20)),
+    ('lanthipeptide', 'Lanthipeptide', 'ripp', 6, (15, 30)),
+    ('lassopeptide', 'Lasso peptide', 'ripp', 2, (15, 25)),
+    ('thiopeptide', 'Thiopeptide', 'ripp', 1, (20, 35)),
+    ('siderophore', 'Siderophore', None, 7, (10, 25)),
+    ('arylpolyene', 'Aryl polyene', None, 4, (35, 50)),
+    ('betalactone', 'Beta-lactone containing protease inhibitor', None, 4, (20, 35)),
+    ('ectoine', 'Ectoine', None, 2, (8, 15)),
+    ('butyrolactone', 'Butyrolactone', None, 2, (8, 15)),
+    ('hserlactone', 'Homoserine lactone', None, 3, (8, 15)),
+    ('nucleoside', 'Nucleoside', None, 1, (15, 30)),
+    ('phosphonate', 'Phosphonate', None, 1, (15, 30)),
+    ('other', 'Cluster containing a secondary metabolite-related protein that does not fit into any other category', None, 3, (20, 45)),
+]
+
+HYBRID_RATES = ((3, 0.03), (2, 0.15))
+
+# Domains of the core genes of NRPS and PKS BGCs, by module type
+MODULE_DOMAINS = {
+    'nrps': ['Condensation_LCL', 'AMP-binding', 'PCP'],
+    'pks': ['PKS_KS', 'PKS_AT', 'PKS_KR', 'ACP'],
+}
+EXTRA_DOMAINS = {
+    'nrps': ['Epimerization', 'nMT', 'Thioesterase'],
+    'pks': ['PKS_DH', 'PKS_ER', 'Thioesterase', 'cMT'],
+}
+DOMAIN_NAMES = sorted(set(name for names in list(MODULE_DOMAINS.values()) + list(EXTRA_DOMAINS.values())
+                          for name in names))
+
+# Profiles hit by the core genes of each type
+TYPE_PROFILES = {
+    'nrps': ['Condensation', 'AMP-binding'],
+    'nrps-like': ['AMP-binding'],
+    't1pks': ['PKS_KS', 'PKS_AT'],
+    't2pks': ['t2ks', 't2clf'],
+    't3pks': ['Chal_sti_synt_N', 'Chal_sti_synt_C'],
+    'transatpks': ['PKS_KS', 'ATd'],
+    'terpene': ['Terpene_synth', 'Terpene_synth_C', 'phytoene_synt'],
+    'bacteriocin': ['DUF692', 'TIGR03651'],
+    'lanthipeptide': ['LANC_like', 'Lant_dehyd_N', 'Lant_dehyd_C'],
+    'lassopeptide': ['PF13471', 'Asn_synthase'],
+    'thiopeptide': ['TIGR03603', 'thiostrepton'],
+    'siderophore': ['IucA_IucC'],
+    'arylpolyene': ['APE_KS1'],
+    'betalactone': ['AMP-binding', 'HMGL-like'],
+    'ectoine': ['ectoine_synt'],
+    'butyrolactone': ['AfsA'],
+    'hserlactone': ['Autoind_synth'],
+    'nucleoside': ['LmbU'],
+    'phosphonate': ['phosphonates'],
+    'other': ['cyanobactin_synth'],
+}
+PROFILE_NAMES = sorted(set(name for names in TYPE_PROFILES.values() for name in names))
+
+MONOMERS = [
+    ('ala', 'Ala', 'A'), ('arg', 'Arg', 'R'), ('asn', 'Asn', 'N'), ('asp', 'Asp', 'D'), ('cys', 'Cys', 'C'),
+    ('gln', 'Gln', 'Q'), ('glu', 'Glu', 'E'), ('gly', 'Gly', 'G'), ('his', 'His', 'H'), ('ile', 'Ile', 'I'),
+    ('leu', 'Leu', 'L'), ('lys', 'Lys', 'K'), ('met', 'Met', 'M'), ('phe', 'Phe', 'F'), ('pro', 'Pro', 'P'),
+    ('ser', 'Ser', 'S'), ('thr', 'Thr', 'T'), ('trp', 'Trp', 'W'), ('tyr', 'Tyr', 'Y'), ('val', 'Val', 'V'),
+    ('orn', 'Orn', None), ('dhb', 'Dhb', None), ('bht', 'Bht', None), ('hpg', 'Hpg', None),
+    ('mal', None, None), ('mmal', None, None), ('emal', None, None),
+]
+PKS_MONOMERS = ['mal', 'mmal', 'emal']
+
+TERPENES = [('geosmin', 'Geosmin synthase', 1, 10), ('germacradienol', 'Germacradienol synthase', 1, 10),
+            ('hopene', 'Squalene-hopene cyclase', 1, 22), ('carotenoid', 'Phytoene synthase', 1, 40),
+            ('epi-isozizaene', 'Epi-isozizaene synthase', 1, 6)]
+
+SMCOG_FUNCTIONS = ['ABC_transporter_ATP-binding_protein', 'MbtH-like_protein', 'AMP-dependent_synthetase_and_ligase',
+                   'major_facilitator_transporter', 'short-chain_dehydrogenase/reductase_SDR', 'GntR_family_transcriptional_regulator',
+                   'cytochrome_P450', 'methyltransferase', 'thioesterase', 'aminotransferase_class_I_and_II',
+                   'LuxR_family_transcriptional_regulator', 'glycosyltransferase', 'acyl-CoA_dehydrogenase',
+                   '4\'-phosphopantetheinyl_transferase', 'TetR_family_transcriptional_regulator']
+NUM_SMCOGS = 300
+NUM_MIBIG = 2000
+CLUSTERBLAST_ALGORITHMS = ['clusterblast', 'knownclusterblast', 'subclusterblast']
+
+DNA_BLOCK_SIZE = 1 << 20
+AMINO_ACIDS = 'ACDEFGHIKLMNPQRSTVWY'
+
+# Flush a table's buffered rows with COPY once this many rows are waiting
+FLUSH_ROWS = 50000
+
+
+def zipf_weights(count, exponent=1.1):
+    '''Relative weights of the ranks 1..count of a Zipf distribution
+
+    >>> [round(w, 3) for w in zipf_weights(3, exponent=1)]
+    [1.0, 0.5, 0.333]
+    '''
+    return [1.0 / (rank ** exponent) for rank in range(1, count + 1)]
+
+
+def copy_value(value):
+    '''Format a value for COPY's text format
+
+    >>> copy_value(None), copy_value(True), copy_value(3), copy_value('a\\tb')
+    ('\\\\N', 't', '3', 'a\\\\tb')
+    '''
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    value = str(value)
+    if any(char in value for char in '\\\t\n\r'):
+        value = value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+    return value
+
+
+class CopyWriter(object):
+    '''Buffer rows per table and load them with COPY'''
+    def __init__(self, connection):
+        self.connection = connection
+        self.columns = {}
+        self.buffers = {}
+        self.counts = {}
+
+    def add(self, table, row):
+        '''Queue a row, a dict of column name to value'''
+        if table not in self.columns:
+            self.columns[table] = list(row)
+            self.buffers[table] = []
+            self.counts[table] = 0
+        buffer = self.buffers[table]
+        buffer.append('\t'.join(copy_value(row[column]) for column in self.columns[table]))
+        if len(buffer) >= FLUSH_ROWS:
+            self.flush()
+
+    def flush(self):
+        '''COPY the queued rows of all tables
+
+        Tables are loaded in the order of their first row, so referenced rows
+        are always loaded before the rows referencing them.
+        '''
+        cursor = self.connection.cursor()
+        for name in self.buffers:
+            rows = self.buffers[name]
+            if not rows:
+                continue
+            data = io.StringIO('\n'.join(rows) + '\n')
+            columns = ', '.join('"{}"'.format(column) for column in self.columns[name])
+            cursor.copy_expert('COPY antismash.{} ({}) FROM STDIN'.format(name, columns), data)
+            self.counts[name] += len(rows)
+            self.buffers[name] = []
+        cursor.close()
+
+
+class Generator(object):
+    '''Generate the rows of a synthetic data set of a given number of BGCs'''
+    def __init__(self, writer, num_bgcs, seed=0, with_dna=True):
+        self.writer = writer
+        self.num_bgcs = num_bgcs
+        self.rng = random.Random(seed)
+        self.with_dna = with_dna
+        self.ids = {}
+        self.type_ids = {}
+        self.profile_ids = {}
+        self.monomer_ids = {}
+        self.terpene_ids = {}
+        self.algorithm_ids = {}
+        self.dna_blocks = {}
+        self.protein_block = ''.join(self.rng.choices(AMINO_ACIDS, k=DNA_BLOCK_SIZE // 4))
+
+        self.genera = self._genera()
+        # Cumulative weights, so picking from the long lists stays cheap
+        self.genus_weights = list(itertools.accumulate(zipf_weights(len(self.genera))))
+        self.type_weights = list(itertools.accumulate(frequency for _, _, _, frequency, _ in BGC_TYPES))
+        self.species_weights = list(itertools.accumulate(zipf_weights(len(EPITHETS) * 2)))
+        self.smcog_weights = list(itertools.accumulate(zipf_weights(NUM_SMCOGS, exponent=0.8)))
+        self.mibig_weights = list(itertools.accumulate(zipf_weights(NUM_MIBIG, exponent=0.7)))
+
+    def next_id(self, name):
+        '''Get the next id of a table'''
+        self.ids[name] = self.ids.get(name, 0) + 1
+        return self.ids[name]
+
+    def _genera(self):
+        '''Known genera followed by synthetic ones, about 2*sqrt(BGCs) genera in total'''
+        genera = list(KNOWN_GENERA)
+        num_long_tail = max(0, int(2 * self.num_bgcs ** 0.5) - len(genera))
+        for i in range(num_long_tail):
+            parent = KNOWN_GENERA[i % len(KNOWN_GENERA)]
+            genera.append(parent[:5] + ('Synthetica{}'.format(i + 1), LONG_TAIL_BGCS_PER_GENOME, parent[7]))
+        return genera
+
+    def dna(self, gc_content, length):
+        '''Get a random-looking DNA sequence with roughly the given GC content'''
+        key = round(gc_content, 2)
+        if key not in self.dna_blocks:
+            rng = random.Random(key)
+            weights = [gc_content / 2] * 2 + [(1 - gc_content) / 2] * 2
+            self.dna_blocks[key] = ''.join(rng.choices('GCAT', weights=weights, k=DNA_BLOCK_SIZE))
+        block = self.dna_blocks[key]
+        offset = self.rng.randrange(DNA_BLOCK_SIZE)
+        repeats = (offset + length) // DNA_BLOCK_SIZE + 1
+        return (block * repeats)[offset:offset + length] if repeats > 1 else block[offset:offset + length]
+
+    def protein(self, length):
+        '''Get a random-looking protein sequence'''
+        offset = self.rng.randrange(len(self.protein_block) - length)
+        return 'M' + self.protein_block[offset:offset + length - 1]
+
+    def generate(self):
+        '''Generate the full data set'''
+        self.static_tables()
+        bgcs = 0
+        while bgcs < self.num_bgcs:
+            bgcs += self.genome(self.num_bgcs - bgcs)
+        self.writer.flush()
+
+    def static_tables(self):
+        '''Types, profiles, monomers and the other lookup tables'''
+        for term, description, parent, _, _ in BGC_TYPES:
+            self.type_ids[term] = self.next_id('bgc_types')
+            self.writer.add('bgc_types', {'bgc_type_id': self.type_ids[term], 'term': term, 'description': description,
+                                          'parent_id': self.type_ids[parent] if parent else None})
+        for name in DOMAIN_NAMES:
+            self.profile_ids[name] = self.next_id('as_domain_profiles')
+            self.writer.add('as_domain_profiles', {'as_domain_profile_id': self.profile_ids[name], 'name': name,
+                                                   'description': '{} domain'.format(name), 'database': 'nrpspksdomains'})
+        for name in PROFILE_NAMES:
+            self.writer.add('profiles', {'name': name, 'description': '{} profile'.format(name), 'cutoff': 20,
+                                         'filename': '{}.hmm'.format(name)})
+        for name, three_letter, one_letter in MONOMERS:
+            self.monomer_ids[name] = self.next_id('monomers')
+            self.writer.add('monomers', {'monomer_id': self.monomer_ids[name], 'name': name, 'description': name,
+                                         'three_letter_code': three_letter, 'single_letter_code': one_letter})
+        for name, description, _, _ in TERPENES:
+            self.terpene_ids[name] = self.next_id('terpenes')
+            self.writer.add('terpenes', {'terpene_id': self.terpene_ids[name], 'name': name, 'description': description})
+        for number in range(NUM_SMCOGS):
+            self.writer.add('smcogs', {'smcog_id': self.next_id('smcogs'), 'description': None,
+                                       'name': 'SMCOG{}:{}'.format(1000 + number, SMCOG_FUNCTIONS[number % len(SMCOG_FUNCTIONS)])})
+        for name in CLUSTERBLAST_ALGORITHMS:
+            self.algorithm_ids[name] = self.next_id('clusterblast_algorithms')
+            self.writer.add('clusterblast_algorithms', {'algorithm_id': self.algorithm_ids[name], 'name': name})
+
+    def genome(self, bgcs_left):
+        '''Generate a genome with its taxon, sequences and BGCs, return the number of BGCs'''
+        rng = self.rng
+        superkingdom, phylum, tax_class, order, family, genus, mean_bgcs, gc_content = \
+            rng.choices(self.genera, cum_weights=self.genus_weights)[0]
+        num_bgcs = min(bgcs_left, max(1, int(rng.gammavariate(4, mean_bgcs / 4))))
+
+        genome_id = self.next_id('genomes')
+        tax_id = self.next_id('taxa')
+        species_rank = rng.choices(range(len(EPITHETS) * 2), cum_weights=self.species_weights)[0]
+        species = EPITHETS[species_rank] if species_rank < len(EPITHETS) else 'sp{}'.format(species_rank)
+        assembly_id = 'GCF_{:09d}.1'.format(genome_id)
+        self.writer.add('taxa', {'tax_id': tax_id, 'superkingdom': superkingdom, 'phylum': phylum, 'class': tax_class,
+                                 'taxonomic_order': order, 'family': family, 'genus': genus, 'species': species,
+                                 'strain': 'SYN-{}'.format(genome_id)})
+        self.writer.add('genomes', {'genome_id': genome_id, 'tax_id': tax_id, 'assembly_id': assembly_id})
+        self.writer.add('filenames', {'assembly_id': assembly_id, 'base_filename': 'GCF_{:09d}'.format(genome_id)})
+
+        # Complete genomes have all BGCs on one record, drafts spread them over contigs
+        if rng.random() < 0.3:
+            num_sequences = 1
+        else:
+            num_sequences = min(num_bgcs, rng.randint(1, 8))
+        per_sequence = [[] for _ in range(num_sequences)]
+        for _ in range(num_bgcs):
+            per_sequence[rng.randrange(num_sequences)].append(self.pick_types())
+
+        for bgc_types in per_sequence:
+            self.sequence(genome_id, gc_content, bgc_types, draft=num_sequences > 1)
+        return num_bgcs
+
+    def pick_types(self):
+        '''Pick the types of a BGC, some are hybrids'''
+        roll = self.rng.random()
+        count = 1
+        for hybrid_count, rate in HYBRID_RATES:
+            if roll < rate:
+                count = hybrid_count
+                break
+        types = []
+        while len(types) < count:
+            bgc_type = self.rng.choices(BGC_TYPES, cum_weights=self.type_weights)[0]
+            if bgc_type not in types:
+                types.append(bgc_type)
+        return types
+
+    def sequence(self, genome_id, gc_content, bgc_types, draft):
+        '''Generate a DNA sequence record and its BGCs'''
+        rng = self.rng
+        sequence_id = self.next_id('dna_sequences')
+        layout = []
+        position = rng.randint(1000, 200000)
+        for types in bgc_types:
+            kb_min = max(length[0] for _, _, _, _, length in types)
+            kb_max = max(length[1] for _, _, _, _, length in types) + 20 * (len(types) - 1)
+            length = rng.randint(kb_min, kb_max) * 1000
+            layout.append((types, position, position + length, draft and rng.random() < 0.25))
+            position += length + rng.randint(5000, 300000)
+
+        self.writer.add('dna_sequences', {
+            'sequence_id': sequence_id,
+            'dna': self.dna(gc_content, position) if self.with_dna else None,
+            'acc': 'NZ_SYN{:08d}'.format(sequence_id),
+            'version': 1,
+            'genome_id': genome_id,
+        })
+        self.writer.add('sequence_lengths', {'sequence_id': sequence_id, 'seq_length': position})
+        self.writer.add('sequence_gc_content', {'sequence_id': sequence_id, 'gc_content': round(gc_content, 2)})
+
+        for cluster_number, (types, start, end, contig_edge) in enumerate(layout, 1):
+            self.bgc(sequence_id, cluster_number, types, start, end, contig_edge)
+
+    def locus(self, sequence_id, start, end, strand='+'):
+        '''Add a locus, return its id'''
+        locus_id = self.next_id('loci')
+        self.writer.add('loci', {'locus_id': locus_id, 'start_pos': start, 'end_pos': end, 'strand': strand,
+                                 'sequence_id': sequence_id})
+        return locus_id
+
+    def bgc(self, sequence_id, cluster_number, types, start, end, contig_edge):
+        '''Generate a BGC with its genes and annotations'''
+        rng = self.rng
+        bgc_id = self.next_id('biosynthetic_gene_clusters')
+        self.writer.add('biosynthetic_gene_clusters', {
+            'bgc_id': bgc_id,
+            'cluster_number': cluster_number,
+            'locus_id': self.locus(sequence_id, start, end),
+            'contig_edge': contig_edge,
+            'minimal': False,
+        })
+        for term, _, _, _, _ in types:
+            self.writer.add('rel_clusters_types', {'bgc_id': bgc_id, 'bgc_type_id': self.type_ids[term]})
+
+        # Genes are about 1kb with short gaps, the ones in the middle are the core genes
+        cds_ids = []
+        position = start
+        while True:
+            gene_length = rng.randint(100, 700) * 3
+            if position + gene_length > end:
+                break
+            strand = rng.choice('+-')
+            cds_id = self.next_id('cdss')
+            self.writer.add('cdss', {
+                'cds_id': cds_id,
+                'locus_tag': 'SYN{}_{:05d}'.format(sequence_id, len(cds_ids) + 1),
+                'translation': self.protein(gene_length // 3 - 1),
+                'locus_id': self.locus(sequence_id, position, position + gene_length, strand),
+            })
+            self.writer.add('cds_cluster_map', {'sequence_id': sequence_id, 'bgc_id': bgc_id, 'cds_id': cds_id})
+            if rng.random() < 0.4:
+                self.writer.add('smcog_hits', {
+                    'smcog_id': rng.choices(range(1, NUM_SMCOGS + 1), cum_weights=self.smcog_weights)[0],
+                    'cds_id': cds_id, 'score': round(rng.uniform(50, 500), 1),
+                    'evalue': 10 ** -rng.randint(10, 150)})
+            cds_ids.append((cds_id, position, gene_length))
+            position += gene_length + rng.randint(0, 300)
+
+        middle = len(cds_ids) // 2
+        for term, _, _, _, _ in types:
+            num_core = rng.randint(2, 6) if term in ('nrps', 't1pks', 'transatpks') else rng.randint(1, 2)
+            core = cds_ids[max(0, middle - num_core // 2):middle + (num_core + 1) // 2]
+            for cds_id, gene_start, gene_length in core:
+                self.core_gene(sequence_id, term, cds_id, gene_start, gene_length)
+            self.compounds(bgc_id, term, core)
+
+        self.clusterblast_hits(bgc_id)
+
+    def core_gene(self, sequence_id, term, cds_id, gene_start, gene_length):
+        '''Add profile hits and, for NRPS/PKS, domains to a core gene'''
+        rng = self.rng
+        for name in TYPE_PROFILES.get(term, []):
+            self.writer.add('profile_hits', {'profile_hit_id': self.next_id('profile_hits'), 'cds_id': cds_id,
+                                             'name': name, 'evalue': 10 ** -rng.randint(20, 200),
+                                             'bitscore': round(rng.uniform(30, 800), 1), 'seeds': rng.randint(5, 200)})
+
+        if term == 'terpene' and rng.random() < 0.5:
+            name, _, from_carbon, to_carbon = rng.choice(TERPENES)
+            self.writer.add('terpene_cyclisations', {'terpene_id': self.terpene_ids[name], 'cds_id': cds_id,
+                                                     'from_carbon': from_carbon, 'to_carbon': to_carbon})
+
+        kind = 'nrps' if term in ('nrps', 'nrps-like') else 'pks' if term in ('t1pks', 'transatpks') else None
+        if kind is None:
+            return
+        num_modules = rng.randint(1, 4) if term != 'nrps-like' else 1
+        domains = []
+        for _ in range(num_modules):
+            domains.extend(MODULE_DOMAINS[kind])
+            if rng.random() < 0.3:
+                domains.append(rng.choice(EXTRA_DOMAINS[kind]))
+        domain_length = max(60, gene_length // len(domains)) // 3 * 3
+        for number, name in enumerate(domains):
+            start = gene_start + number * domain_length
+            as_domain_id = self.next_id('as_domains')
+            monomer = None
+            if name == 'AMP-binding':
+                monomer = rng.choice([m for m, _, _ in MONOMERS if m not in PKS_MONOMERS])
+            elif name == 'PKS_AT':
+                monomer = rng.choice(PKS_MONOMERS)
+            self.writer.add('as_domains', {
+                'as_domain_id': as_domain_id, 'detection': 'hmmscan', 'score': round(rng.uniform(50, 500), 1),
+                'evalue': 10 ** -rng.randint(10, 150), 'translation': self.protein(domain_length // 3),
+                'consensus': monomer, 'as_domain_profile_id': self.profile_ids[name],
+                'locus_id': self.locus(sequence_id, start, start + domain_length), 'cds_id': cds_id,
+            })
+            if monomer is not None:
+                self.writer.add('rel_as_domains_monomers', {'as_domain_id': as_domain_id,
+                                                            'monomer_id': self.monomer_ids[monomer],
+                                                            'position_in_domain': 1})
+
+    def compounds(self, bgc_id, term, core):
+        '''Predicted products of RiPP and NRPS BGCs'''
+        rng = self.rng
+        if not core:
+            return
+        if term in ('lanthipeptide', 'lassopeptide', 'thiopeptide') and rng.random() < 0.6:
+            compound_id = self.next_id('compounds')
+            peptide = ''.join(rng.choice(AMINO_ACIDS) for _ in range(rng.randint(15, 35)))
+            self.writer.add('compounds', {
+                'compound_id': compound_id, 'peptide_sequence': peptide,
+                'molecular_weight': round(len(peptide) * 110.0, 2), 'class': 'Class {}'.format(rng.choice('I II III'.split())),
+                'score': rng.randint(10, 60), 'locus_tag': None,
+            })
+            self.writer.add('rel_clusters_compounds', {'bgc_id': bgc_id, 'compound_id': compound_id})
+        elif term == 'nrps' and rng.random() < 0.3:
+            compound_id = self.next_id('compounds')
+            self.writer.add('compounds', {
+                'compound_id': compound_id, 'peptide_sequence': None, 'molecular_weight': None,
+                'class': None, 'score': None, 'locus_tag': None,
+            })
+            self.writer.add('rel_clusters_compounds', {'bgc_id': bgc_id, 'compound_id': compound_id})
+            for position in range(rng.randint(3, 10)):
+                self.writer.add('rel_compounds_monomers', {
+                    'compound_id': compound_id, 'position': position,
+                    'monomer_id': self.monomer_ids[rng.choice([m for m, _, _ in MONOMERS if m not in PKS_MONOMERS])],
+                })
+
+    def clusterblast_hits(self, bgc_id):
+        '''Hits against MIBiG, other records and subclusters, ranked by similarity'''
+        rng = self.rng
+        counts = {
+            'knownclusterblast': rng.randint(1, 5) if rng.random() < 0.6 else 0,
+            'clusterblast': rng.randint(0, 10),
+            'subclusterblast': rng.randint(1, 2) if rng.random() < 0.2 else 0,
+        }
+        for algorithm in CLUSTERBLAST_ALGORITHMS:
+            similarities = sorted((int(100 * rng.betavariate(1.2, 3)) + 1 for _ in range(counts[algorithm])), reverse=True)
+            for rank, similarity in enumerate(similarities, 1):
+                if algorithm == 'knownclusterblast':
+                    number = rng.choices(range(1, NUM_MIBIG + 1), cum_weights=self.mibig_weights)[0]
+                    acc = 'BGC{:07d}'.format(number)
+                    description = 'compound_{} biosynthetic gene cluster'.format(number)
+                elif algorithm == 'subclusterblast':
+                    acc = 'SUB{:05d}'.format(rng.randint(1, 200))
+                    description = 'subcluster_{}'.format(acc)
+                else:
+                    acc = 'NZ_SYN{:08d}'.format(rng.randint(1, max(1, self.ids.get('dna_sequences', 1))))
+                    description = 'Synthetic record {}'.format(acc)
+                self.writer.add('clusterblast_hits', {
+                    'clusterblast_hit_id': self.next_id('clusterblast_hits'), 'rank': rank, 'acc': acc,
+                    'description': description, 'similarity': similarity,
+                    'algorithm_id': self.algorithm_ids[algorithm], 'bgc_id': bgc_id,
+                })
+
+
+def create_schema(engine, drop):
+    '''Create the antismash schema from the models'''
+    sys.path.insert(0, ROOT)
+    from sqlalchemy.exc import DBAPIError
+    from api.models import db
+    from api.search import regions
+
+    with engine.begin() as connection:
+        if drop:
+            connection.execute('DROP SCHEMA IF EXISTS antismash CASCADE')
+        connection.execute('CREATE SCHEMA IF NOT EXISTS antismash')
+
+    # The region search index needs btree_gist, which is a contrib extension that
+    # may be missing or need superuser rights. Region searches work without the
+    # index, on the plain start and end index of the loci.
+    try:
+        with engine.begin() as connection:
+            connection.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    except DBAPIError as error:
+        print('Skipping {}, btree_gist is not available: {}'.format(regions.REGION_INDEX.name, error.orig),
+              file=sys.stderr)
+        regions.REGION_INDEX.table.indexes.discard(regions.REGION_INDEX)
+    db.metadata.create_all(engine)
+
+    with engine.connect() as connection:
+        if connection.execute('SELECT EXISTS (SELECT 1 FROM antismash.biosynthetic_gene_clusters)').scalar():
+            raise SystemExit('The database already contains BGCs, use --drop to replace them')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db-uri', default=os.getenv('AS_DB_URI'), help='Database to fill, defaults to $AS_DB_URI')
+    parser.add_argument('--bgcs', type=int, default=1000, help='Number of BGCs to generate')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--drop', action='store_true', help='Drop an existing antismash schema first')
+    parser.add_argument('--no-dna', dest='with_dna', action='store_false', help='Leave the DNA sequences empty')
+    args = parser.parse_args()
+    if not args.db_uri:
+        parser.error('No database given, use --db-uri or set AS_DB_URI')
+
+    from sqlalchemy import create_engine
+
+    engine = create_engine(args.db_uri)
+    create_schema(engine, args.drop)
+
+    start = time.perf_counter()
+    connection = engine.raw_connection()
+    try:
+        writer = CopyWriter(connection)
+        Generator(writer, args.bgcs, seed=args.seed, with_dna=args.with_dna).generate()
+        connection.commit()
+    finally:
+        connection.close()
+
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level='AUTOCOMMIT').execute('ANALYZE')
+
+    for table, count in sorted(writer.counts.items()):
+        print('{:30} {:>12}'.format(table, count))
+    print('Generated in {:.1f}s'.format(time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
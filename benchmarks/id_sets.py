@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+'''Find the crossover between id arrays and temporary id tables
+
+Re-queries random sets of CDS ids the way the gene CSV formatter does, with an
+IN list (one parameter per id), a single array parameter (= ANY) and a
+temporary table filled by COPY, for growing set sizes. Times include building
+and compiling the query, loading the temporary table and fetching all rows.
+Needs a database in $AS_DB_URI, e.g. one filled by generate_db.py.
+
+The reported crossover is the smallest size at which the temporary table beat
+the array parameter, a starting point for AS_ID_TEMP_TABLE_THRESHOLD.
+
+Usage: python benchmarks/id_sets.py [--runs N] [--sizes 100,1000,...] [--seed N]
+'''
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = '100,1000,5000,10000,20000,50000,100000,200000'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Runs per size and strategy')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='Comma separated id set sizes')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for picking the ids')
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from api import app
+    from api.models import db, Cds, DnaSequence, Locus
+    from api.search.idsets import id_filter, join_id_table
+
+    def base_query():
+        return db.session.query(Cds.locus_tag, Locus.start_pos, Locus.end_pos, Locus.strand,
+                                DnaSequence.acc, DnaSequence.version).join(Locus).join(DnaSequence)
+
+    strategies = {
+        'in_list': lambda ids: base_query().filter(Cds.cds_id.in_(ids)),
+        'any_array': lambda ids: base_query().filter(id_filter(Cds.cds_id, ids)),
+        'temp_table': lambda ids: join_id_table(base_query(), Cds.cds_id, ids),
+    }
+
+    rng = random.Random(args.seed)
+    report = {'sizes': {}}
+    with app.test_request_context():
+        all_ids = [cds_id for cds_id, in db.session.query(Cds.cds_id)]
+        for size in map(int, args.sizes.split(',')):
+            if size > len(all_ids):
+                print('Skipping {} ids, the database only has {} CDSs'.format(size, len(all_ids)), file=sys.stderr)
+                continue
+            ids = rng.sample(all_ids, size)
+            timings = {}
+            for name, build in sorted(strategies.items()):
+                runs = []
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    build(ids).order_by(Cds.cds_id).all()
+                    runs.append((time.perf_counter() - start) * 1000)
+                    db.session.rollback()
+                runs.sort()
+                timings[name] = round(runs[len(runs) // 2], 3)
+            report['sizes'][size] = timings
+
+    crossover = None
+    for size, timings in sorted(report['sizes'].items()):
+        if timings['temp_table'] < timings['any_array']:
+            crossover = size
+            break
+    report['crossover'] = crossover
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
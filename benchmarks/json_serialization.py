@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+'''Compare JSON serialization time of search results
+
+Builds clusters_to_json output of 1k, 10k and 100k synthetic clusters and times
+how long it takes to encode it to bytes with flask.json (what jsonify used
+before), and with every serializer in api.serialization. No database needed.
+
+Usage: python benchmarks/json_serialization.py [--runs N] [--sizes 1000,10000,100000]
+'''
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TYPES = [('nrps', 'Non-ribosomal peptide synthetase'), ('t1pks', 'Type I polyketide synthase'),
+         ('terpene', 'Terpene'), ('lanthipeptide', 'Lanthipeptide')]
+
+
+def cluster_rows(count):
+    '''Get the clusters_from_rows rows of count clusters'''
+    rows = []
+    for bgc_id in range(1, count + 1):
+        types = [TYPES[bgc_id % len(TYPES)]]
+        if bgc_id % 7 == 0:
+            types.append(TYPES[(bgc_id + 1) % len(TYPES)])
+        hit = (None, None, None, None)
+        if bgc_id % 3:
+            hit = (bgc_id % 100, 'compound_{} biosynthetic gene cluster'.format(bgc_id % 2000),
+                   'BGC{:07d}'.format(bgc_id % 2000), 1)
+        rows.append((bgc_id, bgc_id % 30 + 1, bgc_id * 1000, bgc_id * 1000 + 45000, 'NZ_SYN{:08d}'.format(bgc_id // 20),
+                     'GCF_{:09d}.1'.format(bgc_id // 20), 1, 'Streptomyces', 'coelicolor', 'SYN-{}'.format(bgc_id // 20),
+                     bgc_id % 4 == 0, False, [term for term, _ in types], [description for _, description in types])
+                    + hit)
+    return rows
+
+
+def time_runs(function, data, runs):
+    '''Get the median time of encoding data in ms'''
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function(data)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return round(timings[len(timings) // 2], 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Runs per size and serializer')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='Comma separated numbers of clusters')
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from flask import json as flask_json
+    from api import app
+    from api.search.clusters import clusters_from_rows
+    from api.serialization import SERIALIZERS
+
+    encoders = {
+        'flask.json': lambda data: flask_json.dumps(data, separators=(',', ':')).encode('utf-8'),
+    }
+    for name, serializer in SERIALIZERS.items():
+        encoders[name] = lambda data, serializer=serializer: serializer(data, True, False)
+
+    report = {}
+    with app.app_context():
+        for size in map(int, args.sizes.split(',')):
+            data = {'clusters': clusters_from_rows(cluster_rows(size)), 'total': size}
+            report[size] = {name: time_runs(encoder, data, args.runs) for name, encoder in sorted(encoders.items())}
+            report[size]['bytes'] = len(encoders['flask.json'](data))
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+'''Compare startup cost of the legacy accession lookup
+
+Measures import time and resident memory of the memory-mapped accession file
+against the former approach of a Python set literal in the module source.
+Every measurement runs in a fresh interpreter.
+
+Usage: python benchmarks/legacy_startup.py [--runs N]
+'''
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEGACY_PY = os.path.join(ROOT, 'api', 'legacy.py')
+
+MEASURE = '''
+import importlib.util, json, os, resource, sys, time
+
+def rss_kb():
+    try:
+        with open('/proc/self/statm') as handle:
+            return int(handle.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+rss_before = rss_kb()
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('legacy_bench', sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+imported = time.perf_counter()
+found = 'CP006680' in module.dbv1_accessions
+looked_up = time.perf_counter()
+rss_after = rss_kb()
+print(json.dumps({'import_ms': (imported - start) * 1000, 'first_lookup_ms': (looked_up - imported) * 1000,
+                  'rss_kb': rss_after - rss_before, 'found': found}))
+'''
+
+
+def write_set_module(path):
+    '''Write a module with the accessions as a set literal, like the old api/legacy.py'''
+    sys.path.insert(0, ROOT)
+    from api.legacy import AccessionSet, ACCESSION_FILE
+    accessions = sorted(AccessionSet(ACCESSION_FILE))
+    with open(path, 'w') as handle:
+        handle.write('# These accessions are contained in version1 of the DB\n')
+        handle.write('dbv1_accessions = set([\n')
+        for accession in accessions:
+            handle.write("    '{}',\n".format(accession))
+        handle.write('])\n')
+
+
+def measure(module_path, runs):
+    '''Run the import measurement runs times, return the median values'''
+    results = []
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, '-c', MEASURE, module_path])
+        results.append(json.loads(out.decode('utf-8')))
+
+    summary = {}
+    for key in ('import_ms', 'first_lookup_ms', 'rss_kb'):
+        values = sorted(result[key] for result in results)
+        summary[key] = round(values[len(values) // 2], 3)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters per variant')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        set_module = os.path.join(tmpdir, 'legacy_set.py')
+        write_set_module(set_module)
+        # The first import compiles the source, workers normally start from cached bytecode
+        measure(set_module, 1)
+        report = {
+            'set_literal': measure(set_module, args.runs),
+            'mmap_file': measure(LEGACY_PY, args.runs),
+        }
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+'''Replay captured requests against a running server
+
+Reads the NDJSON files written when AS_CAPTURE_DIR is set and sends the
+requests to --url in the order they arrived, keeping their inter-arrival times.
+--rate speeds the replay up or slows it down, 0 sends them as fast as
+--concurrency allows. Requests that can't start on time because all
+connections are busy are sent late, the delay is reported as lag.
+
+Reported overall and per endpoint: throughput, latency percentiles, status
+codes and, for comparison, the durations measured when the requests were
+captured.
+
+Usage: python benchmarks/replay.py CAPTURE_FILE... [--url URL] [--concurrency N] [--rate X] [--limit N] [--output FILE]
+'''
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import time
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+from run_benchmarks import percentile
+
+
+def load_records(paths, endpoints=None):
+    '''Load the captured requests of several files, sorted by arrival'''
+    records = []
+    for path in paths:
+        with open(path) as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if endpoints and record.get('endpoint') not in endpoints:
+                    continue
+                records.append(record)
+    records.sort(key=lambda record: record['timestamp'])
+    return records
+
+
+def build_request(base_url, record):
+    '''Turn a captured request into a urllib Request'''
+    url = base_url.rstrip('/') + record['path']
+    if record.get('args'):
+        url += '?' + urlencode(record['args'])
+
+    data = None
+    headers = {}
+    if record['method'] == 'POST' and record.get('body') is not None:
+        data = json.dumps(record['body']).encode('utf-8')
+        headers['Content-Type'] = 'application/json'
+    return Request(url, data=data, headers=headers, method=record['method'])
+
+
+def send(request, due, timeout):
+    '''Send a request, return its status, latency, lag and size'''
+    start = time.perf_counter()
+    status = None
+    size = 0
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            status = response.status
+            size = len(response.read())
+    except HTTPError as err:
+        status = err.code
+        size = len(err.read())
+    except (URLError, OSError):
+        pass
+    end = time.perf_counter()
+    return {
+        'status': status,
+        'latency_ms': (end - start) * 1000,
+        'lag_ms': max(start - due, 0) * 1000 if due is not None else 0.0,
+        'bytes': size,
+        'end': end,
+    }
+
+
+def replay(records, base_url, concurrency, rate, timeout):
+    '''Send the records, return the (record, result) pairs and the elapsed time'''
+    futures = []
+    start = time.perf_counter()
+    first = records[0]['timestamp'] if records else 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for record in records:
+            due = None
+            if rate > 0:
+                due = start + (record['timestamp'] - first) / rate
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            futures.append((record, executor.submit(send, build_request(base_url, record), due, timeout)))
+        results = [(record, future.result()) for record, future in futures]
+
+    end = max([result['end'] for _, result in results] or [start])
+    return results, end - start
+
+
+def summarize(pairs, elapsed):
+    '''Get throughput and latency statistics of (record, result) pairs'''
+    latencies = [result['latency_ms'] for _, result in pairs]
+    lags = [result['lag_ms'] for _, result in pairs]
+    captured = [record['duration'] * 1000 for record, _ in pairs if record.get('duration') is not None]
+    statuses = {}
+    for _, result in pairs:
+        key = str(result['status'])
+        statuses[key] = statuses.get(key, 0) + 1
+
+    summary = {
+        'requests': len(pairs),
+        'errors': sum(1 for _, result in pairs if result['status'] is None or result['status'] >= 500),
+        'statuses': statuses,
+        'throughput_rps': round(len(pairs) / elapsed, 3) if elapsed > 0 else None,
+        'bytes': sum(result['bytes'] for _, result in pairs),
+    }
+    if latencies:
+        summary.update({
+            'p50_ms': round(percentile(latencies, 0.5), 3),
+            'p90_ms': round(percentile(latencies, 0.9), 3),
+            'p99_ms': round(percentile(latencies, 0.99), 3),
+            'max_ms': round(max(latencies), 3),
+            'mean_ms': round(sum(latencies) / len(latencies), 3),
+            'lag_p50_ms': round(percentile(lags, 0.5), 3),
+            'lag_p99_ms': round(percentile(lags, 0.99), 3),
+        })
+    if captured:
+        summary['captured_p50_ms'] = round(percentile(captured, 0.5), 3)
+        summary['captured_p90_ms'] = round(percentile(captured, 0.9), 3)
+    return summary
+
+
+def report(pairs, elapsed):
+    '''Get the overall and per endpoint summaries'''
+    by_endpoint = {}
+    for record, result in pairs:
+        by_endpoint.setdefault(record.get('endpoint') or '', []).append((record, result))
+    return {
+        'elapsed_s': round(elapsed, 3),
+        'overall': summarize(pairs, elapsed),
+        'endpoints': {endpoint: summarize(endpoint_pairs, elapsed)
+                      for endpoint, endpoint_pairs in sorted(by_endpoint.items())},
+    }
+
+
+def print_report(result):
+    '''Print a table of a report'''
+    print('{:26} {:>8} {:>8} {:>10} {:>10} {:>10} {:>10} {:>12}'.format(
+        'endpoint', 'requests', 'errors', 'req/s', 'p50 ms', 'p99 ms', 'lag p99', 'captured p50'))
+    rows = [('overall', result['overall'])] + list(result['endpoints'].items())
+    for name, summary in rows:
+        print('{:26} {:>8} {:>8} {:>10} {:>10} {:>10} {:>10} {:>12}'.format(
+            name, summary['requests'], summary['errors'], summary['throughput_rps'], summary.get('p50_ms', '-'),
+            summary.get('p99_ms', '-'), summary.get('lag_p99_ms', '-'), summary.get('captured_p50_ms', '-')))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('captures', nargs='+', help='NDJSON capture files')
+    parser.add_argument('--url', default='http://localhost:5000', help='Server to send the requests to')
+    parser.add_argument('--concurrency', type=int, default=8, help='Maximum number of requests in flight')
+    parser.add_argument('--rate', type=float, default=1.0,
+                        help='Replay speed relative to the captured traffic, 0 sends as fast as possible')
+    parser.add_argument('--limit', type=int, help='Only replay the first N requests')
+    parser.add_argument('--endpoint', action='append', default=[], help='Only replay this endpoint, repeatable')
+    parser.add_argument('--timeout', type=float, default=300, help='Request timeout in seconds')
+    parser.add_argument('--output', help='Write the report as JSON to this file')
+    args = parser.parse_args()
+
+    records = load_records(args.captures, set(args.endpoint))
+    if args.limit is not None:
+        records = records[:args.limit]
+    if not records:
+        parser.error('No captured requests found')
+
+    pairs, elapsed = replay(records, args.url, args.concurrency, args.rate, args.timeout)
+    result = report(pairs, elapsed)
+    result['meta'] = {
+        'url': args.url,
+        'concurrency': args.concurrency,
+        'rate': args.rate,
+        'captured_span_s': round(records[-1]['timestamp'] - records[0]['timestamp'], 3),
+    }
+
+    print_report(result)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(result, handle, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
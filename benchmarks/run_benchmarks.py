@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+'''Run a fixed query corpus against the API and report latencies
+
+Requests go through the Flask test client against the database in $AS_DB_URI,
+normally one filled by generate_db.py, so the numbers cover query building,
+SQL and formatting but not the HTTP server. Every corpus entry is run once cold
+(caches empty, reported separately), then --runs times. Reported per entry:
+
+- latency percentiles and mean in ms
+- SQL statements and rows per request
+- response size
+- with --trace-memory, peak Python memory of one extra traced run
+
+The report is printed and, with --output, written as JSON. Pass an earlier
+report with --compare to print the p50/p90 changes against it.
+
+Usage: python benchmarks/run_benchmarks.py [--runs N] [--only NAME] [--output FILE] [--compare FILE] [--trace-memory]
+'''
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from urllib.parse import quote
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEARCH = '/api/v1.0/search'
+EXPORT = '/api/v1.0/export'
+ACTINOMYCETIA = 'bacteria_actinobacteria_actinomycetia'
+STREPTOMYCETACEAE = ACTINOMYCETIA + '_streptomycetales_streptomycetaceae'
+
+
+def _search(search_string):
+    return {'search_string': search_string}
+
+
+def _query(search_type, category, term, return_type='json'):
+    return {'query': {'search': search_type, 'return_type': return_type,
+                      'terms': {'term_type': 'expr', 'category': category, 'term': term}}}
+
+
+def _export_get(search_type, return_type, search_string):
+    return '/api/v1.0/export/{}/{}?search={}'.format(search_type, return_type, quote(search_string))
+
+
+# (name, method, path, JSON body), all terms exist in a generate_db.py data set
+CORPUS = [
+    ('search_type', 'POST', SEARCH, _search('[type]nrps')),
+    ('search_type_parent', 'POST', SEARCH, _search('[type]pks')),
+    ('search_guess_genus', 'POST', SEARCH, _search('Streptomyces')),
+    ('search_hybrid', 'POST', SEARCH, _search('[type]t1pks AND [type]nrps')),
+    ('search_phylum_except', 'POST', SEARCH, _search('[phylum]Actinobacteria EXCEPT [type]terpene')),
+    ('search_or_taxa', 'POST', SEARCH, _search('[genus]Myxococcus OR [genus]Amycolatopsis')),
+    ('search_acc', 'POST', SEARCH, _search('[acc]NZ_SYN00000001')),
+    ('search_region', 'POST', SEARCH, _search('[region]NZ_SYN00000001:1-500000')),
+    ('search_knowncluster', 'POST', SEARCH, _search('[knowncluster]BGC0000001')),
+    ('search_asdomain', 'POST', SEARCH, _search('[asdomain]PKS_KS')),
+    ('search_smcog', 'POST', SEARCH, _search('[smcog]SMCOG1000')),
+    ('search_monomer', 'POST', SEARCH, _search('[monomer]ala')),
+    ('search_terpene', 'POST', SEARCH, _search('[terpene]geosmin')),
+    ('search_no_results', 'POST', SEARCH, _search('[genus]Streptomyzes')),
+    ('search_gene_profile', 'POST', SEARCH, _query('gene', 'profile', 'LANC_like')),
+    ('search_gene_region', 'POST', SEARCH, _query('gene', 'region', 'NZ_SYN00000001:100000-150000')),
+    ('search_domain_asdomain', 'POST', SEARCH, _query('domain', 'asdomain', 'Thioesterase')),
+    ('export_csv', 'POST', EXPORT, _search('[type]lanthipeptide')),
+    ('export_json', 'POST', EXPORT, _query('cluster', 'genus', 'Bacillus')),
+    ('export_cluster_fasta', 'GET', _export_get('cluster', 'fasta', '[acc]NZ_SYN00000001'), None),
+    ('export_gene_fastaa', 'GET', _export_get('gene', 'fastaa', '[acc]NZ_SYN00000001'), None),
+    ('export_domain_csv', 'GET', _export_get('domain', 'csv', '[asdomain]Epimerization'), None),
+    ('available_genus', 'GET', '/api/v1.0/available/genus/strep', None),
+    ('available_species', 'GET', '/api/v1.0/available/species/co', None),
+    ('available_monomer', 'GET', '/api/v1.0/available/monomer/a', None),
+    ('tree_root', 'GET', '/api/v1.0/tree/taxa?id=1', None),
+    ('tree_family', 'GET', '/api/v1.0/tree/taxa?id=family_{}'.format(STREPTOMYCETACEAE), None),
+    ('tree_massload', 'GET', '/api/v1.0/tree/taxa/massload?id=1,phylum_bacteria,class_bacteria_actinobacteria,'
+                             'order_{}_streptomycetales'.format(ACTINOMYCETIA), None),
+    ('tree_search', 'GET', '/api/v1.0/tree/taxa/search?str=strep', None),
+    ('tree_secmet', 'GET', '/api/v1.0/tree/secmet', None),
+    ('stats_v1', 'GET', '/api/v1.0/stats', None),
+    ('stats_v2', 'GET', '/api/v2.0/stats', None),
+]
+
+
+def percentile(values, fraction):
+    '''Get a percentile of a list of numbers, interpolating between the closest ranks
+
+    >>> percentile([1, 2, 3, 4], 0.5)
+    2.5
+    >>> percentile([5], 0.99)
+    5
+    '''
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class SqlCounter(object):
+    '''Count the SQL statements and rows of all engines'''
+    def __init__(self):
+        self.statements = 0
+        self.rows = 0
+
+    def install(self):
+        '''Start counting'''
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        @event.listens_for(Engine, 'after_cursor_execute')
+        def count(conn, cursor, statement, parameters, context, executemany):
+            self.statements += 1
+            self.rows += max(cursor.rowcount, 0)
+
+    def snapshot(self):
+        '''Get the current (statements, rows) counts'''
+        return self.statements, self.rows
+
+
+def run_request(client, counter, method, path, body):
+    '''Run a request, return its latency, status, size and SQL counts'''
+    statements, rows = counter.snapshot()
+    start = time.perf_counter()
+    response = client.open(path, method=method, json=body)
+    # Streamed responses are only generated while reading them
+    data = response.get_data()
+    latency = time.perf_counter() - start
+    response.close()
+    return {
+        'latency_ms': latency * 1000,
+        'status': response.status_code,
+        'bytes': len(data),
+        'sql_statements': counter.statements - statements,
+        'sql_rows': counter.rows - rows,
+    }
+
+
+def traced_peak_kb(client, counter, method, path, body):
+    '''Get the peak Python memory allocated during a request'''
+    tracemalloc.start()
+    try:
+        run_request(client, counter, method, path, body)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak // 1024
+
+
+def benchmark(client, counter, entry, runs, trace_memory):
+    '''Run one corpus entry, return its summary'''
+    name, method, path, body = entry
+    cold = run_request(client, counter, method, path, body)
+    results = [run_request(client, counter, method, path, body) for _ in range(runs)]
+    latencies = [result['latency_ms'] for result in results]
+
+    summary = {
+        'method': method,
+        'path': path,
+        'body': body,
+        'runs': runs,
+        'status': sorted(set(result['status'] for result in results)),
+        'cold_ms': round(cold['latency_ms'], 3),
+        'min_ms': round(min(latencies), 3),
+        'p50_ms': round(percentile(latencies, 0.5), 3),
+        'p90_ms': round(percentile(latencies, 0.9), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'max_ms': round(max(latencies), 3),
+        'mean_ms': round(sum(latencies) / len(latencies), 3),
+        'sql_statements': percentile([result['sql_statements'] for result in results], 0.5),
+        'sql_rows': percentile([result['sql_rows'] for result in results], 0.5),
+        'bytes': results[-1]['bytes'],
+    }
+    if trace_memory:
+        summary['peak_memory_kb'] = traced_peak_kb(client, counter, method, path, body)
+    return summary
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL).decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def data_set_size(app):
+    '''Count the BGCs, genomes and CDSs of the benchmarked database'''
+    from api.models import db, BiosyntheticGeneCluster, Cds, Genome
+
+    with app.app_context():
+        return {
+            'bgcs': db.session.query(BiosyntheticGeneCluster).count(),
+            'genomes': db.session.query(Genome).count(),
+            'cdss': db.session.query(Cds).count(),
+        }
+
+
+def print_report(report):
+    '''Print a table of the results'''
+    print('{:28} {:>6} {:>10} {:>10} {:>10} {:>10} {:>8} {:>10}'.format(
+        'name', 'status', 'cold ms', 'p50 ms', 'p90 ms', 'p99 ms', 'sql', 'peak kB'))
+    for name, result in report['results'].items():
+        print('{:28} {:>6} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.1f} {:>8} {:>10}'.format(
+            name, ','.join(map(str, result['status'])), result['cold_ms'], result['p50_ms'], result['p90_ms'],
+            result['p99_ms'], result['sql_statements'], result.get('peak_memory_kb', '-')))
+
+
+def print_comparison(baseline, report):
+    '''Print the latency changes against an earlier report'''
+    print('\n{:28} {:>12} {:>12} {:>8} {:>12} {:>12} {:>8}'.format(
+        'name', 'base p50', 'p50', 'ratio', 'base p90', 'p90', 'ratio'))
+    for name, result in report['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        print('{:28} {:>12.1f} {:>12.1f} {:>8.2f} {:>12.1f} {:>12.1f} {:>8.2f}'.format(
+            name, base['p50_ms'], result['p50_ms'], result['p50_ms'] / max(base['p50_ms'], 1e-9),
+            base['p90_ms'], result['p90_ms'], result['p90_ms'] / max(base['p90_ms'], 1e-9)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='Timed runs per corpus entry')
+    parser.add_argument('--only', action='append', default=[], help='Only run entries whose name contains this, repeatable')
+    parser.add_argument('--output', help='Write the report as JSON to this file')
+    parser.add_argument('--compare', help='Earlier JSON report to compare against')
+    parser.add_argument('--trace-memory', action='store_true', help='Measure peak Python memory in an extra run')
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from api import app
+
+    counter = SqlCounter()
+    counter.install()
+
+    corpus = [entry for entry in CORPUS if not args.only or any(only in entry[0] for only in args.only)]
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'revision': _git_revision(),
+            'python': platform.python_version(),
+            'runs': args.runs,
+            'data_set': data_set_size(app),
+        },
+        'results': {},
+    }
+
+    client = app.test_client()
+    for entry in corpus:
+        report['results'][entry[0]] = benchmark(client, counter, entry, args.runs, args.trace_memory)
+    report['meta']['max_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print_report(report)
+    if args.compare:
+        with open(args.compare) as handle:
+            print_comparison(json.load(handle), report)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
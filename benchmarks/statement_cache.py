@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+'''Measure the Python overhead saved by the compiled statement cache
+
+For a few small, frequent query shapes, times what a request spends before the
+SQL goes to the database: building the ORM query and compiling it, against
+looking up the cached statement of the shape, filling in its parameters and
+compiling the text() construct, which is what api.statements does. No database
+needed, the terms differ between runs so nothing but the shape is reused.
+
+Usage: python benchmarks/statement_cache.py [--runs N]
+'''
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GENERA = ['streptomyces', 'bacillus', 'pseudomonas', 'amycolatopsis', 'nocardia', 'salinispora']
+
+
+def time_runs(function, runs):
+    '''Get the median time of function(run) in microseconds'''
+    timings = []
+    for run in range(runs):
+        start = time.perf_counter()
+        function(run)
+        timings.append((time.perf_counter() - start) * 1000000)
+    timings.sort()
+    return round(timings[len(timings) // 2], 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=2000, help='Runs per shape and strategy')
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from api import app, taxtree
+    from api.models import db
+    from api.search import SEARCH_TYPES, term_from_shape, term_shape
+    from api.search.available import AVAILABLE
+    from api.search_parser import QueryTerm
+    from api.statements import STATEMENTS, shape_statement
+
+    def search_shape(search_string):
+        model, order, from_term = SEARCH_TYPES['cluster']
+        shape = term_shape(QueryTerm.from_string(search_string))
+        arity = search_string.count('[')
+        return (('cluster', shape), lambda *values: from_term(term_from_shape(shape, iter(values))).order_by(order),
+                lambda run: [GENERA[(run + index) % len(GENERA)] for index in range(arity)], model)
+
+    shapes = {
+        'search_genus': search_shape('[genus]streptomyces'),
+        'search_acc': search_shape('[acc]NC_003888'),
+        'search_type_and_genus': search_shape('[type]nrps AND [genus]streptomyces'),
+        'available_genus': (('available', 'genus'), lambda term: AVAILABLE['genus'](term).limit(50),
+                            lambda run: [GENERA[run % len(GENERA)][:3]], None),
+        'tree_genus': (('tree_level', 'genus'), lambda *terms: taxtree.level_query('genus', list(terms)),
+                       lambda run: ['bacteria', 'actinobacteria', 'actinomycetia', 'streptomycetales',
+                                    GENERA[run % len(GENERA)]], None),
+    }
+
+    report = {}
+    with app.app_context():
+        dialect = db.session.get_bind().dialect
+
+        for name, (key, build, values, model) in sorted(shapes.items()):
+            def uncached(run):
+                statement = build(*values(run)).statement
+                compiled = statement.compile(dialect=dialect)
+                return compiled.string, compiled.params
+
+            def cached(run):
+                statement, params = shape_statement(key, build, values(run))
+                if model is not None:
+                    statement = db.session.query(model).from_statement(statement).params(**params).statement
+                return statement.compile(dialect=dialect).string, params
+
+            STATEMENTS.clear()
+            first = time_runs(cached, 1)
+            report[name] = {
+                'orm_compile_us': time_runs(uncached, args.runs),
+                'cached_us': time_runs(cached, args.runs),
+                'first_use_us': first,
+            }
+            report[name]['speedup'] = round(report[name]['orm_compile_us'] / report[name]['cached_us'], 1)
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
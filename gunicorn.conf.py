@@ -0,0 +1,23 @@
+'''gunicorn settings for serving api:app'''
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+# Same default as gunicorn without this file, set GUNICORN_WORKERS to scale up
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))
+# With more than one thread, every worker serves requests from a thread pool
+threads = int(os.getenv('GUNICORN_THREADS', '1'))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread' if threads > 1 else 'sync')
+
+
+def post_worker_init(worker):
+    '''Open the database connections before the worker takes its first request'''
+    from api import app
+    from api.models import db
+    from api.pool import prewarm
+
+    count = app.config.get('DB_POOL_PREWARM', 0)
+    if count < 1:
+        return
+    with app.app_context():
+        opened = prewarm(db.get_engine(), count)
+    worker.log.info('Pre-warmed %d database connections', opened)
@@ -25,4 +25,5 @@ setup(name='antismash.db.api',
       author_email='kblin@biosustain.dtu.dk',
       description='A REST-like web API for antismash DB',
       packages=['api'],
+      package_data={'api': ['legacy_accessions.dat']},
       zip_safe=False)
@@ -1,6 +1,7 @@
 import json
 from flask import url_for
 from api import taxtree
+from api.search import format_results
 
 
 def test_version(client):
@@ -318,3 +319,74 @@ def test_available(client):
     results = client.get(url_for('list_available', category='genus', term='streptom'))
     assert results.status_code == 200
     assert results.json == expected
+
+
+def test_goto(client):
+    '''Test /go/<identifier> endpoints'''
+    results = client.get(url_for('goto', identifier='NC_003888.3'))
+    assert results.status_code == 302
+    assert results.location.endswith('/output/GCF_000203835/index.html')
+
+    results = client.get(url_for('goto_cluster', identifier='GCF_000203835.1', number=5))
+    assert results.status_code == 302
+    assert results.location.endswith('/output/GCF_000203835/index.html#cluster-5')
+
+    results = client.get(url_for('goto', identifier='AE000511'))
+    assert results.status_code == 302
+    assert results.location == 'https://antismash-dbv1.secondarymetabolites.org/output/AE000511/index.html'
+
+    results = client.get(url_for('goto', identifier='XY_404'))
+    assert results.status_code == 404
+
+
+def test_download_bulk(client):
+    '''Test /api/v1.0/download/bulk endpoint'''
+    results = client.post(url_for('download_bulk'), data='{}', content_type="application/json")
+    assert results.status_code == 400
+
+    query = {'downloads': ['XY_404', {'assembly_id': 'XY_404', 'cluster_number': 1}]}
+    results = client.post(url_for('download_bulk'), data=json.dumps(query), content_type="application/json")
+    assert results.status_code == 200
+    assert results.json == {'urls': [], 'not_found': query['downloads']}
+
+    query = {'downloads': [{'assembly_id': 'XY_404', 'cluster_number': 'one'}]}
+    results = client.post(url_for('download_bulk'), data=json.dumps(query), content_type="application/json")
+    assert results.status_code == 400
+
+
+def test_download_bulk_invalid(client):
+    '''Test that malformed /api/v1.0/download/bulk requests are rejected'''
+    url = url_for('download_bulk')
+    assert client.post(url, data='[]', content_type="application/json").status_code == 400
+    assert client.post(url, data='["XY_404"]', content_type="application/json").status_code == 400
+    for number in (True, 0, -1):
+        query = {'downloads': [{'assembly_id': 'XY_404', 'cluster_number': number}]}
+        results = client.post(url, data=json.dumps(query), content_type="application/json")
+        assert results.status_code == 400, number
+
+
+def test_export_interleaved(client, monkeypatch):
+    '''Test that an export formatted while another one runs keeps its own FASTA header suffix'''
+    url = url_for('export')
+
+    def export(verbose):
+        query = {'query': {'search': 'cluster', 'return_type': 'fasta', 'verbose': verbose,
+                           'terms': {'term_type': 'expr', 'category': 'type', 'term': 'furan'}}}
+        results = client.post(url, data=json.dumps(query), content_type="application/json")
+        assert results.status_code == 200
+        return results.data.split(b'\n')[0]
+
+    # Run a non-verbose export in the middle of a verbose one, after its search
+    # and before its formatting. Requests of the test client share flask.g.
+    inner = []
+
+    def interleaved(*args, **kwargs):
+        if not inner:
+            inner.append(export(False))
+        return format_results(*args, **kwargs)
+
+    monkeypatch.setattr('api.api.format_results', interleaved)
+    outer = export(True)
+
+    assert outer.endswith(b'|Query(search: cluster, terms: [type]furan)')
+    assert inner[0].endswith(b'Streptomyces coelicolor A3(2)')
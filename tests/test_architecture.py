@@ -0,0 +1,67 @@
+'Tests for the domain architecture search'
+
+import pytest
+
+from api.search.architecture import ArchitectureIndex, group_architectures
+from api.search_parser import Query
+
+PROFILES = ['ACP', 'AMP-binding', 'Condensation_DCL', 'Condensation_LCL', 'PCP', 'PKS_AT', 'PKS_DH', 'PKS_KR',
+            'PKS_KS', 'Thioesterase']
+
+ARCHITECTURES = [
+    (1, ['Condensation_LCL', 'AMP-binding', 'PCP', 'Condensation_DCL', 'AMP-binding', 'PCP', 'Thioesterase']),
+    (2, ['PKS_KS', 'PKS_AT', 'PKS_DH', 'PKS_KR', 'ACP']),
+    (3, ['PKS_KS', 'PKS_AT', 'ACP']),
+    (4, ['AMP-binding', 'PCP']),
+    (5, []),
+    (6, ['PKS_KS', 'PKS_AT', 'PKS_KR']),
+]
+
+
+@pytest.fixture
+def index():
+    return ArchitectureIndex(PROFILES, ARCHITECTURES)
+
+
+@pytest.mark.parametrize('pattern, expected', [
+    ('Condensation AMP-binding PCP', [1]),
+    ('condensation_dcl amp-binding pcp', [1]),
+    ('AMP-binding PCP', [1, 4]),
+    ('KS AT ACP', [3]),
+    ('KS AT * ACP', [2, 3]),
+    ('KS,AT,*,ACP', [2, 3]),
+    ('KS AT ? ? ACP', [2]),
+    ('KS AT ?', [2, 3, 6]),
+    ('^ AMP-binding', [4]),
+    ('PCP $', [4]),
+    ('^ KS * KR $', [6]),
+    ('DH|KR ACP', [2]),
+    ('PKS', [2, 3, 6]),
+    ('KS unknown', []),
+    ('Thioesterase AMP-binding', []),
+])
+def test_match(index, pattern, expected):
+    assert index.match(pattern) == expected
+
+
+@pytest.mark.parametrize('pattern', ['', ',', '*', '^ * $'])
+def test_match_invalid(index, pattern):
+    with pytest.raises(ValueError):
+        index.match(pattern)
+
+
+def test_match_does_not_cross_genes(index):
+    # 3 ends in ACP, 4 starts with AMP-binding
+    assert index.match('ACP AMP-binding') == []
+    assert index.match('ACP * AMP-binding') == []
+
+
+def test_search_string():
+    term = Query.from_string('[type]nrps AND [architecture]Condensation,AMP-binding,PCP').terms.right
+    assert (term.category, term.term) == ('architecture', 'Condensation,AMP-binding,PCP')
+
+
+def test_group_architectures():
+    rows = [(1, '+', 'KS'), (1, '+', 'AT'), (2, '-', 'PCP'), (2, '-', 'AMP-binding'), (2, '-', 'Condensation')]
+    assert list(group_architectures(rows)) == [(1, ['KS', 'AT']), (2, ['Condensation', 'AMP-binding', 'PCP'])]
+    assert list(group_architectures([])) == []
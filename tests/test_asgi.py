@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+import pytest
+
+from api import asgi
+from api.models import BiosyntheticGeneCluster as Bgc
+from api.search_parser import Query
+
+
+class FakeRequest:
+    def __init__(self, method, path):
+        self.method = method
+        self.path = path
+
+
+def test_dispatch_errors():
+    with pytest.raises(asgi.HTTPError) as error:
+        asyncio.run(asgi.dispatch(FakeRequest('GET', '/api/v1.0/nonexistent')))
+    assert error.value.status == 404
+
+    with pytest.raises(asgi.HTTPError) as error:
+        asyncio.run(asgi.dispatch(FakeRequest('GET', '/api/v1.0/search')))
+    assert error.value.status == 405
+
+
+def test_route_parameters():
+    pattern = [pattern for pattern, _, handler in asgi.ROUTES if handler is asgi.list_available][0]
+    assert pattern.match('/api/v1.0/available/genus/strep').groupdict() == {'category': 'genus', 'term': 'strep'}
+    assert pattern.match('/api/v1.0/available/genus/strep/extra') is None
+
+
+def test_cluster_search_builds_query_in_thread(app, monkeypatch):
+    threads = []
+
+    def cluster_query_from_term(terms, guess=None):
+        threads.append(threading.get_ident())
+        return Bgc.query
+
+    async def fetch(query):
+        return []
+
+    monkeypatch.setattr(asgi, 'cluster_query_from_term', cluster_query_from_term)
+    monkeypatch.setattr(asgi.DB, 'fetch', fetch)
+    query = Query.from_string('[type]nrps')
+    assert asyncio.run(asgi.cluster_search(query)) == []
+    assert threads and threads[0] != threading.get_ident()
+
+
+def test_list_available_without_sql(app):
+    rows = asyncio.run(asgi.list_available(None, 'contigedge', 'tr'))
+    assert rows == [{'val': 'true', 'desc': 'Cluster is on a contig edge'}]
@@ -0,0 +1,19 @@
+from api.asyncdb import coerce_args, compile_query
+from api.models import db, Taxa
+
+
+def test_compile_query(app):
+    query = db.session.query(Taxa.genus).filter(Taxa.tax_id == '12').filter(Taxa.genus.ilike('%strep%')) \
+                      .filter(Taxa.species.ilike('%strep%')).filter(Taxa.strain.op('%')('x')).limit(5)
+    sql, args = compile_query(query)
+    assert 'tax_id = $1' in sql
+    assert 'genus ILIKE $2' in sql
+    assert 'species ILIKE $3' in sql
+    assert 'strain % $4' in sql
+    assert 'LIMIT $5' in sql
+    assert '%(' not in sql
+    assert args == ['12', '%strep%', '%strep%', 'x', 5]
+
+
+def test_coerce_args():
+    assert coerce_args(['int4', 'text', 'bool', 'int8'], ['12', 3, True, None]) == [12, '3', True, None]
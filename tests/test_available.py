@@ -1,4 +1,4 @@
-from api.search import available
+from api.search import available, typeclosure
 
 
 def test_available_term_by_category_invalid():
@@ -36,3 +36,27 @@ def test_available_term_by_category():
     ]
     for args, expected in tests:
         assert available.available_term_by_category(*args) == expected, args
+
+
+def test_available_term_by_category_counts():
+    found = available.available_term_by_category('genus', 'streptom', with_counts=True)
+    assert [(entry['val'], entry['desc']) for entry in found] == [('Streptomyces', None)]
+    assert found[0]['count'] > 0
+    ranked = available.available_term_by_category('type', '', by_count=True)
+    assert ranked[0]['count'] >= ranked[-1]['count']
+
+
+def test_count_type_includes_subtypes():
+    closure = typeclosure.type_closure()
+    counts = available.get_typeahead_counts('type')
+    for bgc_type_id, descendants in closure.descendants.items():
+        term = closure.types[bgc_type_id][0]
+        for descendant in descendants:
+            assert counts.get(term, 0) >= counts.get(closure.types[descendant][0], 0)
+
+
+def test_available_term_by_category_fuzzy():
+    expected = [{'val': 'Streptomyces', 'desc': None, 'distance': 1}]
+    assert available.fuzzy_term_by_category('genus', 'strpetomyces') == expected
+    assert available.available_term_by_category('genus', 'strpetomyces') == [{'val': 'Streptomyces', 'desc': None, 'fuzzy': True}]
+    assert available.fuzzy_term_by_category('acc', 'nc_003888') == []
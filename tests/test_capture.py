@@ -0,0 +1,67 @@
+import glob
+import json
+import os
+
+from flask import Flask, request
+
+from api import capture, timing
+from api.search_parser import Query
+
+
+def _app(directory, rate):
+    app = Flask(__name__)
+    app.config['CAPTURE_DIR'] = directory
+    app.config['CAPTURE_RATE'] = rate
+    capture.init_capture(app)
+
+    @app.route('/search', methods=['POST'])
+    def search():
+        timing.label_query(Query.from_string(request.json['search_string']))
+        return 'ok'
+
+    @app.route('/other')
+    def other():
+        return 'ok'
+
+    return app
+
+
+def _records(directory):
+    records = []
+    for filename in glob.glob(os.path.join(directory, '*.ndjson')):
+        with open(filename) as handle:
+            records.extend(json.loads(line) for line in handle)
+    return records
+
+
+def test_capture(tmpdir):
+    directory = str(tmpdir)
+    client = _app(directory, 1.0).test_client()
+
+    client.post('/search', json={'search_string': '[type]nrps', 'offset': 10})
+    client.get('/other')
+
+    records = _records(directory)
+    assert len(records) == 1
+    record = records[0]
+    assert record['endpoint'] == 'search'
+    assert record['method'] == 'POST'
+    assert record['status'] == 200
+    assert record['duration'] >= 0
+    expected_query = {
+        'search': 'cluster',
+        'return_type': 'json',
+        'verbose': False,
+        'terms': {'term_type': 'expr', 'category': 'type', 'term': 'nrps'},
+    }
+    assert record['query'] == expected_query
+    assert record['body'] == {'offset': 10, 'query': expected_query}
+
+
+def test_capture_sampled_out(tmpdir):
+    directory = str(tmpdir)
+    client = _app(directory, 0.0).test_client()
+
+    client.post('/search', json={'search_string': '[type]nrps'})
+
+    assert _records(directory) == []
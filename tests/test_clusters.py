@@ -2,6 +2,7 @@
 
 from api.search_parser import QueryTerm
 from api.search import clusters
+from api.search.helpers import FormatContext
 from api.models import BiosyntheticGeneCluster as Bgc
 
 
@@ -93,3 +94,43 @@ def test_clusters_by_knowncluster():
 
 def test_clusters_by_subcluster():
     assert clusters.clusters_by_subcluster('AF386507_1_c1').count() == 1
+
+
+def test_clusters_to_json():
+    found = clusters.clusters_by_acc('NC_003888').all()
+    result = clusters.clusters_to_json(found, FormatContext())
+    assert len(result) == SCO_CLUSTER_COUNT
+    assert [cluster['bgc_id'] for cluster in result] == sorted(cluster.bgc_id for cluster in found)
+    for cluster in result:
+        assert cluster['acc'] == 'NC_003888'
+        assert cluster['term']
+        assert ('cbh_rank' in cluster) == (cluster['cbh_acc'] is not None)
+
+
+def test_clusters_to_fasta():
+    found = clusters.clusters_by_acc('NC_003888').all()[:3]
+    records = list(clusters.clusters_to_fasta(found, FormatContext()))
+    assert len(records) == 3
+    assert all(record.startswith('>NC_003888.') for record in records)
+
+
+def test_clusters_from_rows():
+    rows = [
+        (1, 3, 100, 200, 'NC_003888', 'GCF_000203835.1', 3, 'Streptomyces', 'coelicolor', 'A3(2)', False, False,
+         ['nrps'], ['Non-ribosomal peptide synthetase'], 42, 'Coelichelin', 'BGC0000325', 1),
+        (2, 4, 300, 400, 'NC_003888', 'GCF_000203835.1', 3, 'Streptomyces', 'coelicolor', 'A3(2)', True, False,
+         ['t1pks', 'nrps'], ['Type I PKS', 'Non-ribosomal peptide synthetase'], None, None, None, None),
+    ]
+
+    result = clusters.clusters_from_rows(rows)
+    assert [cluster['bgc_id'] for cluster in result] == [1, 2]
+    assert result[0]['assembly_id'] == 'GCF_000203835'
+    assert result[0]['term'] == 'nrps'
+    assert result[0]['description'] == 'Non-ribosomal peptide synthetase'
+    assert result[0]['similarity'] == 42
+    assert result[0]['cbh_rank'] == 1
+    assert result[1]['term'] == 'nrps-t1pks hybrid'
+    assert result[1]['description'] == 'Hybrid cluster: Non-ribosomal peptide synthetase & Type I PKS'
+    assert result[1]['similarity'] is None
+    assert 'cbh_rank' not in result[1]
+    assert result[1]['contig_edge'] is True
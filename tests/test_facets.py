@@ -0,0 +1,79 @@
+'Tests for the search facets'
+
+import pytest
+from flask import url_for
+
+from api.search import facets
+
+np = pytest.importorskip('numpy')
+
+BGC_IDS = [7, 3, 5, 1]
+SINGLE = {
+    'genus': ['Streptomyces', 'Bacillus', 'Streptomyces', None],
+    'contigedge': [True, False, False, False],
+}
+MULTI = {
+    'type': [(7, 'nrps'), (7, 't1pks'), (3, 'nrps'), (5, 'lanthipeptide'), (5, 'lanthipeptide'), (42, 'nrps')],
+    'monomer': [],
+}
+
+
+@pytest.fixture
+def attributes():
+    return facets.ClusterAttributes(BGC_IDS, SINGLE, MULTI)
+
+
+def test_rows(attributes):
+    assert list(attributes.rows([1, 5, 2, 100])) == [0, 2, -1, -1]
+    assert list(facets.ClusterAttributes([], {}, {}).rows([1])) == [-1]
+
+
+def test_facets(attributes):
+    found = attributes.facets([1, 3, 5, 7], ['genus', 'contigedge', 'type', 'monomer'])
+    assert found == {
+        'genus': [('Streptomyces', 2), ('Bacillus', 1)],
+        'contigedge': [(False, 3), (True, 1)],
+        'type': [('nrps', 2), ('lanthipeptide', 1), ('t1pks', 1)],
+        'monomer': [],
+    }
+
+    assert attributes.facets([3, 7, 99], ['type'], limit=1) == {'type': [('nrps', 2)]}
+    assert attributes.facets([], ['genus', 'type']) == {'genus': [], 'type': []}
+
+
+def test_facets_match_python_counts():
+    rng = np.random.RandomState(3)
+    bgc_ids = rng.permutation(np.arange(1, 2001)).tolist()
+    genera = ['genus{}'.format(rng.randint(30)) for _ in bgc_ids]
+    types = [(bgc_id, 'type{}'.format(rng.randint(12))) for bgc_id in bgc_ids for _ in range(rng.randint(3))]
+    attributes = facets.ClusterAttributes(bgc_ids, {'genus': genera}, {'type': types})
+
+    subset = set(rng.choice(bgc_ids, 500, replace=False).tolist())
+    found = attributes.facets(subset, ['genus', 'type'], limit=100)
+
+    expected_genera = {}
+    for bgc_id, genus in zip(bgc_ids, genera):
+        if bgc_id in subset:
+            expected_genera[genus] = expected_genera.get(genus, 0) + 1
+    expected_types = {}
+    for bgc_id, term in set(types):
+        if bgc_id in subset:
+            expected_types[term] = expected_types.get(term, 0) + 1
+    assert dict(found['genus']) == expected_genera
+    assert dict(found['type']) == expected_types
+    counts = [count for _, count in found['genus']]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_search_facets_unknown_category():
+    with pytest.raises(ValueError):
+        facets.search_facets([1], ['genus', 'colour'])
+
+
+def test_search_bad_facets(client):
+    def post(**body):
+        return client.post(url_for('search'), json=dict(search_string='[genus]streptomyces', **body))
+
+    assert post(facets=['colour']).status_code == 400
+    assert post(facets={'genus': 1}).status_code == 400
+    assert post(facets='genus', facet_limit='x').status_code == 400
@@ -0,0 +1,36 @@
+from flask import g
+from sqlalchemy.dialects import postgresql
+
+from api.models import BiosyntheticGeneCluster as Bgc
+from api.search import idsets
+
+
+def test_id_filter():
+    clause = idsets.id_filter(Bgc.bgc_id, [3, 1, 3, 2])
+    compiled = clause.compile(dialect=postgresql.dialect())
+    assert str(compiled) == 'antismash.biosynthetic_gene_clusters.bgc_id = ANY (%(param_1)s::INTEGER[])'
+    assert compiled.params == {'param_1': [1, 2, 3]}
+
+
+def test_restrict_to_ids_on_replica(app):
+    # the request shares the app context of the whole test session, and with it g
+    with app.test_request_context():
+        g.db_replica = object()
+        try:
+            query = idsets.restrict_to_ids(Bgc.query, Bgc.bgc_id, range(app.config['ID_TEMP_TABLE_THRESHOLD']))
+        finally:
+            g.pop('db_replica', None)
+    assert 'ANY' in str(query.statement.compile(dialect=postgresql.dialect()))
+
+
+def test_restrict_to_ids_temp_table(app, session):
+    ids = [bgc_id for bgc_id, in session.query(Bgc.bgc_id).limit(50)]
+    threshold = app.config['ID_TEMP_TABLE_THRESHOLD']
+    with app.test_request_context():
+        try:
+            app.config['ID_TEMP_TABLE_THRESHOLD'] = 10
+            joined = idsets.restrict_to_ids(session.query(Bgc.bgc_id), Bgc.bgc_id, ids)
+        finally:
+            app.config['ID_TEMP_TABLE_THRESHOLD'] = threshold
+        assert 'search_ids_' in str(joined.statement)
+        assert sorted(bgc_id for bgc_id, in joined) == sorted(ids)
@@ -0,0 +1,22 @@
+from api import legacy
+
+
+def test_dbv1_accessions():
+    assert len(legacy.dbv1_accessions) == 8878
+    assert 'AE000511' in legacy.dbv1_accessions
+    assert 'CP006680' in legacy.dbv1_accessions
+    assert 'AE00051' not in legacy.dbv1_accessions
+    assert 'NC_003888' not in legacy.dbv1_accessions
+    assert '' not in legacy.dbv1_accessions
+
+
+def test_write_accession_file(tmp_path):
+    path = str(tmp_path / 'accessions.dat')
+    legacy.write_accession_file(['B2', 'A1', 'C333', 'A1'], path)
+    accessions = legacy.AccessionSet(path)
+    assert len(accessions) == 3
+    assert list(accessions) == ['A1', 'B2', 'C333']
+    for accession in ('A1', 'B2', 'C333'):
+        assert accession in accessions
+    for accession in ('A', 'C33', 'C3333', 'Ä1', None):
+        assert accession not in accessions
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import exc
+
+from api import pool
+
+
+class FakeConnection:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_instrumented_queue_pool():
+    test_pool = pool.InstrumentedQueuePool(FakeConnection, pool_size=1, max_overflow=1, timeout=0.01)
+    in_use = pool.POOL_IN_USE.get()
+    overflows = pool.POOL_OVERFLOWS.get()
+    timeouts = pool.POOL_TIMEOUTS.get()
+    checkouts, _ = pool.POOL_CHECKOUT_WAIT.get()
+
+    first = test_pool.connect()
+    second = test_pool.connect()
+    assert pool.POOL_IN_USE.get() == in_use + 2
+    assert pool.POOL_OVERFLOWS.get() == overflows + 1
+
+    with pytest.raises(exc.TimeoutError):
+        test_pool.connect()
+    assert pool.POOL_TIMEOUTS.get() == timeouts + 1
+    assert pool.POOL_CHECKOUT_WAIT.get()[0] == checkouts + 3
+
+    first.close()
+    second.close()
+    assert pool.POOL_IN_USE.get() == in_use
+
+
+def test_prewarm():
+    test_pool = pool.InstrumentedQueuePool(FakeConnection, pool_size=3, max_overflow=0)
+
+    class FakeEngine:
+        def connect(self):
+            return test_pool.connect()
+
+    assert pool.prewarm(FakeEngine(), 3) == 3
+    assert test_pool.checkedin() == 3
@@ -0,0 +1,126 @@
+'Tests for the protein k-mer index'
+
+import random
+
+import pytest
+from flask import url_for
+
+from api import protein_index
+
+np = pytest.importorskip('numpy')
+
+PROTEINS = {
+    11: 'MKTAYIAKQRQISFVKSHFSRQLEERLGLIEVQAPILSRVGDGTQDNLSGAEKAVQVKVKALPDAQFEVVHSLAKWKRQTLGQHDFSAGEGLYTHMKALRPDEDRLSPLHSVYVDQWDWERVMGDGERQFSTLKSTVEAIWAGIKATEAAVSEEFGLAPFLPDQIHFVHSQELLSRYPDLDAKGRERAIAKDLGAVFLVGIGGKLSDGHRHDVRAPDYDDWUAIGGLKRKALEEIKTWLEY',
+    12: 'MSDNLLTYREAVDLLRKAGAMPVSGEVITEAGISRGDLYSLAVYYAGHDSRLMRELGLTEEELAKRVQVLCESGVLTEHNGRWRLTEKGRAYAESHVDKITAWLRASVNHLTDEEFAAFEAMLTKLLHA',
+    13: 'MAEIGIAVAAERLGVHPRTLRYWDREGLLHPQRSANGYRYYTEQQLETIQLIRYLLRVNVSLPEIRDVLAAHEDERLRGALETLLRRLEDELRELRALLARVEGLTAG',
+}
+
+
+def reference_score(query, target):
+    '''Plain Gotoh Smith-Waterman for comparison'''
+    score = protein_index.SCORE_MATRIX
+    query = protein_index._encode_residues(query)
+    target = protein_index._encode_residues(target)
+    gap_first = protein_index.GAP_OPEN + protein_index.GAP_EXTEND
+    ext = protein_index.GAP_EXTEND
+    rows, cols = len(query) + 1, len(target) + 1
+    h = [[0] * cols for _ in range(rows)]
+    e = [[-10 ** 6] * cols for _ in range(rows)]
+    f = [[-10 ** 6] * cols for _ in range(rows)]
+    best = 0
+    for i in range(1, rows):
+        for j in range(1, cols):
+            e[i][j] = max(h[i][j - 1] - gap_first, e[i][j - 1] - ext)
+            f[i][j] = max(h[i - 1][j] - gap_first, f[i - 1][j] - ext)
+            h[i][j] = max(0, h[i - 1][j - 1] + int(score[query[i - 1], target[j - 1]]), e[i][j], f[i][j])
+            best = max(best, h[i][j])
+    return best
+
+
+def test_kmer_codes():
+    # L, I, V and M are the same letter of the reduced alphabet
+    assert list(protein_index.kmer_codes('LLLLL')) == list(protein_index.kmer_codes('IVMLI'))
+    assert len(protein_index.kmer_codes('ACDEFGH')) == 3
+    assert len(protein_index.kmer_codes('ACXEFGHK')) == 1
+    assert len(protein_index.kmer_codes('ACDE')) == 0
+
+
+def test_build_save_load(tmp_path):
+    index = protein_index.KmerIndex.build(list(PROTEINS), list(PROTEINS.values()), processes=1, chunk_size=2)
+    path = str(tmp_path / 'proteins.idx')
+    index.save(path)
+    loaded = protein_index.KmerIndex.load(path)
+    assert list(loaded.cds_ids) == list(PROTEINS)
+    assert list(loaded.offsets) == list(index.offsets)
+    assert list(loaded.postings) == list(index.postings)
+    assert protein_index.get_index(path) is protein_index.get_index(path)
+
+
+def test_candidates():
+    index = protein_index.KmerIndex.build(list(PROTEINS), list(PROTEINS.values()), processes=1)
+    query = PROTEINS[12][10:90]
+    candidates = index.candidates(query, 2)
+    assert candidates[0][0] == 12
+    assert candidates[0][1] == len(protein_index.kmer_codes(query))
+    assert index.candidates('WWWWWWWW', 5) == []
+
+
+def test_align_scores():
+    rng = random.Random(0)
+    query = PROTEINS[13][:40]
+    mutated = ''.join(rng.choice(protein_index.AMINO_ACIDS) if rng.random() < 0.2 else aa for aa in query)
+    targets = [PROTEINS[13], PROTEINS[11][:60], mutated[:15] + mutated[20:], 'X', '']
+    expected = [reference_score(query, target) if target else 0 for target in targets]
+    assert protein_index.align_scores(query, targets, threads=2, batch_size=2) == expected
+    assert expected[0] > expected[1]
+
+
+def test_search():
+    index = protein_index.KmerIndex.build(list(PROTEINS), list(PROTEINS.values()), processes=1)
+    hits = protein_index.search(index, PROTEINS[11][30:120], limit=3, translations=lambda ids: {i: PROTEINS[i] for i in ids})
+    assert hits[0]['cds_id'] == 11
+    assert hits[0]['score'] > 0
+    assert 'score' not in protein_index.search(index, PROTEINS[11][30:120], verify=False)[0]
+
+
+def test_search_verifies_top_candidates(monkeypatch):
+    monkeypatch.setattr(protein_index, 'MAX_VERIFIED', 2)
+    monkeypatch.setattr(protein_index, 'MAX_ALIGNED_LENGTH', 20)
+    aligned = []
+
+    def align_scores(query, targets, threads=1):
+        aligned.append(query)
+        return [len(target) for target in targets]
+
+    monkeypatch.setattr(protein_index, 'align_scores', align_scores)
+    index = protein_index.KmerIndex.build(list(PROTEINS), list(PROTEINS.values()), processes=1)
+    query = PROTEINS[11][:100] + PROTEINS[12][:70] + PROTEINS[13][:40]
+    hits = protein_index.search(index, query, limit=3, translations=lambda ids: {i: PROTEINS[i] for i in ids})
+    assert aligned == [query[:20]]
+    assert [hit['cds_id'] for hit in hits] == [11, 12, 13]
+    assert [hit.get('score') for hit in hits] == [len(PROTEINS[11]), len(PROTEINS[12]), None]
+
+
+def test_search_protein_unconfigured(client):
+    response = client.post(url_for('search_protein'), json={'sequence': PROTEINS[11]})
+    assert response.status_code == 503
+    assert client.post(url_for('search_protein'), json={'sequence': 'M3K'}).status_code == 400
+
+
+def test_search_protein_options(client, tmp_path, monkeypatch):
+    path = str(tmp_path / 'proteins.idx')
+    protein_index.KmerIndex.build(list(PROTEINS), list(PROTEINS.values()), processes=1).save(path)
+    monkeypatch.setitem(client.application.config, 'PROTEIN_INDEX', path)
+    searches = []
+    monkeypatch.setattr(protein_index, 'search', lambda index, sequence, **kwargs: searches.append(kwargs) or [])
+    monkeypatch.setattr('api.api.protein_hits_to_json', lambda hits: hits)
+
+    def post(**options):
+        return client.post(url_for('search_protein'), json=dict(sequence=PROTEINS[11], **options))
+
+    assert post(limit=None).status_code == 400
+    assert post(limit=[5]).status_code == 400
+    assert post(limit='x').status_code == 400
+    assert post(verify='false', limit='7').status_code == 200
+    assert post().status_code == 200
+    assert [(search['limit'], search['verify']) for search in searches] == [(7, False), (50, True)]
@@ -0,0 +1,45 @@
+'Tests for the region search'
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from api.models import BiosyntheticGeneCluster as Bgc
+from api.search import clusters, domains, genes, regions
+
+
+def test_parse_region():
+    assert regions.parse_region(' NC_003888.3:1-8667507 ') == ('NC_003888', 3, 0, 8667507)
+    for invalid in ('NC_003888', 'NC_003888:100', 'NC_003888:200-100', 'NC_003888:0-100', ':1-100', 'NC 003888:1-10'):
+        with pytest.raises(ValueError):
+            regions.parse_region(invalid)
+
+
+def test_region_filter():
+    clause = regions.region_filter(('NC_003888', None, 99, 200))
+    compiled = clause.compile(dialect=postgresql.dialect())
+    assert 'int4range(antismash.loci.start_pos, antismash.loci.end_pos) && int4range(' in str(compiled)
+    assert 'version' not in str(compiled)
+    assert sorted(compiled.params.values(), key=str) == [200, 200, 99, 99, 'NC_003888']
+
+    clause = regions.region_filter(('NC_003888', 3, 99, 200))
+    assert 'antismash.dna_sequences.version = ' in str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_invalid_region_matches_nothing(app):
+    query = clusters.clusters_by_region('not a region')
+    assert 'false' in str(query.statement.compile(dialect=postgresql.dialect()))
+
+
+def test_clusters_by_region(session):
+    assert clusters.clusters_by_region('NC_003888:1-10000000').count() == clusters.clusters_by_acc('NC_003888').count()
+
+    first = clusters.clusters_by_acc('NC_003888').order_by(Bgc.bgc_id).first()
+    start, end = first.locus.start_pos, first.locus.end_pos
+    assert first in clusters.clusters_by_region('NC_003888:{}-{}'.format(end, end + 10)).all()
+    assert first not in clusters.clusters_by_region('NC_003888:{}-{}'.format(end + 1, end + 10)).all()
+    assert first in clusters.clusters_by_region('NC_003888:{}-{}'.format(start - 10, start + 1)).all()
+
+
+def test_genes_and_domains_by_region(session):
+    assert genes.query_region('NC_003888:1-10000000').count() == genes.query_acc('NC_003888').count()
+    assert domains.query_region('NC_003888:1-10000000').count() == domains.query_acc('NC_003888').count()
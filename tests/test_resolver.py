@@ -0,0 +1,17 @@
+from api.resolver import IdentifierResolver
+
+
+def test_identifier_resolver():
+    resolver = IdentifierResolver(
+        ['GCF_000203835.1', 'GCF_000009765.2'],
+        [('NC_003888', 3, 'GCF_000203835.1'), ('NC_003903', 1, 'GCF_000203835.1'),
+         ('NC_003155', 5, 'GCF_000009765.2'), ('NZ_ORPHAN', 1, None)],
+    )
+    assert resolver.resolve('GCF_000203835') == 'GCF_000203835'
+    assert resolver.resolve('gcf_000009765') == 'GCF_000009765'
+    assert resolver.resolve('NC_003155') == 'GCF_000009765'
+    assert resolver.resolve('nc_003903') == 'GCF_000203835'
+    # prefixes match like the previous ILIKE 'prefix%' lookups
+    assert resolver.resolve('NC_00315') == 'GCF_000009765'
+    assert resolver.resolve('NZ_ORPHAN') is None
+    assert resolver.resolve('XY_123') is None
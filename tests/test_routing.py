@@ -0,0 +1,102 @@
+import threading
+import time
+
+from flask import Flask, g
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import create_engine
+
+from api import routing
+
+
+def make_replicas(lags, **kwargs):
+    lags = dict(lags)
+    replicas = routing.ReplicaSet(list(lags), lag_check=lambda engine: lags[engine], background=False, **kwargs)
+    replicas.refresh()
+    return replicas, lags
+
+
+def test_replica_set_least_connections():
+    replicas, _ = make_replicas({'a': 0.0, 'b': 1.0})
+
+    first = replicas.acquire()
+    second = replicas.acquire()
+    assert {first.engine, second.engine} == {'a', 'b'}
+
+    replicas.release(second)
+    assert replicas.acquire() is second
+
+
+def test_replica_set_skips_lagging():
+    replicas, lags = make_replicas({'a': 0.0, 'b': 60.0, 'c': None}, max_lag=30, check_interval=0)
+
+    assert replicas.acquire().engine == 'a'
+    assert replicas.acquire().engine == 'a'
+
+    lags['a'] = 120.0
+    assert replicas.acquire().engine == 'a'
+    replicas.refresh()
+    assert replicas.acquire() is None
+
+    lags['b'] = 5.0
+    replicas.refresh()
+    assert replicas.acquire().engine == 'b'
+
+
+def test_replica_set_checks_in_background():
+    started = threading.Event()
+    unblock = threading.Event()
+
+    def lag_check(engine):
+        started.set()
+        unblock.wait(5)
+        return 0.0
+
+    replicas = routing.ReplicaSet(['a'], check_interval=3600, lag_check=lag_check)
+    try:
+        # a hanging lag check doesn't block requests, they use the primary meanwhile
+        assert replicas.acquire() is None
+        assert started.wait(5)
+        assert replicas.acquire() is None
+
+        unblock.set()
+        deadline = time.time() + 5
+        while replicas.replicas[0].lag is None and time.time() < deadline:
+            time.sleep(0.01)
+        assert replicas.acquire().engine == 'a'
+    finally:
+        replicas.close()
+        unblock.set()
+
+
+def test_routing_session():
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['DB_REPLICA_URIS'] = ['sqlite://']
+    db = SQLAlchemy(app)
+    replicas = routing.init_replicas(app, db)
+    replica_engine = replicas.replicas[0].engine
+
+    @app.route('/read')
+    @routing.read_only
+    def read():
+        return str(db.session.get_bind() is replica_engine)
+
+    @app.route('/write')
+    def write():
+        return str(db.session.get_bind() is replica_engine)
+
+    # sqlite has no replication status, so the replica counts as unreachable
+    replicas.background = False
+    replicas.refresh()
+    client = app.test_client()
+    assert client.get('/read').data == b'False'
+
+    replicas.replicas[0].lag = 0.0
+    assert client.get('/read').data == b'True'
+    assert client.get('/write').data == b'False'
+    assert replicas.replicas[0].active == 0
+
+    with app.test_request_context():
+        g.db_replica = routing.Replica(create_engine('sqlite://'))
+        assert db.session.get_bind() is g.db_replica.engine
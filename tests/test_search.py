@@ -83,3 +83,21 @@ def test_cluster_query_from_term_invalid():
     term.kind = 'bogus'
     ret = search.cluster_query_from_term(term)
     assert ret.count() == 0
+
+
+def test_suggest_corrections():
+    term = QueryTerm.from_string('[genus]Streptomcyes')
+    suggestions = search.suggest_corrections(term)
+    assert suggestions == [{
+        'category': 'genus',
+        'term': 'Streptomcyes',
+        'candidates': [{'val': 'Streptomyces', 'desc': None, 'distance': 1}],
+    }]
+
+    term = QueryTerm.from_string('[genus]Streptomyces')
+    assert search.suggest_corrections(term) == []
+
+
+def test_suggest_corrections_without_typeahead(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'TYPEAHEAD_INDEX', False)
+    assert search.suggest_corrections(QueryTerm.from_string('[genus]Streptomcyes')) == []
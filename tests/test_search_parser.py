@@ -46,6 +46,25 @@ def test_query_from_string():
     assert isinstance(query.terms, QueryTerm)
 
 
+def test_query_to_json():
+    query = Query.from_string('[type]nrps AND Streptomyces', search_type='gene', return_type='csv')
+    expected = {
+        'search': 'gene',
+        'return_type': 'csv',
+        'verbose': False,
+        'terms': {
+            'term_type': 'op',
+            'operation': 'and',
+            'left': {'term_type': 'expr', 'category': 'type', 'term': 'nrps'},
+            'right': {'term_type': 'expr', 'category': 'unknown', 'term': 'Streptomyces'},
+        },
+    }
+    assert query.to_json() == expected
+
+    round_trip = Query.from_json(query.to_json())
+    assert round_trip.to_json() == expected
+
+
 def test_query_term_init_expression():
     with pytest.raises(ValueError):
         term = QueryTerm('expression')
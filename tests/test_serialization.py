@@ -0,0 +1,42 @@
+import json
+
+from flask import Flask
+import pytest
+
+from api import serialization
+
+
+DATA = {'b': [1, 2.5, None], 'a': {'z': True, 'y': 'Streptomyces coelicolor A3(2)', 'x': 'é'}}
+
+
+@pytest.mark.parametrize('name', sorted(serialization.SERIALIZERS))
+def test_serializers(name):
+    serializer = serialization.get_serializer(name)
+    encoded = serializer(DATA, True, False)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded.decode('utf-8')) == DATA
+    assert encoded.index(b'"a"') < encoded.index(b'"b"')
+
+    pretty = serializer(DATA, False, True)
+    assert json.loads(pretty.decode('utf-8')) == DATA
+    assert b'\n' in pretty
+
+
+def test_get_serializer():
+    assert serialization.get_serializer('json') is serialization.SERIALIZERS['json']
+    assert serialization.get_serializer('auto') in serialization.SERIALIZERS.values()
+    with pytest.raises(ValueError):
+        serialization.get_serializer('invalid')
+
+
+def test_jsonify():
+    app = Flask(__name__)
+    app.config['JSON_SERIALIZER'] = 'json'
+
+    with app.app_context():
+        response = serialization.jsonify(DATA)
+        assert response.mimetype == 'application/json'
+        assert response.get_data() == json.dumps(DATA, sort_keys=True, separators=(',', ':')).encode('utf-8') + b'\n'
+
+        app.config['JSON_SORT_KEYS'] = False
+        assert serialization.dumps({'b': 1, 'a': 2}) == b'{"b":1,"a":2}'
@@ -0,0 +1,106 @@
+'Tests for the cluster similarity search'
+
+import random
+
+import pytest
+from flask import url_for
+
+from api import similarity
+
+np = pytest.importorskip('numpy')
+
+FEATURES = {
+    1: ['pfam:PF00109', 'pfam:PF02801', 'asdomain:PKS_KS', 'asdomain:PKS_AT', 'smcog:SMCOG1022'],
+    2: ['pfam:PF00109', 'pfam:PF02801', 'asdomain:PKS_KS', 'asdomain:PKS_AT'],
+    3: ['pfam:PF00109', 'asdomain:PKS_KS', 'profile:t1pks'],
+    4: ['pfam:PF00501', 'asdomain:AMP-binding', 'asdomain:Condensation', 'profile:Condensation'],
+    5: [],
+}
+
+
+def build(features=FEATURES):
+    pairs = [(bgc_id, name) for bgc_id, names in features.items() for name in names]
+    return similarity.FeatureMatrix.from_pairs(features.keys(), pairs)
+
+
+def reference(features, query, metric):
+    '''Scores of all clusters sharing a feature with query, computed on Python sets'''
+    query = set(query)
+    scores = {}
+    for bgc_id, names in features.items():
+        shared = len(query & set(names))
+        if not shared:
+            continue
+        if metric == 'jaccard':
+            scores[bgc_id] = shared / len(query | set(names))
+        else:
+            scores[bgc_id] = shared / (len(query) * len(names)) ** 0.5
+    return scores
+
+
+def test_from_pairs():
+    matrix = build()
+    assert len(matrix) == 5
+    assert matrix.row_of(4) == 3
+    assert matrix.row_of(6) is None
+    assert list(matrix.sizes) == [5, 4, 3, 4, 0]
+    assert [matrix.features[f] for f in matrix.cluster_features(matrix.row_of(3))] == \
+        sorted(FEATURES[3], key=matrix.feature_ids.get)
+
+    # duplicates and unknown clusters are dropped
+    matrix = similarity.FeatureMatrix.from_pairs([1, 2], [(1, 'a'), (1, 'a'), (3, 'b'), (2, 'b')])
+    assert list(matrix.sizes) == [1, 1]
+
+
+def test_similar():
+    matrix = build()
+    query = matrix.cluster_features(matrix.row_of(1))
+    assert matrix.similar(query, exclude_row=matrix.row_of(1)) == [(2, 0.8, 4), (3, 0.3333, 2)]
+    assert matrix.similar(query, metric='cosine', limit=1) == [(1, 1.0, 5)]
+    assert matrix.similar(matrix.feature_indices(['pfam:PF00501', 'unknown'])) == [(4, 0.25, 1)]
+    assert matrix.similar(matrix.feature_indices(['unknown'])) == []
+    with pytest.raises(ValueError):
+        matrix.similar(query, metric='dice')
+
+
+def test_similar_matches_reference():
+    rng = random.Random(42)
+    vocabulary = ['pfam:PF{:05}'.format(index) for index in range(60)]
+    features = {bgc_id: rng.sample(vocabulary, rng.randint(0, 15)) for bgc_id in range(1, 201)}
+    matrix = build(features)
+    query = rng.sample(vocabulary, 10)
+    for metric in similarity.METRICS:
+        expected = reference(features, query, metric)
+        found = matrix.similar(matrix.feature_indices(query), limit=len(features), metric=metric)
+        assert {bgc_id: score for bgc_id, score, _ in found} == pytest.approx(expected, abs=1e-4)
+        scores = [score for _, score, _ in found]
+        assert scores == sorted(scores, reverse=True)
+
+
+def test_prefilter():
+    rng = random.Random(7)
+    vocabulary = ['pfam:PF{:05}'.format(index) for index in range(500)]
+    features = {bgc_id: rng.sample(vocabulary, 20) for bgc_id in range(1, 301)}
+    # near duplicates of cluster 1
+    features[301] = features[1][:19] + ['pfam:PF99999']
+    features[302] = list(features[1])
+    matrix = build(features)
+    query = matrix.cluster_features(matrix.row_of(1))
+
+    candidates = matrix.lsh_candidates(query)
+    assert {matrix.row_of(1), matrix.row_of(301), matrix.row_of(302)} <= set(candidates)
+    assert len(candidates) < len(matrix) // 2
+
+    found = matrix.similar(query, limit=2, prefilter=True, exclude_row=matrix.row_of(1))
+    assert [bgc_id for bgc_id, _, _ in found] == [302, 301]
+    assert found == matrix.similar(query, limit=2, exclude_row=matrix.row_of(1))
+
+
+def test_similar_bad_requests(client):
+    assert client.post(url_for('similar_to_features'), json={}).status_code == 400
+    assert client.post(url_for('similar_to_features'), json=['pfam:PF00109']).status_code == 400
+    assert client.post(url_for('similar_to_features'), data='{"bgc_id": 1}').status_code == 400
+    assert client.post(url_for('similar_to_features'), json={'bgc_id': 'x'}).status_code == 400
+    response = client.post(url_for('similar_to_features'), json={'features': ['pfam:PF00109'], 'metric': 'dice'})
+    assert response.status_code == 400
+    assert client.get(url_for('similar_to_cluster', bgc_id=1, limit='x')).status_code == 400
@@ -0,0 +1,40 @@
+import json
+
+from flask import g
+from sqlalchemy import create_engine
+
+from api import sqllog
+
+
+def test_statement_accounting(app):
+    engine = create_engine('sqlite://')
+    with app.test_request_context():
+        # g belongs to the app context of the whole test session, so it may count earlier statements
+        before = g.get('sql_statements', 0)
+        engine.execute('SELECT 1').fetchall()
+        engine.execute('SELECT 1 UNION SELECT 2').fetchall()
+        assert g.sql_statements - before == 2
+
+
+def test_slow_query_log(app, tmpdir, caplog):
+    engine = create_engine('sqlite://')
+    explain_log = str(tmpdir.join('explain.log'))
+    old_config = app.config['SLOW_QUERY_SECONDS'], app.config['EXPLAIN_LOG']
+    app.config['SLOW_QUERY_SECONDS'] = 0
+    app.config['EXPLAIN_LOG'] = explain_log
+    try:
+        slow_before = sqllog.SLOW_STATEMENTS.get()
+        with app.app_context():
+            engine.execute('SELECT 1').fetchall()
+        sqllog._EXPLAIN_QUEUE.join()
+    finally:
+        app.config['SLOW_QUERY_SECONDS'], app.config['EXPLAIN_LOG'] = old_config
+
+    assert sqllog.SLOW_STATEMENTS.get() == slow_before + 1
+    assert 'slow query' in caplog.text
+
+    with open(explain_log) as handle:
+        record = json.loads(handle.readline())
+    assert record['statement'] == 'SELECT 1'
+    # sqlite has no EXPLAIN (FORMAT JSON), the failure is recorded instead
+    assert 'error' in record
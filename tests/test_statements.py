@@ -0,0 +1,65 @@
+'Tests for the compiled statement cache'
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from api.models import BiosyntheticGeneCluster as Bgc, Taxa
+from api.search import core_search, term_from_shape, term_shape
+from api.search.clusters import clusters_by_genus
+from api.search_parser import Query, QueryTerm
+from api import statements
+
+DIALECT = postgresql.dialect(paramstyle='named')
+
+
+def test_compile_shape(app):
+    shape = statements.compile_shape(clusters_by_genus, 1, DIALECT)
+    assert 'ILIKE :genus_1' in str(shape.statement)
+    assert shape.params(['streptomyces']) == {'genus_1': '%streptomyces%'}
+
+
+def test_compile_shape_constants(app):
+    shape = statements.compile_shape(lambda term: clusters_by_genus(term).limit(50), 1, DIALECT)
+    assert shape.params(['streptomyces']) == {'genus_1': '%streptomyces%', 'param_1': 50}
+
+
+def _transformed(term):
+    return Bgc.query.filter(Taxa.genus == term.upper())
+
+
+def _branching(term):
+    return Bgc.query.filter(Taxa.genus == term) if term.startswith('Q') else Bgc.query
+
+
+@pytest.mark.parametrize('build', [_transformed, _branching])
+def test_compile_shape_uncacheable(app, build):
+    with pytest.raises(statements.UncacheableShape):
+        statements.compile_shape(build, 1, DIALECT)
+
+
+def test_statement_cache(app):
+    cache = statements.StatementCache(size=2)
+    first = cache.get('genus', clusters_by_genus, 1, DIALECT)
+    assert cache.get('genus', clusters_by_genus, 1, DIALECT) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert cache.get('upper', lambda term: Bgc.query.filter(Taxa.genus == term.upper()), 1, DIALECT) is None
+    cache.get('other', clusters_by_genus, 1, DIALECT)
+    assert len(cache) == 2
+    assert cache.get('genus', clusters_by_genus, 1, DIALECT) is not first
+
+
+def test_term_shape():
+    terms = Query.from_string('[genus]streptomyces AND [contigedge]true OR [type]nrps').terms
+    shape = term_shape(terms)
+    rebuilt = term_from_shape(shape, iter(['bacillus', False, 'lanthipeptide']))
+    assert term_shape(rebuilt) == shape
+    assert str(rebuilt) == str(QueryTerm.from_string('[genus]bacillus AND [contigedge]false OR [type]lanthipeptide'))
+
+
+def test_core_search_cached(session):
+    statements.STATEMENTS.clear()
+    first = core_search(Query.from_string('[genus]streptomyces'))
+    second = core_search(Query.from_string('[genus]Streptomyces'))
+    assert [bgc.bgc_id for bgc in first] == [bgc.bgc_id for bgc in second]
+    assert len(first) == clusters_by_genus('streptomyces').count()
@@ -8,6 +8,7 @@ from api.taxtree import (
     get_genus,
     get_species,
     get_strains,
+    TaxonSearchIndex,
     _create_tree_node,
 )
 
@@ -135,3 +136,27 @@ def test__create_tree_node(session):
     }
     node = _create_tree_node(expected['id'], expected['parent'], expected['text'], assembly_id=expected['assembly_id'], disabled=False, leaf=True)
     assert node == expected
+
+
+def test_taxon_search_index():
+    rows = [
+        ('Bacteria', 'Actinobacteria', 'Actinobacteria', 'Streptomycetales', 'Streptomycetaceae', 'Streptomyces', 'coelicolor', 'A3(2)'),
+        ('Bacteria', 'Actinobacteria', 'Actinobacteria', 'Micromonosporales', 'Micromonosporaceae', 'Salinispora', 'tropica', 'CNB-440'),
+    ]
+    index = TaxonSearchIndex(rows)
+
+    assert index.search('nothing') == []
+    assert index.search('COELI') == [
+        'superkingdom_bacteria',
+        'phylum_bacteria_actinobacteria',
+        'class_bacteria_actinobacteria_actinobacteria',
+        'order_bacteria_actinobacteria_actinobacteria_streptomycetales',
+        'family_bacteria_actinobacteria_actinobacteria_streptomycetales_streptomycetaceae',
+        'genus_bacteria_actinobacteria_actinobacteria_streptomycetales_streptomycetaceae_streptomyces',
+        'species_bacteria_actinobacteria_actinobacteria_streptomycetales_streptomycetaceae_streptomyces_coelicolor',
+    ]
+    # strain match, shared levels only listed once
+    ret = index.search('cnb')
+    assert ret[0] == 'superkingdom_bacteria'
+    assert ret[-1] == 'species_bacteria_actinobacteria_actinobacteria_micromonosporales_micromonosporaceae_salinispora_tropica'
+    assert len(index.search('a')) == 1 + 1 + 1 + 2 + 2 + 2 + 2
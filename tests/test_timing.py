@@ -0,0 +1,35 @@
+from flask import Flask
+
+from api import timing
+from api.search_parser import Query
+
+
+def test_phases():
+    app = Flask(__name__)
+    timing.init_timing(app)
+
+    @app.route('/timed')
+    def timed():
+        with timing.phase('parse'):
+            query = Query.from_string('[type]nrps', return_type='csv')
+        timing.label_query(query)
+        with timing.phase('search'):
+            pass
+        return 'ok'
+
+    @app.route('/untimed')
+    def untimed():
+        return 'ok'
+
+    before, _ = timing.PHASE_SECONDS.get(endpoint='timed', phase='search', search_type='cluster', return_type='csv')
+
+    client = app.test_client()
+    response = client.get('/timed')
+    names = [part.split(';')[0] for part in response.headers['Server-Timing'].split(', ')]
+    assert names == ['parse', 'search', 'total']
+    after, _ = timing.PHASE_SECONDS.get(endpoint='timed', phase='search', search_type='cluster', return_type='csv')
+    assert after == before + 1
+
+    response = client.get('/untimed')
+    assert response.headers['Server-Timing'].startswith('total;dur=')
+    assert timing.PHASE_SECONDS.get(endpoint='untimed', phase='total', search_type='', return_type='')[0] >= 1
@@ -0,0 +1,39 @@
+from api.search.typeahead import TypeaheadIndex
+
+
+def test_typeahead_index_value_prefix():
+    index = TypeaheadIndex([('Class-III', None), ('class-II', None), ('Class-I', None), ('Other', None), ('Class-I', None)])
+    assert len(index) == 4
+    assert index.lookup('class') == [('Class-I', None), ('class-II', None), ('Class-III', None)]
+    assert index.lookup('CLASS-II', limit=1) == [('class-II', None)]
+    assert index.lookup('x') == []
+
+
+def test_typeahead_index_numeric_values():
+    index = TypeaheadIndex([(10, 10), (1, 1), (2, 2), (11, 11)])
+    assert index.lookup('1') == [(1, 1), (10, 10), (11, 11)]
+
+
+def test_typeahead_index_description_substring():
+    entries = [
+        ('AB469822_c1', 'Streptomyces griseoviridis DNA, includes prodigiosin'),
+        ('BGC0001066_c1', 'Kendomycin'),
+        ('KR_01', 'Ketoreductase'),
+    ]
+    index = TypeaheadIndex(entries, 'substring')
+    assert index.lookup('kendo') == [entries[1]]
+    assert index.lookup('k') == entries[1:]
+    assert index.lookup('e') == entries
+    assert index.lookup('prodigiosin') == [entries[0]]
+
+    index = TypeaheadIndex(entries)
+    assert index.lookup('kendo') == []
+
+
+def test_typeahead_index_ranked_by_count():
+    entries = [('Salinispora', None), ('Sorangium', None), ('Streptomyces', None), ('Bacillus', None)]
+    index = TypeaheadIndex(entries)
+    counts = {'Streptomyces': 120, 'Sorangium': 3, 'Salinispora': 3, 'Bacillus': 500}
+    assert index.lookup('s', counts=counts) == [('Streptomyces', None), ('Salinispora', None), ('Sorangium', None)]
+    assert index.lookup('s', limit=1, counts=counts) == [('Streptomyces', None)]
+    assert index.lookup('s', counts={}) == index.lookup('s')
@@ -0,0 +1,59 @@
+'Tests for the BGC type closure'
+
+from sqlalchemy.dialects import postgresql
+
+from api.search import clusters, genes, typeclosure
+
+TYPES = [
+    (1, 'nrps', 'Non-ribosomal peptide synthetase', None),
+    (2, 'nrps-like', 'NRPS-like fragment', 1),
+    (3, 'thiopeptide', 'Thiopeptide', None),
+    (4, 'lanthipeptide', 'Lanthipeptide', None),
+    (5, 'lanthipeptide-class-i', 'Class I lanthipeptide', 4),
+    (6, 'lanthipeptide-class-ii', 'Class II lanthipeptide', 4),
+    (7, 'lanthipeptide-class-ii-x', 'Class II lanthipeptide, variant', 6),
+]
+
+
+def test_closure():
+    closure = typeclosure.TypeClosure(TYPES)
+    assert closure.descendants[4] == {4, 5, 6, 7}
+    assert closure.ancestors[7] == {4, 6, 7}
+    assert closure.descendants[3] == closure.ancestors[3] == {3}
+
+
+def test_closure_broken_data():
+    # unknown parents and cycles don't recurse forever
+    closure = typeclosure.TypeClosure([(1, 'a', '', 2), (2, 'b', '', 1), (3, 'c', '', 42)])
+    assert closure.descendants[1] == closure.descendants[2] == {1, 2}
+    assert closure.ancestors[3] == {3}
+
+
+def test_matching():
+    closure = typeclosure.TypeClosure(TYPES)
+    assert closure.matching('Thiopeptide') == {3}
+    assert closure.matching('NRPS') == {1, 2}
+    assert closure.matching('lanthipeptide-class') == set()
+    assert closure.matching('lanthipeptide-class', substring_terms=True) == {5, 6, 7}
+    assert closure.matching('class ii') == {6, 7}
+    assert closure.with_subtypes(closure.matching('lanthipeptide')) == {4, 5, 6, 7}
+    assert closure.with_parents({5, 7}) == {4, 5, 6, 7}
+
+
+def test_rollup():
+    closure = typeclosure.TypeClosure(TYPES)
+    counts = closure.rollup([(10, 5), (10, 7), (11, 7), (12, 1), (12, 3), (13, 2)])
+    assert counts == {1: 2, 2: 1, 3: 1, 4: 2, 5: 1, 6: 2, 7: 2}
+
+
+def test_type_handlers(app, monkeypatch):
+    closure = typeclosure.TypeClosure(TYPES)
+    monkeypatch.setattr(clusters, 'type_closure', lambda: closure)
+    monkeypatch.setattr(genes, 'type_closure', lambda: closure)
+
+    compiled = clusters.CLUSTERS['type']('lanthipeptide').statement.compile(dialect=postgresql.dialect())
+    assert 'RECURSIVE' not in compiled.string
+    assert list(compiled.params.values()) == [[4, 5, 6, 7]]
+
+    compiled = genes.GENE_QUERIES['type']('class-i').statement.compile(dialect=postgresql.dialect())
+    assert list(compiled.params.values()) == [[5, 6, 7]]